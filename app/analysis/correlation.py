@@ -0,0 +1,281 @@
+"""
+Correlation Analysis Module for SOUL_SENSE_EXAM
+
+Relates a user's EQ scores to the wellbeing metrics they track in the
+journal (sleep, stress, energy, screen time and journal sentiment).
+
+Both tables are averaged per calendar day in SQL and joined into a single
+date-indexed frame with one row per day between the first and last
+observation. Lagged copies of the journal metrics ("sleep N days before the
+test") are added as extra columns, so the whole Pearson or Spearman matrix,
+together with pairwise observation counts, comes out of one vectorized
+``DataFrame.corr`` call.
+
+Reports are cached per user data version (row count and highest id of the
+user's scores and journal entries), so repeated requests from the dashboard,
+CLI or API are free until new data is saved.
+
+The engine only issues plain SQL against the session it is given, which lets
+both the desktop app (``app.db``) and the FastAPI backend reuse it.
+"""
+
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.utils.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+logger = logging.getLogger(__name__)
+
+TARGET = "eq_score"
+METRICS = ("sleep_hours", "stress_level", "energy_level", "screen_time_mins", "journal_sentiment")
+METHODS = ("pearson", "spearman")
+DEFAULT_LAGS = (0, 1)
+
+# Friendly names for reports
+METRIC_LABELS = {
+    "eq_score": "EQ score",
+    "sleep_hours": "Sleep hours",
+    "stress_level": "Stress level",
+    "energy_level": "Energy level",
+    "screen_time_mins": "Screen time",
+    "journal_sentiment": "Journal sentiment",
+}
+
+_SCORES_SQL = """
+    SELECT substr(timestamp, 1, 10) AS day, AVG(total_score) AS eq_score
+    FROM scores
+    WHERE username = :username AND timestamp IS NOT NULL
+    GROUP BY day
+"""
+
+_JOURNAL_SQL = """
+    SELECT substr(entry_date, 1, 10) AS day,
+           AVG(sleep_hours) AS sleep_hours,
+           AVG(stress_level) AS stress_level,
+           AVG(energy_level) AS energy_level,
+           AVG(screen_time_mins) AS screen_time_mins,
+           AVG(sentiment_score) AS journal_sentiment
+    FROM journal_entries
+    WHERE username = :username AND entry_date IS NOT NULL
+      AND (is_deleted IS NULL OR is_deleted = 0)
+    GROUP BY day
+"""
+
+_VERSION_SQL = """
+    SELECT (SELECT COUNT(id) FROM scores WHERE username = :username),
+           (SELECT MAX(id) FROM scores WHERE username = :username),
+           (SELECT COUNT(id) FROM journal_entries
+             WHERE username = :username AND (is_deleted IS NULL OR is_deleted = 0)),
+           (SELECT MAX(id) FROM journal_entries WHERE username = :username)
+"""
+
+
+def lag_column(metric: str, lag: int) -> str:
+    """Column name for ``metric`` observed ``lag`` days before the EQ score."""
+    return metric if lag == 0 else f"{metric}_lag{lag}"
+
+
+def build_daily_frame(score_rows, journal_rows):
+    """
+    Join per-day score and journal aggregates on a continuous daily index.
+
+    Args:
+        score_rows: ``(day, eq_score)`` rows
+        journal_rows: ``(day, *METRICS)`` rows
+
+    Returns:
+        DataFrame indexed by date with ``TARGET`` and every metric as columns
+        (NaN where nothing was recorded that day)
+    """
+    scores = pd.DataFrame(score_rows, columns=["day", TARGET])
+    journals = pd.DataFrame(journal_rows, columns=["day", *METRICS])
+    frame = scores.merge(journals, on="day", how="outer")
+    frame["day"] = pd.to_datetime(frame["day"], errors="coerce")
+    frame = frame.dropna(subset=["day"]).set_index("day").sort_index()
+    frame = frame.astype(float)
+    if not frame.empty:
+        # Continuous days so that shifting by N rows means N days
+        frame = frame.reindex(pd.date_range(frame.index.min(), frame.index.max(), freq="D"))
+    return frame[[TARGET, *METRICS]]
+
+
+def correlation_matrix(frame, method: str = "pearson", lags: Sequence[int] = DEFAULT_LAGS,
+                       min_periods: int = 3) -> Dict[str, Any]:
+    """
+    Correlate every column of a daily frame, including lagged journal metrics.
+
+    Args:
+        frame: Output of :func:`build_daily_frame`
+        method: ``"pearson"`` or ``"spearman"``
+        lags: Day offsets; lag N pairs each EQ score with metrics from N days earlier
+        min_periods: Minimum paired observations for a coefficient (else None)
+
+    Returns:
+        Dictionary with the column list, the full matrix, pairwise counts and
+        ``eq_correlations`` (each metric/lag against the EQ score, strongest first)
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+    lags = sorted({int(lag) for lag in lags})
+    if not lags or lags[0] < 0:
+        raise ValueError("lags must be non-negative day offsets")
+
+    columns = {TARGET: frame[TARGET]}
+    for lag in lags:
+        for metric in METRICS:
+            columns[lag_column(metric, lag)] = frame[metric].shift(lag) if lag else frame[metric]
+    wide = pd.DataFrame(columns)
+
+    matrix = wide.corr(method=method, min_periods=min_periods)
+    valid = wide.notna().to_numpy(dtype=float)
+    counts = valid.T @ valid
+
+    names = list(wide.columns)
+    target_row = matrix.loc[TARGET]
+    eq_correlations = []
+    for lag in lags:
+        for metric in METRICS:
+            name = lag_column(metric, lag)
+            r = _clean(target_row[name])
+            if r is None:
+                continue
+            eq_correlations.append({
+                "metric": metric,
+                "lag": lag,
+                "r": r,
+                "n": int(counts[0, names.index(name)]),
+            })
+    eq_correlations.sort(key=lambda row: abs(row["r"]), reverse=True)
+
+    return {
+        "method": method,
+        "lags": lags,
+        "min_periods": min_periods,
+        "days": int(frame.notna().any(axis=1).sum()),
+        "columns": names,
+        "matrix": [[_clean(v) for v in row] for row in matrix.to_numpy()],
+        "counts": counts.astype(int).tolist(),
+        "eq_correlations": eq_correlations,
+    }
+
+
+def describe_strength(r: float) -> str:
+    """Plain-language strength of a correlation coefficient."""
+    size = abs(r)
+    if size >= 0.7:
+        strength = "strong"
+    elif size >= 0.4:
+        strength = "moderate"
+    elif size >= 0.2:
+        strength = "weak"
+    else:
+        return "no clear"
+    return f"{strength} {'positive' if r > 0 else 'negative'}"
+
+
+def describe_correlation(row: Dict[str, Any]) -> str:
+    """One-line summary of an ``eq_correlations`` entry for text reports."""
+    when = "same day" if row["lag"] == 0 else f"{row['lag']} day(s) before"
+    return (f"{METRIC_LABELS[row['metric']]} ({when}): r = {row['r']:+.2f}, "
+            f"{describe_strength(row['r'])} (n={row['n']})")
+
+
+def _clean(value) -> Optional[float]:
+    """Round a coefficient for output; NaN becomes None."""
+    value = float(value)
+    return None if math.isnan(value) else round(value, 4)
+
+
+class CorrelationEngine:
+    """Computes and caches per-user correlation reports."""
+
+    def __init__(self, max_entries: int = 64):
+        """Initialize the engine with an empty, version-keyed LRU cache."""
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def data_version(self, session: Session, username: str) -> Tuple:
+        """
+        Return a cheap fingerprint of ``username``'s scores and journal entries.
+
+        New, deleted or soft-deleted rows change the row counts or max ids.
+        Rows edited in place do not; call :meth:`invalidate` after such edits.
+        """
+        return tuple(session.execute(text(_VERSION_SQL), {"username": username}).one())
+
+    def build_frame(self, session: Session, username: str):
+        """Load the aligned daily frame of EQ scores and journal metrics."""
+        params = {"username": username}
+        score_rows = session.execute(text(_SCORES_SQL), params).all()
+        journal_rows = session.execute(text(_JOURNAL_SQL), params).all()
+        return build_daily_frame(score_rows, journal_rows)
+
+    def get_report(self, session: Session, username: str, method: str = "pearson",
+                   lags: Sequence[int] = DEFAULT_LAGS, min_periods: int = 3) -> Dict[str, Any]:
+        """
+        Get the correlation report, recomputing only if the user's data changed.
+
+        Args:
+            session: Active SQLAlchemy session bound to the application database
+            username: User whose scores and journal entries are analysed
+            method: ``"pearson"`` or ``"spearman"``
+            lags: Day offsets to correlate journal metrics at
+            min_periods: Minimum paired observations per coefficient
+
+        Returns:
+            Dictionary from :func:`correlation_matrix` plus ``username`` and
+            ``data_version``
+        """
+        version = self.data_version(session, username)
+        key = (username, version, method, tuple(sorted(set(lags))), min_periods)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        report = correlation_matrix(self.build_frame(session, username), method, lags, min_periods)
+        report["username"] = username
+        report["data_version"] = list(version)
+
+        with self._lock:
+            # Drop this user's reports computed against older data
+            for stale in [k for k in self._cache if k[0] == username and k[1] != version]:
+                del self._cache[stale]
+            self._cache[key] = report
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return report
+
+    def invalidate(self, username: Optional[str] = None) -> None:
+        """Clear cached reports for ``username`` (everyone if None)."""
+        with self._lock:
+            if username is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[0] == username]:
+                    del self._cache[key]
+
+
+# Shared engine instance so the cache is reused across callers
+correlation_engine = CorrelationEngine()
+
+
+def get_user_correlations(username: str, method: str = "pearson",
+                          lags: Sequence[int] = DEFAULT_LAGS, min_periods: int = 3) -> Dict[str, Any]:
+    """Correlation report for ``username`` from the desktop database (UI and CLI)."""
+    from app.db import safe_db_context
+
+    with safe_db_context() as session:
+        return correlation_engine.get_report(session, username, method=method,
+                                             lags=lags, min_periods=min_periods)
@@ -6,7 +6,7 @@ from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from app.models import Score, User
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,19 @@ logger = logging.getLogger(__name__)
 class OutlierDetector:
     """Outlier detection using multiple statistical methods."""
     
+    # Columns needed to report outlier details (avoids loading full ORM rows)
+    _DETAIL_COLUMNS = (
+        Score.id, Score.username, Score.total_score,
+        Score.age, Score.detailed_age_group, Score.timestamp,
+    )
+    
+    # Grouping columns supported by the batch mode
+    _BATCH_GROUP_COLUMNS = {
+        "username": Score.username,
+        "age_group": Score.detailed_age_group,
+        "global": None,
+    }
+    
     def __init__(self, threshold: float = 2.5):
         """Initialize with Z-score threshold (default: 2.5)."""
         self.threshold = threshold
@@ -228,7 +241,7 @@ class OutlierDetector:
                                     method: str = "ensemble") -> Dict:
         """Age group-level outlier detection."""
         try:
-            scores_query = session.query(Score).filter(
+            scores_query = session.query(*self._DETAIL_COLUMNS).filter(
                 Score.detailed_age_group == age_group
             ).order_by(Score.timestamp).all()
             
@@ -287,7 +300,7 @@ class OutlierDetector:
     def detect_outliers_global(self, session: Session, method: str = "ensemble") -> Dict:
         """System-wide outlier detection."""
         try:
-            scores_query = session.query(Score).order_by(Score.timestamp).all()
+            scores_query = session.query(*self._DETAIL_COLUMNS).order_by(Score.timestamp).all()
             
             if not scores_query:
                 logger.warning("No scores found in database")
@@ -342,6 +355,74 @@ class OutlierDetector:
             logger.error(f"Error detecting global outliers: {e}")
             return {"error": str(e)}
     
+    # Batch mode: all groups at once on NumPy columns
+    def load_score_columns(self, session: Session, group_by: str = "username") -> Dict[str, np.ndarray]:
+        """Fetch only id, total_score and the grouping column as NumPy arrays."""
+        if group_by not in self._BATCH_GROUP_COLUMNS:
+            raise ValueError(f"Unsupported group_by: {group_by}")
+        
+        group_column = self._BATCH_GROUP_COLUMNS[group_by]
+        columns = [Score.id, Score.total_score]
+        query_filter = [Score.total_score.isnot(None)]
+        if group_column is not None:
+            columns.append(group_column)
+            query_filter.append(group_column.isnot(None))
+        
+        # Core-level execute skips ORM row processing
+        rows = session.connection().execute(select(*columns).where(*query_filter)).all()
+        
+        if not rows:
+            empty = np.array([], dtype=np.int64)
+            return {"score_ids": empty, "values": empty.astype(float),
+                    "codes": empty, "labels": np.array([], dtype=object)}
+        
+        columns_data = list(zip(*rows))
+        score_ids = np.asarray(columns_data[0], dtype=np.int64)
+        values = np.asarray(columns_data[1], dtype=float)
+        if group_column is not None:
+            # Dense codes in first-seen order (cheaper than np.unique on strings)
+            label_index = {label: code for code, label in enumerate(dict.fromkeys(columns_data[2]))}
+            codes = np.fromiter(map(label_index.__getitem__, columns_data[2]),
+                                dtype=np.int64, count=len(rows))
+            labels = np.empty(len(label_index), dtype=object)
+            labels[:] = list(label_index)
+        else:
+            codes = np.zeros(len(rows), dtype=np.int64)
+            labels = np.array(["global"], dtype=object)
+        
+        return {"score_ids": score_ids, "values": values, "codes": codes, "labels": labels}
+    
+    def detect_outliers_batch(self, session: Session, group_by: str = "username",
+                              method: str = "ensemble",
+                              consensus_threshold: float = 0.5) -> Dict:
+        """Detect outliers for every user / age group in one vectorized pass."""
+        try:
+            columns = self.load_score_columns(session, group_by)
+            masks = grouped_outlier_masks(
+                columns["values"], columns["codes"],
+                zscore_threshold=self.threshold,
+                consensus_threshold=consensus_threshold,
+            )
+            
+            mask_key = method if method in masks else "ensemble"
+            indices = np.flatnonzero(masks[mask_key])
+            
+            return {
+                "scope": group_by,
+                "detection_method": mask_key,
+                "total_scores": int(columns["values"].size),
+                "total_groups": int(columns["labels"].size),
+                "outlier_count": int(indices.size),
+                "indices": indices,
+                "score_ids": columns["score_ids"][indices],
+                "outlier_values": columns["values"][indices],
+                "outlier_groups": columns["labels"][columns["codes"][indices]],
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in batch outlier detection by {group_by}: {e}")
+            return {"error": str(e)}
+    
     def detect_inconsistency_patterns(self, session: Session, username: str,
                                      time_window_days: int = 30) -> Dict:
         """Detect scoring inconsistency over time window."""
@@ -433,5 +514,94 @@ class OutlierDetector:
             return {"error": str(e)}
 
 
+def _group_quantile(sorted_values: np.ndarray, starts: np.ndarray,
+                    counts: np.ndarray, q: float) -> np.ndarray:
+    """Per-group quantile (linear interpolation, like np.percentile) on group-sorted data."""
+    position = np.maximum(counts - 1, 0) * q
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    last = max(sorted_values.size - 1, 0)
+    lo_values = sorted_values[np.minimum(starts + lower, last)]
+    hi_values = sorted_values[np.minimum(starts + upper, last)]
+    return lo_values + (hi_values - lo_values) * (position - lower)
+
+
+def grouped_outlier_masks(values: np.ndarray, codes: np.ndarray,
+                          zscore_threshold: float = 2.5,
+                          iqr_multiplier: float = 1.5,
+                          modified_zscore_threshold: float = 3.5,
+                          mad_threshold: float = 2.5,
+                          consensus_threshold: float = 0.5) -> Dict[str, np.ndarray]:
+    """
+    Vectorized per-group outlier masks for all four detectors plus the ensemble.
+    
+    Each group is evaluated exactly like the list-based OutlierDetector methods
+    (same thresholds, minimum sizes and zero-spread rules), but all groups are
+    handled at once with bincount and a single group-wise sort.
+    
+    Args:
+        values: Score values, one per row
+        codes: Dense group code (0..n_groups-1) for each row
+    
+    Returns:
+        Boolean masks aligned with ``values`` keyed by method name
+    """
+    values = np.asarray(values, dtype=float)
+    codes = np.asarray(codes, dtype=np.int64)
+    if values.size == 0:
+        empty = np.zeros(0, dtype=bool)
+        return {name: empty for name in ("zscore", "iqr", "modified_zscore", "mad", "ensemble")}
+    
+    counts = np.bincount(codes)
+    safe_counts = np.maximum(counts, 1)
+    row_counts = counts[codes]
+    
+    # Z-score (population std, like np.std)
+    means = np.bincount(codes, weights=values) / safe_counts
+    deviations = values - means[codes]
+    stds = np.sqrt(np.bincount(codes, weights=deviations * deviations) / safe_counts)
+    row_stds = stds[codes]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_scores = np.abs(deviations) / row_stds
+    zscore_mask = (row_counts >= 2) & (row_stds > 0) & (z_scores > zscore_threshold)
+    
+    # One sort by (group, value) serves quartiles and medians
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    sorted_values = values[np.lexsort((values, codes))]
+    q1 = _group_quantile(sorted_values, starts, counts, 0.25)
+    q3 = _group_quantile(sorted_values, starts, counts, 0.75)
+    medians = _group_quantile(sorted_values, starts, counts, 0.5)
+    
+    # IQR
+    iqr = q3 - q1
+    lower_bound = (q1 - iqr_multiplier * iqr)[codes]
+    upper_bound = (q3 + iqr_multiplier * iqr)[codes]
+    iqr_mask = (row_counts >= 4) & ((values < lower_bound) | (values > upper_bound))
+    
+    # MAD and modified z-score share the median absolute deviation
+    abs_deviations = np.abs(values - medians[codes])
+    sorted_abs_deviations = abs_deviations[np.lexsort((abs_deviations, codes))]
+    mads = _group_quantile(sorted_abs_deviations, starts, counts, 0.5)
+    row_mads = mads[codes]
+    valid_mad = (row_counts >= 2) & (row_mads > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        modified_z = 0.6745 * abs_deviations / row_mads
+    modified_zscore_mask = valid_mad & (modified_z > modified_zscore_threshold)
+    mad_mask = valid_mad & (abs_deviations > mad_threshold * row_mads)
+    
+    # Ensemble: consensus voting over the four methods
+    votes = (zscore_mask.astype(np.int8) + iqr_mask + modified_zscore_mask + mad_mask)
+    votes_needed = int(np.ceil(4 * consensus_threshold))
+    ensemble_mask = (row_counts >= 2) & (votes >= votes_needed)
+    
+    return {
+        "zscore": zscore_mask,
+        "iqr": iqr_mask,
+        "modified_zscore": modified_zscore_mask,
+        "mad": mad_mask,
+        "ensemble": ensemble_mask,
+    }
+
+
 # Create singleton instance
 outlier_detector = OutlierDetector()
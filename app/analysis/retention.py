@@ -0,0 +1,224 @@
+"""
+Cohort Retention Analysis Module for SOUL_SENSE_EXAM
+
+Population-scale retention reporting over the ``scores`` table. Every report is
+produced in two set-based passes that run entirely inside the database:
+
+1. Weekly cohort matrix - users are bucketed by the week of their first
+   assessment and counted again for every later week they were active.
+2. Time-between-attempts distribution - consecutive attempts are paired with a
+   window function, bucketed, and the returning-user count is folded into the
+   same scan.
+
+Results are cached per data version (row count, max id, max timestamp of the
+``scores`` table), so repeated admin/API requests are free until a new score is
+saved.
+
+The engine only issues plain SQL against the session it is given, which lets
+both the desktop app (``app.db``) and the FastAPI backend reuse it.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Monday of the ISO week for an ISO-8601 timestamp string (SQLite date modifiers)
+WEEK_START_SQL = "date(substr(timestamp, 1, 10), 'weekday 0', '-6 days')"
+
+# Upper bounds (exclusive, in days) for the time-between-attempts histogram
+GAP_BUCKETS: List[Tuple[str, Optional[float]]] = [
+    ("<1d", 1),
+    ("1-7d", 7),
+    ("7-30d", 30),
+    ("30-90d", 90),
+    ("90d+", None),
+]
+
+_COHORT_SQL = f"""
+    WITH activity AS (
+        SELECT username, {WEEK_START_SQL} AS week
+        FROM scores
+        WHERE username IS NOT NULL AND timestamp IS NOT NULL
+        GROUP BY username, week
+    ),
+    cohorts AS (
+        SELECT username, MIN(week) AS cohort_week
+        FROM activity
+        GROUP BY username
+    )
+    SELECT c.cohort_week AS cohort_week,
+           CAST(ROUND((julianday(a.week) - julianday(c.cohort_week)) / 7) AS INTEGER) AS week_offset,
+           COUNT(*) AS active_users
+    FROM activity a
+    JOIN cohorts c ON c.username = a.username
+    GROUP BY c.cohort_week, week_offset
+    ORDER BY c.cohort_week, week_offset
+"""
+
+
+def _gap_bucket_case() -> str:
+    """Build the SQL CASE expression mapping ``gap_days`` to a bucket index."""
+    clauses = [
+        f"WHEN gap_days < {upper} THEN {index}"
+        for index, (_, upper) in enumerate(GAP_BUCKETS)
+        if upper is not None
+    ]
+    return f"CASE WHEN gap_days IS NULL THEN -1 {' '.join(clauses)} ELSE {len(GAP_BUCKETS) - 1} END"
+
+
+_GAP_SQL = f"""
+    WITH ordered AS (
+        SELECT username,
+               julianday(timestamp) - julianday(
+                   LAG(timestamp) OVER (PARTITION BY username ORDER BY timestamp, id)
+               ) AS gap_days,
+               COUNT(*) OVER (PARTITION BY username) AS attempts
+        FROM scores
+        WHERE username IS NOT NULL AND timestamp IS NOT NULL
+    )
+    SELECT {_gap_bucket_case()} AS bucket,
+           COUNT(*) AS n,
+           SUM(gap_days) AS total_gap_days,
+           SUM(CASE WHEN gap_days IS NULL AND attempts >= :min_attempts THEN 1 ELSE 0 END) AS returning_users
+    FROM ordered
+    GROUP BY bucket
+"""
+
+_VERSION_SQL = "SELECT COUNT(id), MAX(id), MAX(timestamp) FROM scores"
+
+
+class RetentionEngine:
+    """Computes and caches cohort retention reports for the whole population."""
+
+    def __init__(self):
+        """Initialize the engine with an empty, version-keyed cache."""
+        self._cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def data_version(self, session: Session) -> Tuple:
+        """
+        Return a cheap fingerprint of the ``scores`` table.
+
+        Any insert or delete changes at least one of the row count, max id or
+        latest timestamp, which invalidates cached reports.
+        """
+        return tuple(session.execute(text(_VERSION_SQL)).one())
+
+    def get_report(self, session: Session, weeks: int = 12, min_attempts: int = 2) -> Dict[str, Any]:
+        """
+        Get the retention report, recomputing only if the data changed.
+
+        Args:
+            session: Active SQLAlchemy session bound to the application database
+            weeks: Number of most recent cohorts (and week offsets) to include
+            min_attempts: Minimum attempts for a user to count as returning
+
+        Returns:
+            Dictionary with ``cohorts``, ``gap_distribution`` and user counts
+        """
+        version = self.data_version(session)
+        key = (version, weeks, min_attempts)
+
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        report = self._compute(session, weeks, min_attempts)
+        report["data_version"] = list(version)
+
+        with self._lock:
+            # Drop reports computed against older data
+            self._cache = {k: v for k, v in self._cache.items() if k[0] == version}
+            self._cache[key] = report
+        return report
+
+    def invalidate(self) -> None:
+        """Clear all cached reports."""
+        with self._lock:
+            self._cache.clear()
+
+    def _compute(self, session: Session, weeks: int, min_attempts: int) -> Dict[str, Any]:
+        """Run both passes and shape the results."""
+        cohort_rows = session.execute(text(_COHORT_SQL)).all()
+        gap_rows = session.execute(text(_GAP_SQL), {"min_attempts": min_attempts}).all()
+
+        report = build_cohort_matrix(cohort_rows, weeks)
+        report.update(build_gap_summary(gap_rows))
+        report["min_attempts"] = min_attempts
+        return report
+
+
+def build_cohort_matrix(rows, weeks: int = 12) -> Dict[str, Any]:
+    """
+    Shape ``(cohort_week, week_offset, active_users)`` rows into a retention matrix.
+
+    Args:
+        rows: Aggregated rows from the cohort pass, ordered by cohort and offset
+        weeks: Number of most recent cohorts (and week offsets) to keep
+
+    Returns:
+        Dictionary with a list of cohorts, each carrying absolute active-user
+        counts and percentage retention per week offset
+    """
+    by_cohort: Dict[str, Dict[int, int]] = {}
+    for cohort_week, week_offset, active_users in rows:
+        by_cohort.setdefault(cohort_week, {})[int(week_offset)] = int(active_users)
+
+    cohorts = []
+    for cohort_week in sorted(by_cohort)[-weeks:] if weeks > 0 else []:
+        offsets = by_cohort[cohort_week]
+        size = offsets.get(0, 0)
+        active = [offsets.get(i, 0) for i in range(weeks)]
+        cohorts.append({
+            "cohort_week": cohort_week,
+            "cohort_size": size,
+            "active_users": active,
+            "retention": [round(n / size * 100, 2) if size else 0.0 for n in active],
+        })
+
+    return {"weeks": weeks, "cohorts": cohorts}
+
+
+def build_gap_summary(rows) -> Dict[str, Any]:
+    """
+    Shape ``(bucket, n, total_gap_days, returning_users)`` rows from the gap pass.
+
+    Bucket ``-1`` holds each user's first attempt, so its count is the number of
+    distinct users and carries the returning-user count.
+    """
+    counts = [0] * len(GAP_BUCKETS)
+    total_users = 0
+    returning_users = 0
+    total_gap_days = 0.0
+    total_gaps = 0
+
+    for bucket, n, gap_days, returning in rows:
+        bucket = int(bucket)
+        if bucket < 0:
+            total_users = int(n)
+            returning_users = int(returning or 0)
+            continue
+        counts[bucket] = int(n)
+        total_gaps += int(n)
+        total_gap_days += float(gap_days or 0)
+
+    return {
+        "total_users": total_users,
+        "returning_users": returning_users,
+        "returning_user_rate": round(returning_users / total_users * 100, 2) if total_users else 0.0,
+        "average_days_between_attempts": round(total_gap_days / total_gaps, 2) if total_gaps else None,
+        "gap_distribution": [
+            {"range": label, "count": count}
+            for (label, _), count in zip(GAP_BUCKETS, counts)
+        ],
+    }
+
+
+# Shared engine instance so the cache is reused across callers
+retention_engine = RetentionEngine()
@@ -0,0 +1,114 @@
+"""
+Streaming per-user score statistics.
+
+Keeps one ``UserScoreStats`` row per user with Welford running mean/variance,
+the last score and the running sum of absolute score changes. The row is
+updated in the same transaction that saves a score, so validating a new score
+is O(1) instead of re-reading the user's whole history. The store can always be
+rebuilt from ``scores`` for backfills or after manual data fixes.
+"""
+
+import logging
+import math
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import Score, UserScoreStats
+
+logger = logging.getLogger(__name__)
+
+
+def apply_score(stats: UserScoreStats, value: float) -> UserScoreStats:
+    """Fold one new score into the running statistics (Welford update)."""
+    count = (stats.count or 0) + 1
+    mean = stats.mean or 0.0
+    delta = value - mean
+    mean += delta / count
+
+    if stats.last_score is not None:
+        stats.abs_change_sum = (stats.abs_change_sum or 0.0) + abs(value - stats.last_score)
+
+    stats.m2 = (stats.m2 or 0.0) + delta * (value - mean)
+    stats.mean = mean
+    stats.count = count
+    stats.last_score = value
+    stats.updated_at = datetime.utcnow().isoformat()
+    return stats
+
+
+def record_score(session: Session, username: str, value: int) -> UserScoreStats:
+    """
+    Update (or create) the running statistics for ``username`` with a new score.
+
+    Call it before the new score is flushed: a user without a stats row yet
+    (e.g. one with scores from before the store existed) is first rebuilt
+    from the scores already in the database, then the new value is applied.
+    """
+    stats = session.query(UserScoreStats).filter_by(username=username).first()
+    if stats is None:
+        with session.no_autoflush:
+            rebuilt = rebuild_user_stats(session, username)
+        if rebuilt:
+            # Sessions here run with autoflush off; make the row visible to the lookup
+            session.flush()
+            stats = session.query(UserScoreStats).filter_by(username=username).first()
+        else:
+            stats = UserScoreStats(username=username, count=0, mean=0.0, m2=0.0, abs_change_sum=0.0)
+            session.add(stats)
+            session.flush()
+    return apply_score(stats, value)
+
+
+def get_user_stats(session: Session, username: str) -> Optional[UserScoreStats]:
+    """Return the stored statistics for ``username``, or None if not tracked yet."""
+    return session.query(UserScoreStats).filter_by(username=username).first()
+
+
+def rebuild_user_stats(session: Session, username: Optional[str] = None) -> int:
+    """
+    Rebuild the store from score history.
+
+    Args:
+        session: Active database session (caller commits)
+        username: Rebuild a single user; all users when omitted
+
+    Returns:
+        Number of users rebuilt
+    """
+    query = session.query(Score.username, Score.total_score).filter(
+        Score.username.isnot(None), Score.total_score.isnot(None)
+    )
+    stats_query = session.query(UserScoreStats)
+    if username is not None:
+        query = query.filter(Score.username == username)
+        stats_query = stats_query.filter(UserScoreStats.username == username)
+
+    stats_query.delete(synchronize_session=False)
+
+    rebuilt: Dict[str, UserScoreStats] = {}
+    for name, value in query.order_by(Score.username, Score.timestamp, Score.id):
+        stats = rebuilt.get(name)
+        if stats is None:
+            stats = UserScoreStats(username=name, count=0, mean=0.0, m2=0.0, abs_change_sum=0.0)
+            rebuilt[name] = stats
+        apply_score(stats, value)
+
+    session.add_all(rebuilt.values())
+    logger.info(f"Rebuilt score statistics for {len(rebuilt)} user(s)")
+    return len(rebuilt)
+
+
+def stats_std(stats: UserScoreStats) -> float:
+    """Population standard deviation of the tracked scores."""
+    if not stats.count or stats.count < 2:
+        return 0.0
+    return math.sqrt(max(stats.m2 or 0.0, 0.0) / stats.count)
+
+
+def stats_average_change(stats: UserScoreStats) -> float:
+    """Mean absolute change between consecutive tracked scores."""
+    if not stats.count or stats.count < 2:
+        return 0.0
+    return (stats.abs_change_sum or 0.0) / (stats.count - 1)
@@ -21,10 +21,72 @@ from typing import Dict, List, Tuple, Optional
 from sqlalchemy import func
 from app.db import safe_db_context
 from app.models import User, Score, Response, JournalEntry
+from app.analysis.retention import retention_engine
 
 logger = logging.getLogger(__name__)
 
 
+def summarize_score_trends(username: str, score_values: List[int], timestamps: List[str]) -> Dict:
+    """
+    Trend statistics for a user's scores, given in chronological order.
+
+    Shared by TimeBasedAnalyzer.analyze_score_trends and the dashboard
+    snapshot, which already holds the user's scores in memory.
+    """
+    if not score_values:
+        return {"error": "No score data available"}
+
+    trend_analysis = {
+        "username": username,
+        "total_attempts": len(score_values),
+        "first_score": score_values[0],
+        "last_score": score_values[-1],
+        "average_score": mean(score_values),
+        "max_score": max(score_values),
+        "min_score": min(score_values),
+        "first_attempt_date": timestamps[0],
+        "last_attempt_date": timestamps[-1],
+    }
+    
+    # Calculate improvement
+    improvement = score_values[-1] - score_values[0]
+    trend_analysis["total_improvement"] = improvement
+    
+    if score_values[0] != 0:
+        trend_analysis["improvement_percentage"] = (improvement / score_values[0]) * 100
+    else:
+        trend_analysis["improvement_percentage"] = 0
+    
+    # Calculate standard deviation if more than one score
+    if len(score_values) > 1:
+        trend_analysis["score_std_dev"] = stdev(score_values)
+        
+        # Calculate moving average (3-point)
+        moving_avgs = []
+        for i in range(len(score_values) - 2):
+            moving_avgs.append(mean(score_values[i:i+3]))
+        trend_analysis["moving_average_3"] = moving_avgs
+    
+    # Determine trend direction
+    if len(score_values) >= 3:
+        recent_avg = mean(score_values[-3:])
+        early_avg = mean(score_values[:3])
+        trend_direction = recent_avg - early_avg
+        
+        if trend_direction > 5:
+            trend_analysis["trend_direction"] = "Strong Upward"
+        elif trend_direction > 0:
+            trend_analysis["trend_direction"] = "Moderate Upward"
+        elif trend_direction < -5:
+            trend_analysis["trend_direction"] = "Strong Downward"
+        elif trend_direction < 0:
+            trend_analysis["trend_direction"] = "Moderate Downward"
+        else:
+            trend_analysis["trend_direction"] = "Stable"
+    
+    return trend_analysis
+
+
 class TimeBasedAnalyzer:
     """Analyzer for temporal patterns in user responses and emotional intelligence scores."""
 
@@ -107,58 +169,11 @@ class TimeBasedAnalyzer:
                 if not scores:
                     return {"error": "No score data available"}
                 
-                score_values = [s.total_score for s in scores]
-                timestamps = [s.timestamp for s in scores]
-                
-                trend_analysis = {
-                    "username": username,
-                    "total_attempts": len(scores),
-                    "first_score": score_values[0],
-                    "last_score": score_values[-1],
-                    "average_score": mean(score_values),
-                    "max_score": max(score_values),
-                    "min_score": min(score_values),
-                    "first_attempt_date": timestamps[0],
-                    "last_attempt_date": timestamps[-1],
-                }
-                
-                # Calculate improvement
-                improvement = score_values[-1] - score_values[0]
-                trend_analysis["total_improvement"] = improvement
-                
-                if score_values[0] != 0:
-                    trend_analysis["improvement_percentage"] = (improvement / score_values[0]) * 100
-                else:
-                    trend_analysis["improvement_percentage"] = 0
-                
-                # Calculate standard deviation if more than one score
-                if len(score_values) > 1:
-                    trend_analysis["score_std_dev"] = stdev(score_values)
-                    
-                    # Calculate moving average (3-point)
-                    moving_avgs = []
-                    for i in range(len(score_values) - 2):
-                        moving_avgs.append(mean(score_values[i:i+3]))
-                    trend_analysis["moving_average_3"] = moving_avgs
-                
-                # Determine trend direction
-                if len(score_values) >= 3:
-                    recent_avg = mean(score_values[-3:])
-                    early_avg = mean(score_values[:3])
-                    trend_direction = recent_avg - early_avg
-                    
-                    if trend_direction > 5:
-                        trend_analysis["trend_direction"] = "Strong Upward"
-                    elif trend_direction > 0:
-                        trend_analysis["trend_direction"] = "Moderate Upward"
-                    elif trend_direction < -5:
-                        trend_analysis["trend_direction"] = "Strong Downward"
-                    elif trend_direction < 0:
-                        trend_analysis["trend_direction"] = "Moderate Downward"
-                    else:
-                        trend_analysis["trend_direction"] = "Stable"
-                
-                return trend_analysis
+                return summarize_score_trends(
+                    username,
+                    [s.total_score for s in scores],
+                    [s.timestamp for s in scores],
+                )
         except Exception as e:
             self.logger.error(f"Error analyzing score trends for {username}: {e}")
             return {}
@@ -308,9 +323,9 @@ class TimeBasedAnalyzer:
                     func.min(Score.timestamp).label("first_attempt"),
                     func.max(Score.timestamp).label("last_attempt"),
                     func.avg(Score.total_score).label("avg_score"),
-                ).group_by(Score.username).filter(
+                ).group_by(Score.username).having(
                     func.count(Score.id) >= min_attempts
-                ).all()
+                ).order_by(func.count(Score.id).desc()).all()
                 
                 returning_users = [
                     {
@@ -323,11 +338,32 @@ class TimeBasedAnalyzer:
                     for user in user_scores
                 ]
                 
-                return sorted(returning_users, key=lambda x: x["total_attempts"], reverse=True)
+                return returning_users
         except Exception as e:
             self.logger.error(f"Error identifying returning users: {e}")
             return []
 
+    def get_retention_report(self, weeks: int = 12, min_attempts: int = 2) -> Dict:
+        """
+        Get population-wide cohort retention analytics.
+        
+        Computed set-based in the database and cached until the scores table changes.
+        
+        Args:
+            weeks: Number of most recent weekly cohorts (and week offsets) to include
+            min_attempts: Minimum number of attempts to be considered a returning user
+            
+        Returns:
+            Dictionary containing the cohort retention matrix, time-between-attempts
+            distribution and returning-user counts
+        """
+        try:
+            with safe_db_context() as session:
+                return retention_engine.get_report(session, weeks=weeks, min_attempts=min_attempts)
+        except Exception as e:
+            self.logger.error(f"Error computing retention report: {e}")
+            return {}
+
     def get_comparative_analysis(self, username: str, lookback_days: int = 30) -> Dict:
         """
         Compare recent user performance with their historical average.
@@ -1,6 +1,7 @@
 import tkinter as tk
 from app import auth
 from app.logger import get_logger
+from app.utils.startup_profiler import startup_profiler
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -101,6 +102,11 @@ class AppAuth:
                  font=("Segoe UI", 10), bg=self.app.colors["bg"], fg=self.app.colors["primary"],
                  bd=0, cursor="hand2").pack()
 
+        # Time-to-login-window milestone for --profile-startup
+        login_win.update_idletasks()
+        startup_profiler.mark("login_window")
+        startup_profiler.finish()
+
     def show_signup_screen(self):
         """Show signup popup window"""
         signup_win = tk.Toplevel(self.app.root)
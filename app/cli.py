@@ -707,10 +707,11 @@ class SoulSenseCLI:
             print("  2. ⏱️  Time-Based Analysis")
             print("  3. 🧠 Emotional Profile")
             print("  4. 💡 AI Insights")
-            print("  5. ← Back to Menu")
+            print("  5. 🔗 Wellbeing Correlations")
+            print("  6. ← Back to Menu")
             print("")
             
-            choice = self.get_input("Select option (1-5): ")
+            choice = self.get_input("Select option (1-6): ")
             
             if choice == '1':
                 self.show_eq_trends()
@@ -721,6 +722,8 @@ class SoulSenseCLI:
             elif choice == '4':
                 self.show_ai_insights()
             elif choice == '5':
+                self.show_correlations()
+            elif choice == '6':
                 return
             else:
                 print("Invalid choice.")
@@ -733,16 +736,9 @@ class SoulSenseCLI:
         print("="*60 + "\n")
         
         try:
-            from app.db import get_connection
-            conn = get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                """SELECT timestamp, total_score FROM scores 
-                   WHERE username = ? ORDER BY timestamp ASC LIMIT 20""",
-                (self.username,)
-            )
-            rows = cursor.fetchall()
+            from app.services.dashboard_snapshot import dashboard_snapshots
+            snapshot = dashboard_snapshots.get(self.username)
+            rows = [(r.timestamp, r.total_score) for r in snapshot.scores_by_time()[:20]]
             
             if not rows:
                 print("No data yet. Take some exams first!")
@@ -780,19 +776,12 @@ class SoulSenseCLI:
         print("="*60 + "\n")
         
         try:
-            from app.db import get_connection
+            from app.services.dashboard_snapshot import dashboard_snapshots
             from datetime import datetime
             
-            conn = get_connection()
-            cursor = conn.cursor()
-            
-            # Get all scores with timestamps
-            cursor.execute(
-                """SELECT timestamp, total_score FROM scores 
-                   WHERE username = ? ORDER BY timestamp DESC""",
-                (self.username,)
-            )
-            rows = cursor.fetchall()
+            # All scores with timestamps, newest first
+            snapshot = dashboard_snapshots.get(self.username)
+            rows = [(r.timestamp, r.total_score) for r in reversed(snapshot.scores_by_time())]
             
             if not rows:
                 print("No data yet.")
@@ -831,6 +820,32 @@ class SoulSenseCLI:
         
         self.get_input("\nPress Enter to continue...")
 
+    def show_correlations(self) -> None:
+        """Display how journal wellbeing metrics relate to EQ scores"""
+        self.clear_screen()
+        print("="*60)
+        print("      W E L L B E I N G   C O R R E L A T I O N S")
+        print("="*60 + "\n")
+        
+        try:
+            from app.analysis.correlation import describe_correlation, get_user_correlations
+            report = get_user_correlations(self.username, method="spearman")
+            
+            if not report["eq_correlations"]:
+                print("Not enough data yet. Log sleep, stress and energy in your journal")
+                print("on days you take an exam (at least 3 days).")
+            else:
+                print(colorize(f"🔗 Spearman correlations over {report['days']} days:", Colors.BOLD))
+                print("")
+                for row in report["eq_correlations"]:
+                    color = Colors.GREEN if row["r"] > 0 else Colors.RED
+                    print("  " + colorize("●", color) + " " + describe_correlation(row))
+                    
+        except Exception as e:
+            print(f"Error: {e}")
+        
+        self.get_input("\nPress Enter to continue...")
+
     def show_emotional_profile(self) -> None:
         """Display emotional profile analysis"""
         self.clear_screen()
@@ -839,17 +854,11 @@ class SoulSenseCLI:
         print("="*60 + "\n")
         
         try:
-            from app.db import get_connection
-            conn = get_connection()
-            cursor = conn.cursor()
+            from app.services.dashboard_snapshot import dashboard_snapshots
+            snapshot = dashboard_snapshots.get(self.username)
             
-            # Get average score and sentiment
-            cursor.execute(
-                """SELECT AVG(total_score), AVG(sentiment_score), COUNT(*) 
-                   FROM scores WHERE username = ?""",
-                (self.username,)
-            )
-            row = cursor.fetchone()
+            # Average score and sentiment
+            row = (snapshot.average_score, snapshot.average_score_sentiment, snapshot.score_count)
             
             if not row or row[2] == 0:
                 print("No data yet. Take some exams first!")
@@ -900,17 +909,14 @@ class SoulSenseCLI:
         print("="*60 + "\n")
         
         try:
-            from app.db import get_connection
-            conn = get_connection()
-            cursor = conn.cursor()
+            from app.services.dashboard_snapshot import dashboard_snapshots
+            snapshot = dashboard_snapshots.get(self.username)
             
-            # Get user data
-            cursor.execute(
-                """SELECT total_score, sentiment_score, is_rushed, is_inconsistent 
-                   FROM scores WHERE username = ? ORDER BY timestamp DESC LIMIT 5""",
-                (self.username,)
-            )
-            rows = cursor.fetchall()
+            # Five most recent exams
+            rows = [
+                (r.total_score, r.sentiment_score, r.is_rushed, r.is_inconsistent)
+                for r in reversed(snapshot.scores_by_time()[-5:])
+            ]
             
             if not rows:
                 print("Not enough data for AI insights. Take some exams first!")
@@ -79,7 +79,8 @@ DEFAULT_CONFIG: Dict[str, Dict[str, Any]] = {
     },
     "ui": {
         "theme": "light",
-        "window_size": "800x600"
+        "window_size": "800x600",
+        "view_cache_size": 3
     },
     "features": {
         "enable_journal": True,
@@ -181,6 +182,8 @@ else:
 
 # UI Settings
 THEME: str = _config["ui"]["theme"]
+# Number of rendered views kept alive when switching (0 disables view caching)
+VIEW_CACHE_SIZE: int = get_env_var("VIEW_CACHE_SIZE", _config["ui"]["view_cache_size"], int)
 
 # Feature Toggles (env vars take precedence over config file)
 _cfg_journal = _config["features"]["enable_journal"]
@@ -0,0 +1,57 @@
+"""
+In-process data-change notifications.
+
+Services publish an event after a write commits; caches that hold derived
+data (e.g. the ViewManager view cache) subscribe and invalidate themselves.
+
+Callbacks run synchronously on the publishing thread, so subscribers that
+touch Tk widgets should only record the change and act on it later from
+the UI thread.
+
+Usage:
+    from app.events import subscribe, publish, SCORE_SAVED
+
+    subscribe(SCORE_SAVED, lambda **payload: ...)
+    publish(SCORE_SAVED, username="alice")
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Event names
+SCORE_SAVED = "score_saved"
+JOURNAL_SAVED = "journal_saved"
+SATISFACTION_SAVED = "satisfaction_saved"
+ASSESSMENT_SAVED = "assessment_saved"
+THEME_CHANGED = "theme_changed"
+
+_subscribers: Dict[str, List[Callable[..., None]]] = {}
+_lock = threading.Lock()
+
+
+def subscribe(event: str, callback: Callable[..., None]) -> None:
+    """Register ``callback`` to be called with the payload of every ``event``."""
+    with _lock:
+        _subscribers.setdefault(event, []).append(callback)
+
+
+def unsubscribe(event: str, callback: Callable[..., None]) -> None:
+    """Remove a callback registered with subscribe(); unknown callbacks are ignored."""
+    with _lock:
+        callbacks = _subscribers.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+
+def publish(event: str, **payload: Any) -> None:
+    """Notify subscribers of ``event``. Subscriber errors are logged, never raised."""
+    with _lock:
+        callbacks = list(_subscribers.get(event, []))
+    for callback in callbacks:
+        try:
+            callback(**payload)
+        except Exception as e:
+            logger.error(f"Event subscriber for '{event}' failed: {e}")
@@ -4,14 +4,27 @@ SoulSense Main Application Entry Point
 This module serves as the central entry point for the SoulSense EQ assessment application.
 It orchestrates the complete application lifecycle from startup validation through
 graceful shutdown, coordinating all major subsystems and ensuring proper initialization order.
+
+Pass --profile-startup (or set SOULSENSE_PROFILE_STARTUP=1) to print per-module
+import times and per-phase init times once the login window is up, and
+--full-check to re-run every startup integrity check instead of reusing the
+cached result for an unchanged install.
 """
 
+# === STARTUP PROFILING ===
+# Must be enabled before the application imports below so their cost is recorded
+from app.utils.startup_profiler import startup_profiler, profiling_requested
+if __name__ == "__main__" and profiling_requested():
+    startup_profiler.enable()
+
 # === CORE UI FRAMEWORK ===
+import sys
 import tkinter as tk
 from tkinter import messagebox
 
 # === LOGGING AND ERROR HANDLING ===
 import logging
+import threading
 from app.logger import setup_logging
 from app.error_handler import setup_global_exception_handlers
 
@@ -175,6 +188,15 @@ class SoulSenseApp:
 # These functions provide application-wide error handling and user notification
 # They ensure errors are properly logged and displayed to users in a user-friendly way
 
+def _warm_up_ml_models():
+    """Preload ML models into the shared model cache (runs off the UI thread)."""
+    try:
+        from app.ml.model_cache import warm_up_models
+        warm_up_models()
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"ML model warm-up skipped: {e}")
+
+
 def show_error(title, message, exception=None):
     """
     Global error display function that handles both logging and user notification.
@@ -226,7 +248,13 @@ if __name__ == "__main__":
         try:
             # Execute all startup checks with critical failure handling
             # If any critical check fails, the application will not start
-            results = run_all_checks(raise_on_critical=True)
+            # Unchanged installs reuse the last clean result; --full-check forces a re-run
+            with startup_profiler.phase("startup_checks"):
+                results = run_all_checks(
+                    raise_on_critical=True,
+                    use_cache=True,
+                    full_check="--full-check" in sys.argv,
+                )
             summary = get_check_summary(results)
             logger.info(summary)
 
@@ -260,12 +288,18 @@ if __name__ == "__main__":
         # Preload question data into memory cache before GUI initialization
         # This improves application responsiveness by avoiding lazy-loading delays
         logger.info("Preloading questions into memory...")
-        if not initialize_questions():
+        with startup_profiler.phase("initialize_questions"):
+            questions_loaded = initialize_questions()
+        if not questions_loaded:
             logger.warning("Initial question preload failed. Application will attempt lazy-loading.")
 
+        # Unpickle ML models on a background thread so the first prediction is warm
+        threading.Thread(target=_warm_up_ml_models, name="ml-warmup", daemon=True).start()
+
         # === PHASE 4: GUI Framework Initialization ===
         # Create the main Tkinter root window - foundation for all UI components
-        root = tk.Tk()
+        with startup_profiler.phase("tk_root"):
+            root = tk.Tk()
 
         # === PHASE 5: Exception Handling Setup ===
         # Register Tkinter-specific exception handler for GUI callback errors
@@ -288,7 +322,8 @@ if __name__ == "__main__":
         # === PHASE 6: Application Core Initialization ===
         # Create the main SoulSenseApp instance with all modules and managers
         # This is the central application object that coordinates all functionality
-        app = SoulSenseApp(root)
+        with startup_profiler.phase("app_init"):
+            app = SoulSenseApp(root)
 
         # === PHASE 7: Shutdown Handling Setup ===
         # Register multiple shutdown mechanisms for graceful application termination
@@ -1,5 +1,18 @@
-from .risk_predictor import RiskPredictor
-from .bias_checker import SimpleBiasChecker
-from .versioning import ModelVersioningManager
-from .clustering import EmotionalProfileClusterer
-from .score_analyzer import ScoreAnalyzer
+from app.utils.lazy_imports import lazy_exports
+
+# Submodules pull in pandas/sklearn/seaborn; import them only when used
+__all__ = [
+    "RiskPredictor",
+    "SimpleBiasChecker",
+    "ModelVersioningManager",
+    "EmotionalProfileClusterer",
+    "ScoreAnalyzer",
+]
+
+__getattr__ = lazy_exports(__name__, {
+    "RiskPredictor": ".risk_predictor",
+    "SimpleBiasChecker": ".bias_checker",
+    "ModelVersioningManager": ".versioning",
+    "EmotionalProfileClusterer": ".clustering",
+    "ScoreAnalyzer": ".score_analyzer",
+})
@@ -39,16 +39,15 @@ def _get_sklearn_imports():
 # from sklearn.metrics import silhouette_score, calinski_harabasz_score, davies_bouldin_score
 # from sklearn.manifold import TSNE
 
-# Optional visualization imports
-try:
-    import matplotlib.pyplot as plt
-    import seaborn as sns
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# Optional visualization imports (deferred until a chart is drawn)
+from app.utils.lazy_imports import lazy_import, module_available, select_agg_backend
+MATPLOTLIB_AVAILABLE = module_available("matplotlib") and module_available("seaborn")
+plt = lazy_import("matplotlib.pyplot", before_import=select_agg_backend)
+sns = lazy_import("seaborn", before_import=select_agg_backend)
 
 # Database imports
 from app.db import get_session, safe_db_context
+from app.ml.feature_store import feature_store
 from app.models import Score, Response, User
 
 logger = logging.getLogger(__name__)
@@ -287,33 +286,85 @@ class EmotionalFeatureExtractor:
     def extract_all_users_features(self) -> pd.DataFrame:
         """Extract features for all users in the database.
 
+        Reads the score and response snapshots of the feature store (refreshed
+        incrementally from the database) and computes every user's features
+        with grouped operations, instead of two queries per user.
+
         Returns:
             pd.DataFrame: DataFrame containing features for all users with sufficient data.
         """
-        features_list = []
-        
         try:
             with safe_db_context() as session:
-                # Get all unique usernames
-                usernames = session.query(Score.username).distinct().all()
-                usernames = [u[0] for u in usernames if u[0]]
-                
+                scores = feature_store.snapshot(
+                    session, "scores", columns=["username", "total_score", "sentiment_score", "timestamp"]
+                )
+                responses = feature_store.snapshot(session, "responses", columns=["username", "response_value"])
         except Exception as e:
-            logger.error(f"Error getting usernames: {e}")
+            logger.error(f"Error loading feature snapshots: {e}")
             return pd.DataFrame()
-        
-        for username in usernames:
-            features = self.extract_user_features(username)
-            if features:
-                features_list.append(features)
-        
-        if not features_list:
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(features_list)
-        logger.info(f"Extracted features for {len(df)} users")
+
+        df = self.features_from_frames(scores, responses)
+        if not df.empty:
+            logger.info(f"Extracted features for {len(df)} users")
         return df
-    
+
+    def features_from_frames(self, scores: pd.DataFrame, responses: pd.DataFrame) -> pd.DataFrame:
+        """Compute :meth:`extract_user_features` for every user from score/response frames.
+
+        Args:
+            scores (pd.DataFrame): Columns username, total_score, sentiment_score, timestamp.
+            responses (pd.DataFrame): Columns username, response_value.
+
+        Returns:
+            pd.DataFrame: One row per user with at least one valid total score.
+        """
+        scores = scores[scores['username'].fillna('') != '']
+        scores = scores.sort_values(['username', 'timestamp'], kind='stable')
+        if scores.empty:
+            return pd.DataFrame()
+
+        by_user = scores.groupby('username', sort=True)
+        valid = scores[scores['total_score'].notna()]
+        totals = valid.groupby('username')['total_score']
+        sentiments = scores.groupby('username')['sentiment_score']
+
+        # Trend: correlation of each user's valid scores with their position in time
+        position = valid.groupby('username').cumcount().astype(float)
+        dx = position - position.groupby(valid['username']).transform('mean')
+        dy = valid['total_score'] - totals.transform('mean')
+        sums = pd.DataFrame({'xy': dx * dy, 'xx': dx * dx, 'yy': dy * dy,
+                             'username': valid['username']}).groupby('username').sum()
+        denominator = np.sqrt(sums['xx'] * sums['yy'])
+        trend = (sums['xy'] / denominator.where(denominator > 0)).fillna(0.0)
+
+        features = pd.DataFrame({
+            'avg_total_score': totals.mean(),
+            'score_std': totals.std(ddof=0),
+            'avg_sentiment': sentiments.mean(),
+            'sentiment_std': sentiments.std(ddof=0),
+            'score_trend': trend,
+            'emotional_range': totals.max() - totals.min(),
+            'assessment_frequency': by_user.size(),
+        }).dropna(subset=['avg_total_score'])
+
+        # Response pattern features (users without responses get the neutral defaults)
+        responses = responses[responses['username'].isin(features.index)]
+        values = responses.groupby('username')['response_value']
+        answered = responses.groupby('username').size().reindex(features.index, fill_value=0)
+        n_values = values.count().reindex(features.index, fill_value=0)
+        variance = values.var(ddof=0).reindex(features.index)
+
+        consistency = (1 - variance / 4.0).clip(0, 1)
+        features['response_consistency'] = consistency.where(n_values >= 2, 1.0).where(answered > 0, 0.0)
+        features['avg_response_value'] = values.mean().reindex(features.index).fillna(2.5)
+        features['response_variance'] = variance.where(n_values >= 2, 0.0)
+        features = features.fillna({'avg_sentiment': 0.0, 'sentiment_std': 0.0})
+
+        features = features.rename_axis('username').reset_index()
+        return features[['username', 'avg_total_score', 'score_std', 'avg_sentiment', 'sentiment_std',
+                         'score_trend', 'response_consistency', 'emotional_range',
+                         'assessment_frequency', 'avg_response_value', 'response_variance']]
+
     def _calculate_trend(self, scores: List[float]) -> float:
         """Calculate score trend using linear correlation.
 
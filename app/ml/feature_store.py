@@ -0,0 +1,356 @@
+"""
+Feature Store for SOUL_SENSE_EXAM ML training
+
+Materializes the tables the training code learns from (scores, responses and
+journal entries) into versioned, columnar snapshots on disk, so retraining and
+experiments read NumPy arrays instead of re-scanning the live SQLite database.
+
+Layout (one directory per table):
+
+    data/feature_store/scores/
+        manifest.json            # columns, watermark and the list of versions
+        part-00001/id.npy        # one .npy file per numeric column
+        part-00001/username.bytes.npy, username.offsets.npy   # UTF-8 strings
+        part-00002/...           # rows appended by a later refresh
+
+Every column is a plain ``.npy`` file, so snapshots are opened with
+``np.load(mmap_mode="r")`` and only the pages a caller touches are read.
+
+A refresh reads the table in one set-based ``SELECT``. Later refreshes only
+fetch rows whose timestamp is at or after the stored watermark and write them
+as a new part. A version is the list of parts it is made of, so a model trained
+on version N can always be retrained on exactly the same rows.
+
+If the number of rows stamped before the watermark no longer matches the
+snapshot (rows were deleted, or rows arrived with an older or missing
+timestamp), the table is rebuilt in full. Rows edited in place are not
+detected; call ``refresh(..., full=True)`` after such edits.
+
+Usage:
+    from app.ml.feature_store import feature_store
+
+    with safe_db_context() as session:
+        scores = feature_store.snapshot(session, "scores")
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+
+from app.config import DATA_DIR
+from app.utils.atomic import atomic_write
+from app.utils.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = os.path.join(DATA_DIR, "feature_store")
+MANIFEST_NAME = "manifest.json"
+
+# Column kinds: numbers are stored as fixed dtypes (NULL -> NaN for floats),
+# strings as UTF-8 bytes plus offsets (NULL -> "")
+KIND_DTYPES = {"int": np.int64, "float": np.float64}
+
+
+@dataclass(frozen=True)
+class FeatureTable:
+    """Source table and column kinds of one snapshot."""
+
+    source: str
+    columns: Tuple[Tuple[str, str], ...]
+    watermark: str
+    where: str = ""
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _ in self.columns]
+
+    def select_sql(self, incremental: bool) -> str:
+        conditions = [c for c in (self.where, f"{self.watermark} >= :watermark" if incremental else "") if c]
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return (f"SELECT {', '.join(self.names)} FROM {self.source} {where} "
+                f"ORDER BY {self.watermark}, id")
+
+    def count_sql(self) -> str:
+        where = f"AND {self.where}" if self.where else ""
+        return (f"SELECT COUNT(id) FROM {self.source} "
+                f"WHERE ({self.watermark} IS NULL OR {self.watermark} < :watermark) {where}")
+
+
+TABLES: Dict[str, FeatureTable] = {
+    "scores": FeatureTable(
+        source="scores",
+        columns=(
+            ("id", "int"), ("username", "str"), ("user_id", "float"), ("total_score", "float"),
+            ("sentiment_score", "float"), ("age", "float"), ("timestamp", "str"),
+        ),
+        watermark="timestamp",
+    ),
+    "responses": FeatureTable(
+        source="responses",
+        columns=(
+            ("id", "int"), ("username", "str"), ("user_id", "float"), ("question_id", "float"),
+            ("response_value", "float"), ("timestamp", "str"),
+        ),
+        watermark="timestamp",
+    ),
+    "journal_entries": FeatureTable(
+        source="journal_entries",
+        columns=(
+            ("id", "int"), ("username", "str"), ("user_id", "float"), ("entry_date", "str"),
+            ("content", "str"), ("sentiment_score", "float"), ("emotional_patterns", "str"),
+            ("sleep_hours", "float"), ("stress_level", "float"), ("energy_level", "float"),
+            ("screen_time_mins", "float"),
+        ),
+        watermark="entry_date",
+        where="(is_deleted IS NULL OR is_deleted = 0)",
+    ),
+}
+
+
+def _source_id(session) -> str:
+    """Identify the database behind a Session or Connection."""
+    bind = session.get_bind() if hasattr(session, "get_bind") else getattr(session, "engine", None)
+    url = getattr(bind, "url", None)
+    return url.render_as_string(hide_password=True) if url is not None else ""
+
+
+def _to_column(values: Sequence[Any], kind: str) -> np.ndarray:
+    if kind == "float":
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return np.array(values, dtype=KIND_DTYPES[kind])
+
+
+def _encode_strings(values: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [b"" if v is None else str(v).encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _decode_strings(data: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    raw = bytes(data)
+    out = np.empty(len(offsets) - 1, dtype=object)
+    for i in range(len(out)):
+        out[i] = raw[offsets[i]:offsets[i + 1]].decode("utf-8")
+    return out
+
+
+class FeatureStore:
+    """Versioned, columnar snapshots of the training tables."""
+
+    def __init__(self, root: str = DEFAULT_ROOT, tables: Optional[Dict[str, FeatureTable]] = None):
+        """
+        Args:
+            root: Directory holding one sub-directory per table
+            tables: Table definitions (defaults to TABLES)
+        """
+        self.root = Path(root)
+        self.tables = tables or TABLES
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------------- manifest
+
+    def _spec(self, table: str) -> FeatureTable:
+        if table not in self.tables:
+            raise ValueError(f"Unknown feature table: {table}. Choose from {list(self.tables)}")
+        return self.tables[table]
+
+    def _table_dir(self, table: str) -> Path:
+        self._spec(table)
+        return self.root / table
+
+    def manifest(self, table: str) -> Dict[str, Any]:
+        """Manifest of ``table`` (empty version list if never materialized)."""
+        path = self._table_dir(table) / MANIFEST_NAME
+        if not path.exists():
+            return {"table": table, "source": None, "next_part": 1, "versions": []}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_manifest(self, table: str, manifest: Dict[str, Any]) -> None:
+        with atomic_write(str(self._table_dir(table) / MANIFEST_NAME)) as f:
+            json.dump(manifest, f, indent=2)
+
+    def versions(self, table: str) -> List[Dict[str, Any]]:
+        """All versions of ``table``, oldest first."""
+        return self.manifest(table)["versions"]
+
+    def current_version(self, table: str) -> Optional[int]:
+        """Latest version number of ``table`` (None if never materialized)."""
+        versions = self.versions(table)
+        return versions[-1]["version"] if versions else None
+
+    def _get_version(self, manifest: Dict[str, Any], version: Optional[int]) -> Optional[Dict[str, Any]]:
+        if not manifest["versions"]:
+            return None
+        if version is None:
+            return manifest["versions"][-1]
+        for entry in manifest["versions"]:
+            if entry["version"] == version:
+                return entry
+        raise ValueError(f"Version {version} of {manifest['table']} not found")
+
+    # ------------------------------------------------------------ refresh
+
+    def refresh(self, session, table: str, full: bool = False) -> Dict[str, Any]:
+        """
+        Bring the snapshot of ``table`` up to date with the database.
+
+        Args:
+            session: SQLAlchemy Session or Connection to read from
+            table: Name of a table in ``self.tables``
+            full: Rebuild from scratch instead of appending new rows
+
+        Returns:
+            The manifest entry of the current version
+        """
+        spec = self._spec(table)
+        with self._lock:
+            manifest = self.manifest(table)
+            current = self._get_version(manifest, None)
+            source = _source_id(session)
+
+            if current is not None and not full:
+                if manifest.get("source") != source or current["watermark"] is None:
+                    full = True
+                else:
+                    # Rows strictly before the watermark can no longer change in an append-only table
+                    settled = session.execute(text(spec.count_sql()),
+                                              {"watermark": current["watermark"]}).scalar()
+                    if settled != current["rows"] - current["at_watermark"]:
+                        logger.info(f"Feature store {table}: rows before the watermark changed; rebuilding")
+                        full = True
+
+            base = current if current is not None and not full else None
+            params = {"watermark": base["watermark"]} if base else {}
+            rows = session.execute(text(spec.select_sql(incremental=base is not None)), params).all()
+
+            if base and rows:
+                # Rows stamped exactly at the watermark may already be stored
+                ids = np.array([row[0] for row in rows], dtype=np.int64)
+                known_ids = self._read_parts(table, base["parts"], ["id"])["id"]
+                rows = [row for row, seen in zip(rows, np.isin(ids, known_ids)) if not seen]
+                if not rows:
+                    return base
+
+            number = manifest["next_part"]
+            while (self._table_dir(table) / f"part-{number:05d}").exists():
+                number += 1  # left behind by a refresh that failed before its manifest was saved
+            part = f"part-{number:05d}"
+            self._write_part(table, part, rows)
+
+            position = spec.names.index(spec.watermark)
+            stamps = [row[position] for row in rows if row[position] is not None]
+            watermark = max(stamps + ([base["watermark"]] if base else []), default=None)
+            at_watermark = sum(1 for stamp in stamps if stamp == watermark)
+            if base and base["watermark"] == watermark:
+                at_watermark += base["at_watermark"]
+
+            entry = {
+                "version": (current["version"] + 1) if current is not None else 1,
+                "parts": (base["parts"] if base else []) + [part],
+                "rows": (base["rows"] if base else 0) + len(rows),
+                "watermark": watermark,
+                "at_watermark": at_watermark,
+                "created_at": datetime.now().isoformat(),
+            }
+            manifest.update(source=source, next_part=number + 1,
+                            columns=dict(spec.columns))
+            manifest["versions"].append(entry)
+            self._write_manifest(table, manifest)
+
+        logger.info(f"Feature store {table}: version {entry['version']} "
+                    f"({len(rows)} {'new' if base else 'total'} rows, {entry['rows']} in snapshot)")
+        return entry
+
+    def _write_part(self, table: str, part: str, rows: Sequence[Tuple]) -> None:
+        spec = self._spec(table)
+        table_dir = self._table_dir(table)
+        table_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=table_dir, prefix=f".{part}_"))
+        try:
+            columns = list(zip(*rows)) if rows else [()] * len(spec.columns)
+            for (name, kind), values in zip(spec.columns, columns):
+                if kind == "str":
+                    data, offsets = _encode_strings(values)
+                    np.save(staging / f"{name}.bytes.npy", data)
+                    np.save(staging / f"{name}.offsets.npy", offsets)
+                else:
+                    np.save(staging / f"{name}.npy", _to_column(values, kind))
+            os.replace(staging, table_dir / part)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    # --------------------------------------------------------------- read
+
+    def _read_parts(self, table: str, parts: Sequence[str], columns: Sequence[str],
+                    mmap: bool = True) -> Dict[str, np.ndarray]:
+        kinds = dict(self._spec(table).columns)
+        mode = "r" if mmap else None
+        out = {}
+        for name in columns:
+            chunks = []
+            for part in parts:
+                part_dir = self._table_dir(table) / part
+                if kinds[name] == "str":
+                    chunks.append(_decode_strings(np.load(part_dir / f"{name}.bytes.npy", mmap_mode=mode),
+                                                  np.load(part_dir / f"{name}.offsets.npy", mmap_mode=mode)))
+                else:
+                    chunks.append(np.load(part_dir / f"{name}.npy", mmap_mode=mode))
+            if len(chunks) == 1:
+                out[name] = chunks[0]
+            elif chunks:
+                out[name] = np.concatenate(chunks)
+            else:
+                out[name] = np.array([], dtype=object if kinds[name] == "str" else KIND_DTYPES[kinds[name]])
+        return out
+
+    def load_columns(self, table: str, columns: Optional[Sequence[str]] = None,
+                     version: Optional[int] = None, mmap: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Read columns of a snapshot as NumPy arrays.
+
+        Numeric columns of a single-part version are returned as read-only
+        memory maps; string columns are decoded to object arrays.
+
+        Args:
+            table: Table name
+            columns: Columns to read (default: all)
+            version: Version to read (default: latest)
+            mmap: Memory-map numeric columns instead of reading them into RAM
+        """
+        spec = self._spec(table)
+        columns = list(columns or spec.names)
+        unknown = set(columns) - set(spec.names)
+        if unknown:
+            raise ValueError(f"Unknown columns for {table}: {sorted(unknown)}")
+        entry = self._get_version(self.manifest(table), version)
+        return self._read_parts(table, entry["parts"] if entry else [], columns, mmap=mmap)
+
+    def load_frame(self, table: str, columns: Optional[Sequence[str]] = None,
+                   version: Optional[int] = None):
+        """Read a snapshot as a pandas DataFrame (see :meth:`load_columns`)."""
+        columns = list(columns or self._spec(table).names)
+        return pd.DataFrame(self.load_columns(table, columns, version), columns=columns)
+
+    def snapshot(self, session, table: str, columns: Optional[Sequence[str]] = None):
+        """Refresh ``table`` from ``session`` and return the latest snapshot as a DataFrame."""
+        version = self.refresh(session, table)["version"]
+        return self.load_frame(table, columns, version)
+
+
+# Shared store used by the training code
+feature_store = FeatureStore()
@@ -16,17 +16,75 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
 
 from app.db import get_session
+from app.ml.feature_store import feature_store
 from app.models import Score, UserStrengths, UserEmotionalPatterns, User
 
 logger = logging.getLogger(__name__)
 
+# Score columns the training frame is built from
+SCORE_COLUMNS = ["user_id", "total_score", "sentiment_score", "age", "timestamp"]
+
+# Assumed maximum EQ score when estimating room for growth
+MAX_SCORE = 25
+
+
+def build_training_frame(scores: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the insights model's features and target from score rows.
+
+    Per-user score variance and improvement potential are computed for all
+    users at once with grouped window operations, rather than with a
+    database query and a Python loop per score.
+
+    Improvement potential is the slope of a user's scores over their
+    assessment sequence (times 5) plus 10% of the remaining room to
+    MAX_SCORE, and 0 for users with a single score.
+
+    Args:
+        scores: Columns of SCORE_COLUMNS; rows without a user or total score are ignored
+
+    Returns:
+        One row per score, ordered by user and time, with the model's feature
+        columns, ``user_id``, ``timestamp`` and ``improvement_potential``
+    """
+    df = scores.loc[scores['user_id'].notna() & scores['total_score'].notna(), SCORE_COLUMNS]
+    df = df.sort_values(['user_id', 'timestamp'], kind='stable').reset_index(drop=True)
+    df['user_id'] = df['user_id'].astype(int)
+    df['age'] = df['age'].replace(0, np.nan).fillna(25)
+    df['sentiment_score'] = df['sentiment_score'].fillna(0.0)
+
+    users = df.groupby('user_id')
+    count = users['total_score'].transform('size')
+    mean = users['total_score'].transform('mean')
+    df['score_variance'] = users['total_score'].transform('var', ddof=0).where(count >= 2, 0.0)
+
+    # Least-squares slope of score against position in the user's history
+    position = users.cumcount().astype(float)
+    dx = position - (count - 1) / 2
+    dy = df['total_score'] - mean
+    sums = pd.DataFrame({'xy': dx * dy, 'xx': dx * dx}).groupby(df['user_id']).transform('sum')
+    slope = (sums['xy'] / sums['xx'].where(sums['xx'] > 0)).fillna(0.0)
+    df['improvement_potential'] = (slope * 5 + (MAX_SCORE - mean) * 0.1).where(count >= 2, 0.0)
+
+    df['avg_response'] = df['total_score'] / 5  # Assuming 5 questions
+    df['question_count'] = 5
+    df['time_per_question'] = 60  # Default assumption
+    return df
+
+
 class EQInsightsGenerator:
     """
     Generates personalized EQ insights and recommendations using ML techniques.
     """
 
-    def __init__(self):
-        """Initialize the insights generator."""
+    def __init__(self, load_model: bool = True):
+        """
+        Initialize the insights generator.
+
+        Args:
+            load_model: Load the saved model, or train one from the database
+                when none exists (False leaves the generator untrained)
+        """
         self.model = None
         self.scaler = None
         self.cluster_model = None
@@ -39,7 +97,8 @@ class EQInsightsGenerator:
         ]
 
         # Load or train model
-        self._load_or_train_model()
+        if load_model:
+            self._load_or_train_model()
 
     def _load_or_train_model(self) -> None:
         """Load existing model or train new one from historical data."""
@@ -69,81 +128,66 @@ class EQInsightsGenerator:
         try:
             session = get_session()
             try:
-                # Get historical scores with user data
-                scores_query = session.query(
-                    Score.id, Score.username, Score.total_score, Score.sentiment_score,
-                    Score.age, Score.user_id, Score.timestamp
-                ).filter(Score.user_id.isnot(None)).all()
-
-                if len(scores_query) < 10:
-                    logger.warning("Insufficient data for training ML model")
-                    return
-
-                # Convert to DataFrame
-                data = []
-                for score in scores_query:
-                    # Calculate additional features
-                    score_variance = self._calculate_score_variance(session, score.user_id)
-                    avg_response = score.total_score / 5  # Assuming 5 questions
-                    question_count = 5
-                    time_per_question = 60  # Default assumption
-
-                    data.append({
-                        'user_id': score.user_id,
-                        'age': score.age or 25,
-                        'total_score': score.total_score,
-                        'sentiment_score': score.sentiment_score or 0.0,
-                        'score_variance': score_variance,
-                        'avg_response': avg_response,
-                        'question_count': question_count,
-                        'time_per_question': time_per_question,
-                        'timestamp': score.timestamp
-                    })
-
-                df = pd.DataFrame(data)
-
-                # Create target variable: improvement potential (future score - current score)
-                df['improvement_potential'] = self._calculate_improvement_potential(df)
-
-                # Prepare features and target
-                X = df[self.feature_columns]
-                y = df['improvement_potential']
-
-                # Split data
-                X_train, X_test, y_train, y_test = train_test_split(
-                    X, y, test_size=0.2, random_state=42
-                )
-
-                # Scale features
-                self.scaler = StandardScaler()
-                X_train_scaled = self.scaler.fit_transform(X_train)
-                X_test_scaled = self.scaler.transform(X_test)
-
-                # Train regression model
-                self.model = LinearRegression()
-                self.model.fit(X_train_scaled, y_train)
-
-                # Train clustering model for user segmentation
-                self.cluster_model = KMeans(n_clusters=3, random_state=42)
-                self.cluster_model.fit(X_train_scaled)
-
-                # Evaluate model
-                y_pred = self.model.predict(X_test_scaled)
-                mse = mean_squared_error(y_test, y_pred)
-                r2 = r2_score(y_test, y_pred)
-
-                logger.info(f"Trained EQ insights model - MSE: {mse:.2f}, R²: {r2:.2f}")
-                self.is_trained = True
-
-                # Save model
-                self._save_model()
-
+                # Get historical scores with user data from the feature store snapshot
+                scores = feature_store.snapshot(session, "scores", columns=SCORE_COLUMNS)
             finally:
                 session.close()
 
+            if self.train_from_scores(scores):
+                self._save_model()
+
         except Exception as e:
             logger.error(f"Failed to train ML model: {e}")
 
+    def train_from_scores(self, scores: pd.DataFrame) -> Optional[Dict[str, float]]:
+        """
+        Fit the regression and clustering models on a frame of score rows.
+
+        Args:
+            scores: Columns of SCORE_COLUMNS, one row per saved score
+
+        Returns:
+            Test-set metrics (``mse``, ``r2``), or None if there is too little data
+        """
+        df = build_training_frame(scores)
+        if len(df) < 10:
+            logger.warning("Insufficient data for training ML model")
+            return None
+        return self._fit_models(df)
+
+    def _fit_models(self, df: pd.DataFrame) -> Dict[str, float]:
+        """Fit scaler, regression and clustering models on a training frame."""
+        # Prepare features and target
+        X = df[self.feature_columns]
+        y = df['improvement_potential']
+
+        # Split data
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42
+        )
+
+        # Scale features
+        self.scaler = StandardScaler()
+        X_train_scaled = self.scaler.fit_transform(X_train)
+        X_test_scaled = self.scaler.transform(X_test)
+
+        # Train regression model
+        self.model = LinearRegression()
+        self.model.fit(X_train_scaled, y_train)
+
+        # Train clustering model for user segmentation
+        self.cluster_model = KMeans(n_clusters=3, random_state=42)
+        self.cluster_model.fit(X_train_scaled)
+
+        # Evaluate model
+        y_pred = self.model.predict(X_test_scaled)
+        mse = mean_squared_error(y_test, y_pred)
+        r2 = r2_score(y_test, y_pred)
+
+        logger.info(f"Trained EQ insights model - MSE: {mse:.2f}, R²: {r2:.2f}")
+        self.is_trained = True
+        return {'mse': mse, 'r2': r2}
+
     def _calculate_score_variance(self, session, user_id: int) -> float:
         """Calculate score variance for a user."""
         try:
@@ -160,38 +204,6 @@ class EQInsightsGenerator:
         except Exception:
             return 0.0
 
-    def _calculate_improvement_potential(self, df: pd.DataFrame) -> pd.Series:
-        """Calculate improvement potential based on historical trends."""
-        improvement_potentials = []
-
-        for user_id in df['user_id'].unique():
-            user_scores = df[df['user_id'] == user_id].sort_values('timestamp')
-
-            if len(user_scores) < 2:
-                improvement_potentials.extend([0.0] * len(user_scores))
-                continue
-
-            # Calculate trend (simple linear regression on scores over time)
-            scores = user_scores['total_score'].values
-            times = np.arange(len(scores))
-
-            if len(scores) > 1:
-                trend_model = LinearRegression()
-                trend_model.fit(times.reshape(-1, 1), scores)
-                slope = trend_model.coef_[0]
-            else:
-                slope = 0.0
-
-            # Improvement potential = positive trend + room for growth
-            max_score = 25  # Assuming max score
-            avg_score = user_scores['total_score'].mean()
-            room_for_growth = max_score - avg_score
-
-            improvement = slope * 5 + room_for_growth * 0.1  # Weighted combination
-            improvement_potentials.extend([improvement] * len(user_scores))
-
-        return pd.Series(improvement_potentials)
-
     def _save_model(self) -> None:
         """Save trained model to disk."""
         try:
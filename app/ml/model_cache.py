@@ -0,0 +1,186 @@
+"""
+Process-wide cache for unpickled ML models.
+
+Predictors used to ``joblib.load`` their model on every construction, so cold
+predictions paid the full unpickling cost each time. This module keeps one
+loaded copy per model file, keyed by ``(name, version, file fingerprint)``:
+
+- the fingerprint is the registry's SHA-256 when known, otherwise the file's
+  size and modification time, so a replaced file is never served stale
+- large NumPy arrays can be memory-mapped (``mmap_mode='r'``) instead of copied
+- ``ModelRegistry.promote_to_production`` bumps a per-model generation counter,
+  which predictors check to hot-reload the new production model
+- ``warm_up_models`` preloads models at app/backend startup
+
+Cached objects are shared between callers and must be treated as read-only.
+"""
+
+import glob
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import joblib
+
+from app.config import MODELS_DIR
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]
+
+
+def file_fingerprint(path: str) -> Optional[str]:
+    """Cheap change detector for a model file (size + mtime), or None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+class ModelCache:
+    """Thread-safe cache of loaded model artifacts."""
+
+    def __init__(self):
+        self._entries: Dict[CacheKey, Any] = {}
+        self._paths: Dict[str, CacheKey] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(
+        self,
+        path: str,
+        name: Optional[str] = None,
+        version: str = "",
+        file_hash: Optional[str] = None,
+        mmap: bool = False,
+        loader: Optional[Callable[..., Any]] = None,
+    ) -> Any:
+        """Return the unpickled object stored at ``path``, loading it at most once.
+
+        Args:
+            path (str): Model file path.
+            name (Optional[str]): Logical model name. Defaults to the file name.
+            version (str): Model version, if known.
+            file_hash (Optional[str]): Content hash from the registry, if known.
+            mmap (bool): Memory-map NumPy arrays read-only instead of copying them.
+            loader (Optional[Callable]): Custom loader; defaults to ``joblib.load``.
+
+        Returns:
+            Any: The loaded model object.
+        """
+        name = name or os.path.basename(path)
+        fingerprint = file_hash or file_fingerprint(path)
+
+        if fingerprint is None:
+            # Nothing stable to key on (e.g. the file vanished); load uncached
+            return self._load_file(path, mmap, loader)
+
+        key = (name, version, fingerprint)
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+
+            self.misses += 1
+            model = self._load_file(path, mmap, loader)
+
+            # Drop the previous artifact loaded from the same path
+            stale_key = self._paths.get(path)
+            if stale_key is not None and stale_key != key:
+                self._entries.pop(stale_key, None)
+            self._entries[key] = model
+            self._paths[path] = key
+            return model
+
+    @staticmethod
+    def _load_file(path: str, mmap: bool, loader: Optional[Callable[..., Any]]) -> Any:
+        """Unpickle a model file."""
+        if loader is not None:
+            return loader(path)
+        if mmap:
+            return joblib.load(path, mmap_mode="r")
+        return joblib.load(path)
+
+    def latest_file(self, pattern: str) -> Optional[str]:
+        """Most recently created file matching a glob pattern, or None."""
+        files = glob.glob(pattern)
+        if not files:
+            return None
+        return max(files, key=os.path.getctime)
+
+    def evict(self, name: str, version: Optional[str] = None) -> None:
+        """Remove cached artifacts for a model (optionally a single version)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == name and (version is None or k[1] == version)]:
+                del self._entries[key]
+            self._paths = {p: k for p, k in self._paths.items() if k in self._entries}
+
+    def clear(self) -> None:
+        """Drop every cached model and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def production_generation(self, name: str) -> int:
+        """Counter bumped whenever the production pointer for ``name`` changes."""
+        with self._lock:
+            return self._generations.get(name, 0)
+
+    def notify_production_changed(self, name: str) -> None:
+        """Signal predictors holding ``name`` to reload on their next prediction."""
+        with self._lock:
+            self._generations[name] = self._generations.get(name, 0) + 1
+        logger.info(f"Production pointer changed for {name}; predictors will hot-reload")
+
+    def stats(self) -> Dict[str, int]:
+        """Cache size and hit/miss counters."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Shared, process-wide instance
+model_cache = ModelCache()
+
+
+def warm_up_models(models_dir: str = MODELS_DIR, names: Iterable[str] = ("soulsense_predictor",)) -> Dict[str, int]:
+    """Preload the models predictors will ask for so the first prediction is warm.
+
+    Safe to call from a background thread; failures are logged and skipped.
+
+    Args:
+        models_dir (str): Directory holding ``risk_model_v*.pkl`` files.
+        names (Iterable[str]): Registry model names to preload.
+
+    Returns:
+        Dict[str, int]: Cache statistics after warm-up.
+    """
+    latest_risk_model = model_cache.latest_file(os.path.join(models_dir, "risk_model_v*.pkl"))
+    if latest_risk_model:
+        try:
+            model_cache.load(latest_risk_model, name="risk_model")
+        except Exception as e:
+            logger.warning(f"Warm-up failed for {latest_risk_model}: {e}")
+
+    try:
+        from app.ml.versioning import ModelRegistry
+        registry = ModelRegistry()
+        for name in names:
+            try:
+                if registry.get_production_model(name) is None:
+                    registry.get_model(name)
+            except ValueError:
+                continue
+            except Exception as e:
+                logger.warning(f"Warm-up failed for registry model {name}: {e}")
+    except Exception as e:
+        logger.warning(f"Model registry unavailable for warm-up: {e}")
+
+    stats = model_cache.stats()
+    logger.info(f"ML model warm-up complete: {stats['entries']} model(s) cached")
+    return stats
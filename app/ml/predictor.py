@@ -1,13 +1,25 @@
 import os
-import joblib
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 import numpy as np
+import pandas as pd
 
-from app.ml.risk_predictor import RiskPredictor
+from app.ml.risk_predictor import RiskPredictor, risk_codes
+from app.ml.model_cache import model_cache
 
 logger = logging.getLogger(__name__)
 
+MODEL_NAME = "soulsense_predictor"
+
+
+@lru_cache(maxsize=1)
+def _get_registry():
+    """Shared model registry (refreshes itself when registry.json changes)."""
+    from app.ml.versioning import ModelRegistry
+    return ModelRegistry()
+
+
 class SoulSenseMLPredictor:
     """
     Advanced ML Predictor for SoulSense with versioning and scaling support.
@@ -47,16 +59,20 @@ class SoulSenseMLPredictor:
     def _load_model(self) -> bool:
         """Load the latest trained model and scaler.
 
+        Models come from the process-wide model cache, so constructing
+        additional predictors does not unpickle the model again.
+
         Returns:
             bool: True if model loaded successfully, False otherwise.
         """
+        self._model_generation = model_cache.production_generation(MODEL_NAME)
         try:
-            # Try to load from versioning system first
+            # Try to load from versioning system first (production, else latest)
             if self.use_versioning:
                 try:
-                    from model_versioning import ModelVersioningManager
-                    versioning_manager = ModelVersioningManager()
-                    model_data, metadata = versioning_manager.registry.load_model("soulsense_predictor")
+                    registry = _get_registry()
+                    loaded = registry.get_production_model(MODEL_NAME) or registry.load_model(MODEL_NAME)
+                    model_data, metadata = loaded
                     self.model = model_data.get("model")
                     self.scaler = model_data.get("scaler")
                     logger.info(f"Loaded model version {metadata.version} from versioning system")
@@ -66,7 +82,7 @@ class SoulSenseMLPredictor:
 
             # Fallback: load from models directory
             model_files = [f for f in os.listdir(self.models_dir)
-                          if f.startswith("soulsense_predictor") and f.endswith(".pkl")]
+                          if f.startswith(MODEL_NAME) and f.endswith(".pkl")]
 
             if model_files:
                 # Sort by modification time to get latest
@@ -74,7 +90,7 @@ class SoulSenseMLPredictor:
                                reverse=True)
                 latest_model = os.path.join(self.models_dir, model_files[0])
 
-                model_data = joblib.load(latest_model)
+                model_data = model_cache.load(latest_model, name=MODEL_NAME)
                 self.model = model_data.get("model")
                 self.scaler = model_data.get("scaler")
                 logger.info(f"Loaded model from {latest_model}")
@@ -87,6 +103,12 @@ class SoulSenseMLPredictor:
         logger.info("Using fallback rule-based prediction")
         return False
 
+    def _reload_if_promoted(self) -> None:
+        """Hot-reload the model if a new version was promoted to production."""
+        if model_cache.production_generation(MODEL_NAME) != self._model_generation:
+            logger.info("Production model changed; reloading")
+            self._load_model()
+
     def predict(self, total_score: float, sentiment_score: float, age: int) -> str:
         """Predict risk level using the trained model or fallback.
 
@@ -98,6 +120,7 @@ class SoulSenseMLPredictor:
         Returns:
             str: Risk level string ("Low Risk", "Moderate Risk", or "High Risk").
         """
+        self._reload_if_promoted()
         if self.model is not None and self.scaler is not None:
             try:
                 # Prepare features
@@ -145,12 +168,7 @@ class SoulSenseMLPredictor:
                 logger.warning(f"Could not calculate confidence: {e}")
 
         # Map to UI codes (0=Low, 1=Moderate, 2=High)
-        if "High Risk" in label:
-            code = 2
-        elif "Moderate Risk" in label:
-            code = 1
-        else:
-            code = 0
+        code = int(risk_codes([label])[0])
 
         return {
             "prediction": code,
@@ -160,6 +178,70 @@ class SoulSenseMLPredictor:
             "confidence": confidence
         }
 
+    def predict_many(self, features) -> np.ndarray:
+        """Predict risk levels for many assessments in one vectorized pass.
+
+        Args:
+            features: Array-like of shape (n, 3) with columns
+                (total_score, sentiment_score, age), or a DataFrame with
+                'total_score', 'sentiment_score' (or 'avg_sentiment') and 'age'.
+
+        Returns:
+            np.ndarray: Risk level strings, one per row.
+        """
+        return self._predict_labels_and_confidence(features)[0]
+
+    def predict_with_explanation_many(self, features) -> pd.DataFrame:
+        """Vectorized counterpart of predict_with_explanation.
+
+        Args:
+            features: Same formats as predict_many.
+
+        Returns:
+            pd.DataFrame: One row per input with 'prediction', 'prediction_label',
+            'score', 'sentiment' and 'confidence' columns.
+        """
+        matrix = self._feature_matrix(features)
+        labels, confidence = self._predict_labels_and_confidence(matrix)
+        return pd.DataFrame({
+            "prediction": risk_codes(labels),
+            "prediction_label": labels,
+            "score": matrix[:, 0],
+            "sentiment": matrix[:, 1],
+            "confidence": confidence,
+        })
+
+    def _predict_labels_and_confidence(self, features):
+        """Scale once and run a single predict_proba for labels and confidence."""
+        matrix = self._feature_matrix(features)
+        self._reload_if_promoted()
+        if self.model is not None and self.scaler is not None and len(matrix):
+            try:
+                features_scaled = self.scaler.transform(matrix)
+                class_names = np.asarray(self.class_names, dtype=object)
+                classes = getattr(self.model, "classes_", None)
+                if hasattr(self.model, "predict_proba") and isinstance(classes, (np.ndarray, list)):
+                    probas = np.asarray(self.model.predict_proba(features_scaled))
+                    labels = class_names[np.asarray(classes)[probas.argmax(axis=1)]]
+                    return labels, probas.max(axis=1)
+                labels = class_names[np.asarray(self.model.predict(features_scaled), dtype=int)]
+                return labels, np.full(len(matrix), 0.8)
+            except Exception as e:
+                logger.error(f"Batch model prediction failed: {e}")
+
+        # Fallback to rule-based prediction
+        return self.risk_predictor._predict_labels_and_confidence(
+            self.risk_predictor._to_feature_frame(matrix)
+        )
+
+    @staticmethod
+    def _feature_matrix(features) -> np.ndarray:
+        """Normalize input to a float array of (total_score, sentiment, age) rows."""
+        if isinstance(features, pd.DataFrame):
+            features = features.rename(columns={"avg_sentiment": "sentiment_score"})
+            features = features[["total_score", "sentiment_score", "age"]]
+        return np.asarray(features, dtype=float).reshape(-1, 3)
+
     def is_model_loaded(self) -> bool:
         """Check if a trained model is loaded.
 
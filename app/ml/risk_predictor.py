@@ -1,12 +1,28 @@
 import os
-import joblib
+import numpy as np
 import pandas as pd
-import glob
 import logging
 
+from app.ml.model_cache import model_cache
+
 # Setup Logging
 logging.basicConfig(level=logging.INFO)
 
+# Training column order: score, sentiment, age
+FEATURE_COLUMNS = ['total_score', 'avg_sentiment', 'age']
+
+
+def risk_codes(labels):
+    """Map risk labels to UI codes (2 = High, 1 = Medium/Moderate, 0 = Low).
+
+    The trained models say "Moderate Risk", the rule-based fallback
+    "Medium Risk (Rule)"; both are code 1.
+    """
+    labels = np.asarray(labels, dtype=str)
+    medium = (np.char.find(labels, "Medium Risk") >= 0) | (np.char.find(labels, "Moderate Risk") >= 0)
+    return np.where(np.char.find(labels, "High Risk") >= 0, 2, np.where(medium, 1, 0))
+
+
 class RiskPredictor:
     """Predicts emotional risk levels using ML models or rule-based fallback."""
 
@@ -21,22 +37,20 @@ class RiskPredictor:
         self._model_loaded = False
         
     def load_latest_model(self):
-        """Finds and loads the most recent model file."""
+        """Finds and loads the most recent model file (shared via the model cache)."""
         try:
             # List all .pkl files in models dir
             pattern = os.path.join(self.models_dir, "risk_model_v*.pkl")
-            files = glob.glob(pattern)
+            latest_file = model_cache.latest_file(pattern)
             
-            if not files:
+            if not latest_file:
                 logging.warning("No ML models found in %s. Using fallback logic.", self.models_dir)
                 self.model = None
                 return
 
-            # Sort by name (timestamp is in name)
-            latest_file = max(files, key=os.path.getctime)
             logging.info(f"Loading ML Model: {latest_file}")
             
-            self.model = joblib.load(latest_file)
+            self.model = model_cache.load(latest_file, name="risk_model")
             
         except Exception as e:
             logging.error(f"Failed to load ML model: {e}")
@@ -104,12 +118,7 @@ class RiskPredictor:
 
         # Map to UI codes
         # 2 = High Risk (Red), 1 = Medium Risk (Yellow), 0 = Low Risk (Green)
-        if "High Risk" in label:
-            code = 2
-        elif "Medium Risk" in label:
-            code = 1
-        else:
-            code = 0
+        code = int(risk_codes([label])[0])
             
         return {
             "prediction": code,
@@ -119,6 +128,82 @@ class RiskPredictor:
             "confidence": confidence
         }
 
+    def predict_many(self, features):
+        """Predicts risk levels for many assessments at once.
+
+        Args:
+            features: NumPy array of shape (n, 3) with columns
+                (total_score, sentiment_score, age), or a DataFrame with
+                'total_score', 'avg_sentiment' (or 'sentiment_score') and 'age'.
+
+        Returns:
+            np.ndarray: Risk level labels, one per row.
+        """
+        return self._predict_labels_and_confidence(self._to_feature_frame(features))[0]
+
+    def predict_with_explanation_many(self, features):
+        """Vectorized counterpart of predict_with_explanation.
+
+        Labels and confidence come from a single predict_proba call when the
+        model exposes class labels.
+
+        Args:
+            features: Same formats as predict_many.
+
+        Returns:
+            pd.DataFrame: One row per input with 'prediction', 'prediction_label',
+            'score', 'sentiment' and 'confidence' columns.
+        """
+        frame = self._to_feature_frame(features)
+        labels, confidence = self._predict_labels_and_confidence(frame)
+        return pd.DataFrame({
+            "prediction": risk_codes(labels),
+            "prediction_label": labels,
+            "score": frame["total_score"].to_numpy(),
+            "sentiment": frame["avg_sentiment"].to_numpy(),
+            "confidence": confidence,
+        })
+
+    def _predict_labels_and_confidence(self, frame):
+        """Run the model once over a feature frame; rule-based if no model."""
+        if not self._model_loaded:
+            self.load_latest_model()
+            self._model_loaded = True
+
+        default_confidence = np.full(len(frame), 0.8)  # Rule-based or fallback
+        if self.model is None or len(frame) == 0:
+            return self._rule_based_fallback_many(frame), default_confidence
+
+        try:
+            classes = getattr(self.model, "classes_", None)
+            if hasattr(self.model, "predict_proba") and isinstance(classes, (np.ndarray, list)):
+                probs = np.asarray(self.model.predict_proba(frame))
+                labels = np.asarray(classes, dtype=object)[probs.argmax(axis=1)]
+                return labels, probs.max(axis=1)
+            return np.asarray(self.model.predict(frame), dtype=object), default_confidence
+        except Exception as e:
+            logging.error(f"Batch prediction error: {e}")
+            return self._rule_based_fallback_many(frame), default_confidence
+
+    @staticmethod
+    def _to_feature_frame(features):
+        """Normalize input to a DataFrame with the training column names."""
+        if isinstance(features, pd.DataFrame):
+            frame = features.rename(columns={"sentiment_score": "avg_sentiment"})
+            return frame[FEATURE_COLUMNS]
+        array = np.asarray(features, dtype=float).reshape(-1, len(FEATURE_COLUMNS))
+        return pd.DataFrame(array, columns=FEATURE_COLUMNS)
+
+    @staticmethod
+    def _rule_based_fallback_many(frame):
+        """Vectorized _rule_based_fallback."""
+        scores = frame["total_score"].to_numpy(dtype=float)
+        return np.select(
+            [scores < 25, scores > 35],
+            ["High Risk (Rule)", "Low Risk (Rule)"],
+            default="Medium Risk (Rule)",
+        ).astype(object)
+
     def _rule_based_fallback(self, score, sentiment):
         """Simple rules if ML is broken/missing.
 
@@ -5,6 +5,9 @@ from typing import Dict, List, Optional
 from app.db import get_session
 from app.models import Score, User
 from app.analysis.outlier_detection import OutlierDetector
+from app.analysis.score_stats import (
+    get_user_stats, rebuild_user_stats, stats_average_change, stats_std
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,11 +17,17 @@ class ScoreAnalyzer:
     
     def __init__(self):
         """Initialize the score analyzer with outlier detector."""
+        self.detector = OutlierDetector()
     
     def validate_user_score(self, username: str, score_value: int, 
                            age: int, age_group: str) -> Dict:
         """Validate new score against user history.
 
+        Uses the per-user running statistics store, so validation is O(1)
+        regardless of how many scores the user has. Users without a store
+        entry (e.g. scores saved before the store existed) are backfilled
+        from history once.
+
         Args:
             username (str): Username to validate score for.
             score_value (int): New score value to validate.
@@ -30,27 +39,28 @@ class ScoreAnalyzer:
         """
         session = get_session()
         try:
-            # Get user's historical scores
-            historical_scores = session.query(Score).filter(
-                Score.username == username
-            ).all()
+            stats = get_user_stats(session, username)
+            if stats is None and rebuild_user_stats(session, username):
+                session.commit()
+                stats = get_user_stats(session, username)
             
-            if not historical_scores:
+            if stats is None or not stats.count:
                 return {
                     "valid": True,
                     "warnings": [],
                     "message": "First score - no historical comparison available"
                 }
             
-            historical_values = [s.total_score for s in historical_scores]
-            
             warnings = []
             
-            # Check if new score would be statistical outlier
-            all_scores = historical_values + [score_value]
-            result = self.detector.detect_outliers_zscore(all_scores)
+            # Check if new score would be a statistical outlier (z-score over
+            # history + new score, computed from the running mean/variance)
+            count = stats.count + 1
+            delta = score_value - stats.mean
+            new_mean = stats.mean + delta / count
+            new_std = ((stats.m2 + delta * (score_value - new_mean)) / count) ** 0.5
             
-            if score_value in result["outliers"]:
+            if new_std > 0 and abs(score_value - new_mean) / new_std > self.detector.threshold:
                 warnings.append({
                     "type": "statistical_outlier",
                     "severity": "medium",
@@ -58,9 +68,9 @@ class ScoreAnalyzer:
                 })
             
             # Check for extreme change from last score
-            last_score = historical_values[-1]
+            last_score = stats.last_score
             change = abs(score_value - last_score)
-            avg_change = self._calculate_average_change(historical_values)
+            avg_change = stats_average_change(stats)
             
             if change > 3 * avg_change:
                 warnings.append({
@@ -73,9 +83,9 @@ class ScoreAnalyzer:
                 "valid": len(warnings) == 0 or all(w["severity"] != "critical" for w in warnings),
                 "warnings": warnings,
                 "validation_details": {
-                    "user_history_count": len(historical_values),
-                    "historical_mean": sum(historical_values) / len(historical_values),
-                    "historical_std": self._calculate_std(historical_values),
+                    "user_history_count": stats.count,
+                    "historical_mean": stats.mean,
+                    "historical_std": stats_std(stats),
                     "change_from_last": score_value - last_score
                 }
             }
@@ -21,7 +21,9 @@ from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict, field
 import uuid
 import logging
+import joblib
 from app.config import MODELS_DIR, DATA_DIR
+from app.ml.model_cache import model_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -132,11 +134,13 @@ class ModelRegistry:
         self.models_path.mkdir(parents=True, exist_ok=True)
         
         # Load or initialize registry
+        self._registry_mtime: Optional[int] = None
         self.registry = self._load_registry()
     
     def _load_registry(self) -> Dict[str, Any]:
         """Load registry from disk."""
         if self.metadata_file.exists():
+            self._registry_mtime = self.metadata_file.stat().st_mtime_ns
             with open(self.metadata_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
         return {
@@ -152,6 +156,25 @@ class ModelRegistry:
         self.registry["updated_at"] = datetime.now(timezone.utc).isoformat()
         with open(self.metadata_file, 'w', encoding='utf-8') as f:
             json.dump(self.registry, f, indent=2, default=str)
+        self._registry_mtime = self.metadata_file.stat().st_mtime_ns
+    
+    def refresh(self) -> bool:
+        """Reload the registry if another process changed it on disk.
+
+        Returns:
+            bool: True if the registry was reloaded.
+        """
+        if not self.metadata_file.exists():
+            return False
+        if self.metadata_file.stat().st_mtime_ns == self._registry_mtime:
+            return False
+        
+        old_pointer = self.registry.get("production_model")
+        self.registry = self._load_registry()
+        new_pointer = self.registry.get("production_model")
+        if new_pointer != old_pointer and new_pointer:
+            model_cache.notify_production_changed(new_pointer.split(":", 1)[0])
+        return True
     
     def _compute_file_hash(self, filepath: Path) -> str:
         """Compute SHA256 hash of a file."""
@@ -243,9 +266,9 @@ class ModelRegistry:
             **(additional_artifacts or {})
         }
         
+        # joblib format so get_model(mmap=True) can memory-map the arrays
         model_file = model_dir / "model.pkl"
-        with open(model_file, 'wb') as f:
-            pickle.dump(model_data, f)
+        joblib.dump(model_data, model_file)
         
         # Compute file hash and size
         file_hash = self._compute_file_hash(model_file)
@@ -290,13 +313,15 @@ class ModelRegistry:
     def get_model(
         self,
         name: str,
-        version: Optional[str] = None
+        version: Optional[str] = None,
+        mmap: bool = False
     ) -> Tuple[Any, ModelMetadata]:
         """Load a model by name and version.
 
         Args:
             name (str): Model name.
             version (Optional[str], optional): Version string. Defaults to latest.
+            mmap (bool, optional): Memory-map large arrays read-only. Defaults to False.
 
         Returns:
             Tuple[Any, ModelMetadata]: Tuple of (model_data, metadata).
@@ -315,15 +340,20 @@ class ModelRegistry:
         if version not in versions:
             raise ValueError(f"Version '{version}' not found for model '{name}'")
         
-        # Load model
+        # Load model (shared, process-wide cache keyed by name/version/hash)
         model_dir = self.models_path / name / version
         model_file = model_dir / "model.pkl"
+        metadata_dict = versions[version]
         
-        with open(model_file, 'rb') as f:
-            model_data = pickle.load(f)
+        model_data = model_cache.load(
+            str(model_file),
+            name=name,
+            version=version,
+            file_hash=metadata_dict.get("file_hash"),
+            mmap=mmap,
+        )
         
         # Load metadata
-        metadata_dict = versions[version]
         metadata = ModelMetadata(**metadata_dict)
         
         logger.info(f"✅ Loaded model: {name} v{version}")
@@ -351,6 +381,7 @@ class ModelRegistry:
         Returns:
             Optional[Tuple[Any, ModelMetadata]]: Production model data and metadata, or None.
         """
+        self.refresh()
         if name not in self.registry["models"]:
             return None
         
@@ -394,6 +425,7 @@ class ModelRegistry:
         versions[version]["is_production"] = True
         self.registry["production_model"] = f"{name}:{version}"
         self._save_registry()
+        model_cache.notify_production_changed(name)
         
         logger.info(f"🚀 Promoted {name} v{version} to production")
         return True
@@ -536,6 +568,7 @@ class ModelRegistry:
         # Update registry
         del versions[version]
         self._save_registry()
+        model_cache.evict(name, version)
         
         logger.info(f"🗑️ Deleted model: {name} v{version}")
         return True
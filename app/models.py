@@ -205,6 +205,19 @@ class Score(Base):
         Index('idx_score_agegroup_score', 'detailed_age_group', 'total_score'),
     )
 
+class UserScoreStats(Base):
+    """Running per-user score statistics, updated incrementally on every saved score."""
+    __tablename__ = 'user_score_stats'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    username = Column(String, unique=True, index=True, nullable=False)
+    count = Column(Integer, default=0)
+    mean = Column(Float, default=0.0)
+    m2 = Column(Float, default=0.0)  # Welford: sum of squared deviations from the mean
+    last_score = Column(Integer, nullable=True)
+    abs_change_sum = Column(Float, default=0.0)  # Sum of |score - previous score|
+    updated_at = Column(String, default=lambda: datetime.utcnow().isoformat())
+
 class Response(Base):
     __tablename__ = 'responses'
 
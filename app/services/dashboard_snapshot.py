@@ -0,0 +1,331 @@
+"""
+Per-user dashboard snapshot.
+
+Every analytics panel (EQ trends, correlation, time-based analysis, journal
+analytics, wellbeing, insights, satisfaction) and the CLI dashboard read the
+same user's scores and journal entries. Instead of each panel running its
+own queries, DashboardSnapshotService loads those rows once, folds them into
+running aggregates, and keeps the result keyed by the user's data version
+(row count and highest id per table).
+
+When a new score, journal entry or satisfaction record arrives, the version
+moves forward and only rows with a higher id are fetched and folded in; any
+other change (deletes, rewritten history) triggers a full rebuild. Edits to
+existing rows do not change the version, so code that edits rows in place
+should call ``dashboard_snapshots.invalidate(username)``.
+
+Usage:
+    from app.services.dashboard_snapshot import dashboard_snapshots
+
+    snapshot = dashboard_snapshots.get(username)
+    rows = snapshot.eq_trend_rows()
+"""
+
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import func
+
+from app.db import safe_db_context
+from app.models import JournalEntry, SatisfactionRecord, Score
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreRow(NamedTuple):
+    id: int
+    total_score: Optional[int]
+    timestamp: Optional[str]
+    sentiment_score: Optional[float]
+    is_rushed: Optional[bool]
+    is_inconsistent: Optional[bool]
+
+
+class JournalRow(NamedTuple):
+    id: int
+    entry_date: Optional[str]
+    sentiment_score: Optional[float]
+    emotional_patterns: Optional[str]
+    sleep_hours: Optional[float]
+    energy_level: Optional[int]
+    stress_level: Optional[int]
+    screen_time_mins: Optional[int]
+    work_hours: Optional[float]
+
+
+class SatisfactionRow(NamedTuple):
+    id: int
+    satisfaction_score: Optional[int]
+    timestamp: Optional[str]
+    positive_factors: Optional[str]
+    negative_factors: Optional[str]
+
+
+class DataVersion(NamedTuple):
+    """(row count, highest id) per table for one user."""
+    scores: Tuple[int, int]
+    journals: Tuple[int, int]
+    satisfaction: Tuple[int, int]
+
+
+_SCORE_COLUMNS = (Score.id, Score.total_score, Score.timestamp, Score.sentiment_score,
+                  Score.is_rushed, Score.is_inconsistent)
+_JOURNAL_COLUMNS = (JournalEntry.id, JournalEntry.entry_date, JournalEntry.sentiment_score,
+                    JournalEntry.emotional_patterns, JournalEntry.sleep_hours, JournalEntry.energy_level,
+                    JournalEntry.stress_level, JournalEntry.screen_time_mins, JournalEntry.work_hours)
+_SATISFACTION_COLUMNS = (SatisfactionRecord.id, SatisfactionRecord.satisfaction_score,
+                         SatisfactionRecord.timestamp, SatisfactionRecord.positive_factors,
+                         SatisfactionRecord.negative_factors)
+
+_ADDERS = {"scores": "add_scores", "journals": "add_journals", "satisfaction": "add_satisfaction"}
+
+
+@dataclass
+class DashboardSnapshot:
+    """All dashboard panel inputs for one user, with running aggregates."""
+
+    username: str
+    version: DataVersion = DataVersion((0, 0), (0, 0), (0, 0))
+    scores: List[ScoreRow] = field(default_factory=list)          # by id
+    journals: List[JournalRow] = field(default_factory=list)      # by id
+    satisfaction: List[SatisfactionRow] = field(default_factory=list)  # by id
+
+    score_total: int = 0
+    score_min: Optional[int] = None
+    score_max: Optional[int] = None
+    score_sentiment_sum: float = 0.0
+    score_sentiment_count: int = 0
+    journal_sentiment_sum: float = 0.0
+    journal_sentiment_count: int = 0
+    journal_sentiment_max: Optional[float] = None
+    pattern_counts: Counter = field(default_factory=Counter)
+
+    _scores_by_time: Optional[List[ScoreRow]] = field(default=None, repr=False)
+
+    # ------------------------------------------------------------- folding
+
+    def copy(self) -> "DashboardSnapshot":
+        """Independent copy to fold new rows into (readers keep the old one)."""
+        return replace(
+            self,
+            scores=list(self.scores),
+            journals=list(self.journals),
+            satisfaction=list(self.satisfaction),
+            pattern_counts=Counter(self.pattern_counts),
+            _scores_by_time=None,
+        )
+
+    def add_scores(self, rows: List[ScoreRow]) -> None:
+        for row in rows:
+            self.scores.append(row)
+            value = row.total_score or 0
+            self.score_total += value
+            self.score_min = value if self.score_min is None else min(self.score_min, value)
+            self.score_max = value if self.score_max is None else max(self.score_max, value)
+            if row.sentiment_score is not None:
+                self.score_sentiment_sum += row.sentiment_score
+                self.score_sentiment_count += 1
+        if rows:
+            self._scores_by_time = None
+
+    def add_journals(self, rows: List[JournalRow]) -> None:
+        for row in rows:
+            self.journals.append(row)
+            if row.sentiment_score is not None:
+                self.journal_sentiment_sum += row.sentiment_score
+                self.journal_sentiment_count += 1
+                if self.journal_sentiment_max is None or row.sentiment_score > self.journal_sentiment_max:
+                    self.journal_sentiment_max = row.sentiment_score
+            if row.emotional_patterns:
+                self.pattern_counts.update(row.emotional_patterns.split('; '))
+
+    def add_satisfaction(self, rows: List[SatisfactionRow]) -> None:
+        self.satisfaction.extend(rows)
+
+    # -------------------------------------------------------------- scores
+
+    @property
+    def score_count(self) -> int:
+        return len(self.scores)
+
+    @property
+    def average_score(self) -> float:
+        return self.score_total / len(self.scores) if self.scores else 0.0
+
+    @property
+    def average_score_sentiment(self) -> float:
+        """Mean reflection sentiment over scores that have one (like SQL AVG)."""
+        if not self.score_sentiment_count:
+            return 0.0
+        return self.score_sentiment_sum / self.score_sentiment_count
+
+    def scores_by_time(self) -> List[ScoreRow]:
+        """Scores ordered by timestamp (cached until new scores arrive)."""
+        if self._scores_by_time is None:
+            self._scores_by_time = sorted(self.scores, key=lambda r: r.timestamp or "")
+        return self._scores_by_time
+
+    def eq_trend_rows(self) -> List[Tuple]:
+        """(total_score, timestamp, id, sentiment_score) rows in attempt order."""
+        return [(r.total_score, r.timestamp, r.id, r.sentiment_score) for r in self.scores]
+
+    def score_trends(self) -> Dict[str, Any]:
+        """Same result as TimeBasedAnalyzer.analyze_score_trends, from the snapshot."""
+        from app.analysis.time_based_analysis import summarize_score_trends
+
+        ordered = self.scores_by_time()
+        return summarize_score_trends(
+            self.username,
+            [r.total_score for r in ordered],
+            [r.timestamp for r in ordered],
+        )
+
+    # ------------------------------------------------------------ journals
+
+    @property
+    def journal_count(self) -> int:
+        return len(self.journals)
+
+    @property
+    def average_journal_sentiment(self) -> Optional[float]:
+        if not self.journal_sentiment_count:
+            return None
+        return self.journal_sentiment_sum / self.journal_sentiment_count
+
+    def wellbeing_rows(self) -> List[JournalRow]:
+        """Journal entries with sleep tracked, ordered by entry date."""
+        tracked = [r for r in self.journals if r.sleep_hours is not None]
+        return sorted(tracked, key=lambda r: r.entry_date or "")
+
+    # -------------------------------------------------------- satisfaction
+
+    def satisfaction_records(self) -> List[Tuple]:
+        """(satisfaction_score, timestamp, positive_factors, negative_factors), newest first."""
+        ordered = sorted(self.satisfaction, key=lambda r: r.timestamp or "", reverse=True)
+        return [(r.satisfaction_score, r.timestamp, r.positive_factors, r.negative_factors)
+                for r in ordered]
+
+
+class DashboardSnapshotService:
+    """Builds and incrementally refreshes per-user dashboard snapshots."""
+
+    def __init__(self, max_users: int = 32):
+        self.max_users = max_users
+        self._snapshots: Dict[str, DashboardSnapshot] = {}
+        self._lock = threading.RLock()
+        self.full_builds = 0
+        self.incremental_updates = 0
+
+    def get(self, username: str) -> DashboardSnapshot:
+        """
+        Return an up-to-date snapshot for ``username``.
+
+        Safe to call from worker threads. The returned snapshot must be
+        treated as read-only.
+        """
+        with self._lock, safe_db_context() as session:
+            version = self._data_version(session, username)
+            snapshot = self._snapshots.get(username)
+
+            if snapshot is not None and snapshot.version == version:
+                return snapshot
+            updated = self._apply_increment(session, snapshot, version) if snapshot is not None else None
+            snapshot = updated or self._build(session, username, version)
+
+            self._remember(username, snapshot)
+            return snapshot
+
+    def invalidate(self, username: Optional[str] = None) -> None:
+        """Drop the snapshot for ``username`` (everyone if None)."""
+        with self._lock:
+            if username is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(username, None)
+
+    # ---------------------------------------------------------------- internal
+
+    @staticmethod
+    def _data_version(session, username: str) -> DataVersion:
+        def count_and_max(model) -> Tuple[int, int]:
+            count, max_id = session.query(func.count(model.id), func.max(model.id))\
+                .filter(model.username == username).one()
+            return int(count or 0), int(max_id or 0)
+
+        return DataVersion(
+            scores=count_and_max(Score),
+            journals=count_and_max(JournalEntry),
+            satisfaction=count_and_max(SatisfactionRecord),
+        )
+
+    @staticmethod
+    def _rows_after(session, columns, model, username: str, after_id: int, row_type):
+        rows = session.query(*columns)\
+            .filter(model.username == username, model.id > after_id)\
+            .order_by(model.id)\
+            .all()
+        return [row_type(*row) for row in rows]
+
+    def _build(self, session, username: str, version: DataVersion) -> DashboardSnapshot:
+        snapshot = DashboardSnapshot(username=username, version=version)
+        snapshot.add_scores(self._rows_after(session, _SCORE_COLUMNS, Score, username, 0, ScoreRow))
+        snapshot.add_journals(self._rows_after(session, _JOURNAL_COLUMNS, JournalEntry, username, 0, JournalRow))
+        snapshot.add_satisfaction(self._rows_after(
+            session, _SATISFACTION_COLUMNS, SatisfactionRecord, username, 0, SatisfactionRow))
+        # Rows may have landed between the version query and the loads
+        snapshot.version = DataVersion(
+            scores=(len(snapshot.scores), snapshot.scores[-1].id if snapshot.scores else 0),
+            journals=(len(snapshot.journals), snapshot.journals[-1].id if snapshot.journals else 0),
+            satisfaction=(len(snapshot.satisfaction), snapshot.satisfaction[-1].id if snapshot.satisfaction else 0),
+        )
+        self.full_builds += 1
+        logger.debug(f"Built dashboard snapshot for {username}: {snapshot.version}")
+        return snapshot
+
+    def _apply_increment(self, session, snapshot: DashboardSnapshot,
+                         version: DataVersion) -> Optional[DashboardSnapshot]:
+        """
+        Fold rows newer than ``snapshot`` into a copy of it.
+
+        Returns:
+            The updated snapshot, or None if the change is not append-only
+            (the caller rebuilds)
+        """
+        tables = (
+            ("scores", _SCORE_COLUMNS, Score, ScoreRow),
+            ("journals", _JOURNAL_COLUMNS, JournalEntry, JournalRow),
+            ("satisfaction", _SATISFACTION_COLUMNS, SatisfactionRecord, SatisfactionRow),
+        )
+
+        pending = []
+        for name, columns, model, row_type in tables:
+            old_count, old_max = getattr(snapshot.version, name)
+            new_count, new_max = getattr(version, name)
+            if (new_count, new_max) == (old_count, old_max):
+                continue
+            if new_max < old_max or new_count < old_count:
+                return None
+            rows = self._rows_after(session, columns, model, snapshot.username, old_max, row_type)
+            if old_count + len(rows) != new_count:
+                return None  # Something other than appends happened
+            pending.append((name, rows))
+
+        updated = snapshot.copy()
+        for name, rows in pending:
+            getattr(updated, _ADDERS[name])(rows)
+        updated.version = version
+        self.incremental_updates += 1
+        return updated
+
+    def _remember(self, username: str, snapshot: DashboardSnapshot) -> None:
+        self._snapshots.pop(username, None)
+        self._snapshots[username] = snapshot
+        while len(self._snapshots) > self.max_users:
+            self._snapshots.pop(next(iter(self._snapshots)))
+
+
+# Process-wide service shared by the desktop dashboard and the CLI
+dashboard_snapshots = DashboardSnapshotService()
@@ -7,6 +7,8 @@ from sqlalchemy import desc
 from app.db import safe_db_context
 from app.models import Score, Response, User, AssessmentResult
 from app.exceptions import DatabaseError
+from app.analysis.score_stats import record_score
+from app.events import publish, SCORE_SAVED
 
 # Try importing NLTK sentiment analyzer
 try:
@@ -90,9 +92,12 @@ class ExamService:
                     detailed_age_group=detailed_age_group
                 )
                 session.add(new_score)
+                # Keep running per-user stats in step with the scores table
+                record_score(session, username, score)
                 # Commit handled by context
                 
             logger.info(f"Exam saved. Score: {score}, User: {username}")
+            publish(SCORE_SAVED, username=username)
             return True
             
         except Exception as e:
@@ -5,6 +5,7 @@ from sqlalchemy import desc
 from app.db import safe_db_context
 from app.models import JournalEntry, User
 from app.exceptions import DatabaseError
+from app.events import publish, JOURNAL_SAVED
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +61,9 @@ class JournalService:
                 # Refresh/Expunge to allow usage outside session if needed, 
                 # but returning ID or simple DTO is often safer. 
                 # For now, we rely on the fact that simple attributes are accessible.
-                return entry
+
+            publish(JOURNAL_SAVED, username=username)
+            return entry
                 
         except Exception as e:
             logger.error(f"Failed to create journal entry for {username}: {e}")
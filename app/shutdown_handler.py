@@ -55,6 +55,11 @@ class ShutdownHandler:
         """Perform graceful shutdown operations"""
         self.logger.info("Initiating graceful application shutdown...")
 
+        # Stop background view queries before the database goes away
+        loader = getattr(self.app, 'view_loader', None)
+        if loader is not None:
+            loader.shutdown()
+
         try:
             # Commit any pending database operations from the scoped session
             from app.db import SessionLocal
@@ -1,19 +1,28 @@
 """
 Startup integrity checks for the SoulSense application.
 Validates database schema and required files at application startup.
+
+Checks run concurrently, and the app entry point caches clean results
+against a fingerprint of the install (SQLite schema version, alembic
+revision, config hash, required directories) so an unchanged install skips
+the schema inspection. ``python -m app.main --full-check`` forces a full run.
 """
 
 import os
 import json
+import hashlib
 import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import List, Optional, Dict, Any, Callable
 from sqlalchemy import inspect
 
 from app.config import (
     BASE_DIR, DATA_DIR, LOG_DIR, MODELS_DIR, 
-    DB_PATH, CONFIG_PATH, DEFAULT_CONFIG
+    DB_PATH, CONFIG_PATH, DEFAULT_CONFIG, DATABASE_TYPE
 )
 from app.exceptions import IntegrityError, DatabaseError, ConfigurationError
 
@@ -53,6 +62,10 @@ REQUIRED_TABLES: List[str] = [
     "user_settings",
 ]
 
+# Fingerprint cache for clean check runs (bump the version when checks change)
+CHECK_CACHE_PATH: str = os.path.join(DATA_DIR, "startup_checks_cache.json")
+CHECK_CACHE_VERSION: int = 1
+
 
 def check_database_schema() -> IntegrityCheckResult:
     """
@@ -286,12 +299,149 @@ def check_config_integrity() -> IntegrityCheckResult:
         )
 
 
-def run_all_checks(raise_on_critical: bool = True) -> List[IntegrityCheckResult]:
+def _file_sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _database_fingerprint() -> Optional[Dict[str, Any]]:
+    """
+    Identify the SQLite database and its schema without touching SQLAlchemy.
+
+    File mtime/size change on every write, so the schema is identified by
+    SQLite's ``schema_version`` counter (bumped by any DDL) and the alembic
+    revision instead; the inode catches the file being replaced.
+    Returns None when the database cannot be fingerprinted (not SQLite, or
+    unreadable), which disables the cache.
+    """
+    if DATABASE_TYPE != "sqlite":
+        return None
+    if not os.path.exists(DB_PATH):
+        return {"path": DB_PATH, "exists": False}
+
+    try:
+        uri = Path(DB_PATH).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, timeout=1)
+        try:
+            schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+            try:
+                row = conn.execute("SELECT version_num FROM alembic_version").fetchone()
+                alembic_revision = row[0] if row else None
+            except sqlite3.OperationalError:
+                alembic_revision = None
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Could not fingerprint database: {e}")
+        return None
+
+    return {
+        "path": DB_PATH,
+        "exists": True,
+        "inode": os.stat(DB_PATH).st_ino,
+        "schema_version": schema_version,
+        "alembic_revision": alembic_revision,
+    }
+
+
+def compute_check_fingerprint() -> Optional[Dict[str, Any]]:
+    """
+    Fingerprint everything the startup checks inspect.
+
+    Returns:
+        Dict that changes whenever a check could produce a different result,
+        or None if the install cannot be fingerprinted
+    """
+    database = _database_fingerprint()
+    if database is None:
+        return None
+    return {
+        "cache_version": CHECK_CACHE_VERSION,
+        "database": database,
+        "config_sha256": _file_sha256(CONFIG_PATH),
+        "required_files": {
+            info["path"]: os.path.exists(os.path.join(BASE_DIR, info["path"]))
+            for info in REQUIRED_FILES
+        },
+        "required_tables": REQUIRED_TABLES,
+    }
+
+
+def _load_cached_results(fingerprint: Dict[str, Any], cache_path: str) -> Optional[List[IntegrityCheckResult]]:
+    """Return stored results if they were recorded for ``fingerprint``."""
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if cached.get("fingerprint") != fingerprint:
+        return None
+    try:
+        return [
+            IntegrityCheckResult(
+                name=r["name"],
+                status=CheckStatus(r["status"]),
+                message=r["message"],
+                details={"cached": True},
+            )
+            for r in cached["results"]
+        ]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _store_results(fingerprint: Dict[str, Any], results: List[IntegrityCheckResult], cache_path: str) -> None:
+    """Cache results for the next launch (only clean runs are worth skipping)."""
+    from app.utils.atomic import atomic_write
+
+    payload = {
+        "fingerprint": fingerprint,
+        "results": [
+            {"name": r.name, "status": r.status.value, "message": r.message}
+            for r in results
+        ],
+    }
+    try:
+        with atomic_write(cache_path, "w") as f:
+            json.dump(payload, f, indent=2)
+    except Exception as e:
+        logger.warning(f"Could not write startup check cache: {e}")
+
+
+def _run_check(check_func: Callable[[], IntegrityCheckResult]) -> IntegrityCheckResult:
+    try:
+        return check_func()
+    except Exception as e:
+        logger.error(f"Check {check_func.__name__} crashed: {e}", exc_info=True)
+        return IntegrityCheckResult(
+            name=check_func.__name__,
+            status=CheckStatus.FAILED,
+            message=f"Check crashed: {str(e)}",
+            details={"exception": str(e)}
+        )
+
+
+def run_all_checks(
+    raise_on_critical: bool = True,
+    parallel: bool = True,
+    use_cache: bool = False,
+    full_check: bool = False,
+    cache_path: Optional[str] = None,
+) -> List[IntegrityCheckResult]:
     """
     Run all startup integrity checks.
     
     Args:
         raise_on_critical: If True, raises IntegrityError on any FAILED check
+        parallel: Run the independent checks concurrently
+        use_cache: Skip the checks when the install fingerprint matches the
+            last clean run, and record clean runs for next time
+        full_check: With use_cache, ignore stored results and re-run every check
+        cache_path: Cache file location (defaults to CHECK_CACHE_PATH)
         
     Returns:
         List of IntegrityCheckResult for all checks
@@ -299,43 +449,41 @@ def run_all_checks(raise_on_critical: bool = True) -> List[IntegrityCheckResult]
     Raises:
         IntegrityError: If any check fails and raise_on_critical is True
     """
+    cache_path = cache_path or CHECK_CACHE_PATH
+    fingerprint = compute_check_fingerprint() if use_cache else None
+
+    if fingerprint is not None and not full_check:
+        cached = _load_cached_results(fingerprint, cache_path)
+        if cached is not None:
+            logger.info("Startup integrity checks skipped: install unchanged since last clean run")
+            return cached
+
     logger.info("Running startup integrity checks...")
     
+    # Checks only share read-only config values, so they can run side by side
     checks: List[Callable[[], IntegrityCheckResult]] = [
-        check_config_integrity,  # Config first, as others may depend on it
+        check_config_integrity,
         check_required_files,
         check_database_schema,
     ]
     
-    results: List[IntegrityCheckResult] = []
-    failed_checks: List[str] = []
+    if parallel:
+        with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="startup-check") as executor:
+            results: List[IntegrityCheckResult] = list(executor.map(_run_check, checks))
+    else:
+        results = [_run_check(check_func) for check_func in checks]
     
-    for check_func in checks:
-        try:
-            result = check_func()
-            results.append(result)
-            
-            # Log result
-            if result.status == CheckStatus.PASSED:
-                logger.info(f"✓ {result.name}: {result.message}")
-            elif result.status == CheckStatus.WARNING:
-                logger.warning(f"⚠ {result.name}: {result.message}")
-                if result.recovery_action:
-                    logger.info(f"  Recovery: {result.recovery_action}")
-            else:
-                logger.error(f"✗ {result.name}: {result.message}")
-                failed_checks.append(result.name)
-                
-        except Exception as e:
-            logger.error(f"Check {check_func.__name__} crashed: {e}", exc_info=True)
-            result = IntegrityCheckResult(
-                name=check_func.__name__,
-                status=CheckStatus.FAILED,
-                message=f"Check crashed: {str(e)}",
-                details={"exception": str(e)}
-            )
-            results.append(result)
-            failed_checks.append(check_func.__name__)
+    failed_checks: List[str] = []
+    for result in results:
+        if result.status == CheckStatus.PASSED:
+            logger.info(f"✓ {result.name}: {result.message}")
+        elif result.status == CheckStatus.WARNING:
+            logger.warning(f"⚠ {result.name}: {result.message}")
+            if result.recovery_action:
+                logger.info(f"  Recovery: {result.recovery_action}")
+        else:
+            logger.error(f"✗ {result.name}: {result.message}")
+            failed_checks.append(result.name)
     
     # Summary
     passed = sum(1 for r in results if r.status == CheckStatus.PASSED)
@@ -344,6 +492,12 @@ def run_all_checks(raise_on_critical: bool = True) -> List[IntegrityCheckResult]
     
     logger.info(f"Integrity checks complete: {passed} passed, {warnings} warnings, {failed} failed")
     
+    if use_cache and passed == len(results):
+        # Re-fingerprint: the checks may have created files or tables
+        fingerprint = compute_check_fingerprint()
+        if fingerprint is not None:
+            _store_results(fingerprint, results, cache_path)
+    
     if failed_checks and raise_on_critical:
         raise IntegrityError(
             f"Critical startup checks failed: {', '.join(failed_checks)}. "
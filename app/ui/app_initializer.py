@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any
 from app.ui.sidebar import SidebarNav
 from app.ui.styles import UIStyles
 from app.i18n_manager import get_i18n
+from app.utils.startup_profiler import startup_profiler
 from app.questions import load_questions
 from app.auth import AuthManager
 from app.logger import get_logger
@@ -70,7 +71,8 @@ class AppInitializer:
         self.app.current_user_id: Optional[int] = None
         self.app.age = 25
         self.app.age_group = "adult"
-        self.app.i18n = get_i18n()
+        with startup_profiler.phase("i18n"):
+            self.app.i18n = get_i18n()
         self.app.questions = []
         self.app.auth = AuthManager()
         self.app.settings: Dict[str, Any] = {}
@@ -167,6 +169,10 @@ class AppInitializer:
         if hasattr(self.app, "sidebar"):
             self.app.sidebar.pack_forget()
 
+        # Cached views belong to the user logging out
+        if hasattr(self.app, "view_manager"):
+            self.app.view_manager.invalidate_views()
+
         # Clear Content Area
         if hasattr(self.app, "content_area"):
             for widget in self.app.content_area.winfo_children():
@@ -8,6 +8,7 @@ from datetime import datetime
 from app.services.question_curator import QuestionCurator
 from app.db import get_session
 from app.models import AssessmentResult
+from app.events import publish, ASSESSMENT_SAVED
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -353,6 +354,7 @@ class AssessmentRunnerView:
                 # Suppress popup for seamless embedded flow, or show a toast?
                 # For now just log it. The final view will show results.
                 logger.info(f"Assessment result committed to DB with ID: {res.id}")
+                publish(ASSESSMENT_SAVED, user_id=user_id)
                 return res.id
         except Exception as e:
             logger.error(f"Failed to save assessment: {e}")
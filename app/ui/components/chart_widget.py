@@ -0,0 +1,307 @@
+"""
+Chart Widget Component
+
+A matplotlib chart embedded in Tk that is built once and then updated in
+place. Axes, lines, bars and text labels are created on first use and kept
+alive; later updates only swap their data (``set_data`` / ``set_height``)
+and redraw. When the axes limits are unchanged the update is blitted (the
+cached background is restored and only the data artists are re-rendered);
+otherwise a ``draw_idle`` is scheduled.
+
+Long time series are decimated to the screen resolution of their axes
+before they are handed to matplotlib, keeping the minimum and maximum of
+every pixel column so spikes stay visible.
+
+Usage:
+    from app.ui.components.chart_widget import ChartWidget
+
+    chart = ChartWidget(parent, figsize=(6, 4))
+    ax = chart.axes("main")
+    chart.line("eq", "main", color="#22C55E", marker="o")
+    chart.widget.pack(fill=tk.BOTH, expand=True)
+
+    chart.set_line("eq", x_values, y_values)   # first render and every update
+    chart.refresh()
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.utils.lazy_imports import lazy_attr, lazy_import, select_agg_backend
+
+np = lazy_import("numpy")
+mdates = lazy_import("matplotlib.dates")
+Figure = lazy_attr("matplotlib.figure", "Figure", before_import=select_agg_backend)
+FigureCanvasTkAgg = lazy_attr("matplotlib.backends.backend_tkagg", "FigureCanvasTkAgg",
+                              before_import=select_agg_backend)
+
+# Points kept per pixel column of the axes (its minimum and maximum)
+POINTS_PER_PIXEL = 2
+# Used before the canvas has a real size
+DEFAULT_MAX_POINTS = 1000
+
+
+def decimate(x: Sequence, y: Sequence[float], max_points: int) -> Tuple[Any, Any]:
+    """
+    Reduce a series to at most ``max_points`` points for plotting.
+
+    The series is split into equal index buckets and the minimum and maximum
+    of each bucket are kept (in their original order), together with the
+    first and last points, so the drawn envelope matches the full data.
+
+    Args:
+        x: X values (numbers or datetimes), in plotting order
+        y: Y values, same length as ``x``
+        max_points: Upper bound on returned points
+
+    Returns:
+        (x, y) as numpy arrays; the input unchanged in size when it already fits
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= max_points or max_points < 4:
+        return x, y
+
+    buckets = (max_points - 2) // POINTS_PER_PIXEL
+    edges = np.linspace(0, n, buckets + 1).astype(int)
+    bucket_ids = np.repeat(np.arange(buckets), np.diff(edges))
+    # Sorted by bucket, then by value: each bucket's first/last entries are its min/max
+    order = np.lexsort((y, bucket_ids))
+    keep = np.concatenate((order[edges[:-1]], order[edges[1:] - 1], [0, n - 1]))
+    keep = np.unique(keep)
+    return x[keep], y[keep]
+
+
+class ChartWidget:
+    """
+    A persistent matplotlib figure with named, in-place updatable artists.
+
+    Artists registered through :meth:`line`, :meth:`bars`, :meth:`fill` and
+    :meth:`text` are marked animated when blitting is enabled, so they are
+    left out of the cached background and redrawn on every update.
+    """
+
+    def __init__(self, master=None, figsize: Tuple[float, float] = (6, 4), dpi: int = 100,
+                 facecolor: Optional[str] = None, blit: bool = True,
+                 max_points: Optional[int] = None,
+                 canvas_factory: Optional[Callable[[Any, Any], Any]] = None):
+        """
+        Create the figure and its canvas.
+
+        Args:
+            master: Tk parent for the canvas widget
+            figsize: Figure size in inches
+            dpi: Figure resolution
+            facecolor: Figure background
+            blit: Redraw only the data artists when the axes limits are unchanged
+            max_points: Fixed decimation limit; by default derived from the axes width
+            canvas_factory: ``(figure, master) -> canvas``; defaults to FigureCanvasTkAgg
+        """
+        kwargs = {"figsize": figsize, "dpi": dpi}
+        if facecolor is not None:
+            kwargs["facecolor"] = facecolor
+        self.figure = Figure(**kwargs)
+        factory = canvas_factory or (lambda figure, parent: FigureCanvasTkAgg(figure, master=parent))
+        self.canvas = factory(self.figure, master)
+        self.blit = blit and getattr(self.canvas, "supports_blit", False)
+        self.max_points = max_points
+
+        self._axes: Dict[str, Any] = {}
+        self._lines: Dict[str, Any] = {}
+        self._bars: Dict[str, Tuple[str, Any]] = {}
+        self._texts: Dict[str, Any] = {}
+        self._fills: Dict[str, Any] = {}
+        self._line_axes: Dict[str, str] = {}
+        self._dirty_axes: set = set()
+        self._needs_full_draw = True
+        self._background = None
+        self.full_draws = 0
+        self.blits = 0
+
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    @property
+    def widget(self):
+        """The Tk widget to pack/grid (None for non-Tk canvases)."""
+        get_widget = getattr(self.canvas, "get_tk_widget", None)
+        return get_widget() if get_widget else None
+
+    # ------------------------------------------------------------ artists
+
+    def axes(self, key: str, *args, twin_of: Optional[str] = None, **kwargs):
+        """
+        Return axes ``key``, creating it on first call.
+
+        Args:
+            key: Name of the axes
+            *args: Subplot position for ``Figure.add_subplot`` (default 111)
+            twin_of: Create as ``twinx()`` of this axes instead
+            **kwargs: Passed to ``add_subplot``
+        """
+        if key not in self._axes:
+            if twin_of is not None:
+                self._axes[key] = self._axes[twin_of].twinx()
+            else:
+                self._axes[key] = self.figure.add_subplot(*(args or (111,)), **kwargs)
+        return self._axes[key]
+
+    def line(self, key: str, axes_key: str, **style):
+        """Return line ``key`` on ``axes_key``, creating it (empty) on first call."""
+        if key not in self._lines:
+            line, = self._axes[axes_key].plot([], [], **style)
+            line.set_animated(self.blit)
+            self._lines[key] = line
+            self._line_axes[key] = axes_key
+        return self._lines[key]
+
+    def bars(self, key: str, axes_key: str, count: int, **style):
+        """
+        Return bar container ``key``; recreated only when ``count`` changes.
+        """
+        existing = self._bars.get(key)
+        if existing is not None and len(existing[1].patches) == count:
+            return existing[1]
+        if existing is not None:
+            existing[1].remove()
+            self._needs_full_draw = True
+        container = self._axes[axes_key].bar(range(count), [0] * count, **style)
+        for patch in container.patches:
+            patch.set_animated(self.blit)
+        self._bars[key] = (axes_key, container)
+        return container
+
+    def text(self, key: str, axes_key: str, x: float, y: float, value: str = "", **style):
+        """Set text ``key`` (created on first call) to ``value`` at (x, y)."""
+        artist = self._texts.get(key)
+        if artist is None:
+            artist = self._axes[axes_key].text(x, y, value, **style)
+            artist.set_animated(self.blit)
+            self._texts[key] = artist
+        else:
+            artist.set_text(value)
+            artist.set_position((x, y))
+        return artist
+
+    def fill(self, key: str, axes_key: str, x: Sequence[float], y: Sequence[float], **style):
+        """Replace the area under (x, y) for fill ``key`` (polygons cannot be reshaped in place)."""
+        old = self._fills.pop(key, None)
+        if old is not None:
+            old.remove()
+        collection = self._axes[axes_key].fill_between(x, y, **style)
+        collection.set_animated(self.blit)
+        self._fills[key] = collection
+        self._dirty_axes.add(axes_key)
+        return collection
+
+    # ------------------------------------------------------------- updates
+
+    def set_line(self, key: str, x: Sequence, y: Sequence[float], decimated: bool = True) -> None:
+        """
+        Replace the data of line ``key``.
+
+        Args:
+            key: Line name
+            x: X values (numbers or datetimes)
+            y: Y values
+            decimated: Reduce to the axes' screen resolution (off for scatter-style lines)
+        """
+        axes_key = self._line_axes[key]
+        ax = self._axes[axes_key]
+        x_values = np.asarray(x)
+        if len(x_values) and (x_values.dtype == object or np.issubdtype(x_values.dtype, np.datetime64)):
+            x_values = mdates.date2num(x_values)
+            ax.xaxis_date()
+        y_values = np.asarray(y, dtype=float)
+        if decimated:
+            x_values, y_values = decimate(x_values, y_values, self._max_points_for(ax))
+        self._lines[key].set_data(x_values, y_values)
+        self._dirty_axes.add(axes_key)
+
+    def set_bars(self, key: str, heights: Sequence[float], x: Optional[Sequence[float]] = None,
+                 width: Optional[Sequence[float]] = None) -> None:
+        """Update bar heights, and optionally their left edges and widths."""
+        axes_key, container = self._bars[key]
+        for i, (patch, height) in enumerate(zip(container.patches, heights)):
+            patch.set_height(height)
+            if x is not None:
+                patch.set_x(x[i])
+            if width is not None:
+                patch.set_width(width[i])
+        self._dirty_axes.add(axes_key)
+
+    def refresh(self, full: bool = False) -> None:
+        """
+        Push pending updates to the screen.
+
+        Rescales dirty axes; blits when nothing but the data artists changed,
+        otherwise schedules a full redraw.
+
+        Args:
+            full: Force a full redraw (e.g. after changing titles or ticks)
+        """
+        limits_changed = False
+        for key in self._dirty_axes:
+            ax = self._axes[key]
+            before = (ax.get_xlim(), ax.get_ylim())
+            ax.relim()
+            ax.autoscale_view()
+            limits_changed |= before != (ax.get_xlim(), ax.get_ylim())
+        self._dirty_axes.clear()
+
+        if full or limits_changed or self._needs_full_draw or not self.blit or self._background is None:
+            self._needs_full_draw = False
+            self.full_draws += 1
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+        self.blits += 1
+
+    def draw(self, tight_layout: bool = False) -> None:
+        """
+        Render the figure synchronously (used for the first paint).
+
+        Args:
+            tight_layout: Apply ``Figure.tight_layout`` once the data is scaled in
+        """
+        for key in self._dirty_axes:
+            self._axes[key].relim()
+            self._axes[key].autoscale_view()
+        self._dirty_axes.clear()
+        if tight_layout:
+            self.figure.tight_layout()
+        self._needs_full_draw = False
+        self.full_draws += 1
+        self.canvas.draw()
+
+    # ------------------------------------------------------------ internal
+
+    def _animated_artists(self) -> List[Any]:
+        artists: List[Any] = list(self._lines.values())
+        for _, container in self._bars.values():
+            artists.extend(container.patches)
+        artists.extend(self._fills.values())
+        artists.extend(self._texts.values())
+        return artists
+
+    def _draw_animated(self) -> None:
+        for artist in self._animated_artists():
+            self.figure.draw_artist(artist)
+
+    def _on_draw(self, event) -> None:
+        """After a full draw: cache the background and paint the data artists on it."""
+        if not self.blit:
+            return
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _max_points_for(self, ax) -> int:
+        if self.max_points is not None:
+            return self.max_points
+        try:
+            width = int(ax.get_window_extent().width)
+        except Exception:
+            width = 0
+        return width * POINTS_PER_PIXEL if width > 1 else DEFAULT_MAX_POINTS
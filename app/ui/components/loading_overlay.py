@@ -205,6 +205,81 @@ class LoadingOverlay(tk.Toplevel):
             pass
 
 
+class InlineLoadingIndicator(tk.Frame):
+    """
+    A non-modal spinner shown inside a view container.
+
+    Unlike LoadingOverlay it does not grab input, so the user can keep
+    navigating while a view's data loads in the background.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        message: str = "Loading...",
+        bg_color: Optional[str] = None,
+        fg_color: str = "#64748B",
+        accent_color: str = "#3B82F6"
+    ):
+        """
+        Create an inline loading indicator and pack it into parent.
+
+        Args:
+            parent: Container the indicator is shown in
+            message: Loading message to display
+            bg_color: Background color (defaults to the parent's background)
+            fg_color: Text color
+            accent_color: Spinner color
+        """
+        if bg_color is None:
+            try:
+                bg_color = parent.cget("bg")
+            except tk.TclError:
+                bg_color = "#F8FAFC"
+        super().__init__(parent, bg=bg_color)
+
+        self._frame_index = 0
+        self._animation_id: Optional[str] = None
+        self._is_destroyed = False
+
+        self.spinner_label = tk.Label(
+            self, text=LoadingOverlay.SPINNER_FRAMES[0],
+            font=("Segoe UI", 24), bg=bg_color, fg=accent_color
+        )
+        self.spinner_label.pack(pady=(0, 8))
+        tk.Label(self, text=message, font=("Segoe UI", 11), bg=bg_color, fg=fg_color).pack()
+
+        self.pack(pady=40)
+        self._animate()
+
+    def _animate(self) -> None:
+        """Animate the spinner."""
+        if self._is_destroyed:
+            return
+        try:
+            frames = LoadingOverlay.SPINNER_FRAMES
+            self.spinner_label.configure(text=frames[self._frame_index])
+            self._frame_index = (self._frame_index + 1) % len(frames)
+            self._animation_id = self.after(80, self._animate)
+        except tk.TclError:
+            pass  # Widget may have been destroyed
+
+    def destroy(self) -> None:
+        """Stop the animation and remove the indicator."""
+        if self._is_destroyed:
+            return
+        self._is_destroyed = True
+        if self._animation_id:
+            try:
+                self.after_cancel(self._animation_id)
+            except tk.TclError:
+                pass
+        try:
+            super().destroy()
+        except tk.TclError:
+            pass
+
+
 def show_loading(
     parent: tk.Tk | tk.Toplevel, 
     message: str = "Loading..."
@@ -9,8 +9,8 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
 # App imports
-from app.models import Score, JournalEntry
-from app.db import get_session, safe_db_context
+from app.analysis.correlation import describe_correlation, get_user_correlations
+from app.services.dashboard_snapshot import dashboard_snapshots
 
 class CorrelationTab:
     def __init__(self, parent_frame, username):
@@ -61,17 +61,12 @@ class CorrelationTab:
                 widget.destroy()
 
             # Fetch data
-            with safe_db_context() as session:
-                scores_data = session.query(Score).filter(
-                    Score.username == self.username
-                ).order_by(Score.timestamp).all()
+            scores = [r.total_score for r in dashboard_snapshots.get(self.username).scores_by_time()]
             
-            if len(scores_data) < 2:
+            if len(scores) < 2:
                 self.results_text.insert(tk.END, "⚠️ Need at least 2 EQ tests for correlation analysis.\n")
                 return
             
-            scores = [s.total_score for s in scores_data]
-            
             # Start analysis
             self.results_text.insert(tk.END, "📊 **CORRELATION ANALYSIS RESULTS**\n")
             self.results_text.insert(tk.END, "="*60 + "\n\n")
@@ -157,14 +152,8 @@ class CorrelationTab:
             # 6. Create visualizations
             self.create_visualizations(scores)
             
-            # 7. Check journal correlation if available
-            with safe_db_context() as session:
-                journal_data = session.query(JournalEntry).filter(
-                    JournalEntry.username == self.username
-                ).all()
-
-            if journal_data:
-                self.analyze_journal_correlation(scores, journal_data)
+            # 7. Correlate with journal wellbeing metrics
+            self.analyze_journal_correlation(get_user_correlations(self.username))
             
             self.results_text.insert(tk.END, "\n" + "="*60 + "\n")
             self.results_text.insert(tk.END, "✅ **Analysis complete!** Check visualizations below.\n")
@@ -242,25 +231,13 @@ class CorrelationTab:
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
-    def analyze_journal_correlation(self, eq_scores, journal_data):
-        """Analyze correlation with journal data"""
-        sentiments = [j.sentiment_score for j in journal_data if j.sentiment_score is not None]
+    def analyze_journal_correlation(self, report):
+        """Show how journal metrics (same day and day before) relate to EQ scores"""
+        self.results_text.insert(tk.END, "\n📝 **Journal Correlation Analysis:**\n")
         
-        if sentiments and len(eq_scores) >= 2 and len(sentiments) >= 2:
-            self.results_text.insert(tk.END, "\n📝 **Journal Correlation Analysis:**\n")
-            
-            avg_sentiment = np.mean(sentiments)
-            self.results_text.insert(tk.END, f"• Average journal sentiment: {avg_sentiment:.2f}\n")
-            
-            # Simple correlation analysis
-            recent_eq_avg = np.mean(eq_scores[-min(3, len(eq_scores)):])
-            recent_sentiment_avg = np.mean(sentiments[-min(3, len(sentiments)):])
-            
-            if recent_sentiment_avg > 0 and recent_eq_avg > np.mean(eq_scores):
-                self.results_text.insert(tk.END, "✅ Positive sentiment correlates with higher EQ scores\n")
-            elif recent_sentiment_avg < 0 and recent_eq_avg < np.mean(eq_scores):
-                self.results_text.insert(tk.END, "⚠️ Negative sentiment may affect EQ performance\n")
-            else:
-                self.results_text.insert(tk.END, "🔍 No clear correlation with journal sentiment\n")
-    
-
+        if not report["eq_correlations"]:
+            self.results_text.insert(tk.END, "🔍 Not enough days with both an EQ test and journal data yet\n")
+            return
+        
+        for row in report["eq_correlations"]:
+            self.results_text.insert(tk.END, f"• {describe_correlation(row)}\n")
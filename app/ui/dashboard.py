@@ -2,42 +2,49 @@
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
-from collections import Counter
-import matplotlib
-matplotlib.use("Agg") # Prevent GUI mainloop conflicts
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
 import json
 import os
 import sqlite3
-import numpy as np
 from typing import Optional, Dict, List, Any, Tuple
 
+from app.utils.lazy_imports import lazy_attr, lazy_import, module_available, select_agg_backend
+
+# Charting stack loads when the first chart is drawn (Agg prevents GUI mainloop conflicts)
+plt = lazy_import("matplotlib.pyplot", before_import=select_agg_backend)
+FigureCanvasTkAgg = lazy_attr("matplotlib.backends.backend_tkagg", "FigureCanvasTkAgg",
+                              before_import=select_agg_backend)
+Figure = lazy_attr("matplotlib.figure", "Figure", before_import=select_agg_backend)
+mdates = lazy_import("matplotlib.dates")
+np = lazy_import("numpy")
+
 from app.i18n_manager import get_i18n
-from app.models import Score, JournalEntry, SatisfactionRecord
-from app.db import get_connection, safe_db_context
+from app.db import get_connection
 from app.analysis.time_based_analysis import time_analyzer
+from app.analysis.correlation import describe_correlation, get_user_correlations
+from app.ui.data_loader import ViewDataLoader, run_view_load
+from app.ui.components.chart_widget import ChartWidget
+from app.services.dashboard_snapshot import DashboardSnapshot, dashboard_snapshots
 
-# Import emotional profile clustering
-try:
-    from app.ml.clustering import (
-        EmotionalProfileClusterer,
-        ClusteringVisualizer,
-        EMOTIONAL_PROFILES,
-        create_profile_clusterer,
-        get_user_emotional_profile
-    )
-    CLUSTERING_AVAILABLE = True
-except ImportError:
-    CLUSTERING_AVAILABLE = False
+# Emotional profile clustering (pandas/sklearn) loads when its tab renders
+CLUSTERING_AVAILABLE = module_available("sklearn") and module_available("pandas")
+EmotionalProfileClusterer = lazy_attr("app.ml.clustering", "EmotionalProfileClusterer")
+ClusteringVisualizer = lazy_attr("app.ml.clustering", "ClusteringVisualizer")
+create_profile_clusterer = lazy_attr("app.ml.clustering", "create_profile_clusterer")
+get_user_emotional_profile = lazy_attr("app.ml.clustering", "get_user_emotional_profile")
 
 
 class AnalyticsDashboard:
-    def __init__(self, parent_root: tk.Widget, username: str, colors: Optional[Dict[str, str]] = None, theme: str = "light") -> None:
+    def __init__(self, parent_root: tk.Widget, username: str, colors: Optional[Dict[str, str]] = None, theme: str = "light",
+                 loader: Optional[ViewDataLoader] = None) -> None:
         self.parent_root = parent_root
         self.username = username
+        # Runs tab queries off the UI thread; None loads synchronously
+        self.loader = loader
+        # Shared inputs for every panel, loaded once per render
+        self.snapshot: Optional[DashboardSnapshot] = None
+        # Persistent charts, updated in place instead of rebuilt
+        self.eq_chart: Optional[ChartWidget] = None
+        self.correlation_chart: Optional[ChartWidget] = None
         self.benchmarks = self.load_benchmarks()
         self.i18n = get_i18n()
         self.theme = theme
@@ -133,6 +140,30 @@ class AnalyticsDashboard:
         
         notebook = ttk.Notebook(dashboard)
         notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=(10, 20))
+
+        # One snapshot query feeds every tab
+        run_view_load(
+            self.loader,
+            fetch=lambda: dashboard_snapshots.get(self.username),
+            on_success=lambda snapshot: self._render_tabs(notebook, snapshot),
+            on_error=lambda e: self._show_load_error(notebook, e),
+            owner=notebook,
+            message="Loading analytics...",
+        )
+
+    def _current_snapshot(self) -> DashboardSnapshot:
+        """Snapshot for this render, loading it on first use when a tab is shown on its own."""
+        if self.snapshot is None:
+            self.snapshot = dashboard_snapshots.get(self.username)
+        return self.snapshot
+
+    def _show_load_error(self, parent, error):
+        tk.Label(parent, text=f"Could not load analytics: {error}", fg="red",
+                 font=("Arial", 12)).pack(pady=50)
+
+    def _render_tabs(self, notebook: ttk.Notebook, snapshot: DashboardSnapshot) -> None:
+        """Add every analytics tab, all rendered from ``snapshot``."""
+        self.snapshot = snapshot
         
         # Correlation Analysis Tab
         correlation_frame = ttk.Frame(notebook)
@@ -282,117 +313,122 @@ class AnalyticsDashboard:
     def show_satisfaction_analytics(self, parent):
         """Show satisfaction analytics"""
         parent = self._create_scrollable_frame(parent)
-        # Fetch satisfaction data
         try:
-            with safe_db_context() as session:
-                records = session.query(SatisfactionRecord).filter(
-                    SatisfactionRecord.username == self.username
-                ).order_by(SatisfactionRecord.timestamp.desc()).all()
-                
-                if not records:
-                    tk.Label(parent, 
-                            text="No satisfaction data available.\n\n"
-                                 "Complete a satisfaction survey to see your trends!",
-                            font=("Arial", 14)).pack(pady=50)
-                    return
-                
-                # Title
+            records = self._current_snapshot().satisfaction_records()
+        except Exception as e:
+            self._show_satisfaction_error(parent, e)
+            return
+        self._render_satisfaction_analytics(parent, records)
+
+    def _render_satisfaction_analytics(self, parent, records):
+        try:
+            if not records:
                 tk.Label(parent, 
-                        text="📊 Work/Study Satisfaction Trends",
-                        font=("Arial", 16, "bold")).pack(pady=10)
-                
-                # Overall stats
-                stats_frame = tk.Frame(parent, bg="#f0f9ff", relief=tk.RIDGE, bd=2)
-                stats_frame.pack(fill="x", padx=20, pady=10)
-                
-                avg_score = sum(r.satisfaction_score for r in records) / len(records)
-                latest = records[0].satisfaction_score
-                
-                tk.Label(stats_frame, 
-                        text=f"Latest Score: {latest}/10 | Average: {avg_score:.1f}/10 | Total Surveys: {len(records)}",
-                        font=("Arial", 12, "bold"),
-                        bg="#f0f9ff").pack(pady=10)
-                
-                # Create matplotlib chart
-                fig = Figure(figsize=(8, 4), dpi=100)
-                ax = fig.add_subplot(111)
-                
-                # Plot satisfaction scores over time
-                dates = [datetime.fromisoformat(r.timestamp) for r in records]
-                scores = [r.satisfaction_score for r in records]
-                
-                ax.plot(dates, scores, 'o-', color='#8B5CF6', linewidth=2, markersize=8)
-                ax.fill_between(dates, scores, alpha=0.2, color='#8B5CF6')
-                ax.set_xlabel('Date')
-                ax.set_ylabel('Satisfaction Score (1-10)')
-                ax.set_title('Satisfaction Trend Over Time')
-                ax.grid(True, alpha=0.3)
-                
-                # Format x-axis dates
-                fig.autofmt_xdate()
-                
-                # Embed in tkinter
-                canvas = FigureCanvasTkAgg(fig, parent)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-                
-                # Factors analysis
-                factors_frame = tk.Frame(parent)
-                factors_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-                
-                tk.Label(factors_frame,
-                        text="📈 Top Factors Affecting Your Satisfaction",
-                        font=("Arial", 14, "bold")).pack(anchor="w", pady=10)
-                
-                # Analyze common factors
-                positive_counts = {}
-                negative_counts = {}
-                
-                for record in records:
-                    if record.positive_factors:
-                        factors = json.loads(record.positive_factors)
-                        for factor in factors:
-                            positive_counts[factor] = positive_counts.get(factor, 0) + 1
-                    
-                    if record.negative_factors:
-                        factors = json.loads(record.negative_factors)
-                        for factor in factors:
-                            negative_counts[factor] = negative_counts.get(factor, 0) + 1
-                
-                # Display top factors
-                cols_frame = tk.Frame(factors_frame)
-                cols_frame.pack(fill=tk.BOTH, expand=True)
-                
-                # Positive factors column
-                pos_frame = tk.Frame(cols_frame, relief=tk.GROOVE, bd=1)
-                pos_frame.pack(side="left", fill=tk.BOTH, expand=True, padx=(0, 5))
-                
-                tk.Label(pos_frame, text="✅ Strengths", 
-                        font=("Arial", 12, "bold")).pack(pady=10)
-                
-                for factor, count in sorted(positive_counts.items(), key=lambda x: x[1], reverse=True)[:3]:
-                    percentage = (count / len(records)) * 100
-                    tk.Label(pos_frame, 
-                            text=f"• {factor} ({percentage:.0f}% of surveys)",
-                            font=("Arial", 10)).pack(anchor="w", padx=10, pady=2)
-                
-                # Negative factors column
-                neg_frame = tk.Frame(cols_frame, relief=tk.GROOVE, bd=1)
-                neg_frame.pack(side="right", fill=tk.BOTH, expand=True, padx=(5, 0))
-                
-                tk.Label(neg_frame, text="⚠️ Challenges", 
-                        font=("Arial", 12, "bold")).pack(pady=10)
+                        text="No satisfaction data available.\n\n"
+                             "Complete a satisfaction survey to see your trends!",
+                        font=("Arial", 14)).pack(pady=50)
+                return
+            
+            # Title
+            tk.Label(parent, 
+                    text="📊 Work/Study Satisfaction Trends",
+                    font=("Arial", 16, "bold")).pack(pady=10)
+            
+            # Overall stats
+            stats_frame = tk.Frame(parent, bg="#f0f9ff", relief=tk.RIDGE, bd=2)
+            stats_frame.pack(fill="x", padx=20, pady=10)
+            
+            avg_score = sum(r.satisfaction_score for r in records) / len(records)
+            latest = records[0].satisfaction_score
+            
+            tk.Label(stats_frame, 
+                    text=f"Latest Score: {latest}/10 | Average: {avg_score:.1f}/10 | Total Surveys: {len(records)}",
+                    font=("Arial", 12, "bold"),
+                    bg="#f0f9ff").pack(pady=10)
+            
+            # Create matplotlib chart
+            fig = Figure(figsize=(8, 4), dpi=100)
+            ax = fig.add_subplot(111)
+            
+            # Plot satisfaction scores over time
+            dates = [datetime.fromisoformat(r.timestamp) for r in records]
+            scores = [r.satisfaction_score for r in records]
+            
+            ax.plot(dates, scores, 'o-', color='#8B5CF6', linewidth=2, markersize=8)
+            ax.fill_between(dates, scores, alpha=0.2, color='#8B5CF6')
+            ax.set_xlabel('Date')
+            ax.set_ylabel('Satisfaction Score (1-10)')
+            ax.set_title('Satisfaction Trend Over Time')
+            ax.grid(True, alpha=0.3)
+            
+            # Format x-axis dates
+            fig.autofmt_xdate()
+            
+            # Embed in tkinter
+            canvas = FigureCanvasTkAgg(fig, parent)
+            canvas.draw()
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+            
+            # Factors analysis
+            factors_frame = tk.Frame(parent)
+            factors_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+            
+            tk.Label(factors_frame,
+                    text="📈 Top Factors Affecting Your Satisfaction",
+                    font=("Arial", 14, "bold")).pack(anchor="w", pady=10)
+            
+            # Analyze common factors
+            positive_counts = {}
+            negative_counts = {}
+            
+            for record in records:
+                if record.positive_factors:
+                    factors = json.loads(record.positive_factors)
+                    for factor in factors:
+                        positive_counts[factor] = positive_counts.get(factor, 0) + 1
                 
-                for factor, count in sorted(negative_counts.items(), key=lambda x: x[1], reverse=True)[:3]:
-                    percentage = (count / len(records)) * 100
-                    tk.Label(neg_frame, 
-                            text=f"• {factor} ({percentage:.0f}% of surveys)",
-                            font=("Arial", 10)).pack(anchor="w", padx=10, pady=2)
+                if record.negative_factors:
+                    factors = json.loads(record.negative_factors)
+                    for factor in factors:
+                        negative_counts[factor] = negative_counts.get(factor, 0) + 1
+            
+            # Display top factors
+            cols_frame = tk.Frame(factors_frame)
+            cols_frame.pack(fill=tk.BOTH, expand=True)
+            
+            # Positive factors column
+            pos_frame = tk.Frame(cols_frame, relief=tk.GROOVE, bd=1)
+            pos_frame.pack(side="left", fill=tk.BOTH, expand=True, padx=(0, 5))
+            
+            tk.Label(pos_frame, text="✅ Strengths", 
+                    font=("Arial", 12, "bold")).pack(pady=10)
+            
+            for factor, count in sorted(positive_counts.items(), key=lambda x: x[1], reverse=True)[:3]:
+                percentage = (count / len(records)) * 100
+                tk.Label(pos_frame, 
+                        text=f"• {factor} ({percentage:.0f}% of surveys)",
+                        font=("Arial", 10)).pack(anchor="w", padx=10, pady=2)
+            
+            # Negative factors column
+            neg_frame = tk.Frame(cols_frame, relief=tk.GROOVE, bd=1)
+            neg_frame.pack(side="right", fill=tk.BOTH, expand=True, padx=(5, 0))
+            
+            tk.Label(neg_frame, text="⚠️ Challenges", 
+                    font=("Arial", 12, "bold")).pack(pady=10)
+            
+            for factor, count in sorted(negative_counts.items(), key=lambda x: x[1], reverse=True)[:3]:
+                percentage = (count / len(records)) * 100
+                tk.Label(neg_frame, 
+                        text=f"• {factor} ({percentage:.0f}% of surveys)",
+                        font=("Arial", 10)).pack(anchor="w", padx=10, pady=2)
             
         except Exception as e:
-            tk.Label(parent, 
-                    text=f"Error loading satisfaction data: {str(e)}",
-                    font=("Arial", 12), fg="red").pack(pady=50)
+            self._show_satisfaction_error(parent, e)
+
+    def _show_satisfaction_error(self, parent, error):
+        tk.Label(parent, 
+                text=f"Error loading satisfaction data: {str(error)}",
+                font=("Arial", 12), fg="red").pack(pady=50)
     
     # ========== NEW CORRELATION ANALYSIS METHOD ==========
     def show_correlation_analysis(self, parent):
@@ -421,50 +457,40 @@ class AnalyticsDashboard:
                                        font=("Arial", 11), state='disabled')
         self.correlation_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Visualization frame
+        # Visualization frame (chart is created on the first run, then reused)
         self.correlation_viz_frame = tk.Frame(parent)
         self.correlation_viz_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.correlation_chart = None
     
     def run_correlation(self, parent):
         """Run correlation analysis"""
+        if not self.correlation_text:
+            return
+        # Refresh the snapshot (new tests may have been taken) and the journal
+        # correlations on a worker so the button doesn't freeze the UI
+        run_view_load(
+            self.loader,
+            fetch=lambda: (dashboard_snapshots.get(self.username), get_user_correlations(self.username)),
+            on_success=lambda result: self._show_correlation_results(*result),
+            on_error=self._show_correlation_error,
+            owner=self.correlation_text,
+            message="Running analysis...",
+        )
+
+    def _show_correlation_error(self, error):
+        self.correlation_text.configure(state='normal')
+        self.correlation_text.delete(1.0, tk.END)
+        self.correlation_text.insert(tk.END, f"❌ **Error:** {str(error)}\n")
+
+    def _show_correlation_results(self, snapshot: DashboardSnapshot, report: Dict[str, Any]) -> None:
         try:
             # Clear previous content
-            if self.correlation_text:
-                self.correlation_text.configure(state='normal') # Enable for updates
-                self.correlation_text.delete(1.0, tk.END)
-            else:
-                return
-            
-            # Clear previous visualization
-            for widget in self.correlation_viz_frame.winfo_children():
-                widget.destroy()
+            self.correlation_text.configure(state='normal') # Enable for updates
+            self.correlation_text.delete(1.0, tk.END)
             
             # Get EQ scores
-            conn = get_connection()
-            cursor = conn.cursor()
-            
-            # First, check what columns exist in the scores table
-            cursor.execute("PRAGMA table_info(scores)")
-            columns = [col[1] for col in cursor.fetchall()]
-            
-            # Build query based on available columns
-            if 'timestamp' in columns:
-                cursor.execute("""
-                    SELECT total_score, timestamp 
-                    FROM scores 
-                    WHERE username = ? 
-                    ORDER BY timestamp
-                """, (self.username,))
-            else:
-                cursor.execute("""
-                    SELECT total_score, id 
-                    FROM scores 
-                    WHERE username = ? 
-                    ORDER BY id
-                """, (self.username,))
-            
-            data = cursor.fetchall()
-            conn.close()
+            self.snapshot = snapshot
+            data = [(r.total_score, r.timestamp) for r in self.snapshot.scores_by_time()]
             
             if len(data) < 2:
                 self.correlation_text.insert(tk.END, 
@@ -531,6 +557,15 @@ class AnalyticsDashboard:
                     self.correlation_text.insert(tk.END, "🔀 **High variation** - Inconsistent performance\n")
                 self.correlation_text.insert(tk.END, "\n")
                 
+                # Journal wellbeing metrics vs EQ (cached per data version)
+                self.correlation_text.insert(tk.END, "📝 **Journal Correlations:**\n")
+                if report["eq_correlations"]:
+                    for row in report["eq_correlations"]:
+                        self.correlation_text.insert(tk.END, f"• {describe_correlation(row)}\n")
+                else:
+                    self.correlation_text.insert(tk.END, "• Not enough days with both an EQ test and journal data yet\n")
+                self.correlation_text.insert(tk.END, "\n")
+                
                 # Create visualizations
                 self.create_correlation_visualizations(scores)
                 
@@ -545,74 +580,57 @@ class AnalyticsDashboard:
             self.correlation_text.insert(tk.END, f"❌ **Error:** {str(e)}\n")
     
     def create_correlation_visualizations(self, scores):
-        """Create visualizations for correlation analysis"""
+        """Create (first run) or update in place (later runs) the correlation charts"""
         try:
             import numpy as np
             
-            # Create figure
-            fig = Figure(figsize=(10, 8))
+            first_run = self.correlation_chart is None
+            if first_run:
+                self.correlation_chart = self._create_correlation_chart(self.correlation_viz_frame)
+            chart = self.correlation_chart
+            x_values = np.arange(1, len(scores) + 1)
             
-            # Plot 1: Score trend
-            ax1 = fig.add_subplot(221)
-            x_values = range(1, len(scores) + 1)
-            ax1.plot(x_values, scores, 'o-', color='#4CAF50', linewidth=2)
-            ax1.set_title(self.i18n.get("dashboard.trend_title"), fontweight='bold')
-            ax1.set_xlabel(self.i18n.get("dashboard.trend_xlabel"))
-            ax1.set_ylabel(self.i18n.get("dashboard.trend_ylabel"))
-            ax1.grid(True, alpha=0.3)
-            
-            # Add trend line if enough points
+            # Plot 1: Score trend (trend line if enough points)
+            chart.set_line("scores", x_values, scores)
             if len(scores) >= 3:
                 z = np.polyfit(x_values, scores, 1)
-                p = np.poly1d(z)
-                ax1.plot(x_values, p(x_values), "r--", alpha=0.5)
-                ax1.text(0.05, 0.95, f'Trend: {z[0]:.2f}/test', 
-                        transform=ax1.transAxes, fontsize=10,
-                        bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5))
+                chart.set_line("trend", x_values, np.poly1d(z)(x_values))
+                trend_label = f'Trend: {z[0]:.2f}/test'
+            else:
+                chart.set_line("trend", [], [])
+                trend_label = ''
+            chart.text("trend", "trend", 0.05, 0.95, trend_label).set_visible(bool(trend_label))
             
             # Plot 2: Score distribution
-            ax2 = fig.add_subplot(222)
-            ax2.hist(scores, bins=5, color='#2196F3', edgecolor='black', alpha=0.7)
-            ax2.set_title(self.i18n.get("dashboard.distribution_title"), fontweight='bold')
-            ax2.set_xlabel(self.i18n.get("dashboard.distribution_xlabel"))
-            ax2.set_ylabel(self.i18n.get("dashboard.distribution_ylabel"))
-            ax2.grid(True, alpha=0.3)
+            counts, edges = np.histogram(scores, bins=5)
+            chart.set_bars("distribution", counts, x=edges[:-1], width=np.diff(edges))
             
             # Plot 3: Moving average
-            ax3 = fig.add_subplot(223)
             if len(scores) >= 3:
                 window = min(3, len(scores))
                 moving_avg = [np.mean(scores[max(0, i-window+1):i+1]) 
                              for i in range(len(scores))]
-                ax3.plot(x_values, moving_avg, 's-', color='#9C27B0', linewidth=2)
-                ax3.set_title(self.i18n.get("dashboard.moving_avg_title", window=window), fontweight='bold')
-                ax3.set_xlabel(self.i18n.get("dashboard.trend_xlabel"))
-                ax3.set_ylabel(self.i18n.get("dashboard.moving_avg_ylabel"))
-                ax3.grid(True, alpha=0.3)
+                chart.set_line("moving_avg", x_values, moving_avg)
+            else:
+                chart.set_line("moving_avg", [], [])
             
             # Plot 4: Performance comparison
-            ax4 = fig.add_subplot(224)
             if len(scores) >= 4:
                 half = len(scores) // 2
-                positions = [self.i18n.get("dashboard.first_half"), self.i18n.get("dashboard.second_half")]
                 averages = [np.mean(scores[:half]), np.mean(scores[half:])]
-                colors = ['#FF9800', '#4CAF50']
-                bars = ax4.bar(positions, averages, color=colors)
-                ax4.set_title(self.i18n.get("dashboard.performance_title"), fontweight='bold')
-                ax4.set_ylabel(self.i18n.get("dashboard.performance_ylabel"))
-                
-                # Add value labels
-                for bar, avg in zip(bars, averages):
-                    height = bar.get_height()
-                    ax4.text(bar.get_x() + bar.get_width()/2., height,
-                            f'{avg:.1f}', ha='center', va='bottom')
-            
-            fig.tight_layout()
-            
-            # Embed in tkinter
-            canvas = FigureCanvasTkAgg(fig, master=self.correlation_viz_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            else:
+                averages = [0, 0]
+            chart.set_bars("halves", averages)
+            for i, avg in enumerate(averages):
+                # Value labels
+                chart.text(f"half_{i}", "halves", i, avg, f'{avg:.1f}' if avg else '',
+                           ha='center', va='bottom')
+            
+            if first_run:
+                chart.draw(tight_layout=True)
+                chart.widget.pack(fill=tk.BOTH, expand=True)
+            else:
+                chart.refresh()
 
             # Make read-only
             if self.correlation_text:
@@ -622,37 +640,61 @@ class AnalyticsDashboard:
             self.correlation_text.insert(tk.END, f"⚠️ Could not create visualizations: {str(e)}\n")
             if self.correlation_text:
                  self.correlation_text.configure(state='disabled')
+
+    def _create_correlation_chart(self, parent) -> ChartWidget:
+        """Build the four correlation subplots once; runs only swap their data"""
+        chart = ChartWidget(parent, figsize=(10, 8))
+        
+        ax1 = chart.axes("trend", 221)
+        chart.line("scores", "trend", marker='o', linestyle='-', color='#4CAF50', linewidth=2)
+        chart.line("trend", "trend", linestyle='--', color='r', alpha=0.5)
+        chart.text("trend", "trend", 0.05, 0.95, "", transform=ax1.transAxes, fontsize=10,
+                   bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5))
+        ax1.set_title(self.i18n.get("dashboard.trend_title"), fontweight='bold')
+        ax1.set_xlabel(self.i18n.get("dashboard.trend_xlabel"))
+        ax1.set_ylabel(self.i18n.get("dashboard.trend_ylabel"))
+        ax1.grid(True, alpha=0.3)
+        
+        ax2 = chart.axes("distribution", 222)
+        chart.bars("distribution", "distribution", 5, align='edge',
+                   color='#2196F3', edgecolor='black', alpha=0.7)
+        ax2.set_title(self.i18n.get("dashboard.distribution_title"), fontweight='bold')
+        ax2.set_xlabel(self.i18n.get("dashboard.distribution_xlabel"))
+        ax2.set_ylabel(self.i18n.get("dashboard.distribution_ylabel"))
+        ax2.grid(True, alpha=0.3)
+        
+        ax3 = chart.axes("moving_avg", 223)
+        chart.line("moving_avg", "moving_avg", marker='s', linestyle='-', color='#9C27B0', linewidth=2)
+        ax3.set_title(self.i18n.get("dashboard.moving_avg_title", window=3), fontweight='bold')
+        ax3.set_xlabel(self.i18n.get("dashboard.trend_xlabel"))
+        ax3.set_ylabel(self.i18n.get("dashboard.moving_avg_ylabel"))
+        ax3.grid(True, alpha=0.3)
+        
+        ax4 = chart.axes("halves", 224)
+        chart.bars("halves", "halves", 2, color=['#FF9800', '#4CAF50'])
+        ax4.set_xticks([0, 1], [self.i18n.get("dashboard.first_half"), self.i18n.get("dashboard.second_half")])
+        ax4.set_title(self.i18n.get("dashboard.performance_title"), fontweight='bold')
+        ax4.set_ylabel(self.i18n.get("dashboard.performance_ylabel"))
+        return chart
     
     # ========== EXISTING METHODS (UPDATED) ==========
     def show_eq_trends(self, parent):
         """Show EQ score trends with matplotlib graph"""
         parent = self._create_scrollable_frame(parent)
+        try:
+            data = self._current_snapshot().eq_trend_rows()
+        except Exception as e:
+            print(f"Error fetching EQ trends: {e}")
+            data = []
+        self._render_eq_trends(parent, data)
+
+    def _render_eq_trends(self, parent, data):
         # Set colors
         colors = self.colors
         bg_color = colors.get("bg", "#F8FAFC")
         surface_color = colors.get("surface", "#FFFFFF")
         text_primary = colors.get("text_primary", "#0F172A")
-        text_secondary = colors.get("text_secondary", "#64748B")
-        
-        # Configure parent
-        # parent.configure(style="TFrame")
-        
-        conn = get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("""
-            SELECT total_score, timestamp, id, sentiment_score 
-            FROM scores 
-            WHERE username = ? 
-            ORDER BY id
-            """, (self.username,))
-            data = cursor.fetchall()
-        except Exception as e:
-            print(f"Error fetching EQ trends: {e}")
-            data = []
-        finally:
-            conn.close()
-        
+
         if not data:
             tk.Label(parent, text="No EQ data available", font=("Arial", 14), bg=bg_color, fg=text_primary).pack(pady=50)
             return
@@ -695,73 +737,26 @@ class AnalyticsDashboard:
             tk.Label(right_col, text=f"Progress: {symbol} {improvement:+d} ({improvement_pct:+.1f}%)", 
                     font=("Segoe UI", 11, "bold"), bg=surface_color, fg=color).pack(anchor="w", pady=2)
         
-        # Create matplotlib figure
-        plt.style.use('dark_background' if self.theme == 'dark' else 'default')
-        if self.theme == 'dark':
-            fig_bg = '#1E293B' # Surface color for dark mode chart
-            plot_bg = '#1E293B'
-            text_color = '#F8FAFC'
-            grid_color = '#334155'
-        else:
-            fig_bg = '#F8FAFC'
-            plot_bg = '#F8FAFC'
-            text_color = '#0F172A'
-            grid_color = '#E2E8F0'
-
-        fig = Figure(figsize=(6, 4), dpi=80, facecolor=fig_bg)
-        ax1 = fig.add_subplot(111)
-        ax1.set_facecolor(plot_bg)
-        
-        # Plot EQ Score
-        l1, = ax1.plot(range(1, len(scores) + 1), scores, 
-               marker='o', linestyle='-', linewidth=2, markersize=8,
-               color='#22C55E', markerfacecolor='#22C55E', 
-               markeredgewidth=2, markeredgecolor='white', label="EQ Score")
-        
-        ax1.set_xlabel('Attempt Number', fontsize=11, fontweight='bold', color=text_color)
-        ax1.set_ylabel('EQ Score', fontsize=11, fontweight='bold', color='#22C55E')
-        ax1.tick_params(axis='y', labelcolor='#22C55E', colors=text_color)
-        ax1.tick_params(axis='x', colors=text_color)
-        ax1.set_title('EQ Score & Emotional Sentiment Trends', fontsize=12, fontweight='bold', pad=15, color=text_color)
-        ax1.grid(True, alpha=0.3, linestyle='--', color=grid_color)
-        ax1.set_xticks(range(1, len(scores) + 1))
-        
-        for spine in ax1.spines.values():
-            spine.set_color(grid_color)
+        # Persistent chart; later updates replace the line data in place
+        chart = self.eq_chart = self._create_eq_chart(parent)
+        chart.set_line("eq", range(1, len(scores) + 1), scores)
+        lines = [chart.line("eq", "eq")]
         
         # Plot Sentiment Score (Secondary Axis)
         if sentiment_scores and any(s is not None and s != 0 for s in sentiment_scores):
-            ax2 = ax1.twinx()
             # Filter out Nones for plotting
             valid_indices = [i for i, s in enumerate(sentiment_scores) if s is not None]
-            valid_x = [i + 1 for i in valid_indices]
-            valid_y = [sentiment_scores[i] for i in valid_indices]
-            
-            l2, = ax2.plot(valid_x, valid_y, 
-                     marker='s', linestyle='--', linewidth=2, markersize=6,
-                     color='#F59E0B', markerfacecolor='#F59E0B',
-                     markeredgewidth=2, markeredgecolor='white', label="Sentiment")
-                     
-            ax2.set_ylabel('Sentiment Score (-100 to +100)', fontsize=11, fontweight='bold', color='#F59E0B')
-            ax2.tick_params(axis='y', labelcolor='#F59E0B', colors=text_color)
-            ax2.set_ylim(-110, 110)
-            
-            for spine in ax2.spines.values():
-                spine.set_color(grid_color)
-            
-            # Combined Legend
-            lines = [l1, l2]
-            labels = [l.get_label() for l in lines]
-            ax1.legend(lines, labels, loc='upper left')
-        else:
-            ax1.legend(loc='upper left')
+            chart.set_line("sentiment", [i + 1 for i in valid_indices],
+                           [sentiment_scores[i] for i in valid_indices])
+            chart.axes("sentiment").set_visible(True)
+            lines.append(chart.line("sentiment", "sentiment"))
         
-        fig.tight_layout()
+        # Combined Legend
+        chart.axes("eq").legend(lines, [l.get_label() for l in lines], loc='upper left')
         
         # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        chart.draw(tight_layout=True)
+        chart.widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
         # Add trend analysis
         if len(scores) >= 3:
@@ -786,13 +781,59 @@ class AnalyticsDashboard:
             tk.Label(trend_frame, text=trend_msg, 
                     font=("Arial", 10), bg="#e3f2fd", wraplength=500).pack(pady=5)
 
+    def _create_eq_chart(self, parent) -> ChartWidget:
+        """EQ score chart with a secondary sentiment axis (hidden until there is sentiment data)."""
+        from matplotlib.ticker import MaxNLocator
+
+        plt.style.use('dark_background' if self.theme == 'dark' else 'default')
+        if self.theme == 'dark':
+            fig_bg = '#1E293B' # Surface color for dark mode chart
+            plot_bg = '#1E293B'
+            text_color = '#F8FAFC'
+            grid_color = '#334155'
+        else:
+            fig_bg = '#F8FAFC'
+            plot_bg = '#F8FAFC'
+            text_color = '#0F172A'
+            grid_color = '#E2E8F0'
+
+        chart = ChartWidget(parent, figsize=(6, 4), dpi=80, facecolor=fig_bg)
+        ax1 = chart.axes("eq")
+        ax1.set_facecolor(plot_bg)
+        chart.line("eq", "eq", marker='o', linestyle='-', linewidth=2, markersize=8,
+                   color='#22C55E', markerfacecolor='#22C55E',
+                   markeredgewidth=2, markeredgecolor='white', label="EQ Score")
+        
+        ax1.set_xlabel('Attempt Number', fontsize=11, fontweight='bold', color=text_color)
+        ax1.set_ylabel('EQ Score', fontsize=11, fontweight='bold', color='#22C55E')
+        ax1.tick_params(axis='y', labelcolor='#22C55E', colors=text_color)
+        ax1.tick_params(axis='x', colors=text_color)
+        ax1.set_title('EQ Score & Emotional Sentiment Trends', fontsize=12, fontweight='bold', pad=15, color=text_color)
+        ax1.grid(True, alpha=0.3, linestyle='--', color=grid_color)
+        ax1.xaxis.set_major_locator(MaxNLocator(integer=True))
+        for spine in ax1.spines.values():
+            spine.set_color(grid_color)
+
+        # Sentiment Score (Secondary Axis)
+        ax2 = chart.axes("sentiment", twin_of="eq")
+        chart.line("sentiment", "sentiment", marker='s', linestyle='--', linewidth=2, markersize=6,
+                   color='#F59E0B', markerfacecolor='#F59E0B',
+                   markeredgewidth=2, markeredgecolor='white', label="Sentiment")
+        ax2.set_ylabel('Sentiment Score (-100 to +100)', fontsize=11, fontweight='bold', color='#F59E0B')
+        ax2.tick_params(axis='y', labelcolor='#F59E0B', colors=text_color)
+        ax2.set_ylim(-110, 110)
+        for spine in ax2.spines.values():
+            spine.set_color(grid_color)
+        ax2.set_visible(False)
+        return chart
+
     def show_time_based_analysis(self, parent):
         """Show time-based analysis of responses for returning users"""
         tk.Label(parent, text="⏰ Time-Based Response Analysis", 
                 font=("Arial", 14, "bold")).pack(pady=10)
         
         # Get score trends
-        trend_data = time_analyzer.analyze_score_trends(self.username)
+        trend_data = self._current_snapshot().score_trends()
         
         if "error" in trend_data:
             tk.Label(parent, text="No data available for time-based analysis", 
@@ -930,25 +971,8 @@ class AnalyticsDashboard:
     def show_journal_analytics(self, parent):
         """Show journal analytics"""
         parent = self._create_scrollable_frame(parent)
-        conn = get_connection() # Use centralized connection logic
-        cursor = conn.cursor()
-        
-        # Check if journal_entries table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='journal_entries'")
-        if not cursor.fetchone():
-            conn.close()
-            tk.Label(parent, text="Journal feature not yet used", font=("Arial", 14)).pack(pady=50)
-            return
-        
-        # Get journal data
-        cursor.execute("""
-            SELECT sentiment_score, emotional_patterns 
-            FROM journal_entries 
-            WHERE username = ? 
-            ORDER BY id
-        """, (self.username,))
-        rows = cursor.fetchall()
-        conn.close()
+        snapshot = self._current_snapshot()
+        rows = snapshot.journals
         
         if not rows:
             tk.Label(parent, text="No journal entries found", font=("Arial", 14)).pack(pady=50)
@@ -956,18 +980,16 @@ class AnalyticsDashboard:
             
         tk.Label(parent, text="📝 Journal Analytics", font=("Arial", 14, "bold")).pack(pady=10)
         
-        sentiments = [r[0] for r in rows if r[0] is not None]
-        
         # Stats
         stats_frame = tk.Frame(parent)
         stats_frame.pack(fill=tk.X, padx=20, pady=10)
         
         tk.Label(stats_frame, text=f"Total Entries: {len(rows)}", font=("Arial", 12)).pack(anchor="w")
         
-        if sentiments:
-            tk.Label(stats_frame, text=f"Avg Sentiment: {sum(sentiments)/len(sentiments):.1f}", 
+        if snapshot.journal_sentiment_count:
+            tk.Label(stats_frame, text=f"Avg Sentiment: {snapshot.average_journal_sentiment:.1f}", 
                     font=("Arial", 12)).pack(anchor="w")
-            tk.Label(stats_frame, text=f"Most Positive: {max(sentiments):.1f}", 
+            tk.Label(stats_frame, text=f"Most Positive: {snapshot.journal_sentiment_max:.1f}", 
                     font=("Arial", 12)).pack(anchor="w")
         
         # Patterns
@@ -977,12 +999,7 @@ class AnalyticsDashboard:
         tk.Label(patterns_frame, text="Top Emotional Patterns:", 
                 font=("Arial", 12, "bold")).pack(anchor="w")
         
-        all_patterns = []
-        for r in rows:
-            if r[1]: # emotional_patterns
-                all_patterns.extend(r[1].split('; '))
-        
-        pattern_counts = Counter(all_patterns)
+        pattern_counts = snapshot.pattern_counts
         
         patterns_text = tk.Text(patterns_frame, height=6, font=("Arial", 11))
         patterns_text.pack(fill=tk.BOTH, expand=True)
@@ -1173,6 +1190,7 @@ class AnalyticsDashboard:
             profiles_row = tk.Frame(dist_frame, bg="#f8f9fa")
             profiles_row.pack()
             
+            from app.ml.clustering import EMOTIONAL_PROFILES
             for pid, pinfo in EMOTIONAL_PROFILES.items():
                 is_current = pid == profile.get('cluster_id')
                 badge_bg = pinfo['color'] if is_current else "#cccccc"
@@ -1196,23 +1214,13 @@ class AnalyticsDashboard:
         
         scores = []
         test_sentiments = []
-        journal_sentiments = []
+        avg_journal_sentiment = None
 
         try:
-            with safe_db_context() as session:
-                # EQ and Sentiment insights from SCORES table
-                eq_rows = session.query(Score.total_score, Score.sentiment_score)\
-                    .filter_by(username=self.username)\
-                    .order_by(Score.id)\
-                    .all()
-                scores = [r[0] for r in eq_rows]
-                test_sentiments = [r[1] for r in eq_rows if r[1] is not None]
-                
-                # Journal insights purely from Journal entries
-                j_rows = session.query(JournalEntry.sentiment_score)\
-                    .filter_by(username=self.username)\
-                    .all()
-                journal_sentiments = [r[0] for r in j_rows]
+            snapshot = self._current_snapshot()
+            scores = [r.total_score for r in snapshot.scores]
+            test_sentiments = [r.sentiment_score for r in snapshot.scores if r.sentiment_score is not None]
+            avg_journal_sentiment = snapshot.average_journal_sentiment
         except Exception as e:
             # Log error but continue with empty data to avoid crashing UI
             print(f"Error generating insights: {e}")
@@ -1226,8 +1234,8 @@ class AnalyticsDashboard:
             else:
                 insights.append("💪 Focus on emotional awareness to boost EQ scores")
         
-        if journal_sentiments:
-            avg_sentiment = sum(journal_sentiments) / len(journal_sentiments)
+        if avg_journal_sentiment is not None:
+            avg_sentiment = avg_journal_sentiment
             if avg_sentiment > 20:
                 insights.append("😊 Your journal shows positive emotional tone - keep it up!")
             elif avg_sentiment < -20:
@@ -1260,22 +1268,47 @@ class AnalyticsDashboard:
         return insights
 
     # ========== WELLBEING ANALYTICS (PR 1.5) ==========
+    @staticmethod
+    def _sleep_mood_curve(sleeps, sentiments):
+        """
+        Line through mood by sleep hours: a cubic spline over per-hour averages
+        when there are enough distinct values, else the raw points in sleep order.
+
+        Returns:
+            (x, y, smoothed)
+        """
+        sorted_indices = sorted(range(len(sleeps)), key=lambda k: sleeps[k])
+        s_sleep = np.array([sleeps[i] for i in sorted_indices])
+        s_mood = np.array([sentiments[i] for i in sorted_indices])
+        
+        # Smooth Line Interpolation
+        try:
+            from scipy.interpolate import make_interp_spline
+            if len(s_sleep) > 3:
+                # Handle duplicate X values by grouping and averaging
+                unique_sleep_dict = {}
+                for s, m in zip(s_sleep, s_mood):
+                    unique_sleep_dict.setdefault(s, []).append(m)
+                
+                X_unique = np.array(sorted(unique_sleep_dict.keys()))
+                Y_unique = np.array([np.mean(unique_sleep_dict[k]) for k in X_unique])
+
+                if len(X_unique) > 3: # Check again after deduplication
+                    X_line = np.linspace(X_unique.min(), X_unique.max(), 300)
+                    spl = make_interp_spline(X_unique, Y_unique, k=3)
+                    return X_line, spl(X_line), True
+        except Exception as e:
+            # Fallback for any spline error (duplicates, singular matrix, etc)
+            print(f"Spline error: {e}")
+        return s_sleep, s_mood, False
+
     def show_wellbeing_analytics(self, parent):
         """Show wellbeing analytics (Sleep vs Mood, Work vs Mood)"""
         parent = self._create_scrollable_frame(parent)
-        # Fetch Data
-        conn = get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("""
-                SELECT sentiment_score, sleep_hours, energy_level, work_hours 
-                FROM journal_entries 
-                WHERE username = ? AND sleep_hours IS NOT NULL
-                ORDER BY entry_date ASC
-            """, (self.username,))
-            rows = cursor.fetchall()
-        finally:
-            conn.close()
+        rows = [
+            (r.sentiment_score, r.sleep_hours, r.energy_level, r.work_hours)
+            for r in self._current_snapshot().wellbeing_rows()
+        ]
 
         # Handle Empty State
         if len(rows) < 3:
@@ -1319,7 +1352,6 @@ class AnalyticsDashboard:
         
         # Matplotlib Setup - Modern Style
         plt.style.use('seaborn-v0_8-whitegrid' if plt.style.available else 'fast')
-        fig = Figure(figsize=(10, 5), dpi=100)
         
         # Theme Colors
         is_dark = self.theme == "dark"
@@ -1327,55 +1359,23 @@ class AnalyticsDashboard:
         text_color = "white" if is_dark else "#333333"
         grid_color = "#334155" if is_dark else "#E5E7EB"
         
-        fig.patch.set_facecolor(bg_color)
+        chart = ChartWidget(viz_frame, figsize=(10, 5), dpi=100, facecolor=bg_color)
 
         # Plot 1: Sleep vs Sentiment (Smooth Line + Gradient Fill)
-        ax1 = fig.add_subplot(121)
+        ax1 = chart.axes("sleep", 121)
         ax1.set_facecolor(bg_color)
+        chart.line("sleep_curve", "sleep", color='#8B5CF6', linewidth=3, alpha=1.0)
+        # Scatter Accents (Pink)
+        chart.line("sleep_points", "sleep", linestyle='none', marker='o', markersize=9,
+                   markerfacecolor='#EC4899', markeredgecolor='white', markeredgewidth=2, zorder=5)
         
-        # Sort for line plotting
         if len(sleeps) > 0:
-            sorted_indices = sorted(range(len(sleeps)), key=lambda k: sleeps[k])
-            s_sleep = np.array([sleeps[i] for i in sorted_indices])
-            s_mood = np.array([sentiments[i] for i in sorted_indices])
-            
-            # Smooth Line Interpolation
-            try:
-                from scipy.interpolate import make_interp_spline
-                if len(s_sleep) > 3:
-                    # Handle duplicate X values by grouping and averaging
-                    unique_sleep_dict = {}
-                    for s, m in zip(s_sleep, s_mood):
-                        if s not in unique_sleep_dict:
-                            unique_sleep_dict[s] = []
-                        unique_sleep_dict[s].append(m)
-                    
-                    sorted_unique_sleep = sorted(unique_sleep_dict.keys())
-                    avg_mood_unique = [np.mean(unique_sleep_dict[k]) for k in sorted_unique_sleep]
-                    
-                    X_unique = np.array(sorted_unique_sleep)
-                    Y_unique = np.array(avg_mood_unique)
-
-                    if len(X_unique) > 3: # Check again after deduplication
-                        X_line = np.linspace(X_unique.min(), X_unique.max(), 300)
-                        spl = make_interp_spline(X_unique, Y_unique, k=3)
-                        Y_line = spl(X_line)
-                        # Vibrant Purple Line
-                        ax1.plot(X_line, Y_line, color='#8B5CF6', linewidth=3, alpha=1.0)
-                        # Gradient Fill
-                        ax1.fill_between(X_line, Y_line, alpha=0.15, color='#8B5CF6')
-                    else:
-                        # Fallback if deduplication reduces points too much
-                         ax1.plot(s_sleep, s_mood, color='#8B5CF6', linewidth=2, alpha=0.8)
-                else:
-                    ax1.plot(s_sleep, s_mood, color='#8B5CF6', linewidth=3, alpha=1.0)
-            except Exception as e:
-                # Fallback for any spline error (duplicates, singular matrix, etc)
-                print(f"Spline error: {e}")
-                ax1.plot(s_sleep, s_mood, color='#8B5CF6', linewidth=3, alpha=1.0)
-
-            # Scatter Accents (Pink)
-            ax1.scatter(sleeps, sentiments, c='#EC4899', s=80, edgecolors='white', linewidth=2, zorder=5)
+            curve_x, curve_y, smooth = self._sleep_mood_curve(sleeps, sentiments)
+            chart.set_line("sleep_curve", curve_x, curve_y)
+            if smooth:
+                # Gradient Fill
+                chart.fill("sleep_fill", "sleep", curve_x, curve_y, alpha=0.15, color='#8B5CF6')
+            chart.set_line("sleep_points", sleeps, sentiments, decimated=False)
 
         ax1.set_title("Sleep Quality & Mood", color=text_color, fontweight="bold", fontsize=11, pad=15)
         ax1.set_xlabel("Sleep Hours", color="#94A3B8", fontsize=9)
@@ -1391,7 +1391,7 @@ class AnalyticsDashboard:
         ax1.spines['bottom'].set_color(grid_color)
 
         # Plot 2: Productivity Sweet Spot (Vibrant Pillars)
-        ax2 = fig.add_subplot(122)
+        ax2 = chart.axes("work", 122)
         ax2.set_facecolor(bg_color)
         
         # Binning Logic
@@ -1409,7 +1409,9 @@ class AnalyticsDashboard:
         
         # Vibrant Colors: Amber -> Emerald -> Blue
         bar_colors = ["#F59E0B", "#10B981", "#3B82F6"]
-        bars = ax2.bar(buckets.keys(), bucket_avgs, color=bar_colors, width=0.5, edgecolor=None)
+        chart.bars("work", "work", len(bucket_avgs), color=bar_colors, width=0.5, edgecolor=None)
+        chart.set_bars("work", bucket_avgs)
+        ax2.set_xticks(range(len(buckets)), list(buckets.keys()))
         
         ax2.set_title("Productivity Sweet Spot", color=text_color, fontweight="bold", fontsize=11, pad=15)
         ax2.set_xlabel("Work Duration", color="#94A3B8", fontsize=9)
@@ -1425,20 +1427,15 @@ class AnalyticsDashboard:
         ax2.spines['bottom'].set_color(grid_color)
         
         # Annotate Bars
-        for bar in bars:
-            height = bar.get_height()
+        for i, height in enumerate(bucket_avgs):
             if height != 0:
-                ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                         f'{height:.1f}',
-                         ha='center', va='bottom',
-                         color=text_color, fontweight="bold", fontsize=9)
+                chart.text(f"work_{i}", "work", i, height + 0.5, f'{height:.1f}',
+                           ha='center', va='bottom',
+                           color=text_color, fontweight="bold", fontsize=9)
 
-        fig.tight_layout()
-        
         # Render
-        canvas = FigureCanvasTkAgg(fig, viz_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        chart.draw(tight_layout=True)
+        chart.widget.pack(fill=tk.BOTH, expand=True)
 
         # --- Text Insights ---
         insights_panel = tk.Frame(parent, bg="#F0F9FF" if not is_dark else "#1E293B", relief=tk.RIDGE, bd=1)
@@ -0,0 +1,279 @@
+"""
+View Data Loader
+
+Runs view queries on a small worker pool so the Tk main thread never blocks
+on SQL, then hands results back to the UI thread.
+
+Tk widgets may only be touched from the thread running the mainloop, so
+workers never call back into Tk directly: finished jobs are put on a queue
+that the main thread drains from a ``root.after`` poll. Loads are grouped by
+view; switching views cancels everything still pending for the old one, and
+results for cancelled loads (or for views whose widgets are gone) are dropped.
+
+Usage:
+    loader = ViewDataLoader(root)
+
+    loader.load(
+        fetch=lambda: fetch_rows(username),       # worker thread, no Tk calls
+        on_success=lambda rows: render(rows),     # UI thread
+        owner=container,                          # spinner shown here
+        message="Loading history...",
+    )
+
+    loader.cancel_view()   # e.g. when the user switches views
+
+Fetch functions run outside the caller's database session and should return
+plain data (tuples, dicts), not ORM objects tied to a closed session.
+"""
+
+import logging
+import queue
+import threading
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.ui.components.loading_overlay import InlineLoadingIndicator, show_loading, hide_loading
+
+logger = logging.getLogger(__name__)
+
+
+class LoadHandle:
+    """A single pending load; cancel() drops its result."""
+
+    def __init__(self, loader: "ViewDataLoader", view: str, fetch: Callable[[], Any],
+                 on_success: Callable[[Any], None],
+                 on_error: Optional[Callable[[Exception], None]], owner: Optional[tk.Widget]):
+        self.loader = loader
+        self.view = view
+        self.fetch = fetch
+        self.on_success = on_success
+        self.on_error = on_error
+        self.owner = owner
+        self.indicator: Optional[tk.Widget] = None
+        self.future: Optional[Future] = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Cancel the load; the callbacks will not run. Call from the UI thread."""
+        self.loader._discard(self)
+
+    def _mark_cancelled(self) -> None:
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+
+class ViewDataLoader:
+    """Worker pool for view queries with UI-thread result delivery."""
+
+    POLL_INTERVAL_MS = 30
+
+    def __init__(self, root: tk.Misc, max_workers: int = 4):
+        """
+        Create a loader bound to a Tk root.
+
+        Args:
+            root: Widget whose ``after`` schedules result delivery
+            max_workers: Size of the query worker pool
+        """
+        self.root = root
+        self.current_view = "default"
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="view-loader")
+        self._results: "queue.Queue[tuple]" = queue.Queue()
+        self._pending: set = set()
+        self._poll_id: Optional[str] = None
+        self._closed = False
+
+    def load(
+        self,
+        fetch: Callable[[], Any],
+        on_success: Callable[[Any], None],
+        on_error: Optional[Callable[[Exception], None]] = None,
+        owner: Optional[tk.Widget] = None,
+        message: Optional[str] = None,
+        modal: bool = False,
+        view: Optional[str] = None,
+    ) -> LoadHandle:
+        """
+        Run ``fetch`` on a worker and deliver its result on the UI thread.
+
+        Must be called from the UI thread.
+
+        Args:
+            fetch: Query function (runs on a worker thread; must not touch Tk)
+            on_success: Called with the result on the UI thread
+            on_error: Called with the exception on the UI thread (logged if omitted)
+            owner: Widget the result is for; delivery is skipped once it is destroyed
+            message: Show a loading indicator with this message while fetching
+            modal: Use the blocking LoadingOverlay instead of an inline spinner
+            view: View the load belongs to (defaults to the current view)
+
+        Returns:
+            LoadHandle that can be cancelled
+        """
+        handle = LoadHandle(self, view or self.current_view, fetch, on_success, on_error, owner)
+
+        if self._closed:
+            handle._mark_cancelled()
+            return handle
+
+        if message:
+            handle.indicator = self._show_indicator(owner, message, modal)
+
+        self._pending.add(handle)
+        handle.future = self._executor.submit(self._run, handle)
+        self._schedule_poll()
+        return handle
+
+    def begin_view(self, view: str, cancel_previous: bool = True) -> None:
+        """
+        Make ``view`` current, cancelling loads for the previous view.
+
+        Args:
+            view: View being shown
+            cancel_previous: Set False when the previous view is kept alive
+                (e.g. cached) so its loads can still complete
+        """
+        if cancel_previous:
+            self.cancel_view()
+        self.current_view = view
+
+    def cancel_view(self, view: Optional[str] = None) -> int:
+        """
+        Cancel pending loads for a view (the current view by default).
+
+        Returns:
+            Number of loads cancelled
+        """
+        view = view or self.current_view
+        stale = [h for h in self._pending if h.view == view]
+        for handle in stale:
+            self._discard(handle)
+        return len(stale)
+
+    def cancel_all(self) -> None:
+        """Cancel every pending load."""
+        for handle in list(self._pending):
+            self._discard(handle)
+
+    def shutdown(self) -> None:
+        """Cancel pending loads and stop the worker pool."""
+        self._closed = True
+        self.cancel_all()
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except tk.TclError:
+                pass
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    # ---------------------------------------------------------------- internal
+
+    def _run(self, handle: LoadHandle) -> None:
+        """Worker thread: execute the fetch and queue the outcome."""
+        if handle.cancelled:
+            return
+        try:
+            result, error = handle.fetch(), None
+        except Exception as e:
+            result, error = None, e
+        self._results.put((handle, result, error))
+
+    def _schedule_poll(self) -> None:
+        if self._poll_id is None and not self._closed:
+            self._poll_id = self.root.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """UI thread: deliver finished loads, then poll again while any are pending."""
+        self._poll_id = None
+        while True:
+            try:
+                handle, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(handle, result, error)
+
+        if self._pending:
+            self._schedule_poll()
+
+    def _deliver(self, handle: LoadHandle, result: Any, error: Optional[Exception]) -> None:
+        if handle not in self._pending or handle.cancelled:
+            return  # Cancelled while the query was running
+        self._finish(handle)
+
+        if handle.owner is not None and not self._widget_alive(handle.owner):
+            return
+
+        if error is not None:
+            if handle.on_error is not None:
+                handle.on_error(error)
+            else:
+                logger.error(f"View data load failed: {error}")
+            return
+        handle.on_success(result)
+
+    def _discard(self, handle: LoadHandle) -> None:
+        """Cancel a load and remove its loading indicator."""
+        handle._mark_cancelled()
+        self._finish(handle)
+
+    def _finish(self, handle: LoadHandle) -> None:
+        """Forget a load and remove its loading indicator."""
+        self._pending.discard(handle)
+        if handle.indicator is not None:
+            hide_loading(handle.indicator)
+            handle.indicator = None
+
+    @staticmethod
+    def _show_indicator(owner: Optional[tk.Widget], message: str, modal: bool) -> Optional[tk.Widget]:
+        if owner is None:
+            return None
+        try:
+            if modal:
+                return show_loading(owner.winfo_toplevel(), message)
+            return InlineLoadingIndicator(owner, message)
+        except tk.TclError:
+            return None
+
+    @staticmethod
+    def _widget_alive(widget: tk.Widget) -> bool:
+        try:
+            return bool(widget.winfo_exists())
+        except tk.TclError:
+            return False
+
+
+def run_view_load(
+    loader: Optional[ViewDataLoader],
+    fetch: Callable[[], Any],
+    on_success: Callable[[Any], None],
+    on_error: Optional[Callable[[Exception], None]] = None,
+    **kwargs: Any,
+) -> Optional[LoadHandle]:
+    """
+    Load through ``loader`` when one is available, otherwise synchronously.
+
+    Lets views keep working when constructed outside the main app
+    (dialogs, tests) without a loader.
+    """
+    if loader is not None:
+        return loader.load(fetch, on_success, on_error, **kwargs)
+    try:
+        result = fetch()
+    except Exception as e:
+        if on_error is None:
+            raise
+        on_error(e)
+        return None
+    on_success(result)
+    return None
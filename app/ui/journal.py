@@ -6,17 +6,6 @@ from tkinter import ttk, messagebox, scrolledtext
 from datetime import datetime, timedelta
 import logging
 
-# Conditional import for NLTK - sentiment analysis is optional
-try:
-    import nltk
-    from nltk.sentiment import SentimentIntensityAnalyzer
-    NLTK_AVAILABLE = True
-except ImportError:
-    logging.warning("NLTK not available - sentiment analysis will be disabled")
-    nltk = None
-    SentimentIntensityAnalyzer = None
-    NLTK_AVAILABLE = False
-
 from sqlalchemy import desc, text
 
 from app.i18n_manager import get_i18n
@@ -24,22 +13,24 @@ from app.i18n_manager import get_i18n
 from app.models import JournalEntry, User
 from app.db import get_session, safe_db_context
 from app.services.journal_service import JournalService
+from app.ui.data_loader import run_view_load
+from app.ui.components.chart_widget import ChartWidget
 from app.validation import validate_required, validate_length, validate_range, sanitize_text, RANGES
 from app.validation import MAX_TEXT_LENGTH
 
-# Matplotlib imports for mood trend charts
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    import matplotlib.dates as mdates
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    plt = None
-    Figure = None
-    FigureCanvasTkAgg = None
-    mdates = None
+from app.utils.lazy_imports import lazy_attr, lazy_import, module_available, select_agg_backend
+
+# Sentiment analysis (NLTK) is optional and loads when the journal opens
+NLTK_AVAILABLE = module_available("nltk")
+if not NLTK_AVAILABLE:
+    logging.warning("NLTK not available - sentiment analysis will be disabled")
+nltk = lazy_import("nltk") if NLTK_AVAILABLE else None
+SentimentIntensityAnalyzer = lazy_attr("nltk.sentiment", "SentimentIntensityAnalyzer") if NLTK_AVAILABLE else None
+
+# Matplotlib for mood trend charts, loaded when the first chart is drawn
+MATPLOTLIB_AVAILABLE = module_available("matplotlib")
+plt = lazy_import("matplotlib.pyplot", before_import=select_agg_backend) if MATPLOTLIB_AVAILABLE else None
+mdates = lazy_import("matplotlib.dates")
 
 # Lazy imports to avoid circular dependencies
 # These will be imported only when needed
@@ -58,6 +49,7 @@ class JournalFeature:
         """
         self.parent_root = parent_root
         self.app = app  # Store app reference for theming (can be None)
+        self._inline_results_load = None  # Pending background search, if any
         self.i18n = get_i18n()
         
         # Initialize theme colors (with defaults)
@@ -391,57 +383,80 @@ class JournalFeature:
         to_date = self.inline_to_date_var.get().strip()
         selected_mood = self.inline_mood_var.get()
 
+        # A newer search supersedes one still running
+        if self._inline_results_load is not None:
+            self._inline_results_load.cancel()
+
+        self._inline_results_load = run_view_load(
+            getattr(self.app, "view_loader", None),
+            fetch=lambda: self._fetch_filtered_entries(self.username, selected_tags, from_date,
+                                                       to_date, selected_mood),
+            on_success=self._render_inline_results,
+            owner=self.results_scrollable_frame,
+            message="Searching entries...",
+        )
+
+    @staticmethod
+    def _fetch_filtered_entries(username, tags_filter, from_date, to_date, mood_filter):
+        """Journal entries matching the inline filters, newest first (runs off the UI thread)."""
         with safe_db_context() as session:
             entries = session.query(JournalEntry)\
-                .filter_by(username=self.username)\
+                .filter_by(username=username)\
                 .order_by(desc(JournalEntry.entry_date))\
                 .all()
+            # Detach so the entries stay readable after the session closes
+            session.expunge_all()
+
+        matches = []
+        for entry in entries:
+            # Apply tags filter
+            if tags_filter and tags_filter != "e.g., stress, gratitude":
+                entry_tags = (getattr(entry, 'tags', '') or '').lower()
+                tag_list = [tag.strip() for tag in tags_filter.split(',') if tag.strip()]
+                if not any(tag in entry_tags for tag in tag_list):
+                    continue
 
-            filtered_count = 0
-            for entry in entries:
-                # Apply tags filter
-                if selected_tags and selected_tags != "e.g., stress, gratitude":
-                    entry_tags = (getattr(entry, 'tags', '') or '').lower()
-                    tag_list = [tag.strip() for tag in selected_tags.split(',') if tag.strip()]
-                    if not any(tag in entry_tags for tag in tag_list):
+            # Apply date range filter
+            if from_date and from_date != "YYYY-MM-DD":
+                try:
+                    entry_date = datetime.strptime(str(entry.entry_date).split('.')[0], "%Y-%m-%d %H:%M:%S").date()
+                    from_date_obj = datetime.strptime(from_date, "%Y-%m-%d").date()
+                    if entry_date < from_date_obj:
                         continue
+                except (ValueError, AttributeError):
+                    pass
 
-                # Apply date range filter
-                if from_date and from_date != "YYYY-MM-DD":
-                    try:
-                        entry_date = datetime.strptime(str(entry.entry_date).split('.')[0], "%Y-%m-%d %H:%M:%S").date()
-                        from_date_obj = datetime.strptime(from_date, "%Y-%m-%d").date()
-                        if entry_date < from_date_obj:
-                            continue
-                    except (ValueError, AttributeError):
-                        pass
-
-                if to_date and to_date != "YYYY-MM-DD":
-                    try:
-                        entry_date = datetime.strptime(str(entry.entry_date).split('.')[0], "%Y-%m-%d %H:%M:%S").date()
-                        to_date_obj = datetime.strptime(to_date, "%Y-%m-%d").date()
-                        if entry_date > to_date_obj:
-                            continue
-                    except (ValueError, AttributeError):
-                        pass
-
-                # Apply mood filter
-                if selected_mood != "All Moods":
-                    sentiment_score = getattr(entry, 'sentiment_score', 0) or 0
-                    if selected_mood == "Positive" and sentiment_score <= 30:
-                        continue
-                    elif selected_mood == "Neutral" and (sentiment_score > 30 or sentiment_score < -30):
-                        continue
-                    elif selected_mood == "Negative" and sentiment_score >= -30:
+            if to_date and to_date != "YYYY-MM-DD":
+                try:
+                    entry_date = datetime.strptime(str(entry.entry_date).split('.')[0], "%Y-%m-%d %H:%M:%S").date()
+                    to_date_obj = datetime.strptime(to_date, "%Y-%m-%d").date()
+                    if entry_date > to_date_obj:
                         continue
+                except (ValueError, AttributeError):
+                    pass
+
+            # Apply mood filter
+            if mood_filter != "All Moods":
+                sentiment_score = getattr(entry, 'sentiment_score', 0) or 0
+                if mood_filter == "Positive" and sentiment_score <= 30:
+                    continue
+                elif mood_filter == "Neutral" and (sentiment_score > 30 or sentiment_score < -30):
+                    continue
+                elif mood_filter == "Negative" and sentiment_score >= -30:
+                    continue
 
-                filtered_count += 1
-                self._create_entry_card(self.results_scrollable_frame, entry)
+            matches.append(entry)
 
-            if filtered_count == 0:
-                tk.Label(self.results_scrollable_frame, text="No entries found matching filters.",
-                        font=("Segoe UI", 12), bg=self.colors.get("surface", "#fff"),
-                        fg=self.colors.get("text_secondary", "#666")).pack(pady=20)
+        return matches
+
+    def _render_inline_results(self, entries):
+        for entry in entries:
+            self._create_entry_card(self.results_scrollable_frame, entry)
+
+        if not entries:
+            tk.Label(self.results_scrollable_frame, text="No entries found matching filters.",
+                    font=("Segoe UI", 12), bg=self.colors.get("surface", "#fff"),
+                    fg=self.colors.get("text_secondary", "#666")).pack(pady=20)
 
     def open_journal_window(self, username):
         """Standalone Window Mode (Deprecated but kept for compat)"""
@@ -1086,55 +1101,37 @@ class JournalFeature:
                         fg=self.colors.get("text_secondary", "#666")).pack(pady=20)
                 return
 
-            # Create figure with subplots
-            fig = Figure(figsize=(10, 8), dpi=100, facecolor=self.colors.get("surface", "#fff"))
-            fig.suptitle("Mood & Wellness Trends", fontsize=14, fontweight='bold')
-
-            # Sentiment over time
-            ax1 = fig.add_subplot(221)
-            ax1.plot(dates, sentiments, 'b-', linewidth=2, marker='o', markersize=4)
-            ax1.set_title("Sentiment Score Over Time", fontsize=12)
-            ax1.set_ylabel("Sentiment (-100 to +100)")
-            ax1.grid(True, alpha=0.3)
-            ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-            plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45)
-
-            # Stress levels
-            ax2 = fig.add_subplot(222)
-            ax2.plot(dates, stress_levels, 'r-', linewidth=2, marker='s', markersize=4)
-            ax2.set_title("Stress Levels Over Time", fontsize=12)
-            ax2.set_ylabel("Stress Level (1-10)")
-            ax2.set_ylim(0, 11)
-            ax2.grid(True, alpha=0.3)
-            ax2.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-            plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
-
-            # Energy levels
-            ax3 = fig.add_subplot(223)
-            ax3.plot(dates, energy_levels, 'g-', linewidth=2, marker='^', markersize=4)
-            ax3.set_title("Energy Levels Over Time", fontsize=12)
-            ax3.set_ylabel("Energy Level (1-10)")
-            ax3.set_ylim(0, 11)
-            ax3.grid(True, alpha=0.3)
-            ax3.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-            plt.setp(ax3.xaxis.get_majorticklabels(), rotation=45)
-
-            # Sleep hours
-            ax4 = fig.add_subplot(224)
-            ax4.plot(dates, sleep_hours, 'purple', linewidth=2, marker='d', markersize=4)
-            ax4.set_title("Sleep Hours Over Time", fontsize=12)
-            ax4.set_ylabel("Sleep Hours")
-            ax4.set_ylim(0, max(sleep_hours) + 2 if sleep_hours else 12)
-            ax4.grid(True, alpha=0.3)
-            ax4.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-            plt.setp(ax4.xaxis.get_majorticklabels(), rotation=45)
-
-            fig.tight_layout()
+            # Create figure with subplots; long histories are decimated to screen width
+            chart = ChartWidget(chart_window, figsize=(10, 8), dpi=100,
+                                facecolor=self.colors.get("surface", "#fff"))
+            chart.figure.suptitle("Mood & Wellness Trends", fontsize=14, fontweight='bold')
+
+            panels = [
+                # (key, position, values, style, title, ylabel, ylim)
+                ("sentiment", 221, sentiments, dict(color='b', marker='o'),
+                 "Sentiment Score Over Time", "Sentiment (-100 to +100)", None),
+                ("stress", 222, stress_levels, dict(color='r', marker='s'),
+                 "Stress Levels Over Time", "Stress Level (1-10)", (0, 11)),
+                ("energy", 223, energy_levels, dict(color='g', marker='^'),
+                 "Energy Levels Over Time", "Energy Level (1-10)", (0, 11)),
+                ("sleep", 224, sleep_hours, dict(color='purple', marker='d'),
+                 "Sleep Hours Over Time", "Sleep Hours", (0, max(sleep_hours) + 2 if sleep_hours else 12)),
+            ]
+            for key, position, values, style, title, ylabel, ylim in panels:
+                ax = chart.axes(key, position)
+                chart.line(key, key, linestyle='-', linewidth=2, markersize=4, **style)
+                chart.set_line(key, dates, values)
+                ax.set_title(title, fontsize=12)
+                ax.set_ylabel(ylabel)
+                if ylim:
+                    ax.set_ylim(*ylim)
+                ax.grid(True, alpha=0.3)
+                ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
+                plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
 
             # Embed in tkinter
-            canvas = FigureCanvasTkAgg(fig, master=chart_window)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+            chart.draw(tight_layout=True)
+            chart.widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
 
             # Close button
             tk.Button(chart_window, text="Close", command=chart_window.destroy,
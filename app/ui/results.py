@@ -6,15 +6,18 @@ import random
 from app.db import get_connection, get_session, safe_db_context
 from app.models import Score
 from app.constants import BENCHMARK_DATA
-from app.services.pdf_generator import generate_pdf_report
 import json
 from app.models import AssessmentResult
 from typing import Any, Dict, List, Optional, Tuple
 from app.ui.components.loading_overlay import show_loading, hide_loading
-try:
-    from app.ml.insights_generator import EQInsightsGenerator
-except ImportError:
-    EQInsightsGenerator = None
+from app.ui.data_loader import run_view_load
+from app.utils.lazy_imports import lazy_attr, module_available
+
+# PDF export (matplotlib) and insights (sklearn) load on first use
+generate_pdf_report = lazy_attr("app.services.pdf_generator", "generate_pdf_report")
+EQInsightsGenerator = (
+    lazy_attr("app.ml.insights_generator", "EQInsightsGenerator") if module_available("sklearn") else None
+)
 
 class ResultsManager:
     def __init__(self, app: Any) -> None:
@@ -1243,11 +1246,27 @@ class ResultsManager:
             fg=colors.get("text_primary", "#F8FAFC")
         ).pack(side="left", padx=50)
         
-        conn = get_connection()
-        cursor = conn.cursor()
+        # If username is set, show that user's history
+        if self.app.username:
+            self.display_user_history(self.app.username)
+            return
 
-        # Get history data
-        if not self.app.username:
+        # Otherwise let the visitor pick one of the most recent users
+        container = tk.Frame(self.app.root, bg=colors.get("bg", "#0F172A"))
+        container.pack(fill="both", expand=True)
+        run_view_load(
+            getattr(self.app, "view_loader", None),
+            fetch=self._fetch_recent_users,
+            on_success=lambda users: self._render_user_selection(container, users),
+            owner=container,
+            message="Loading history...",
+        )
+
+    @staticmethod
+    def _fetch_recent_users() -> List[Tuple]:
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
             cursor.execute(
                 """
                 SELECT DISTINCT username FROM scores 
@@ -1255,52 +1274,52 @@ class ResultsManager:
                 LIMIT 5
                 """
             )
-            users = cursor.fetchall()
-            
-            if not users:
-                tk.Label(
-                    self.app.root,
-                    text="No test history found. Please take a test first.",
-                    font=("Arial", 12),
-                    bg=colors.get("bg", "#0F172A"),
-                    fg=colors.get("text_primary", "#F8FAFC")
-                ).pack(pady=50)
-                
-                tk.Button(
-                    self.app.root,
-                    text="Back to Main",
-                    command=self.app.create_welcome_screen,
-                    font=("Arial", 12)
-                ).pack(pady=20)
-                return
-            
-            # Show user selection
-            user_frame = tk.Frame(self.app.root, bg=colors.get("bg", "#0F172A"))
-            user_frame.pack(pady=20)
-            
+            return cursor.fetchall()
+        finally:
+            conn.close()
+
+    def _render_user_selection(self, container, users):
+        colors = self.app.colors
+
+        if not users:
             tk.Label(
-                user_frame,
-                text="Select a user to view their history:",
+                container,
+                text="No test history found. Please take a test first.",
                 font=("Arial", 12),
                 bg=colors.get("bg", "#0F172A"),
                 fg=colors.get("text_primary", "#F8FAFC")
-            ).pack(pady=10)
-            
-            for user in users:
-                username = user[0]
-                user_btn = tk.Button(
-                    user_frame,
-                    text=username,
-                    command=lambda u=username: self.view_user_history(u),
-                    font=("Arial", 12),
-                    width=20
-                )
-                user_btn.pack(pady=5)
+            ).pack(pady=50)
             
+            tk.Button(
+                container,
+                text="Back to Main",
+                command=self.app.create_welcome_screen,
+                font=("Arial", 12)
+            ).pack(pady=20)
             return
         
-        # If username is set, show that user's history
-        self.display_user_history(self.app.username)
+        # Show user selection
+        user_frame = tk.Frame(container, bg=colors.get("bg", "#0F172A"))
+        user_frame.pack(pady=20)
+        
+        tk.Label(
+            user_frame,
+            text="Select a user to view their history:",
+            font=("Arial", 12),
+            bg=colors.get("bg", "#0F172A"),
+            fg=colors.get("text_primary", "#F8FAFC")
+        ).pack(pady=10)
+        
+        for user in users:
+            username = user[0]
+            user_btn = tk.Button(
+                user_frame,
+                text=username,
+                command=lambda u=username: self.view_user_history(u),
+                font=("Arial", 12),
+                width=20
+            )
+            user_btn.pack(pady=5)
 
     def view_user_history(self, username):
         """View history for a specific user"""
@@ -1313,21 +1332,6 @@ class ResultsManager:
         
         colors = self.app.colors
         
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # Get history data
-        cursor.execute(
-            """
-            SELECT id, total_score, age, timestamp 
-            FROM scores 
-            WHERE username = ? 
-            ORDER BY timestamp DESC
-            """,
-            (username,)
-        )
-        history = cursor.fetchall()
-        
         # Header with back button
         header_frame = tk.Frame(self.app.root, bg=colors.get("bg", "#0F172A"))
         header_frame.pack(pady=10, fill="x")
@@ -1349,9 +1353,61 @@ class ResultsManager:
             fg=colors.get("text_primary", "#F8FAFC")
         ).pack(side="left", padx=50)
         
+        # History is queried off the UI thread and rendered into this container
+        container = tk.Frame(self.app.root, bg=colors.get("bg", "#0F172A"))
+        container.pack(fill="both", expand=True)
+
+        run_view_load(
+            getattr(self.app, "view_loader", None),
+            fetch=lambda: self._fetch_user_history(username),
+            on_success=lambda data: self._render_user_history(container, *data),
+            owner=container,
+            message="Loading history...",
+        )
+
+    @staticmethod
+    def _fetch_user_history(username: str) -> Tuple[List[Tuple], List[Tuple]]:
+        """Standard test rows and deep-dive results for a user, newest first."""
+        conn = get_connection()
+        try:
+            cursor = conn.cursor()
+
+            # Get history data
+            cursor.execute(
+                """
+                SELECT id, total_score, age, timestamp 
+                FROM scores 
+                WHERE username = ? 
+                ORDER BY timestamp DESC
+                """,
+                (username,)
+            )
+            history = cursor.fetchall()
+            if not history:
+                return history, []
+
+            # Get user_id for Deep Dive results
+            cursor.execute("SELECT id FROM users WHERE username = ?", (username,))
+            row = cursor.fetchone()
+            user_id = row[0] if row else None
+
+            deep_dives = []
+            if user_id:
+                cursor.execute(
+                    "SELECT assessment_type, total_score, timestamp, details FROM assessment_results WHERE user_id = ? ORDER BY timestamp DESC",
+                    (user_id,)
+                )
+                deep_dives = cursor.fetchall()
+            return history, deep_dives
+        finally:
+            conn.close()
+
+    def _render_user_history(self, container, history, deep_dives):
+        colors = self.app.colors
+
         if not history:
             tk.Label(
-                self.app.root,
+                container,
                 text="No test history found.",
                 font=("Arial", 12),
                 bg=colors.get("bg", "#0F172A"),
@@ -1359,29 +1415,16 @@ class ResultsManager:
             ).pack(pady=50)
             
             tk.Button(
-                self.app.root,
+                container,
                 text="Back to History",
                 command=self.show_history_screen,
                 font=("Arial", 12)
             ).pack(pady=20)
             return
         
-        # Get user_id for Deep Dive results
-        cursor.execute("SELECT id FROM users WHERE username = ?", (username,))
-        row = cursor.fetchone()
-        user_id = row[0] if row else None
-
-        deep_dives = []
-        if user_id:
-            cursor.execute(
-                "SELECT assessment_type, total_score, timestamp, details FROM assessment_results WHERE user_id = ? ORDER BY timestamp DESC",
-                (user_id,)
-            )
-            deep_dives = cursor.fetchall()
-
         # Create scrollable frame for history
-        canvas = tk.Canvas(self.app.root, bg=colors.get("bg", "#0F172A"), highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.app.root, orient="vertical", command=canvas.yview)
+        canvas = tk.Canvas(container, bg=colors.get("bg", "#0F172A"), highlightthickness=0)
+        scrollbar = tk.Scrollbar(container, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=colors.get("bg", "#0F172A"))
         
         scrollable_frame.bind(
@@ -1518,7 +1561,7 @@ class ResultsManager:
         scrollbar.pack(side="right", fill="y")
         
         # Buttons
-        button_frame = tk.Frame(self.app.root, bg=colors.get("bg", "#0F172A"))
+        button_frame = tk.Frame(container, bg=colors.get("bg", "#0F172A"))
         button_frame.pack(pady=20)
         
         if len(history) >= 2:
@@ -8,6 +8,7 @@ import logging
 
 from app.db import get_session, safe_db_context
 from app.models import SatisfactionRecord
+from app.events import publish, SATISFACTION_SAVED
 from app.questions import SATISFACTION_QUESTIONS, SATISFACTION_OPTIONS
 from app.i18n_manager import get_i18n
 
@@ -433,6 +434,7 @@ class SatisfactionSurvey:
             with safe_db_context() as session:
                 session.add(record)
                 session.commit()
+            publish(SATISFACTION_SAVED, username=self.username)
             
             # Show thank you message
             messagebox.showinfo(
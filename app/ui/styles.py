@@ -14,6 +14,7 @@ from app.constants import (
     PADDING_XS, PADDING_SM, PADDING_MD, PADDING_LG, PADDING_XL, PADDING_XXL,
     ANIM_FAST_MS, ANIM_NORMAL_MS, ANIM_SLOW_MS
 )
+from app.events import publish, THEME_CHANGED
 
 
 class DesignTokens:
@@ -361,6 +362,7 @@ class UIStyles:
     def apply_theme(self, theme_name):
         """Apply the selected theme to the application"""
         self.app.current_theme = theme_name
+        publish(THEME_CHANGED, theme=theme_name)
         
         # Get appropriate color scheme
         if theme_name == "dark":
@@ -1,23 +1,51 @@
 import tkinter as tk
-from app.ui.dashboard import AnalyticsDashboard
-from app.ui.journal import JournalFeature
-from app.ui.assessments import AssessmentHub
-from app.ui.results import ResultsManager
-from app.ui.profile import UserProfileView
-from app.ui.exam import ExamManager
+from collections import OrderedDict
+from app.ui.data_loader import ViewDataLoader
 from app.logger import get_logger
-from typing import TYPE_CHECKING
+from app.config import VIEW_CACHE_SIZE
+from app import events
+from typing import TYPE_CHECKING, Callable, Optional
 
 if TYPE_CHECKING:
     from app.main import SoulSenseApp
 
+# Views that can be kept alive (hidden) between visits
+CACHEABLE_VIEWS = ("home", "dashboard", "journal", "history")
+
+# Data changes that make cached views stale; THEME_CHANGED invalidates every view
+VIEW_DEPENDENCIES = {
+    events.SCORE_SAVED: ("dashboard", "history"),
+    events.JOURNAL_SAVED: ("home", "dashboard", "journal"),
+    events.SATISFACTION_SAVED: ("dashboard",),
+    events.ASSESSMENT_SAVED: ("dashboard", "history"),
+}
+
+
 class ViewManager:
-    def __init__(self, app: 'SoulSenseApp'):
+    def __init__(self, app: 'SoulSenseApp', cache_size: int = VIEW_CACHE_SIZE):
         self.app = app
         self.logger = get_logger(__name__)
+        # Background query runner shared by all views (see app/ui/data_loader.py)
+        self.loader = ViewDataLoader(app.root)
+        app.view_loader = self.loader
+
+        # LRU of rendered view frames, hidden with pack_forget while not shown
+        self.cache_size = max(cache_size, 0)
+        self._view_cache: "OrderedDict[str, tk.Frame]" = OrderedDict()
+        self._cache_user: Optional[str] = None
+        # Views invalidated by data-change events; rebuilt on their next visit.
+        # Events may arrive off the UI thread, so only record them here.
+        self._stale_views: set = set()
+        for event, view_ids in VIEW_DEPENDENCIES.items():
+            events.subscribe(event, lambda view_ids=view_ids, **_: self._stale_views.update(view_ids))
+        events.subscribe(events.THEME_CHANGED, lambda **_: self.invalidate_views())
 
     def switch_view(self, view_id):
+        previous = getattr(self.app, "current_view", None)
         self.app.current_view = view_id
+        # Drop results still loading for the view we are leaving, unless it
+        # stays cached (its loads then finish into the hidden frame)
+        self.loader.begin_view(view_id, cancel_previous=previous not in self._view_cache)
         self.clear_screen()
 
         # Manage Main Sidebar Visibility
@@ -53,18 +81,82 @@ class ViewManager:
             self._do_logout()
 
     def clear_screen(self):
+        """Hide cached views and destroy everything else in the content area."""
+        cached = set(self._view_cache.values())
         for widget in self.app.content_area.winfo_children():
-            widget.destroy()
+            if widget in cached:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+
+    def invalidate_views(self, *view_ids: str) -> None:
+        """Mark cached views stale (all of them when no ids are given)."""
+        self._stale_views.update(view_ids or CACHEABLE_VIEWS)
+
+    def _display(self, view_id: str, render: Callable[[tk.Widget], None]) -> None:
+        """Show a view, reusing its cached frame when still valid."""
+        self.clear_screen()
+        if not self.cache_size or view_id not in CACHEABLE_VIEWS:
+            render(self.app.content_area)
+            return
+
+        frame = self._cached_frame(view_id)
+        if frame is not None:
+            frame.pack(fill="both", expand=True)
+            return
+
+        frame = tk.Frame(self.app.content_area, bg=self.app.colors["bg"])
+        frame.pack(fill="both", expand=True)
+        self._view_cache[view_id] = frame
+        while len(self._view_cache) > self.cache_size:
+            _, evicted = self._view_cache.popitem(last=False)
+            evicted.destroy()
+
+        try:
+            render(frame)
+        except Exception:
+            self._drop_cached(view_id)
+            raise
+
+    def _cached_frame(self, view_id: str) -> Optional[tk.Frame]:
+        """Return the cached frame for a view, dropping it if stale or dead."""
+        username = getattr(self.app, "username", None)
+        if username != self._cache_user:
+            # Another user logged in: nothing cached belongs to them
+            for cached_id in list(self._view_cache):
+                self._drop_cached(cached_id)
+            self._cache_user = username
+            self._stale_views.clear()
+            return None
+
+        if view_id in self._stale_views:
+            self._stale_views.discard(view_id)
+            self._drop_cached(view_id)
+            return None
+
+        frame = self._view_cache.get(view_id)
+        if frame is None:
+            return None
+        if not frame.winfo_exists():
+            self._view_cache.pop(view_id, None)
+            return None
+        self._view_cache.move_to_end(view_id)
+        return frame
+
+    def _drop_cached(self, view_id: str) -> None:
+        frame = self._view_cache.pop(view_id, None)
+        if frame is not None:
+            self.loader.cancel_view(view_id)
+            frame.destroy()
 
     def show_home(self):
-        # --- WEB-STYLE HERO DASHBOARD ---
+        self._display("home", self._render_home)
 
-        # Clear previous
-        for widget in self.app.content_area.winfo_children():
-            widget.destroy()
+    def _render_home(self, parent):
+        # --- WEB-STYLE HERO DASHBOARD ---
 
         # 1. Hero Section (Greeting)
-        hero_frame = tk.Frame(self.app.content_area, bg=self.app.colors["primary"], height=200)
+        hero_frame = tk.Frame(parent, bg=self.app.colors["primary"], height=200)
         hero_frame.pack(fill="x", padx=30, pady=(30, 20))
         hero_frame.pack_propagate(False)  # Force height
 
@@ -79,36 +171,18 @@ class ViewManager:
 
         # Journal Summary Section (Enhanced Journal Feature)
         if self.app.username:
-            try:
-                from app.db import safe_db_context
-                from app.models import JournalEntry
-                with safe_db_context() as session:
-                    recent_entries = session.query(JournalEntry)\
-                        .filter_by(username=self.app.username)\
-                        .order_by(JournalEntry.entry_date.desc())\
-                        .limit(3)\
-                        .all()
-
-                if recent_entries:
-                    summary_frame = tk.Frame(self.app.content_area, bg=self.app.colors["bg"], pady=10)
-                    summary_frame.pack(fill="x", padx=30, pady=(10, 0))
-
-                    tk.Label(summary_frame, text="📝 Recent Journal Insights",
-                             font=("Segoe UI", 14, "bold"), bg=self.app.colors["bg"],
-                             fg=self.app.colors["text_primary"]).pack(anchor="w")
-
-                    # Calculate average mood
-                    avg_mood = sum(getattr(e, 'sentiment_score', 0) or 0 for e in recent_entries) / len(recent_entries)
-                    mood_text = "Positive" if avg_mood > 20 else "Neutral" if avg_mood > -20 else "Negative"
-                    mood_color = "#4CAF50" if avg_mood > 20 else "#FF9800" if avg_mood > -20 else "#F44336"
-
-                    tk.Label(summary_frame, text=f"Average mood over last {len(recent_entries)} entries: {mood_text}",
-                             font=("Segoe UI", 11), bg=self.app.colors["bg"], fg=mood_color).pack(anchor="w", pady=(5, 0))
-            except Exception as e:
-                self.logger.error(f"Failed to load journal summary: {e}")
+            # Placeholder keeps the summary above the cards once it arrives
+            summary_slot = tk.Frame(parent, bg=self.app.colors["bg"], pady=10)
+            summary_slot.pack(fill="x", padx=30, pady=(10, 0))
+            self.loader.load(
+                fetch=lambda username=self.app.username: self._fetch_journal_summary(username),
+                on_success=lambda sentiments: self._render_journal_summary(summary_slot, sentiments),
+                on_error=lambda e: self.logger.error(f"Failed to load journal summary: {e}"),
+                owner=summary_slot,
+            )
 
         # 2. Quick Actions Grid
-        grid_frame = tk.Frame(self.app.content_area, bg=self.app.colors["bg"])
+        grid_frame = tk.Frame(parent, bg=self.app.colors["bg"])
         grid_frame.pack(fill="both", expand=True, padx=30)
 
         # Card Helper
@@ -157,7 +231,38 @@ class ViewManager:
         grid_frame.grid_columnconfigure(1, weight=1)
         grid_frame.grid_columnconfigure(2, weight=1)
 
+    @staticmethod
+    def _fetch_journal_summary(username):
+        """Sentiment scores of the user's three most recent journal entries (worker thread)."""
+        from app.db import safe_db_context
+        from app.models import JournalEntry
+        with safe_db_context() as session:
+            rows = session.query(JournalEntry.sentiment_score)\
+                .filter_by(username=username)\
+                .order_by(JournalEntry.entry_date.desc())\
+                .limit(3)\
+                .all()
+        return [row[0] or 0 for row in rows]
+
+    def _render_journal_summary(self, summary_frame, sentiments):
+        if not sentiments:
+            summary_frame.pack_forget()
+            return
+
+        tk.Label(summary_frame, text="📝 Recent Journal Insights",
+                 font=("Segoe UI", 14, "bold"), bg=self.app.colors["bg"],
+                 fg=self.app.colors["text_primary"]).pack(anchor="w")
+
+        # Calculate average mood
+        avg_mood = sum(sentiments) / len(sentiments)
+        mood_text = "Positive" if avg_mood > 20 else "Neutral" if avg_mood > -20 else "Negative"
+        mood_color = "#4CAF50" if avg_mood > 20 else "#FF9800" if avg_mood > -20 else "#F44336"
+
+        tk.Label(summary_frame, text=f"Average mood over last {len(sentiments)} entries: {mood_text}",
+                 font=("Segoe UI", 11), bg=self.app.colors["bg"], fg=mood_color).pack(anchor="w", pady=(5, 0))
+
     def start_exam(self):
+        from app.ui.exam import ExamManager
         # ExamManager expects 'app' with 'root'.
         # We need to trick it to render into content_area, OR let it takeover.
         # But ExamManager uses self.root which is mapped to self.root (Window).
@@ -183,24 +288,31 @@ class ViewManager:
     def show_dashboard(self):
         # Open Dashboard (Embedded)
         try:
-            self.clear_screen()
-            dashboard = AnalyticsDashboard(self.app.content_area, self.app.username, theme="dark", colors=self.app.colors)
-            dashboard.render_dashboard()
+            self._display("dashboard", self._render_dashboard)
         except Exception as e:
             self.logger.error(f"Dashboard error: {e}")
             tk.messagebox.showerror("Error", f"Failed to open dashboard: {e}")
 
+    def _render_dashboard(self, parent):
+        from app.ui.dashboard import AnalyticsDashboard
+        dashboard = AnalyticsDashboard(parent, self.app.username, theme="dark",
+                                       colors=self.app.colors, loader=self.loader)
+        dashboard.render_dashboard()
+
     def show_journal(self):
         # Open Journal Application
         # New embedded mode:
-        self.clear_screen()
         try:
-            journal_feature = JournalFeature(self.app.root, app=self.app)
-            journal_feature.render_journal_view(self.app.content_area, self.app.username or "Guest")
+            self._display("journal", self._render_journal)
         except Exception as e:
             self.logger.error(f"Journal error: {e}")
             tk.messagebox.showerror("Error", f"Failed to open journal: {e}")
 
+    def _render_journal(self, parent):
+        from app.ui.journal import JournalFeature
+        journal_feature = JournalFeature(self.app.root, app=self.app)
+        journal_feature.render_journal_view(parent, self.app.username or "Guest")
+
     def show_profile(self):
         from app.ui.profile import UserProfileView
         # Render Profile into content_area
@@ -208,6 +320,9 @@ class ViewManager:
 
     def show_history(self):
         """Show User History (Embedded)"""
+        self._display("history", self._render_history)
+
+    def _render_history(self, parent):
         from app.ui.results import ResultsManager
         # We need to make sure ResultsManager renders into content_area
         # Ideally, we pass content_area as root or a parent
@@ -231,13 +346,13 @@ class ViewManager:
             def __getattr__(self, name):
                 return getattr(self.real_app, name)
 
-        self.clear_screen()
-        proxy = ContentProxy(self.app, self.app.content_area)
+        proxy = ContentProxy(self.app, parent)
         rm = ResultsManager(proxy)
         rm.display_user_history(self.app.username)
 
     def show_assessments(self):
         """Show Assessment Selection Hub"""
+        from app.ui.assessments import AssessmentHub
         self.clear_screen()
         hub = AssessmentHub(self.app.content_area, self.app)
         hub.render()
@@ -0,0 +1,140 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+matplotlib, nltk, pandas/sklearn and friends cost seconds to import but are
+only needed once the user opens a chart, journal or ML feature. Modules in
+``app/ui`` and ``app/ml`` bind them through these helpers so importing the
+module (and therefore starting the app) stays cheap:
+
+    plt = lazy_import("matplotlib.pyplot", before_import=select_agg_backend)
+    Figure = lazy_attr("matplotlib.figure", "Figure")
+    NLTK_AVAILABLE = module_available("nltk")
+
+The real import happens on first attribute access or call, from whichever
+thread touches it first.
+"""
+
+import importlib.util
+import sys
+import threading
+import types
+from typing import Any, Callable, Dict, Optional
+
+_lock = threading.RLock()
+
+
+def _import(name: str) -> types.ModuleType:
+    # Go through __import__ so the startup profiler's hook sees deferred loads too
+    __import__(name)
+    return sys.modules[name]
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name: str, before_import: Optional[Callable[[], None]] = None):
+        super().__init__(name)
+        self.__dict__["_lazy_before_import"] = before_import
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    hook = self.__dict__["_lazy_before_import"]
+                    if hook is not None:
+                        hook()
+                    module = _import(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+class LazyAttribute:
+    """Callable stand-in for ``from module import name`` that imports on first use."""
+
+    def __init__(self, module: LazyModule, attr: str):
+        self._module = module
+        self._attr = attr
+
+    def resolve(self) -> Any:
+        return getattr(self._module, self._attr)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy attribute '{self._module.__name__}.{self._attr}'>"
+
+
+def lazy_import(name: str, before_import: Optional[Callable[[], None]] = None) -> Any:
+    """
+    Return ``name`` as a module that is imported on first use.
+
+    Args:
+        name: Dotted module name
+        before_import: Called once right before the real import (e.g. backend selection)
+
+    Returns:
+        The module itself if already imported, otherwise a LazyModule proxy
+    """
+    if name in sys.modules and before_import is None:
+        return sys.modules[name]
+    return LazyModule(name, before_import)
+
+
+def lazy_attr(module_name: str, attr: str, before_import: Optional[Callable[[], None]] = None) -> LazyAttribute:
+    """Deferred ``from module_name import attr``; call it like the real object."""
+    return LazyAttribute(LazyModule(module_name, before_import), attr)
+
+
+def module_available(name: str) -> bool:
+    """True if ``name`` can be imported, checked without importing it."""
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def select_agg_backend() -> None:
+    """Use the non-interactive Agg backend (charts are embedded via FigureCanvasTkAgg)."""
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a PEP 562 module ``__getattr__`` that imports submodules on demand.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Attribute name -> relative submodule that defines it
+
+    Returns:
+        Function to assign to the package's ``__getattr__``
+    """
+    def __getattr__(attr: str) -> Any:
+        submodule = exports.get(attr)
+        if submodule is None:
+            raise AttributeError(f"module '{package}' has no attribute '{attr}'")
+        value = getattr(_import(package + submodule), attr)
+        setattr(sys.modules[package], attr, value)
+        return value
+
+    return __getattr__
@@ -0,0 +1,190 @@
+"""
+Startup Profiler
+
+Records where desktop-app startup time goes: per-module import time
+(self and cumulative, first import only) and the duration of named
+initialization phases (startup checks, question preload, i18n, login).
+
+Enabled with ``python -m app.main --profile-startup`` or by setting
+``SOULSENSE_PROFILE_STARTUP=1``; set ``SOULSENSE_PROFILE_STARTUP_OUTPUT``
+to also write the numbers as JSON. When disabled every hook is a no-op.
+
+Usage:
+    from app.utils.startup_profiler import startup_profiler
+
+    startup_profiler.enable()          # before the heavy imports
+    with startup_profiler.phase("startup_checks"):
+        run_all_checks()
+    startup_profiler.mark("login_window")
+    startup_profiler.finish()          # prints the report once
+"""
+
+import builtins
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_ENV = "SOULSENSE_PROFILE_STARTUP"
+OUTPUT_ENV = "SOULSENSE_PROFILE_STARTUP_OUTPUT"
+
+
+def profiling_requested(argv: Optional[List[str]] = None) -> bool:
+    """True if startup profiling was asked for on the command line or in the environment."""
+    argv = sys.argv if argv is None else argv
+    return PROFILE_FLAG in argv or os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+
+class StartupProfiler:
+    """Collects import and phase timings for one application start."""
+
+    def __init__(self):
+        self.enabled = False
+        self.output_path: Optional[str] = None
+        self._t0 = time.perf_counter()
+        self._imports: Dict[str, Dict[str, float]] = {}
+        self._phases: List[Dict[str, Any]] = []
+        self._marks: Dict[str, float] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._original_import = None
+        self._finished = False
+
+    # ------------------------------------------------------------------ control
+
+    def enable(self, output_path: Optional[str] = None) -> None:
+        """Start recording; installs an ``__import__`` hook."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.output_path = output_path or os.environ.get(OUTPUT_ENV)
+        self._t0 = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def disable(self) -> None:
+        """Stop recording imports (collected numbers are kept)."""
+        if self._original_import is not None and builtins.__import__ == self._timed_import:
+            builtins.__import__ = self._original_import
+        self._original_import = None
+        self.enabled = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as initialization phase ``name``."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self._phases.append({
+                    "name": name,
+                    "start_s": start - self._t0,
+                    "duration_s": end - start,
+                })
+
+    def mark(self, name: str) -> None:
+        """Record the time since profiling started at a milestone (first call wins)."""
+        if self.enabled:
+            with self._lock:
+                self._marks.setdefault(name, time.perf_counter() - self._t0)
+
+    def finish(self, top: int = 25) -> None:
+        """Stop recording, then print the report and write JSON output once."""
+        if not self.enabled or self._finished:
+            return
+        self._finished = True
+        self.disable()
+        print(self.report(top=top), file=sys.stderr)
+        if self.output_path:
+            self.write_json(self.output_path)
+
+    # ------------------------------------------------------------------ results
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Timings as plain data (seconds)."""
+        with self._lock:
+            imports: List[Dict[str, Any]] = [
+                {"module": name, **times}
+                for name, times in sorted(
+                    self._imports.items(), key=lambda item: item[1]["cumulative_s"], reverse=True
+                )
+            ]
+            return {
+                "total_import_s": sum(row["self_s"] for row in imports),
+                "imports": imports,
+                "phases": list(self._phases),
+                "marks": dict(self._marks),
+            }
+
+    def report(self, top: int = 25) -> str:
+        """Human-readable summary: phases, milestones and the slowest imports."""
+        data = self.to_dict()
+        lines = ["=== Startup profile ===", "Phases:"]
+        for phase in data["phases"]:
+            lines.append(f"  {phase['name']:<28} {phase['duration_s'] * 1000:9.1f} ms"
+                         f"  (at {phase['start_s'] * 1000:.1f} ms)")
+        if data["marks"]:
+            lines.append("Milestones:")
+            for name, at in data["marks"].items():
+                lines.append(f"  {name:<28} {at * 1000:9.1f} ms after start")
+        lines.append(f"Imports: {len(data['imports'])} modules, "
+                     f"{data['total_import_s'] * 1000:.1f} ms total")
+        lines.append(f"  {'module':<44} {'cumulative':>12} {'self':>10}")
+        for row in data["imports"][:top]:
+            lines.append(f"  {row['module']:<44} {row['cumulative_s'] * 1000:9.1f} ms "
+                         f"{row['self_s'] * 1000:7.1f} ms")
+        return "\n".join(lines)
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    # ----------------------------------------------------------------- internal
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import or builtins.__import__
+        module_name = self._resolve(name, globals, level)
+        if module_name is None or module_name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                self._imports.setdefault(module_name, {
+                    "cumulative_s": elapsed,
+                    "self_s": max(elapsed - children, 0.0),
+                })
+
+    @staticmethod
+    def _resolve(name: str, globals: Optional[Dict[str, Any]], level: int) -> Optional[str]:
+        if level == 0:
+            return name
+        package = (globals or {}).get("__package__") or (globals or {}).get("__name__")
+        try:
+            return importlib.util.resolve_name("." * level + name, package)
+        except (ImportError, ValueError):
+            return None
+
+
+# Process-wide profiler used by app.main and the UI hooks
+startup_profiler = StartupProfiler()
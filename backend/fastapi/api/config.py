@@ -47,6 +47,16 @@ class BaseAppSettings(BaseSettings):
     github_token: Optional[str] = Field(default=None, description="GitHub Personal Access Token")
     github_repo_owner: str = Field(default="nupurmadaan04", description="GitHub Repository Owner")
     github_repo_name: str = Field(default="SOUL_SENSE_EXAM", description="GitHub Repository Name")
+    community_refresh_enabled: bool = Field(default=True, description="Precompute community dashboard aggregates in the background")
+    community_refresh_concurrency: int = Field(default=2, ge=1, description="Max community aggregates rebuilt at once")
+
+    # Rate limiting
+    rate_limit_backend: str = Field(default="memory", description="Rate limit state: 'memory' (per process) or 'sqlite' (shared by workers)")
+    rate_limit_db_path: str = Field(default=str(FASTAPI_DIR / "data" / "rate_limits.db"), description="SQLite file for the shared rate limit store")
+
+    # Instrumentation
+    slow_query_ms: float = Field(default=100.0, ge=0, description="Log queries slower than this (ms)")
+    n_plus_one_query_threshold: int = Field(default=25, ge=1, description="Flag requests running more queries than this")
 
     # CORS Configuration
     allowed_origins: str = Field(
@@ -94,6 +104,14 @@ class BaseAppSettings(BaseSettings):
             raise ValueError('database_url must be a valid database URL')
         return v
 
+    @field_validator('rate_limit_backend')
+    @classmethod
+    def validate_rate_limit_backend(cls, v: str) -> str:
+        allowed_backends = {'memory', 'sqlite'}
+        if v.lower() not in allowed_backends:
+            raise ValueError(f'rate_limit_backend must be one of {allowed_backends}, got {v}')
+        return v.lower()
+
     @field_validator('jwt_secret_key')
     @classmethod
     def validate_jwt_secret_key(cls, v: str) -> str:
@@ -1,9 +1,10 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 # Triggering reload for new community routes
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 from .config import get_settings_instance
+from .middleware.headers import ResponseHeadersMiddleware
 from .api.v1.router import api_router as api_v1_router
 from .routers.health import router as health_router
 
@@ -11,11 +12,48 @@ from .routers.health import router as health_router
 settings = get_settings_instance()
 
 
-class VersionHeaderMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-API-Version"] = "1.0"
-        return response
+class VersionHeaderMiddleware(ResponseHeadersMiddleware):
+    headers = {"X-API-Version": "1.0"}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup: create tables and open the DB pool before serving, then warm the
+    question catalog, hot queries, sentiment analyzer and ML models in the
+    background (/startup reports ready when done). Shutdown releases
+    everything in reverse order.
+    """
+    from .services.warmup import warmup
+    from .services.community_refresher import community_refresher
+    from .services.github_service import github_service
+    from .services.db_service import engine
+
+    app.state.settings = settings
+    app.state.warmup = warmup
+    await warmup.start()
+
+    # Keep community dashboard aggregates precomputed
+    if settings.community_refresh_enabled:
+        community_refresher.max_concurrency = settings.community_refresh_concurrency
+        community_refresher.start()
+
+    print("[OK] SoulSense API started successfully")
+    print(f"[ENV] Environment: {settings.app_env}")
+    print(f"[CONFIG] Debug mode: {settings.debug}")
+    print(f"[DB] Database: {settings.database_url}")
+    print(f"[API] API available at /api/v1")
+
+    yield
+
+    await warmup.stop()
+    # Stop the refresher, then flush pending GitHub cache writes and close its HTTP client
+    try:
+        await community_refresher.stop()
+        await github_service.close()
+    except Exception as e:
+        print(f"[WARN] GitHub cache shutdown failed: {e}")
+    engine.dispose()
 
 
 def create_app() -> FastAPI:
@@ -24,7 +62,8 @@ def create_app() -> FastAPI:
         description="Comprehensive REST API for SoulSense EQ Test Platform",
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        lifespan=lifespan
     )
 
     # Security Headers Middleware
@@ -41,11 +80,20 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
         allow_headers=["Content-Type", "Authorization", "X-Requested-With", "X-API-Version"],
+        expose_headers=["RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy", "Retry-After", "Server-Timing"],
         max_age=3600, # Cache preflight requests for 1 hour
     )
     
     # Version header middleware
     app.add_middleware(VersionHeaderMiddleware)
+
+    # Request timing and DB query accounting (outermost, so it times the whole stack)
+    from .middleware.instrumentation import InstrumentationMiddleware, instrument_engine, instrumentation
+    from .services.db_service import engine
+    instrumentation.slow_query_ms = settings.slow_query_ms
+    instrumentation.n_plus_one_threshold = settings.n_plus_one_query_threshold
+    instrument_engine(engine)
+    app.add_middleware(InstrumentationMiddleware)
     
     # Register V1 API Router
     app.include_router(api_v1_router, prefix="/api/v1")
@@ -74,24 +122,6 @@ def create_app() -> FastAPI:
             "documentation": "/docs"
         }
 
-    @app.on_event("startup")
-    async def startup_event():
-        app.state.settings = settings
-        
-        # Initialize database tables
-        try:
-            from .services.db_service import Base, engine
-            Base.metadata.create_all(bind=engine)
-            print("[OK] Database tables initialized/verified")
-        except Exception as e:
-            print(f"[ERROR] Database initialization failed: {e}")
-            
-        print("[OK] SoulSense API started successfully")
-        print(f"[ENV] Environment: {settings.app_env}")
-        print(f"[CONFIG] Debug mode: {settings.debug}")
-        print(f"[DB] Database: {settings.database_url}")
-        print(f"[API] API available at /api/v1")
-
     return app
 
 
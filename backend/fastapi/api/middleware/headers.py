@@ -0,0 +1,35 @@
+from typing import Dict
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ResponseHeadersMiddleware:
+    """
+    Pure ASGI middleware that sets fixed headers on every HTTP response.
+
+    Headers are written into the `http.response.start` message as it passes
+    through, so unlike BaseHTTPMiddleware there is no extra task or body
+    stream per request and streaming responses are forwarded untouched.
+    Existing headers with the same name are overwritten.
+    """
+
+    headers: Dict[str, str] = {}
+
+    def __init__(self, app: ASGIApp, headers: Dict[str, str] = None):
+        self.app = app
+        self.headers = dict(headers if headers is not None else self.headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in self.headers.items():
+                    response_headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
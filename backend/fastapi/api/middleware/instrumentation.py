@@ -0,0 +1,295 @@
+"""
+Request timing, per-request database query accounting and slow-query logging.
+
+InstrumentationMiddleware times every request under its route template
+(e.g. /api/v1/questions/by-age/{age}) and adds a Server-Timing header.
+instrument_engine() hooks SQLAlchemy's cursor events so queries run while
+handling a request are counted against it; requests that run too many
+queries, or the same statement over and over, are flagged as possible N+1
+patterns. Everything is aggregated in `instrumentation` and rendered in
+Prometheus text format by the /metrics endpoint.
+"""
+import bisect
+import contextvars
+import logging
+import re
+import threading
+import time
+import weakref
+from collections import defaultdict
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so queries differing only in literals group together."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return _PLACEHOLDER_LIST.sub("(?+)", normalized)[:500]
+
+
+class Histogram:
+    """Fixed-bucket histogram (Prometheus semantics: a value lands in the first bucket with le >= value)."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for le, count in zip(list(self.buckets) + ["+Inf"], self.counts):
+            total += count
+            yield le, total
+
+
+class RequestStats:
+    """Database work done while handling one request."""
+
+    __slots__ = ("queries", "db_seconds", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.statements: Dict[str, int] = defaultdict(int)
+
+    def server_timing(self, app_seconds: float) -> str:
+        return (f'app;dur={app_seconds * 1000:.1f}, '
+                f'db;dur={self.db_seconds * 1000:.1f};desc="{self.queries} queries"')
+
+
+_current_request: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar(
+    "current_request_stats", default=None
+)
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Templated path of the matched route, e.g. /api/v1/questions/by-age/{age}.
+
+    Depending on the FastAPI version, routes from included routers carry
+    either the full path or only their own part of it, so the prefix is
+    rebuilt from the request path's leading segments.
+    """
+    path = getattr(scope.get("route"), "path", None)
+    if path is None:
+        return "unmatched"
+    route_parts = [part for part in path.split("/") if part]
+    request_parts = [part for part in scope["path"].split("/") if part]
+    prefix = request_parts[:max(len(request_parts) - len(route_parts), 0)]
+    template = "/" + "/".join(prefix + route_parts)
+    if path.endswith("/") and template != "/":
+        template += "/"
+    return template
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+class Instrumentation:
+    """Process-wide registry of request and query metrics."""
+
+    def __init__(self, slow_query_ms: float = 100.0, n_plus_one_threshold: int = 25,
+                 repeated_query_threshold: int = 10, max_slow_queries: int = 200):
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.repeated_query_threshold = repeated_query_threshold
+        self.max_slow_queries = max_slow_queries
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.latency: Dict[tuple, Histogram] = {}
+            self.responses: Dict[tuple, int] = defaultdict(int)
+            self.query_counts: Dict[str, Histogram] = {}
+            self.db_seconds: Dict[str, float] = defaultdict(float)
+            self.n_plus_one: Dict[str, int] = defaultdict(int)
+            self.slow_queries: Dict[str, dict] = {}
+
+    # --- Recording ---
+    def record_query(self, statement: str, seconds: float):
+        stats = _current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += seconds
+            stats.statements[statement] += 1
+
+        if seconds * 1000 >= self.slow_query_ms:
+            key = fingerprint(statement)
+            logger.warning(f"Slow query ({seconds * 1000:.1f} ms): {key}")
+            with self._lock:
+                entry = self.slow_queries.get(key)
+                if entry is None:
+                    if len(self.slow_queries) >= self.max_slow_queries:
+                        return
+                    entry = self.slow_queries[key] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+                entry["count"] += 1
+                entry["total_ms"] += seconds * 1000
+                entry["max_ms"] = max(entry["max_ms"], seconds * 1000)
+
+    def record_request(self, method: str, route: str, status: int, seconds: float, stats: RequestStats):
+        suspect = None
+        if stats.statements:
+            statement, repeats = max(stats.statements.items(), key=lambda item: item[1])
+            if stats.queries > self.n_plus_one_threshold or repeats >= self.repeated_query_threshold:
+                suspect = (statement, repeats)
+
+        with self._lock:
+            histogram = self.latency.get((method, route))
+            if histogram is None:
+                histogram = self.latency[(method, route)] = Histogram(LATENCY_BUCKETS)
+            histogram.observe(seconds)
+            self.responses[(method, route, status)] += 1
+
+            counts = self.query_counts.get(route)
+            if counts is None:
+                counts = self.query_counts[route] = Histogram(QUERY_COUNT_BUCKETS)
+            counts.observe(stats.queries)
+            self.db_seconds[route] += stats.db_seconds
+            if suspect:
+                self.n_plus_one[route] += 1
+
+        if suspect:
+            logger.warning(
+                f"Possible N+1 on {method} {route}: {stats.queries} queries, "
+                f"{suspect[1]}x {fingerprint(suspect[0])}"
+            )
+
+    # --- Reporting ---
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route template.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (method, route), histogram in sorted(self.latency.items()):
+                labels = f'method="{method}",route="{_label(route)}"'
+                for le, count in histogram.cumulative():
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+            lines += ["# HELP http_responses_total Responses by route template and status.",
+                      "# TYPE http_responses_total counter"]
+            for (method, route, status), count in sorted(self.responses.items()):
+                lines.append(f'http_responses_total{{method="{method}",route="{_label(route)}",status="{status}"}} {count}')
+
+            lines += ["# HELP db_queries_per_request Database queries executed per request.",
+                      "# TYPE db_queries_per_request histogram"]
+            for route, histogram in sorted(self.query_counts.items()):
+                labels = f'route="{_label(route)}"'
+                for le, count in histogram.cumulative():
+                    lines.append(f'db_queries_per_request_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"db_queries_per_request_sum{{{labels}}} {histogram.sum:.0f}")
+                lines.append(f"db_queries_per_request_count{{{labels}}} {histogram.count}")
+
+            lines += ["# HELP db_query_seconds_total Time spent in database queries by route template.",
+                      "# TYPE db_query_seconds_total counter"]
+            for route, seconds in sorted(self.db_seconds.items()):
+                lines.append(f'db_query_seconds_total{{route="{_label(route)}"}} {seconds:.6f}')
+
+            lines += ["# HELP db_n_plus_one_suspects_total Requests flagged for excessive or repeated queries.",
+                      "# TYPE db_n_plus_one_suspects_total counter"]
+            for route, count in sorted(self.n_plus_one.items()):
+                lines.append(f'db_n_plus_one_suspects_total{{route="{_label(route)}"}} {count}')
+
+            lines += ["# HELP db_slow_queries_total Queries slower than the slow-query threshold.",
+                      "# TYPE db_slow_queries_total counter",
+                      f"db_slow_queries_total {sum(e['count'] for e in self.slow_queries.values())}"]
+        return "\n".join(lines) + "\n"
+
+    def summary(self, top: int = 10) -> dict:
+        """Compact view for the health diagnostics: slowest query fingerprints and N+1 suspects."""
+        with self._lock:
+            slow = sorted(self.slow_queries.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:top]
+            return {
+                "slow_query_ms": self.slow_query_ms,
+                "slow_queries": [
+                    {"fingerprint": key, "count": e["count"], "avg_ms": round(e["total_ms"] / e["count"], 2),
+                     "max_ms": round(e["max_ms"], 2)}
+                    for key, e in slow
+                ],
+                "n_plus_one_suspects": dict(self.n_plus_one),
+            }
+
+
+instrumentation = Instrumentation()
+_instrumented_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+def instrument_engine(engine: Engine, registry: Instrumentation = instrumentation):
+    """Count and time every cursor execution on engine (idempotent)."""
+    if engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start"].pop()
+        registry.record_query(statement, time.perf_counter() - start)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+
+class InstrumentationMiddleware:
+    """Pure ASGI middleware timing each request and attaching its DB work to it."""
+
+    def __init__(self, app: ASGIApp, registry: Instrumentation = instrumentation):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing(time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # Label by route template, never the raw path, to keep cardinality bounded
+            route = route_template(scope)
+            self.registry.record_request(scope["method"], route, status, time.perf_counter() - start, stats)
+            _current_request.reset(token)
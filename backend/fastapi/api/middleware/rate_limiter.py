@@ -1,106 +1,220 @@
 """Rate limiting middleware and utilities."""
-from fastapi import Request, HTTPException, status
-from typing import Dict
-from datetime import datetime, timedelta
+from fastapi import Request, Response, HTTPException, status
+from typing import Callable, Optional, Tuple
+from jose import JWTError, jwt
+from cachetools import LRUCache
+import asyncio
+import math
+import os
+import sqlite3
+import threading
 import time
 
+from ..config import get_settings_instance
+
+
+class MemoryRateLimitStore:
+    """
+    In-process store: one float per client key.
+
+    Least recently seen keys are evicted past `max_keys`; an evicted client
+    simply starts again with a full allowance.
+    """
+
+    blocking = False  # in-memory: update on the event loop
+
+    def __init__(self, max_keys: int = 100_000):
+        self._tat = LRUCache(maxsize=max_keys)
+        self._lock = threading.Lock()
+
+    def update(self, key: str, fn: Callable[[Optional[float]], Tuple[Optional[float], object]]) -> object:
+        """Atomically apply fn(old_state) -> (new_state or None to keep, result)."""
+        with self._lock:
+            new_state, result = fn(self._tat.get(key))
+            if new_state is not None:
+                self._tat[key] = new_state
+            return result
+
+
+class SQLiteRateLimitStore:
+    """
+    Store shared by every worker process on a host: one row per client key in
+    a SQLite file, updated inside a write transaction so concurrent workers
+    see each other's requests.
+    """
+
+    PRUNE_EVERY = 1000  # updates between sweeps of expired rows
+    blocking = True  # waits on the file lock: update off the event loop
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._updates = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, tat REAL NOT NULL)")
+            self._local.conn = conn
+        return conn
+
+    def update(self, key: str, fn: Callable[[Optional[float]], Tuple[Optional[float], object]]) -> object:
+        """Atomically apply fn(old_state) -> (new_state or None to keep, result)."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tat FROM rate_limits WHERE key = ?", (key,)).fetchone()
+            new_state, result = fn(row[0] if row else None)
+            if new_state is not None:
+                conn.execute("INSERT OR REPLACE INTO rate_limits (key, tat) VALUES (?, ?)", (key, new_state))
+            self._updates += 1
+            if self._updates % self.PRUNE_EVERY == 0:
+                # A theoretical arrival time in the past is the same as no state
+                conn.execute("DELETE FROM rate_limits WHERE tat < ?", (time.time(),))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
 
 class RateLimiter:
     """
-    Simple in-memory rate limiter.
-    
-    For production, consider using Redis-based rate limiting.
+    GCRA (generic cell rate algorithm) rate limiter.
+
+    Equivalent to a token bucket holding `requests_per_minute` tokens that
+    refills continuously, but the state per client is a single number (the
+    theoretical arrival time of its next request), so memory and CPU per
+    request are O(1). State lives in a pluggable store: in-process by
+    default, or a SQLiteRateLimitStore shared by all workers. Any store with
+    an atomic `update(key, fn)` (e.g. a Redis-backed one) can be plugged in;
+    stores that set `blocking = True` are called from a worker thread.
+
+    Clients are keyed by authenticated user (JWT subject) when a valid bearer
+    token is sent, otherwise by IP.
     """
-    
-    def __init__(self, requests_per_minute: int = 30):
+
+    def __init__(self, requests_per_minute: int = 30, name: str = "default", store=None,
+                 period: float = 60.0, clock: Callable[[], float] = time.time):
         """
         Initialize rate limiter.
-        
+
         Args:
-            requests_per_minute: Maximum requests allowed per minute per IP
+            requests_per_minute: Maximum requests allowed per period per client
+            name: Prefix separating this limiter's keys in a shared store
+            store: State backend (defaults to an in-process MemoryRateLimitStore)
+            period: Window in seconds the limit applies to
+            clock: Time source (injectable for tests)
         """
         self.requests_per_minute = requests_per_minute
-        self.requests: Dict[str, list] = {}
-        self.cleanup_interval = 60  # Clean up old entries every 60 seconds
-        self.last_cleanup = time.time()
-    
-    def _cleanup_old_entries(self):
-        """Remove expired entries to prevent memory growth."""
-        current_time = time.time()
-        
-        if current_time - self.last_cleanup < self.cleanup_interval:
-            return
-        
-        cutoff_time = current_time - 60  # Remove entries older than 1 minute
-        
-        for ip in list(self.requests.keys()):
-            self.requests[ip] = [
-                timestamp for timestamp in self.requests[ip]
-                if timestamp > cutoff_time
-            ]
-            
-            # Remove IP if no recent requests
-            if not self.requests[ip]:
-                del self.requests[ip]
-        
-        self.last_cleanup = current_time
-    
-    async def check_rate_limit(self, request: Request):
+        self.name = name
+        self.store = store if store is not None else MemoryRateLimitStore()
+        self.period = period
+        self.emission_interval = period / requests_per_minute
+        self.clock = clock
+
+    def client_key(self, request: Request) -> str:
+        """Authenticated user if the request carries a valid bearer token, else client IP."""
+        authorization = request.headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            settings = get_settings_instance()
+            try:
+                payload = jwt.decode(authorization[7:], settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+                if payload.get("sub"):
+                    return f"user:{payload['sub']}"
+            except JWTError:
+                pass
+        client_ip = request.client.host if request.client else "unknown"
+        return f"ip:{client_ip}"
+
+    def hit(self, key: str) -> Tuple[bool, int, float, float]:
+        """
+        Record one request for key.
+
+        Returns (allowed, remaining, reset, retry_after): requests left in the
+        current allowance, seconds until it is full again, and seconds until
+        the next request would be allowed (0 when allowed).
         """
-        Check if request is within rate limit.
-        
+        now = self.clock()
+        period, interval = self.period, self.emission_interval
+
+        def gcra(tat: Optional[float]):
+            tat = max(tat or now, now)
+            new_tat = tat + interval
+            allow_at = new_tat - period
+            if allow_at - now > 1e-9:  # tolerate float drift from summing intervals
+                return None, (False, 0, tat - now, allow_at - now)
+            remaining = math.floor((period - (new_tat - now)) / interval + 1e-9)
+            return new_tat, (True, remaining, new_tat - now, 0.0)
+
+        return self.store.update(f"{self.name}:{key}", gcra)
+
+    def headers(self, remaining: int, reset: float) -> dict:
+        return {
+            "RateLimit-Limit": str(self.requests_per_minute),
+            "RateLimit-Remaining": str(remaining),
+            "RateLimit-Reset": str(math.ceil(reset)),
+            "RateLimit-Policy": f"{self.requests_per_minute};w={int(self.period)}",
+        }
+
+    async def check_rate_limit(self, request: Request, response: Optional[Response] = None):
+        """
+        Check if request is within rate limit and set RateLimit-* headers on the response.
+
         Raises:
             HTTPException: If rate limit is exceeded
         """
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
-        
-        # Cleanup old entries periodically
-        self._cleanup_old_entries()
-        
-        current_time = time.time()
-        
-        # Initialize tracking for this IP if needed
-        if client_ip not in self.requests:
-            self.requests[client_ip] = []
-        
-        # Remove requests older than 1 minute
-        cutoff_time = current_time - 60
-        self.requests[client_ip] = [
-            timestamp for timestamp in self.requests[client_ip]
-            if timestamp > cutoff_time
-        ]
-        
-        # Check if limit exceeded
-        if len(self.requests[client_ip]) >= self.requests_per_minute:
+        key = self.client_key(request)
+        if getattr(self.store, "blocking", False):
+            # Keep the event loop free while waiting on a shared store's lock
+            allowed, remaining, reset, retry_after = await asyncio.to_thread(self.hit, key)
+        else:
+            allowed, remaining, reset, retry_after = self.hit(key)
+        headers = self.headers(remaining, reset)
+
+        if not allowed:
+            headers["Retry-After"] = str(math.ceil(retry_after))
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Rate limit exceeded. Maximum {self.requests_per_minute} requests per minute.",
-                headers={"Retry-After": "60"}
+                headers=headers
             )
-        
-        # Add current request
-        self.requests[client_ip].append(current_time)
+
+        if response is not None:
+            response.headers.update(headers)
+
+
+def _default_store():
+    """Store selected by RATE_LIMIT_BACKEND: "memory" (per process) or "sqlite" (shared by workers)."""
+    settings = get_settings_instance()
+    if settings.rate_limit_backend == "sqlite":
+        return SQLiteRateLimitStore(settings.rate_limit_db_path)
+    return MemoryRateLimitStore()
 
 
 # Global rate limiter instances
-analytics_rate_limiter = RateLimiter(requests_per_minute=30)
-general_rate_limiter = RateLimiter(requests_per_minute=60)
+_store = _default_store()
+analytics_rate_limiter = RateLimiter(requests_per_minute=30, name="analytics", store=_store)
+general_rate_limiter = RateLimiter(requests_per_minute=60, name="general", store=_store)
 
 
-async def rate_limit_analytics(request: Request):
+async def rate_limit_analytics(request: Request, response: Response):
     """
     Rate limit dependency for analytics endpoints.
-    
-    Limit: 30 requests per minute per IP
+
+    Limit: 30 requests per minute per user (or IP when anonymous)
     """
-    await analytics_rate_limiter.check_rate_limit(request)
+    await analytics_rate_limiter.check_rate_limit(request, response)
 
 
-async def rate_limit_general(request: Request):
+async def rate_limit_general(request: Request, response: Response):
     """
     Rate limit dependency for general endpoints.
-    
-    Limit: 60 requests per minute per IP
+
+    Limit: 60 requests per minute per user (or IP when anonymous)
     """
-    await general_rate_limiter.check_rate_limit(request)
+    await general_rate_limiter.check_rate_limit(request, response)
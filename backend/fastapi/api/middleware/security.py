@@ -1,25 +1,20 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request
+from .headers import ResponseHeadersMiddleware
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware(ResponseHeadersMiddleware):
     """
     Middleware to add security headers to every response.
     Protect against clickjacking, XSS, and MIME sniffing.
     """
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
+    headers = {
         # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-        
+        "X-Frame-Options": "DENY",
+
         # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        
-        
+        "X-Content-Type-Options": "nosniff",
+
         # Control referrer information
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
+        "Referrer-Policy": "strict-origin-when-cross-origin",
+
         # Enforce HTTPS (HSTS) - strict in production, but good practice to have logic ready
-        # response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        return response
+        # "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    }
@@ -0,0 +1,58 @@
+"""Fast JSON responses for hot routes."""
+from functools import lru_cache
+from typing import Any, Iterable, List, Type
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """orjson fallback for types it can't encode natively (Pydantic models, Decimal, sets, ...)."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    return jsonable_encoder(obj)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response that skips FastAPI's jsonable_encoder and response_model
+    re-validation.
+
+    Return it from a route with a payload that is already valid for the
+    route's response_model, built once by the service/route:
+      - a Pydantic model is dumped by pydantic-core straight to JSON bytes;
+      - dicts/lists (possibly containing models) are encoded with orjson;
+      - bytes are sent as is.
+    The route's response_model still documents the payload in OpenAPI.
+
+    Only returning an instance skips jsonable_encoder; as a response_class
+    FastAPI still encodes the content first. A returned response does not
+    pick up headers set by dependencies on the injected Response (e.g. the
+    RateLimit-* headers), so rate-limited routes keep the default path.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def model_list_json(model: Type[BaseModel], rows: Iterable[Any]) -> bytes:
+    """Validate ORM rows against model once and dump the list to JSON bytes in one pass."""
+    adapter = _list_adapter(model)
+    return adapter.dump_json(adapter.validate_python(list(rows), from_attributes=True), by_alias=True)
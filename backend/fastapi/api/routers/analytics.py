@@ -1,16 +1,20 @@
 """Analytics API router - Aggregated, non-sensitive data only."""
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Annotated, List, Optional
 from ..services.db_service import get_db
 from ..services.analytics_service import AnalyticsService
 from ..schemas import (
     AnalyticsSummary,
     TrendAnalytics,
     BenchmarkComparison,
-    PopulationInsights
+    PopulationInsights,
+    RetentionAnalytics,
+    CorrelationAnalytics
 )
 from ..middleware.rate_limiter import rate_limit_analytics
+from ..routers.auth import get_current_user
+from api.root_models import User
 
 router = APIRouter()
 
@@ -20,7 +24,7 @@ async def get_analytics_summary(db: Session = Depends(get_db)):
     """
     Get overall analytics summary with aggregated data only.
     
-    **Rate Limited**: 30 requests per minute per IP
+    **Rate Limited**: 30 requests per minute per user (or IP when anonymous)
     
     **Data Privacy**: This endpoint returns ONLY aggregated statistics.
     No individual user data or raw sensitive information is exposed.
@@ -46,7 +50,7 @@ async def get_trend_analytics(
     """
     Get trend analytics over time.
     
-    **Rate Limited**: 30 requests per minute per IP
+    **Rate Limited**: 30 requests per minute per user (or IP when anonymous)
     
     **Data Privacy**: Returns aggregated time-series data only.
     No individual assessment data or user information.
@@ -68,7 +72,7 @@ async def get_benchmark_comparison(db: Session = Depends(get_db)):
     """
     Get benchmark comparison data with percentiles.
     
-    **Rate Limited**: 30 requests per minute per IP
+    **Rate Limited**: 30 requests per minute per user (or IP when anonymous)
     
     **Data Privacy**: Returns percentile-based aggregations only.
     No individual scores or user data exposed.
@@ -87,7 +91,7 @@ async def get_population_insights(db: Session = Depends(get_db)):
     """
     Get population-level insights.
     
-    **Rate Limited**: 30 requests per minute per IP
+    **Rate Limited**: 30 requests per minute per user (or IP when anonymous)
     
     **Data Privacy**: Returns population-level aggregations only.
     No individual user data or sensitive information.
@@ -107,7 +111,7 @@ async def get_age_group_statistics(db: Session = Depends(get_db)):
     """
     Get detailed statistics by age group.
     
-    **Rate Limited**: 30 requests per minute per IP
+    **Rate Limited**: 30 requests per minute per user (or IP when anonymous)
     
     **Data Privacy**: Returns aggregated statistics per age group.
     No individual assessment data.
@@ -127,7 +131,7 @@ async def get_score_distribution(db: Session = Depends(get_db)):
     """
     Get score distribution across ranges.
     
-    **Rate Limited**: 30 requests per minute per IP
+    **Rate Limited**: 30 requests per minute per user (or IP when anonymous)
     
     **Data Privacy**: Returns distribution counts only.
     No individual scores or user information.
@@ -138,3 +142,55 @@ async def get_score_distribution(db: Session = Depends(get_db)):
     """
     distribution = AnalyticsService.get_score_distribution(db)
     return {"score_distribution": distribution}
+
+
+@router.get("/retention", response_model=RetentionAnalytics, dependencies=[Depends(rate_limit_analytics)])
+async def get_retention_analytics(
+    weeks: int = Query(12, ge=1, le=52, description="Number of weekly cohorts to return"),
+    min_attempts: int = Query(2, ge=2, le=100, description="Attempts needed to count as a returning user"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get weekly cohort retention analytics.
+    
+    **Rate Limited**: 30 requests per minute per user (or IP when anonymous)
+    
+    **Data Privacy**: Returns cohort-level counts only.
+    No individual user data or usernames.
+    
+    Returns:
+    - Weekly cohort retention matrix (counts and percentages)
+    - Time-between-attempts distribution
+    - Returning-user counts and rate
+    """
+    retention = AnalyticsService.get_retention_analytics(db, weeks=weeks, min_attempts=min_attempts)
+    return RetentionAnalytics(**retention)
+
+
+@router.get("/me/correlations", response_model=CorrelationAnalytics, dependencies=[Depends(rate_limit_analytics)])
+async def get_my_correlations(
+    current_user: Annotated[User, Depends(get_current_user)],
+    method: str = Query("pearson", pattern="^(pearson|spearman)$", description="Correlation method"),
+    lags: List[int] = Query([0, 1], description="Day lags between journal entry and EQ test (0-14)"),
+    min_periods: int = Query(3, ge=2, le=365, description="Minimum paired days per coefficient"),
+    db: Session = Depends(get_db)
+):
+    """
+    Correlate the current user's EQ scores with their journal wellbeing metrics.
+    
+    **Authentication Required**
+    
+    **Rate Limited**: 30 requests per minute per user (or IP when anonymous)
+    
+    Returns:
+    - Full correlation matrix (EQ score, sleep, stress, energy, screen time,
+      journal sentiment and their lagged copies)
+    - Paired observation counts
+    - EQ score correlations, strongest first
+    """
+    if any(lag < 0 or lag > 14 for lag in lags):
+        raise HTTPException(status_code=422, detail="lags must be between 0 and 14 days")
+    correlations = AnalyticsService.get_correlation_analytics(
+        db, current_user.username, method=method, lags=lags, min_periods=min_periods
+    )
+    return CorrelationAnalytics(**correlations)
@@ -9,13 +9,15 @@ from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
 from fastapi import APIRouter, Depends, Query, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from ..schemas import HealthResponse, ServiceStatus
 from ..services.db_service import get_db
+from ..services.warmup import warmup
 from ..config import get_settings
+from ..middleware.instrumentation import instrumentation
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -104,6 +106,10 @@ def get_diagnostics() -> Dict[str, Any]:
         diagnostics["cpu_percent"] = process.cpu_percent(interval=0.1)
     except ImportError:
         pass
+
+    # Request/query instrumentation: slowest query fingerprints and N+1 suspects
+    diagnostics["instrumentation"] = instrumentation.summary()
+    diagnostics["warmup"] = warmup.status()
     
     return diagnostics
 
@@ -173,19 +179,39 @@ async def readiness_check(
 
 
 @router.get("/startup", response_model=HealthResponse, tags=["Health"])
-async def startup_check(db: Session = Depends(get_db)) -> HealthResponse:
+async def startup_check(response: Response, db: Session = Depends(get_db)) -> HealthResponse:
     """
     Startup probe - checks if the application has completed initialization.
     
-    Use this for Kubernetes startupProbe to give the app time to initialize.
+    Returns 503 until the warm-up pipeline (question catalog, hot queries,
+    sentiment analyzer, ML models) has finished, so traffic isn't routed to
+    a cold process. Use this for Kubernetes startupProbe.
     """
-    # For startup, we just check if we can connect to DB
     db_status = check_database(db)
+    warmed_up = warmup.ready
+
+    if db_status.status != "healthy":
+        status = "unhealthy"
+    else:
+        status = "healthy" if warmed_up else "starting"
+    if status != "healthy":
+        response.status_code = 503
     
     return HealthResponse(
-        status="healthy" if db_status.status == "healthy" else "unhealthy",
+        status=status,
         timestamp=datetime.now(timezone.utc).isoformat(),
         version=get_app_version(),
         services={"database": db_status},
-        details=None
+        details={"warmup": warmup.status()}
     )
+
+
+@router.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """
+    Prometheus scrape endpoint.
+
+    Exposes per-route latency histograms, response counts, DB queries per
+    request, DB time, N+1 suspects and slow query counts for this process.
+    """
+    return PlainTextResponse(instrumentation.render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -29,6 +29,7 @@ from ..schemas import (
 )
 from ..services.journal_service import JournalService, get_journal_prompts
 from ..services.db_service import get_db
+from ..responses import FastJSONResponse
 from ..routers.auth import get_current_user
 from api.root_models import User
 
@@ -99,12 +100,12 @@ async def list_journals(
         end_date=end_date
     )
     
-    return JournalListResponse(
-        total=total,
-        entries=[JournalResponse.model_validate(e) for e in entries],
-        page=skip // limit + 1,
-        page_size=limit
-    )
+    return FastJSONResponse(JournalListResponse.model_validate({
+        "total": total,
+        "entries": entries,
+        "page": skip // limit + 1,
+        "page_size": limit
+    }, from_attributes=True))
 
 
 # ============================================================================
@@ -13,6 +13,7 @@ sys.path.insert(0, str(ROOT_DIR))
 VERSION = "1.0.0"
 
 from ..services.db_service import get_db, QuestionService
+from ..responses import FastJSONResponse, model_list_json
 from ..schemas import (
     QuestionResponse,
     QuestionListResponse,
@@ -60,12 +61,13 @@ async def get_questions(
             active_only=active_only
         )
     
-    return QuestionListResponse(
-        total=total,
-        questions=[QuestionResponse.model_validate(q) for q in questions],
-        page=skip // limit + 1 if limit > 0 else 1,
-        page_size=limit
-    )
+    # Validate the rows once and let pydantic-core write the JSON directly
+    return FastJSONResponse(QuestionListResponse.model_validate({
+        "total": total,
+        "questions": questions,
+        "page": skip // limit + 1 if limit > 0 else 1,
+        "page_size": limit
+    }, from_attributes=True))
 
 
 @router.get("/by-age/{age}", response_model=List[QuestionResponse])
@@ -87,7 +89,7 @@ async def get_questions_by_age(
     
     questions = QuestionService.get_questions_by_age(db=db, age=age, limit=limit)
     
-    return [QuestionResponse.model_validate(q) for q in questions]
+    return FastJSONResponse(model_list_json(QuestionResponse, questions))
 
 
 @router.get("/categories", response_model=List[QuestionCategoryResponse])
@@ -482,6 +482,52 @@ class PopulationInsights(BaseModel):
     )
 
 
+class RetentionCohort(BaseModel):
+    """Weekly cohort row of the retention matrix"""
+    cohort_week: str = Field(description="Monday of the week of first assessment (YYYY-MM-DD)")
+    cohort_size: int
+    active_users: List[int] = Field(description="Active users per week offset")
+    retention: List[float] = Field(description="Percentage of the cohort active per week offset")
+
+
+class AttemptGapBucket(BaseModel):
+    """Time-between-attempts histogram bucket"""
+    range: str
+    count: int
+
+
+class RetentionAnalytics(BaseModel):
+    """Cohort retention analytics - aggregated data only"""
+    weeks: int
+    min_attempts: int
+    cohorts: List[RetentionCohort]
+    total_users: int
+    returning_users: int
+    returning_user_rate: float
+    average_days_between_attempts: Optional[float] = None
+    gap_distribution: List[AttemptGapBucket]
+
+
+class EQCorrelation(BaseModel):
+    """Correlation of one journal metric (at a day lag) with EQ score"""
+    metric: str = Field(description="Journal metric, e.g. sleep_hours")
+    lag: int = Field(description="Days between the journal entry and the EQ test")
+    r: float = Field(description="Correlation coefficient (-1 to 1)")
+    n: int = Field(description="Paired days used")
+
+
+class CorrelationAnalytics(BaseModel):
+    """EQ score vs journal wellbeing correlations for the current user"""
+    method: str
+    lags: List[int]
+    min_periods: int
+    days: int = Field(description="Days with any recorded data")
+    columns: List[str]
+    matrix: List[List[Optional[float]]] = Field(description="Correlation matrix over columns (null where undefined)")
+    counts: List[List[int]] = Field(description="Paired observation counts over columns")
+    eq_correlations: List[EQCorrelation]
+
+
 # ============================================================================
 # Journal Schemas for API Router
 # ============================================================================
@@ -6,6 +6,8 @@ from datetime import datetime, timedelta
 
 # Import models from root_models module (handles namespace collision)
 from api.root_models import Score, User
+from app.analysis.retention import retention_engine
+from app.analysis.correlation import correlation_engine
 
 
 class AnalyticsService:
@@ -263,3 +265,28 @@ class AnalyticsService:
             'total_population_size': total_users,
             'assessment_completion_rate': completion_rate
         }
+    
+    @staticmethod
+    def get_retention_analytics(db: Session, weeks: int = 12, min_attempts: int = 2) -> Dict:
+        """
+        Get weekly cohort retention and returning-user analytics.
+        
+        Computed in two set-based passes over scores and cached until
+        the scores table changes. Returns cohort counts only - no usernames.
+        """
+        report = retention_engine.get_report(db, weeks=weeks, min_attempts=min_attempts)
+        return {k: v for k, v in report.items() if k != 'data_version'}
+    
+    @staticmethod
+    def get_correlation_analytics(db: Session, username: str, method: str = "pearson",
+                                  lags: Optional[List[int]] = None, min_periods: int = 3) -> Dict:
+        """
+        Get the correlation matrix between a user's EQ scores and journal metrics.
+        
+        Computed in one vectorized pass over a daily frame and cached until
+        the user's scores or journal entries change.
+        """
+        report = correlation_engine.get_report(
+            db, username, method=method, lags=lags or [0, 1], min_periods=min_periods
+        )
+        return {k: v for k, v in report.items() if k not in ('data_version', 'username')}
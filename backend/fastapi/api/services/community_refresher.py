@@ -0,0 +1,186 @@
+import asyncio
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .github_service import GitHubService, github_service
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process dev server only
+    fcntl = None
+
+
+@dataclass
+class RefreshJob:
+    """One GitHubService aggregate kept warm on a fixed cadence."""
+    aggregate: str
+    interval: float  # seconds between rebuilds
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    # Metrics
+    runs: int = 0
+    failures: int = 0
+    last_started: Optional[float] = None
+    last_duration: Optional[float] = None
+    last_error: Optional[str] = None
+    next_run: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        suffix = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.aggregate}[{suffix}]" if suffix else self.aggregate
+
+
+def default_jobs() -> List[RefreshJob]:
+    """Dashboard aggregates and their cadences (matching their cache TTLs)."""
+    return [
+        RefreshJob("pulse_feed", 300, {"limit": 15}),
+        RefreshJob("good_first_issues", 300),
+        RefreshJob("mission_control_data", 900),
+        RefreshJob("project_roadmap", 3600),
+        RefreshJob("contributors", 10800, {"limit": 100}),
+        RefreshJob("reviewer_stats", 10800),
+        RefreshJob("community_graph", 259200),
+        RefreshJob("repository_sunburst", 259200),
+    ]
+
+
+class CommunityRefresher:
+    """
+    Background scheduler that precomputes the community dashboard aggregates.
+
+    Each job rebuilds its aggregate a little before the cached copy expires,
+    so endpoints read precomputed results instead of paying for the GitHub
+    fan-out on a user request. Run times are jittered so jobs with the same
+    cadence don't fire together, and at most `max_concurrency` rebuilds run
+    at once. Aggregates still fresh in the disk cache at startup are not
+    rebuilt until they are due; failed rebuilds are retried after
+    RETRY_INTERVAL rather than a full cadence.
+
+    With several worker processes only the one holding `lock_path` runs the
+    jobs; results reach the others through the shared disk cache.
+    """
+
+    RETRY_INTERVAL = 300
+
+    def __init__(self, service: GitHubService, jobs: Optional[List[RefreshJob]] = None,
+                 max_concurrency: int = 2, jitter: float = 0.1, lock_path: Optional[str] = None):
+        self.service = service
+        self.jobs = jobs if jobs is not None else default_jobs()
+        self.max_concurrency = max_concurrency
+        self.jitter = jitter
+        self._budget: Optional[asyncio.Semaphore] = None
+        self._tasks: List[asyncio.Task] = []
+        self.running = 0
+        self.lock_path = lock_path
+        self._lock_file = None
+
+    def _delay(self, interval: float) -> float:
+        """Next run in [interval * (1 - jitter), interval]: always before the cache TTL lapses."""
+        return interval * (1 - self.jitter * random.random())
+
+    def _initial_delay(self, job: RefreshJob) -> float:
+        age = self.service.aggregate_age(job.aggregate, **job.params)
+        if age is None:
+            return self.jitter * random.random()  # cold: build now, slightly staggered
+        return max(0.0, self._delay(job.interval) - age)
+
+    async def run_job(self, job: RefreshJob) -> bool:
+        """Rebuild one aggregate within the concurrency budget, recording metrics. Returns success."""
+        if self._budget is None:
+            self._budget = asyncio.Semaphore(self.max_concurrency)
+        async with self._budget:
+            self.running += 1
+            job.last_started = time.time()
+            start = time.perf_counter()
+            try:
+                before = self.service.aggregate_age(job.aggregate, **job.params)
+                await self.service.refresh_aggregate(job.aggregate, **job.params)
+                # Builders fall back to placeholder data without caching it when GitHub is unavailable
+                after = self.service.aggregate_age(job.aggregate, **job.params)
+                if after is None or (before is not None and after >= before):
+                    raise RuntimeError("aggregate was not rebuilt (GitHub unavailable?)")
+                job.last_error = None
+                return True
+            except Exception as e:
+                job.failures += 1
+                job.last_error = str(e)
+                print(f"[WARN] Community refresh failed for {job.name}: {e}")
+                return False
+            finally:
+                job.runs += 1
+                job.last_duration = time.perf_counter() - start
+                self.running -= 1
+
+    async def _loop(self, job: RefreshJob):
+        delay = self._initial_delay(job)
+        while True:
+            job.next_run = time.time() + delay
+            await asyncio.sleep(delay)
+            ok = await self.run_job(job)
+            delay = self._delay(job.interval if ok else min(job.interval, self.RETRY_INTERVAL))
+
+    def _acquire_leadership(self) -> bool:
+        """Take the inter-process lock without blocking; released when the process exits."""
+        if self.lock_path is None or fcntl is None:
+            return True
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    def start(self) -> bool:
+        """Schedule every job on the running event loop. Returns False if another process runs them."""
+        if self._tasks:
+            return True
+        if not self._acquire_leadership():
+            print("[INFO] Community refresher runs in another worker; this one reads the shared cache")
+            return False
+        self._budget = asyncio.Semaphore(self.max_concurrency)
+        self._tasks = [asyncio.create_task(self._loop(job), name=f"refresh:{job.name}") for job in self.jobs]
+        print(f"[OK] Community refresher started ({len(self.jobs)} jobs, concurrency {self.max_concurrency})")
+        return True
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._lock_file is not None:
+            self._lock_file.close()  # releases the flock for a recycled worker's successor
+            self._lock_file = None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "active": bool(self._tasks),  # False in workers that defer to the lock holder
+            "running": self.running,
+            "max_concurrency": self.max_concurrency,
+            "github_requests": dict(self.service.request_stats),
+            "jobs": {
+                job.name: {
+                    "interval_seconds": job.interval,
+                    "runs": job.runs,
+                    "failures": job.failures,
+                    "last_started": job.last_started,
+                    "last_duration_ms": round(job.last_duration * 1000, 2) if job.last_duration is not None else None,
+                    "last_error": job.last_error,
+                    "next_run": job.next_run,
+                    "age_seconds": self.service.aggregate_age(job.aggregate, **job.params),
+                }
+                for job in self.jobs
+            },
+        }
+
+
+community_refresher = CommunityRefresher(
+    github_service,
+    lock_path=os.path.join(os.path.dirname(github_service.CACHE_FILE), "community_refresher.lock"),
+)
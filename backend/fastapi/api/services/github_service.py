@@ -3,12 +3,14 @@ import time
 import asyncio
 import os
 import json
+import sqlite3
+import threading
+import functools
 import aiofiles
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Iterable
 from cachetools import LRUCache
 from backend.fastapi.api.config import get_settings_instance
-from app.utils.atomic import atomic_write
 
 # NLTK Setup for Sentiment Analysis
 import nltk
@@ -24,8 +26,125 @@ except LookupError:
     except Exception as e:
         print(f"[WARN] NLTK Download Failed: {e}")
 
+
+class CacheStore:
+    """
+    SQLite key-value file backing the GitHubService cache, one row per cache key.
+
+    Entries are written incrementally (only keys changed since the last flush)
+    and read back one key at a time, so neither startup nor saving has to
+    (de)serialize the whole cache.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        # Reads happen on the event loop, writes in worker threads
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            row = self._connect().execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return tuple(json.loads(row[0])) if row else None
+
+    def put_many(self, entries: Dict[str, tuple]):
+        rows = [(k, json.dumps(v), v[1]) for k, v in entries.items()]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, updated_at) VALUES (?, ?, ?)", rows
+                )
+
+    def prune(self, older_than: float) -> int:
+        """Drop entries last updated before the given timestamp."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute("DELETE FROM cache WHERE updated_at < ?", (older_than,)).rowcount
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._connect().execute("SELECT key FROM cache")]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def after_fork(self):
+        """Forget a connection inherited from the parent process (never share one across fork)."""
+        self._conn = None
+        self._lock = threading.Lock()
+
+
+class PersistentLRUCache(LRUCache):
+    """
+    LRUCache that falls back to a CacheStore on a miss and records writes.
+
+    Evicted entries stay on disk and are loaded back lazily on their next
+    access. Entries set since the last flush are kept in `dirty` until
+    GitHubService writes them out.
+    """
+
+    def __init__(self, maxsize: int, store: CacheStore):
+        super().__init__(maxsize=maxsize)
+        self.store = store
+        self.dirty: Dict[str, tuple] = {}
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.dirty[key] = value
+
+    def __missing__(self, key):
+        try:
+            value = self.store.get(key)
+        except Exception as e:
+            print(f"[WARN] Failed to read disk cache: {e}")
+            value = None
+        if value is None:
+            raise KeyError(key)
+        # Loaded from disk: cache in memory without marking it dirty
+        super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        # `key in cache` only checks memory; get() also consults the store
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def reload(self, key) -> Optional[tuple]:
+        """Re-read key from the store if another process wrote a newer entry; returns it or None."""
+        try:
+            value: Optional[tuple] = self.store.get(key)
+        except Exception as e:
+            print(f"[WARN] Failed to read disk cache: {e}")
+            return None
+        current: Optional[tuple] = LRUCache.get(self, key)
+        if value is None or (current is not None and value[1] <= current[1]):
+            return None
+        super().__setitem__(key, value)
+        self.dirty.pop(key, None)  # an unflushed older copy must not overwrite it
+        return value
+
+
 class GitHubService:
-    def __init__(self):
+    def __init__(self, cache_file: Optional[str] = None):
         self.settings = get_settings_instance()
         self.base_url = "https://api.github.com"
         self.headers = {
@@ -38,54 +157,147 @@ class GitHubService:
         self.owner = self.settings.github_repo_owner
         self.repo = self.settings.github_repo_name
         
-        # LRU Cache to prevent memory leaks (Max 1000 items)
-        self._cache = LRUCache(maxsize=1000)
         self.CACHE_TTL = 3600 * 24 * 7  # Increased to 7 days for immunity
         self._client: Optional[httpx.AsyncClient] = None
         
-        # Persistent Cache Setup
-        self.CACHE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "github_cache.json")
+        # Persistent Cache Setup: SQLite key-value file, opened on first access
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
+        self.CACHE_FILE = cache_file or os.path.join(data_dir, "github_cache.db")
+        self.LEGACY_CACHE_FILE = os.path.join(data_dir, "github_cache.json")
+        self.CACHE_SAVE_INTERVAL = 30  # Flushes only write changed keys, so they can be frequent
         self._cache_lock = None # Lazy initialization
         self._last_save_time = 0.0
+
+        # LRU Cache to prevent memory leaks (Max 1000 items in memory, the rest loaded lazily from disk)
+        self._store = CacheStore(self.CACHE_FILE)
+        self._cache = PersistentLRUCache(maxsize=1000, store=self._store)
+
+        # Request accounting: 304s renew cached entries without costing rate limit quota
+        self.request_stats = {"fetched": 0, "not_modified": 0, "failed": 0}
+
+        # Single-flight: one in-flight task per cache key, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
         
-        # Load immediately (sync) but safely
-        try:
-            self._load_cache_sync()
-        except Exception:
-            pass
+        # One-time import of the old JSON cache file (only for the default location)
+        if cache_file is None:
+            try:
+                self._import_legacy_cache()
+            except Exception:
+                pass
 
-    def _load_cache_sync(self):
-        """Sync load for startup."""
+    def _import_legacy_cache(self):
+        """Move entries from the old single-file JSON cache into the SQLite store."""
+        if os.path.exists(self._store.path) or not os.path.exists(self.LEGACY_CACHE_FILE):
+            return
         try:
-            if os.path.exists(self.CACHE_FILE):
-                import json
-                with open(self.CACHE_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Load into LRUCache (evicting oldest if file > 1000 items)
-                    self._cache.update({k: (v[0], v[1]) for k, v in data.items()})
-                print(f"[INFO] Loaded {len(self._cache)} items from persistent cache.")
+            with open(self.LEGACY_CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Entries are (data, timestamp) or (data, timestamp, validators)
+            self._store.put_many({k: tuple(v) for k, v in data.items()})
+            print(f"[INFO] Imported {len(data)} items from {self.LEGACY_CACHE_FILE} into {self.CACHE_FILE}.")
         except Exception as e:
-            print(f"[WARN] Failed to load disk cache: {e}")
+            print(f"[WARN] Failed to import legacy disk cache: {e}")
 
     def _get_cached_long_term(self, cache_key: str, ttl: int = 86400) -> Optional[Any]:
         """Check cache for a key with a specific custom TTL (e.g., 24 hours)."""
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            data, timestamp = entry[:2]
             if time.time() - timestamp < ttl:
                 print(f"[INFO] Using long-term cache for {cache_key} (Age: {int(time.time() - timestamp)}s)")
                 return data
         return None
 
+    # Aggregated dashboard payloads: name -> (cache key template, TTL in seconds).
+    # Each is built by _build_<name> and kept fresh by the CommunityRefresher.
+    AGGREGATES = {
+        "pulse_feed": ("pulse:{owner}/{repo}", 300),  # 5 minutes, "near" real-time
+        "contributors": ("contributors_v1:{owner}/{repo}:{limit}", 10800),  # 3 hours
+        "reviewer_stats": ("reviewer_stats_v1:{owner}/{repo}", 10800),  # 3 hours
+        "community_graph": ("community_graph_v1:{owner}/{repo}", 259200),  # 3 days
+        "repository_sunburst": ("sunburst:{owner}/{repo}", 259200),  # 3 days
+        "project_roadmap": ("roadmap_v1:{owner}/{repo}", 3600),  # 1 hour
+        "good_first_issues": ("issues_v3:{owner}/{repo}", 300),  # 5 minutes, priority tasks
+        "mission_control_data": ("mission_control_v1:{owner}/{repo}", 900),  # 15 minutes, heavy aggregation
+    }
+
+    def _aggregate(self, name: str, params: Dict[str, Any]) -> tuple:
+        """Resolve an aggregate to (cache_key, ttl, build) where build() rebuilds and caches it."""
+        template, ttl = self.AGGREGATES[name]
+        cache_key = template.format(owner=self.owner, repo=self.repo, **params)
+        build = functools.partial(getattr(self, f"_build_{name}"), cache_key, **params)
+        return cache_key, ttl, build
+
+    async def _serve_aggregate(self, name: str, **params) -> Any:
+        cache_key, ttl, build = self._aggregate(name, params)
+        return await self._serve_cached(cache_key, ttl, build)
+
+    async def refresh_aggregate(self, name: str, **params) -> Any:
+        """Rebuild an aggregate now regardless of its age, sharing any build already in flight."""
+        cache_key, _, build = self._aggregate(name, params)
+        result = await asyncio.shield(self._single_flight(cache_key, build))
+        # Publish right away so other worker processes pick it up from the shared store
+        await self._save_cache_to_disk(force=True)
+        return result
+
+    def aggregate_age(self, name: str, **params) -> Optional[float]:
+        """Seconds since an aggregate was last built, or None if it is not cached."""
+        cache_key, _, _ = self._aggregate(name, params)
+        entry = self._cache.get(cache_key)
+        return time.time() - entry[1] if entry is not None else None
+
+    def _single_flight(self, key: str, build: Callable[..., Awaitable[Any]], *args) -> asyncio.Task:
+        """Return the in-flight task for key, starting build(*args) if there is none."""
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(build(*args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._flight_done(key, t))
+        return task
+
+    def _flight_done(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception so background refreshes that fail don't go unreported
+        if not task.cancelled() and task.exception() is not None:
+            print(f"[WARN] Refresh failed for {key}: {task.exception()}")
+
+    async def _serve_cached(self, cache_key: str, ttl: int, build: Callable[..., Awaitable[Any]], *args) -> Any:
+        """
+        Stale-while-revalidate read of an aggregated cache entry.
+
+        Fresh entries are returned as is. Stale entries (up to CACHE_TTL old) are
+        returned immediately while build(*args) refreshes them in the background.
+        On a miss, concurrent callers share a single build instead of each
+        fanning out to GitHub.
+        """
+        entry = self._cache.get(cache_key)
+        if entry is not None and entry[0] and time.time() - entry[1] >= ttl:
+            # With several worker processes another one may already have refreshed it
+            entry = self._cache.reload(cache_key) or entry
+        if entry is not None and entry[0]:
+            data, timestamp = entry[:2]
+            age = time.time() - timestamp
+            if age < ttl:
+                return data
+            if age < self.CACHE_TTL:
+                print(f"[INFO] Serving stale {cache_key} (Age: {int(age)}s), refreshing in background")
+                self._single_flight(cache_key, build, *args)
+                return data
+        # Shield so a disconnecting client doesn't cancel the build for everyone else
+        return await asyncio.shield(self._single_flight(cache_key, build, *args))
+
     async def _save_cache_to_disk(self, force: bool = False):
         """
-        Async save with lock to prevent race conditions.
-        Throttled to run at most once every 5 minutes unless forced.
+        Write entries changed since the last flush to the disk cache.
+        Serialization and I/O run in a worker thread so the event loop never
+        stalls on them. Throttled to CACHE_SAVE_INTERVAL unless forced.
         """
-        if not self._cache: return
+        if not self._cache.dirty: return
         
         now = time.time()
-        # Throttle: Only save if > 300s passed since last save, unless forced
-        if not force and (now - self._last_save_time < 300):
+        # Throttle: Only save if the interval passed since last save, unless forced
+        if not force and (now - self._last_save_time < self.CACHE_SAVE_INTERVAL):
             return
 
         if self._cache_lock is None:
@@ -93,25 +305,42 @@ class GitHubService:
 
         try:
             async with self._cache_lock:
-                # Security Check: Scrub potentially sensitive keys before dump if they exist
-                # Note: We store API responses, not headers, but good practice.
-                
-                # Ensure directory exists
-                os.makedirs(os.path.dirname(self.CACHE_FILE), exist_ok=True)
-                
-                # Atomic write to prevent corruption
-                with atomic_write(self.CACHE_FILE, 'w', encoding='utf-8') as f:
-                    # Convert LRUCache to dict for JSON serialization
-                    # We store just value and timestamp, keys are URLs/Params
-                    cache_snapshot = {k: v for k, v in self._cache.items()}
-                    f.write(json.dumps(cache_snapshot))
-                
+                # Swap out the pending entries; anything set meanwhile goes to the next flush
+                pending, self._cache.dirty = self._cache.dirty, {}
                 self._last_save_time = now
-                
+                try:
+                    await asyncio.to_thread(self._store.put_many, pending)
+                except Exception:
+                    # Keep the entries for the next attempt unless they were updated since
+                    for key, value in pending.items():
+                        self._cache.dirty.setdefault(key, value)
+                    raise
         except Exception as e:
             # Don't crash on cache save failure
             print(f"[WARN] Failed to save disk cache: {e}")
 
+    async def close(self):
+        """Flush pending cache writes, drop expired disk entries and release connections."""
+        await self._save_cache_to_disk(force=True)
+        try:
+            await asyncio.to_thread(self._store.prune, time.time() - self.CACHE_TTL)
+        except Exception as e:
+            print(f"[WARN] Failed to prune disk cache: {e}")
+        self._store.close()
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    def after_fork(self):
+        """
+        Reset per-process resources in a freshly forked worker (gunicorn
+        preload_app): the disk cache connection and HTTP client must not be
+        shared with the parent, and in-flight tasks belong to its event loop.
+        """
+        self._store.after_fork()
+        self._client = None
+        self._cache_lock = None
+        self._inflight = {}
+
     def _get_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
@@ -120,65 +349,135 @@ class GitHubService:
             )
         return self._client
 
-    async def _get(self, endpoint: str, params: Dict = None, ttl: Optional[int] = None) -> Any:
+    def _conditional_headers(self, entry: Optional[tuple]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cached entry's validators."""
+        if not entry or len(entry) < 3 or not entry[2]:
+            return {}
+        validators = entry[2]
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _endpoint_from_url(self, url: str) -> str:
+        """Turn an absolute API URL (e.g. a Link header target) back into an endpoint."""
+        if url.startswith(self.base_url):
+            return url[len(self.base_url):]
+        return url
+
+    async def _fetch(self, endpoint: str, params: Dict = None, ttl: Optional[int] = None) -> tuple:
+        """
+        Fetch an endpoint through the cache. Returns (data, validators).
+
+        Expired entries are revalidated with a conditional request: a 304 renews
+        the cached entry's timestamp without re-downloading the payload and, for
+        authenticated requests, without counting against the GitHub rate limit.
+        validators holds the ETag/Last-Modified of the response and the URL of
+        the next page from its Link header.
+        """
         # Check cache (Memory & Disk implied since we loaded disk at start)
         cache_key = f"{endpoint}:{str(params)}"
         effective_ttl = ttl if ttl is not None else self.CACHE_TTL
+        entry = self._cache.get(cache_key)
 
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
+        if entry is not None:
+            data, timestamp = entry[:2]
             # If we have cache, return it immediately if fresh, OR if we want to be safe against rate limits
             # But let's try to fetch fresh first, then fallback to cache if rate limited
             if time.time() - timestamp < effective_ttl:
                 # If it's very fresh (< 1 hour), just return it to save API calls
                 # For custom short TTLs (like 300s), we respect the effective_ttl
                 if time.time() - timestamp < 3600 or ttl is not None:
-                    return data
+                    return self._cached_result(entry)
 
+        # Concurrent misses on the same URL share one request
+        return await asyncio.shield(
+            self._single_flight(f"GET {cache_key}", self._request, endpoint, params, cache_key, entry)
+        )
+
+    @staticmethod
+    def _cached_result(entry: Optional[tuple]) -> tuple:
+        if entry is None:
+            return None, {}
+        return entry[0], (entry[2] if len(entry) > 2 else {}) or {}
+
+    async def _request(self, endpoint: str, params: Optional[Dict], cache_key: str, entry: Optional[tuple]) -> tuple:
+        """Network half of _fetch: (conditional) GET, cache update and fallbacks."""
         client = self._get_client()
         try:
             url = f"{self.base_url}{endpoint}"
-            response = await client.get(url, params=params)
-            
-            if response.status_code == 200:
+            response = await client.get(url, params=params, headers=self._conditional_headers(entry))
+
+            if response.status_code == 304 and entry is not None:
+                # Unchanged upstream: renew freshness, keep payload and validators
+                self.request_stats["not_modified"] += 1
+                self._cache[cache_key] = (entry[0], time.time(), *entry[2:])
+                return self._cached_result(entry)
+            elif response.status_code == 200:
+                self.request_stats["fetched"] += 1
                 data = response.json()
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "next": response.links.get("next", {}).get("url"),
+                }
                 # Update cache
-                self._cache[cache_key] = (data, time.time())
+                self._cache[cache_key] = (data, time.time(), validators)
                 # Save async without blocking (fire and forget task, or await)
                 # We await to be safe, but protected by lock
                 try:
                     await self._save_cache_to_disk()
                 except Exception:
                     pass
-                return data
+                return data, validators
             elif response.status_code == 202:
                 print(f"[WAIT] GitHub API: Stats are being calculated for {url}. Try again soon.")
-                return []
+                return [], {}
             elif response.status_code in [403, 429]:
+                self.request_stats["failed"] += 1
                 retry_after = response.headers.get("Retry-After", "60")
                 if response.status_code == 403 and "rate limit exceeded" in response.text.lower():
                     print(f"[WARN] GitHub 403 Rate Limit Exceeded. Checking Cache...")
                 else:
                     print(f"[WARN] GitHub API [{response.status_code}]. Retry-After: {retry_after}s")
-                
+
                 # FALLBACK TO CACHE ON FAILURE
-                if cache_key in self._cache:
-                    print(f"[INFO] Using cached data for {endpoint} (Timestamp: {self._cache[cache_key][1]})")
-                    return self._cache[cache_key][0]
-                
+                if entry is not None:
+                    print(f"[INFO] Using cached data for {endpoint} (Timestamp: {entry[1]})")
+                    return self._cached_result(entry)
+
                 print("[WARN] No cache available. Using Immunity Mode fallbacks.")
-                return None
+                return None, {}
             else:
+                self.request_stats["failed"] += 1
                 print(f"[ERR] GitHub API Error [{response.status_code}] for {url}")
                 # Try cache even on other errors
-                if cache_key in self._cache:
-                     return self._cache[cache_key][0]
-                return None
+                return self._cached_result(entry)
         except Exception as e:
+            self.request_stats["failed"] += 1
             print(f"[ERR] GitHub Request Failed: {e}")
-            if cache_key in self._cache:
-                 return self._cache[cache_key][0]
-            return None
+            return self._cached_result(entry)
+
+    async def _get(self, endpoint: str, params: Dict = None, ttl: Optional[int] = None) -> Any:
+        data, _ = await self._fetch(endpoint, params=params, ttl=ttl)
+        return data
+
+    async def _get_pages(self, endpoint: str, params: Dict = None, ttl: Optional[int] = None, max_pages: int = 10) -> List[Any]:
+        """Fetch a list endpoint and follow its Link rel="next" pages (each page cached and revalidated on its own)."""
+        results: List[Any] = []
+        for _ in range(max_pages):
+            data, validators = await self._fetch(endpoint, params=params, ttl=ttl)
+            if not data or not isinstance(data, list):
+                break
+            results.extend(data)
+            next_url = validators.get("next")
+            if not next_url:
+                break
+            # The next URL already carries the query string
+            endpoint, params = self._endpoint_from_url(next_url), None
+        return results
 
     async def _get_with_semaphore(self, endpoint: str, semaphore: asyncio.Semaphore, ttl: Optional[int] = None) -> Any:
         async with semaphore:
@@ -186,11 +485,9 @@ class GitHubService:
 
     async def get_pulse_feed(self, limit: int = 15) -> List[Dict[str, Any]]:
         """Fetch recent repository events and format them for a live pulse feed."""
-        cache_key = f"pulse:{self.owner}/{self.repo}"
-        # Cache for 5 minutes to be "near" real-time but save API requests
-        cached_data = self._get_cached_long_term(cache_key, 300) 
-        if cached_data:
-            return cached_data
+        return await self._serve_aggregate("pulse_feed", limit=limit)
+
+    async def _build_pulse_feed(self, cache_key: str, limit: int = 15) -> List[Dict[str, Any]]:
 
         events = await self._get(f"/repos/{self.owner}/{self.repo}/events", params={"per_page": 30}, ttl=300)
         
@@ -314,11 +611,9 @@ class GitHubService:
 
     async def get_contributors(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Fetch top contributors enriched with recent PR data."""
-        cache_key = f"contributors_v1:{self.owner}/{self.repo}:{limit}"
-        # Cache for 3 Hours (10800s) as requested
-        cached_data = self._get_cached_long_term(cache_key, 10800)
-        if cached_data:
-            return cached_data
+        return await self._serve_aggregate("contributors", limit=limit)
+
+    async def _build_contributors(self, cache_key: str, limit: int = 100) -> List[Dict[str, Any]]:
 
         # Fetch contributors
         data = await self._get(f"/repos/{self.owner}/{self.repo}/contributors", params={"per_page": limit}, ttl=10800)
@@ -530,17 +825,16 @@ class GitHubService:
 
     async def get_reviewer_stats(self) -> Dict[str, Any]:
         """Fetch Pull Request reviews and comments to identify top contributors."""
-        cache_key = f"reviewer_stats_v1:{self.owner}/{self.repo}"
-        # Cache for 3 Hours (10800s) as requested
-        cached_data = self._get_cached_long_term(cache_key, 10800)
-        if cached_data:
-            return cached_data
-
-        # 1. Fetch comments
-        comment_tasks = []
-        for i in range(1, 3):
-             comment_tasks.append(self._get(f"/repos/{self.owner}/{self.repo}/pulls/comments?sort=created&direction=desc&per_page=100&page={i}", ttl=10800))
-             comment_tasks.append(self._get(f"/repos/{self.owner}/{self.repo}/issues/comments?sort=created&direction=desc&per_page=100&page={i}", ttl=10800))
+        return await self._serve_aggregate("reviewer_stats")
+
+    async def _build_reviewer_stats(self, cache_key: str) -> Dict[str, Any]:
+
+        # 1. Fetch comments (first 2 pages of each, following Link headers)
+        comment_params = {"sort": "created", "direction": "desc", "per_page": 100}
+        comment_tasks = [
+            self._get_pages(f"/repos/{self.owner}/{self.repo}/pulls/comments", params=comment_params, ttl=10800, max_pages=2),
+            self._get_pages(f"/repos/{self.owner}/{self.repo}/issues/comments", params=comment_params, ttl=10800, max_pages=2),
+        ]
         
         # 2. Fetch recent PRs to get their reviews (limited to last 30 for performance)
         # Use 3-hour TTL
@@ -556,7 +850,7 @@ class GitHubService:
         # Split results
         all_comments = []
         all_reviews = []
-        comment_res_count = 4 # 2 pages * 2 types
+        comment_res_count = len(comment_tasks)
         for idx, res in enumerate(all_results):
             if not res: continue
             if idx < comment_res_count:
@@ -635,11 +929,9 @@ class GitHubService:
 
     async def get_community_graph(self) -> Dict[str, Any]:
         """Builds a force-directed graph structure of Contributor-Module connections."""
-        cache_key = f"community_graph_v1:{self.owner}/{self.repo}"
-        # Cache for 3 Days (259200s) as requested
-        cached_data = self._get_cached_long_term(cache_key, 259200)
-        if cached_data:
-            return cached_data
+        return await self._serve_aggregate("community_graph")
+
+    async def _build_community_graph(self, cache_key: str) -> Dict[str, Any]:
 
         try:
             # 1. Fetch ALL contributors first (Seeding)
@@ -782,11 +1074,9 @@ class GitHubService:
 
     async def get_repository_sunburst(self) -> List[Dict[str, Any]]:
         """Calculates directory-level contribution density for a sunburst visualization."""
-        cache_key = f"sunburst:{self.owner}/{self.repo}"
-        # Cache for 3 Days (259200s) as requested
-        cached_data = self._get_cached_long_term(cache_key, 259200)
-        if cached_data:
-             return cached_data
+        return await self._serve_aggregate("repository_sunburst")
+
+    async def _build_repository_sunburst(self, cache_key: str) -> List[Dict[str, Any]]:
 
         try:
             # 1. Fetch recent commits (latest 100 for better distribution)
@@ -888,10 +1178,9 @@ class GitHubService:
 
     async def get_project_roadmap(self) -> List[Dict[str, Any]]:
         """Fetch GitHub Milestones and calculate progress for project roadmap."""
-        cache_key = f"roadmap_v1:{self.owner}/{self.repo}"
-        cached_data = self._get_cached_long_term(cache_key, 3600)
-        if cached_data:
-            return cached_data
+        return await self._serve_aggregate("project_roadmap")
+
+    async def _build_project_roadmap(self, cache_key: str) -> List[Dict[str, Any]]:
 
         # Fetch all milestones
         data = await self._get(f"/repos/{self.owner}/{self.repo}/milestones", params={
@@ -952,11 +1241,9 @@ class GitHubService:
 
     async def get_good_first_issues(self) -> Dict[str, Any]:
         """Fetch issues with waterfall logic: beginner unassigned > all unassigned > all assigned."""
-        cache_key = f"issues_v3:{self.owner}/{self.repo}"
-        # Cache for 5 minutes (300s) for "Near Real-Time" Priority Tasks
-        cached_data = self._get_cached_long_term(cache_key, 300)
-        if cached_data:
-            return cached_data
+        return await self._serve_aggregate("good_first_issues")
+
+    async def _build_good_first_issues(self, cache_key: str) -> Dict[str, Any]:
 
         # Fetch all open issues
         data = await self._get(f"/repos/{self.owner}/{self.repo}/issues", params={
@@ -1039,11 +1326,9 @@ class GitHubService:
 
     async def get_mission_control_data(self) -> Dict[str, Any]:
         """Aggregates all Issues and PRs into a unified 'God's Eye' view for Mission Control."""
-        cache_key = f"mission_control_v1:{self.owner}/{self.repo}"
-        # Cache for 15 minutes to balance freshness with heavy aggregation
-        cached_data = self._get_cached_long_term(cache_key, 900)
-        if cached_data:
-            return cached_data
+        return await self._serve_aggregate("mission_control_data")
+
+    async def _build_mission_control_data(self, cache_key: str) -> Dict[str, Any]:
 
         # Parallel Fetch: Issues (Open/Closed) and PRs (Open/Closed)
         # Limiting to 100 recent items each for performance in this demo
@@ -0,0 +1,162 @@
+"""
+Startup warm-up pipeline.
+
+Work that would otherwise land on the first requests of a fresh process:
+opening the database pool, reading the question catalog, compiling the hot
+ORM queries, loading the VADER lexicon and unpickling ML models. The
+lifespan in main.py runs the database step before the app accepts traffic
+and the rest in the background; /startup reports ready once every step has
+finished.
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+
+from .db_service import Base, QuestionService, SessionLocal, engine
+
+
+@dataclass
+class WarmupStep:
+    name: str
+    run: Callable[[], Any]
+    blocking: bool = False  # must finish before the app accepts requests
+    status: str = "pending"  # pending | running | ok | failed
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+def init_database():
+    """Create missing tables and open the first pooled connection."""
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def warm_question_catalog():
+    """Read the catalog the questions endpoints serve, filling the DB page cache."""
+    db = SessionLocal()
+    try:
+        QuestionService.get_questions(db, limit=200)
+        QuestionService.get_questions_by_age(db, age=25, limit=200)
+        QuestionService.get_categories(db)
+    finally:
+        db.close()
+
+
+def compile_hot_queries():
+    """
+    Run the per-request queries once so SQLAlchemy's compiled statement
+    cache already holds them (lookups for an id/username that doesn't exist).
+    """
+    from ..root_models import User
+    from .journal_service import JournalService
+
+    db = SessionLocal()
+    try:
+        db.query(User).filter(User.username == "").first()
+        JournalService(db).get_entries(current_user=User(id=-1, username=""), limit=20)
+        QuestionService.get_question_by_id(db, question_id=-1)
+    finally:
+        db.close()
+
+
+def load_sentiment_analyzer():
+    """Load the VADER lexicon the journal endpoints score entries with."""
+    from .journal_service import get_analyzer
+
+    if get_analyzer() is None:
+        raise RuntimeError("NLTK VADER lexicon unavailable")
+
+
+def load_ml_models():
+    """Unpickle the latest risk model and the registry's production models."""
+    from app.ml.model_cache import warm_up_models
+
+    warm_up_models()
+
+
+class WarmupPipeline:
+    """Runs warm-up steps in order, off the event loop, recording how each went."""
+
+    def __init__(self, steps: List[WarmupStep]):
+        self.steps = steps
+        self.started_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.completed_at is not None
+
+    def run_step(self, step: WarmupStep) -> bool:
+        step.status = "running"
+        start = time.perf_counter()
+        try:
+            step.run()
+            step.status = "ok"
+            step.error = None
+            return True
+        except Exception as e:
+            # A failed step only loses its warm-up; the request path still loads lazily
+            step.status = "failed"
+            step.error = str(e)
+            print(f"[WARN] Warm-up step '{step.name}' failed: {e}")
+            return False
+        finally:
+            step.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+
+    def _run_pending(self):
+        for step in self.steps:
+            if step.status == "pending":
+                self.run_step(step)
+
+    async def run(self):
+        """Run every pending step in a worker thread, then mark the pipeline ready."""
+        await asyncio.to_thread(self._run_pending)
+        self.completed_at = time.time()
+        failed = [s.name for s in self.steps if s.status == "failed"]
+        total_ms = sum(s.duration_ms or 0 for s in self.steps)
+        print(f"[OK] Warm-up complete in {total_ms:.0f} ms" + (f" (failed: {', '.join(failed)})" if failed else ""))
+
+    async def start(self):
+        """Run the blocking steps now and the rest in the background."""
+        self.started_at, self.completed_at = time.time(), None
+        for step in self.steps:
+            step.status, step.duration_ms, step.error = "pending", None, None
+        for step in self.steps:
+            if step.blocking:
+                await asyncio.to_thread(self.run_step, step)
+        self._task = asyncio.create_task(self.run(), name="warmup")
+
+    async def stop(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "steps": {
+                s.name: {"status": s.status, "duration_ms": s.duration_ms, "error": s.error}
+                for s in self.steps
+            },
+        }
+
+
+def default_steps() -> List[WarmupStep]:
+    return [
+        WarmupStep("database", init_database, blocking=True),
+        WarmupStep("question_catalog", warm_question_catalog),
+        WarmupStep("hot_queries", compile_hot_queries),
+        WarmupStep("sentiment_analyzer", load_sentiment_analyzer),
+        WarmupStep("ml_models", load_ml_models),
+    ]
+
+
+warmup = WarmupPipeline(default_steps())
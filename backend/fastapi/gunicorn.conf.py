@@ -0,0 +1,66 @@
+"""
+Gunicorn production profile for the Soul Sense API.
+
+    gunicorn -c gunicorn.conf.py api.main:app      (from backend/fastapi)
+    python start_server.py --production            (same, via the quick start script)
+
+Runs uvicorn workers under gunicorn:
+  - workers: WEB_CONCURRENCY, default (2 x CPUs available to the process) + 1,
+    capped by WEB_CONCURRENCY_MAX (default 8);
+  - preload_app: the app and its heavy imports (pandas, NLTK, SQLAlchemy
+    models) are loaded once in the master and shared copy-on-write by the
+    workers; per-process resources are reset in post_fork;
+  - max_requests (+ jitter): each worker is recycled after that many requests
+    to bound slow memory growth, staggered so workers don't restart together.
+
+Shared state across workers (see docs/architecture/DEPLOYMENT.md):
+  - rate limits use the SQLite store (RATE_LIMIT_BACKEND=sqlite) so a client
+    gets one allowance, not one per worker;
+  - the GitHub cache is the shared SQLite file; only the worker holding the
+    refresher lock rebuilds the community aggregates, the others read them;
+  - everything else in memory (LRU caches, instrumentation) is per worker.
+"""
+import multiprocessing
+import os
+
+
+def _cpu_count() -> int:
+    try:
+        return len(os.sched_getaffinity(0))  # respects container CPU pinning
+    except AttributeError:
+        return multiprocessing.cpu_count()
+
+
+def default_workers() -> int:
+    return min(2 * _cpu_count() + 1, int(os.getenv("WEB_CONCURRENCY_MAX", "8")))
+
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", default_workers()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+preload_app = True
+
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+# Must be set before preload imports the app: settings are read at import time
+if workers > 1:
+    os.environ.setdefault("RATE_LIMIT_BACKEND", "sqlite")
+
+
+def post_fork(server, worker):
+    """Drop connections inherited from the master; each worker opens its own."""
+    from api.services.db_service import engine
+    from api.services.github_service import github_service
+
+    engine.dispose(close=False)
+    github_service.after_fork()
@@ -0,0 +1,116 @@
+"""
+Benchmark JSON response serialization on hot routes: FastAPI's default path
+(per-item model_validate, response_model re-validation, jsonable_encoder for
+routes without a response_model) vs. FastJSONResponse (validate once,
+pydantic-core / orjson straight to bytes).
+
+Payloads mirror the real routes without touching the database or GitHub:
+  - /questions: a 100-question QuestionListResponse built from ORM-like rows
+  - /graph: a community-graph-sized dict of nodes and links (no response_model)
+
+Requests are fed straight into the ASGI app, so the numbers isolate
+framework and serialization overhead from the network and HTTP client.
+
+Usage:
+    python scripts/benchmark_json_responses.py [--requests 2000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Make both `api` and `backend.fastapi.api` importable
+FASTAPI_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(FASTAPI_DIR))
+sys.path.insert(0, str(FASTAPI_DIR.parent.parent))
+
+from fastapi import FastAPI
+
+from api.responses import FastJSONResponse
+from api.schemas import QuestionListResponse, QuestionResponse
+
+ROWS = [
+    SimpleNamespace(id=i, question_text=f"How often do you feel {i}?", category_id=i % 5, difficulty=1 + i % 3,
+                    is_active=1, min_age=10, max_age=120, weight=1.0, tooltip=None)
+    for i in range(100)
+]
+
+GRAPH = {
+    "nodes": [{"id": f"user-{i}", "group": "contributor", "val": i % 40, "img": f"https://avatars/{i}"}
+              for i in range(300)]
+             + [{"id": f"api/module_{i}.py", "group": "file", "val": i % 7} for i in range(700)],
+    "links": [{"source": f"user-{i % 300}", "target": f"api/module_{i % 700}.py", "value": i % 9}
+              for i in range(3000)],
+}
+
+
+def build_app(fast: bool) -> FastAPI:
+    app = FastAPI()
+
+    if fast:
+        @app.get("/questions", response_model=QuestionListResponse)
+        async def questions():
+            return FastJSONResponse(QuestionListResponse.model_validate(
+                {"total": len(ROWS), "questions": ROWS, "page": 1, "page_size": 100}, from_attributes=True
+            ))
+
+        @app.get("/graph")
+        async def graph():
+            return FastJSONResponse(GRAPH)
+    else:
+        @app.get("/questions", response_model=QuestionListResponse)
+        async def questions():
+            return QuestionListResponse(
+                total=len(ROWS),
+                questions=[QuestionResponse.model_validate(q) for q in ROWS],
+                page=1,
+                page_size=100,
+            )
+
+        @app.get("/graph")
+        async def graph():
+            return GRAPH
+
+    return app
+
+
+async def measure(app, path: str, requests: int) -> float:
+    """Drive the ASGI app directly: large bodies would otherwise be dominated by the HTTP client."""
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+             "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+             "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1234), "server": ("bench", 80)}
+    status = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await app(dict(scope), receive, send)
+    assert status == [200], status
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requests/sec with default vs. pre-validated orjson responses")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    apps = {"default": build_app(fast=False), "FastJSONResponse": build_app(fast=True)}
+    print(f"{'route':<12} {'default':>12} {'FastJSONResponse':>18} {'speedup':>8}")
+    for path in ("/questions", "/graph"):
+        rates = {name: asyncio.run(measure(app, path, args.requests)) for name, app in apps.items()}
+        before, after = rates["default"], rates["FastJSONResponse"]
+        print(f"{path:<12} {before:>8.0f} r/s {after:>14.0f} r/s {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
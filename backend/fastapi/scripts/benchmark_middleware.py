@@ -0,0 +1,104 @@
+"""
+Benchmark the API's header-injecting middleware: BaseHTTPMiddleware (before)
+vs. pure ASGI (after).
+
+Both variants run the same app from create_app(); the "before" variant swaps
+SecurityHeadersMiddleware and VersionHeaderMiddleware back to the previous
+BaseHTTPMiddleware implementations. Requests go through httpx's in-process
+ASGI transport, so the numbers isolate framework and middleware overhead
+from the network.
+
+Usage:
+    python scripts/benchmark_middleware.py [--requests 3000] [--concurrency 10]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Make both `api` and `backend.fastapi.api` importable
+FASTAPI_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(FASTAPI_DIR))
+sys.path.insert(0, str(FASTAPI_DIR.parent.parent))
+
+import httpx
+from fastapi import Request
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from api.main import VersionHeaderMiddleware, create_app
+from api.middleware.security import SecurityHeadersMiddleware
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        return response
+
+
+class LegacyVersionHeaderMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-API-Version"] = "1.0"
+        return response
+
+
+LEGACY = {
+    SecurityHeadersMiddleware: LegacySecurityHeadersMiddleware,
+    VersionHeaderMiddleware: LegacyVersionHeaderMiddleware,
+}
+
+ITEMS = [{"id": i, "text": f"Question {i}", "category_id": i % 5, "difficulty": 1 + i % 3} for i in range(100)]
+
+
+def build_app(legacy: bool):
+    app = create_app()
+    if legacy:
+        app.user_middleware = [
+            Middleware(LEGACY[m.cls], *m.args, **m.kwargs) if m.cls in LEGACY else m
+            for m in app.user_middleware
+        ]
+
+    @app.get("/bench/items")
+    async def items():
+        """A typical JSON list route (100 objects), without the database."""
+        return ITEMS
+
+    return app
+
+
+async def measure(app, path: str, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get(path)
+        assert response.status_code == 200 and response.headers["X-API-Version"] == "1.0", response.text
+
+        async def worker(count: int):
+            for _ in range(count):
+                await client.get(path)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+        return (requests // concurrency * concurrency) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requests/sec before and after the pure ASGI middleware")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    apps = {"BaseHTTPMiddleware": build_app(legacy=True), "pure ASGI": build_app(legacy=False)}
+    print(f"{'route':<15} {'BaseHTTPMiddleware':>20} {'pure ASGI':>12} {'speedup':>8}")
+    for path in ("/health", "/bench/items"):
+        rates = {name: asyncio.run(measure(app, path, args.requests, args.concurrency)) for name, app in apps.items()}
+        before, after = rates["BaseHTTPMiddleware"], rates["pure ASGI"]
+        print(f"{path:<15} {before:>16.0f} r/s {after:>8.0f} r/s {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark API throughput against the number of worker processes.
+
+For each worker count, starts the production profile (start_server.py
+--production: gunicorn + gunicorn.conf.py, or uvicorn workers where gunicorn
+is unavailable) on a free local port, waits for /health, then drives it with
+several load-generating client processes over real HTTP. Client processes are
+used so that the load generator itself isn't the bottleneck.
+
+Throughput should grow with workers until the CPU count is reached. Run it on
+a machine (or container) with the CPU allowance production gets.
+
+Usage:
+    python scripts/benchmark_workers.py [--workers 1 2 4] [--path /api/v1/questions/?limit=100]
+                                        [--seconds 10] [--clients 4] [--concurrency 16]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+FASTAPI_DIR = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = os.environ.copy()
+    # Keep the benchmark off the network and its numbers free of background rebuilds
+    env.setdefault("COMMUNITY_REFRESH_ENABLED", "false")
+    env.setdefault("GUNICORN_MAX_REQUESTS", "0")
+    return subprocess.Popen(
+        [sys.executable, "start_server.py", "--production", "--y",
+         "--workers", str(workers), "--host", "127.0.0.1", "--port", str(port)],
+        cwd=str(FASTAPI_DIR), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,  # so the whole process group can be stopped
+    )
+
+
+def stop_server(process: subprocess.Popen):
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=30)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+def wait_ready(base_url: str, timeout: float = 120.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"server at {base_url} did not become ready")
+
+
+async def _load(url: str, seconds: float, concurrency: int) -> tuple:
+    done = errors = 0
+    deadline = time.perf_counter() + seconds
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal done, errors
+            while time.perf_counter() < deadline:
+                try:
+                    response = await client.get(url)
+                    if response.status_code == 200:
+                        done += 1
+                    else:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return done, errors
+
+
+def load_client(args) -> tuple:
+    return asyncio.run(_load(*args))
+
+
+def measure(url: str, seconds: float, clients: int, concurrency: int) -> tuple:
+    with multiprocessing.Pool(clients) as pool:
+        results = pool.map(load_client, [(url, seconds, concurrency)] * clients)
+    done = sum(r[0] for r in results)
+    errors = sum(r[1] for r in results)
+    return done / seconds, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requests/sec of the production profile by worker count")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=4, help="Load-generating processes")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent requests per client process")
+    args = parser.parse_args()
+
+    print(f"CPUs available: {len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()}")
+    print(f"{'workers':>7} {'req/s':>9} {'scaling':>8} {'errors':>7}")
+    baseline = None
+    for workers in args.workers:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(workers, port)
+        try:
+            wait_ready(base_url)
+            measure(base_url + args.path, 1.0, args.clients, args.concurrency)  # warm every worker
+            rate, errors = measure(base_url + args.path, args.seconds, args.clients, args.concurrency)
+        finally:
+            stop_server(server)
+        baseline = baseline or rate
+        print(f"{workers:>7} {rate:>9.0f} {rate / baseline:>7.2f}x {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
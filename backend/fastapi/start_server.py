@@ -6,6 +6,7 @@ import subprocess
 import sys
 import os
 import argparse
+import runpy
 from pathlib import Path
 
 def check_dependencies():
@@ -36,38 +37,75 @@ def install_dependencies():
         print("❌ Failed to install dependencies")
         return False
 
-def start_server(host="127.0.0.1", port=8000, reload=True):
-    """Start the FastAPI server."""
+def production_command(host, port, env):
+    """
+    Multi-worker command: gunicorn with gunicorn.conf.py (preload, worker
+    recycling) where available, else plain uvicorn workers (e.g. on Windows,
+    where gunicorn doesn't run) sized the same way. The worker count comes
+    from WEB_CONCURRENCY in env.
+    """
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        conf = runpy.run_path(str(Path(__file__).parent / "gunicorn.conf.py"))
+        workers = int(env.get("WEB_CONCURRENCY") or conf["default_workers"]())
+        if workers > 1:
+            env.setdefault("RATE_LIMIT_BACKEND", "sqlite")
+        print("[WARN] gunicorn not available: using uvicorn workers (no preload)")
+        cmd = [
+            sys.executable, "-m", "uvicorn", "api.main:app",
+            "--host", host,
+            "--port", str(port),
+            "--workers", str(workers),
+        ]
+        if conf["max_requests"]:  # 0 disables recycling for gunicorn, but stops uvicorn at once
+            cmd += ["--limit-max-requests", str(conf["max_requests"])]
+        return cmd
+
+    # gunicorn.conf.py reads HOST/PORT/WEB_CONCURRENCY itself
+    env["HOST"], env["PORT"] = host, str(port)
+    return [sys.executable, "-m", "gunicorn", "api.main:app", "-c", "gunicorn.conf.py"]
+
+
+def start_server(host="127.0.0.1", port=8000, reload=True, production=False, workers=None):
+    """Start the FastAPI server (single reloadable process, or the multi-worker production profile)."""
     print(f"\n[START] Starting Soul Sense API server...")
     print(f"   URL: http://{host}:{port}")
     print(f"   Docs: http://{host}:{port}/docs")
     print(f"   ReDoc: http://{host}:{port}/redoc")
-    print(f"   Reload: {'Enabled' if reload else 'Disabled'}")
-    
-    # Ensure uvicorn is available in the path
-    uvicorn_cmd = [
-        sys.executable, "-m", "uvicorn",
-        "api.main:app",
-        "--host", host,
-        "--port", str(port)
-    ]
-    
-    if reload:
-        uvicorn_cmd.append("--reload")
 
-    print(f"Running: {' '.join(uvicorn_cmd)}")
-    
     # Add project root to PYTHONPATH to ensure backend.core imports work
     env = os.environ.copy()
     project_root = str(Path(__file__).resolve().parent.parent.parent)
     current_pythonpath = env.get("PYTHONPATH", "")
     env["PYTHONPATH"] = f"{project_root}{os.pathsep}{current_pythonpath}"
+
+    if production:
+        if workers:
+            env["WEB_CONCURRENCY"] = str(workers)
+        cmd = production_command(host, port, env)
+        print(f"   Mode: production ({env.get('WEB_CONCURRENCY') or 'auto'} workers)")
+    else:
+        print(f"   Reload: {'Enabled' if reload else 'Disabled'}")
+
+        # Ensure uvicorn is available in the path
+        cmd = [
+            sys.executable, "-m", "uvicorn",
+            "api.main:app",
+            "--host", host,
+            "--port", str(port)
+        ]
+
+        if reload:
+            cmd.append("--reload")
+
+    print(f"Running: {' '.join(cmd)}")
     
-    # Set working directory to backend/fastapi so 'app.main' works
+    # Set working directory to backend/fastapi so 'api.main' works
     cwd = Path(__file__).parent
     
     try:
-        subprocess.run(uvicorn_cmd, env=env, cwd=str(cwd))
+        subprocess.run(cmd, env=env, cwd=str(cwd))
     except KeyboardInterrupt:
         print("\n\n👋 Server stopped")
 
@@ -79,6 +117,8 @@ def main():
     parser.add_argument("--reload", action="store_true", default=None, help="Enable auto-reload")
     parser.add_argument("--no-reload", action="store_false", dest="reload", help="Disable auto-reload")
     parser.add_argument("--y", action="store_true", help="Non-interactive mode (auto-confirm)")
+    parser.add_argument("--production", action="store_true", help="Multi-worker gunicorn profile (gunicorn.conf.py)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --production (default: sized from CPUs)")
     
     args = parser.parse_args()
 
@@ -112,7 +152,8 @@ def main():
         reload_val = not args.y
 
     # Start server
-    start_server(host=args.host, port=args.port, reload=reload_val)
+    start_server(host=args.host, port=args.port, reload=reload_val,
+                 production=args.production, workers=args.workers)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,115 @@
+"""
+Tests for the background refresher that precomputes community dashboard aggregates.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.fastapi.api.services.community_refresher import CommunityRefresher, RefreshJob
+from backend.fastapi.api.services.github_service import GitHubService
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = GitHubService(cache_file=str(tmp_path / "github_cache.db"))
+    service.builds = []
+
+    async def build_graph(cache_key):
+        service.builds.append(cache_key)
+        await asyncio.sleep(0.01)
+        service._cache[cache_key] = ({"nodes": len(service.builds)}, time.time())
+        return {"nodes": len(service.builds)}
+
+    service._build_community_graph = build_graph
+    return service
+
+
+def test_refresh_rebuilds_and_endpoint_reads_result(service):
+    refresher = CommunityRefresher(service, jobs=[RefreshJob("community_graph", 259200)])
+
+    async def scenario():
+        assert await refresher.run_job(refresher.jobs[0])
+        return await service.get_community_graph()
+
+    assert asyncio.run(scenario()) == {"nodes": 1}
+    assert len(service.builds) == 1
+    job = refresher.metrics()["jobs"]["community_graph"]
+    assert job["runs"] == 1 and job["failures"] == 0
+    assert job["age_seconds"] < 5
+
+
+def test_uncached_fallback_counts_as_failure(service):
+    async def unavailable(cache_key):
+        return {"nodes": []}  # placeholder, not cached
+
+    service._build_community_graph = unavailable
+    refresher = CommunityRefresher(service, jobs=[RefreshJob("community_graph", 259200)])
+
+    assert asyncio.run(refresher.run_job(refresher.jobs[0])) is False
+    assert refresher.jobs[0].failures == 1
+    assert "not rebuilt" in refresher.jobs[0].last_error
+
+
+def test_concurrency_budget_limits_parallel_rebuilds(service):
+    peak = []
+
+    async def build(cache_key, limit=100):
+        peak.append(refresher.running)
+        await asyncio.sleep(0.01)
+        service._cache[cache_key] = ([], time.time())
+
+    service._build_contributors = build
+    jobs = [RefreshJob("contributors", 10800, {"limit": n}) for n in (10, 20, 30, 40)]
+    refresher = CommunityRefresher(service, jobs=jobs, max_concurrency=2)
+
+    async def burst():
+        return await asyncio.gather(*(refresher.run_job(j) for j in jobs))
+
+    assert asyncio.run(burst()) == [True] * 4
+
+    assert max(peak) == 2
+    assert all(j.runs == 1 for j in jobs)
+
+
+def test_fresh_cache_delays_first_run_and_jitter_stays_under_ttl(service):
+    refresher = CommunityRefresher(service, jobs=[RefreshJob("community_graph", 1000)], jitter=0.1)
+    job = refresher.jobs[0]
+
+    assert refresher._initial_delay(job) <= 0.1  # cold cache: build right away
+
+    service._cache["community_graph_v1:%s/%s" % (service.owner, service.repo)] = ({"nodes": 1}, time.time() - 400)
+    assert 490 <= refresher._initial_delay(job) <= 600
+    assert all(900 <= refresher._delay(1000) <= 1000 for _ in range(50))
+
+
+def test_start_and_stop(service):
+    refresher = CommunityRefresher(service, jobs=[RefreshJob("community_graph", 259200)], jitter=0)
+
+    async def scenario():
+        refresher.start()
+        await asyncio.sleep(0.05)
+        await refresher.stop()
+
+    asyncio.run(scenario())
+
+    assert service.builds and refresher.jobs[0].runs == 1
+    assert refresher._tasks == []
+
+
+def test_only_one_worker_runs_the_jobs(service, tmp_path):
+    lock_path = str(tmp_path / "community_refresher.lock")
+    leader = CommunityRefresher(service, jobs=[RefreshJob("community_graph", 259200)], lock_path=lock_path)
+    follower = CommunityRefresher(service, jobs=[RefreshJob("community_graph", 259200)], lock_path=lock_path)
+
+    async def scenario():
+        assert leader.start()
+        assert not follower.start()
+        assert follower.metrics()["active"] is False
+        await leader.stop()
+        # Lock released (e.g. the leader was recycled): the next worker takes over
+        assert follower.start()
+        await follower.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,211 @@
+"""
+Tests for GitHubService conditional requests, pagination, request coalescing
+and the on-disk cache, run against an in-process stub of the GitHub API
+(httpx.MockTransport).
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from backend.fastapi.api.services.github_service import GitHubService
+
+
+class StubGitHub:
+    """Minimal GitHub API stub that honours If-None-Match and paginates /items."""
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.payload = {"stargazers_count": 10}
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/items":
+            page = int(request.url.params.get("page", "1"))
+            headers = {}
+            if page < 3:
+                headers["Link"] = f'<https://api.github.com/items?per_page=2&page={page + 1}>; rel="next"'
+            return httpx.Response(200, json=[page * 10, page * 10 + 1], headers=headers)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(200, json=self.payload, headers={"ETag": self.etag})
+
+
+@pytest.fixture
+def stub():
+    return StubGitHub()
+
+
+@pytest.fixture
+def service(tmp_path, stub):
+    service = GitHubService(cache_file=str(tmp_path / "github_cache.db"))
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(stub), headers=service.headers)
+    return service
+
+
+def _expire(service, cache_key):
+    data, _, validators = service._cache[cache_key]
+    service._cache[cache_key] = (data, 0.0, validators)
+
+
+def test_not_modified_renews_cached_entry(service, stub):
+    first = asyncio.run(service._get("/repos/o/r", ttl=60))
+    assert first == {"stargazers_count": 10}
+    assert service._cache["/repos/o/r:None"][2]["etag"] == '"v1"'
+
+    _expire(service, "/repos/o/r:None")
+    second = asyncio.run(service._get("/repos/o/r", ttl=60))
+
+    assert second == first
+    assert stub.requests[1].headers["If-None-Match"] == '"v1"'
+    assert service.request_stats == {"fetched": 1, "not_modified": 1, "failed": 0}
+    # Renewed: served from cache without another request
+    asyncio.run(service._get("/repos/o/r", ttl=60))
+    assert len(stub.requests) == 2
+
+
+def test_changed_resource_replaces_payload(service, stub):
+    asyncio.run(service._get("/repos/o/r", ttl=60))
+    _expire(service, "/repos/o/r:None")
+    stub.etag, stub.payload = '"v2"', {"stargazers_count": 11}
+
+    data = asyncio.run(service._get("/repos/o/r", ttl=60))
+
+    assert data == {"stargazers_count": 11}
+    assert service._cache["/repos/o/r:None"][2]["etag"] == '"v2"'
+
+
+def test_get_pages_follows_link_header(service, stub):
+    items = asyncio.run(service._get_pages("/items", params={"per_page": 2}, ttl=60))
+
+    assert items == [10, 11, 20, 21, 30, 31]
+    assert [r.url.params.get("page") for r in stub.requests] == [None, "2", "3"]
+
+    limited = asyncio.run(service._get_pages("/items", params={"per_page": 2}, ttl=60, max_pages=2))
+    assert limited == [10, 11, 20, 21]
+    assert len(stub.requests) == 3  # second walk served from cache
+
+
+def test_disk_cache_loads_lazily_and_keeps_validators(service):
+    asyncio.run(service._get("/repos/o/r", ttl=60))
+    asyncio.run(service._save_cache_to_disk(force=True))
+
+    reloaded = GitHubService(cache_file=service.CACHE_FILE)
+    assert len(reloaded._cache) == 0  # nothing parsed at startup
+
+    entry = reloaded._cache.get("/repos/o/r:None")
+    assert entry[0] == {"stargazers_count": 10}
+    assert reloaded._conditional_headers(entry) == {"If-None-Match": '"v1"'}
+    assert reloaded._cache.dirty == {}
+    assert reloaded._cache.get("missing") is None
+
+
+def test_flush_writes_only_changed_entries(service, monkeypatch):
+    service._cache["a"] = ({"a": 1}, time.time())
+    service._cache["b"] = ({"b": 1}, time.time())
+    asyncio.run(service._save_cache_to_disk(force=True))
+
+    written = []
+    put_many = service._store.put_many
+
+    def recording_put_many(entries):
+        written.append(set(entries))
+        put_many(entries)
+
+    monkeypatch.setattr(service._store, "put_many", recording_put_many)
+    service._cache["b"] = ({"b": 2}, time.time())
+    asyncio.run(service._save_cache_to_disk(force=True))
+
+    assert written == [{"b"}]
+    assert sorted(service._store.keys()) == ["a", "b"]
+    assert service._store.get("b")[0] == {"b": 2}
+
+
+def test_close_prunes_expired_entries(service):
+    service._cache["old"] = ({"x": 1}, time.time() - service.CACHE_TTL - 1)
+    service._cache["new"] = ({"x": 2}, time.time())
+
+    asyncio.run(service.close())
+
+    assert service._store.keys() == ["new"]
+
+
+def test_legacy_json_cache_is_imported(service, tmp_path):
+    legacy = tmp_path / "github_cache.json"
+    legacy.write_text(json.dumps({"k:None": [[1, 2], 123.0]}), encoding="utf-8")
+    service.LEGACY_CACHE_FILE = str(legacy)
+
+    service._import_legacy_cache()
+
+    assert service._cache.get("k:None") == ([1, 2], 123.0)
+
+
+def test_concurrent_misses_share_one_request(service):
+    calls = []
+
+    async def slow_github(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"ok": True})
+
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(slow_github))
+
+    async def burst():
+        return await asyncio.gather(*(service._get("/repos/o/r", ttl=60) for _ in range(5)))
+
+    assert asyncio.run(burst()) == [{"ok": True}] * 5
+    assert len(calls) == 1
+    assert service._inflight == {}
+
+
+def test_serve_cached_coalesces_builds(service):
+    builds = []
+
+    async def build(key):
+        builds.append(key)
+        await asyncio.sleep(0.01)
+        service._cache[key] = ({"graph": len(builds)}, time.time())
+        return {"graph": len(builds)}
+
+    async def burst():
+        return await asyncio.gather(*(service._serve_cached("graph", 60, build, "graph") for _ in range(4)))
+
+    assert asyncio.run(burst()) == [{"graph": 1}] * 4
+    assert builds == ["graph"]
+
+
+def test_stale_entry_served_while_revalidating(service):
+    service._cache["graph"] = ({"graph": "old"}, time.time() - 120)
+    refreshed = []
+
+    async def build(key):
+        service._cache[key] = ({"graph": "new"}, time.time())
+        refreshed.append(key)
+        return {"graph": "new"}
+
+    async def read_then_settle():
+        stale = await service._serve_cached("graph", 60, build, "graph")
+        assert not refreshed  # returned before the refresh ran
+        await service._inflight["graph"]
+        fresh = await service._serve_cached("graph", 60, build, "graph")
+        return stale, fresh
+
+    assert asyncio.run(read_then_settle()) == ({"graph": "old"}, {"graph": "new"})
+    assert refreshed == ["graph"]
+
+
+def test_stale_entry_picks_up_refresh_from_another_worker(service, tmp_path):
+    service._cache["graph"] = ({"graph": "old"}, time.time() - 120)
+    # Another worker process refreshed the aggregate and published it to the shared store
+    other = GitHubService(cache_file=str(tmp_path / "github_cache.db"))
+    other._store.put_many({"graph": ({"graph": "new"}, time.time())})
+
+    async def build(key):
+        raise AssertionError("should not rebuild")
+
+    assert asyncio.run(service._serve_cached("graph", 60, build, "graph")) == {"graph": "new"}
+    assert "graph" not in service._cache.dirty
@@ -0,0 +1,55 @@
+"""
+Tests for the pure ASGI header-injecting middleware.
+"""
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.fastapi.api.main import VersionHeaderMiddleware
+from backend.fastapi.api.middleware.security import SecurityHeadersMiddleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(VersionHeaderMiddleware)
+
+    @app.get("/json")
+    async def json_route():
+        return {"ok": True}
+
+    @app.get("/framed")
+    async def framed():
+        return PlainTextResponse("x", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i};"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return TestClient(app)
+
+
+def test_headers_added_to_json_and_error_responses():
+    client = _client()
+    for path, status in (("/json", 200), ("/missing", 404)):
+        response = client.get(path)
+        assert response.status_code == status
+        assert response.headers["X-API-Version"] == "1.0"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
+
+
+def test_existing_header_is_overwritten_not_duplicated():
+    response = _client().get("/framed")
+    assert response.headers.get_list("X-Frame-Options") == ["DENY"]
+
+
+def test_streaming_response_passes_through():
+    response = _client().get("/stream")
+    assert response.text == "chunk0;chunk1;chunk2;"
+    assert response.headers["X-API-Version"] == "1.0"
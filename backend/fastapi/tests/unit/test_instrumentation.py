@@ -0,0 +1,91 @@
+"""
+Tests for request timing, per-request query counting and the /metrics output.
+"""
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from backend.fastapi.api.middleware.instrumentation import (
+    Instrumentation,
+    InstrumentationMiddleware,
+    fingerprint,
+    instrument_engine,
+)
+
+
+def _client(registry: Instrumentation) -> TestClient:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    instrument_engine(engine, registry)
+
+    app = FastAPI()
+    app.add_middleware(InstrumentationMiddleware, registry=registry)
+    router = APIRouter()
+
+    @router.get("/{item_id}")
+    def item(item_id: int):
+        with engine.connect() as conn:
+            return {"value": conn.execute(text("SELECT :v"), {"v": item_id}).scalar()}
+
+    @router.get("/")
+    def listing():
+        return []
+
+    @app.get("/loop")
+    def loop():
+        # One query per row: the N+1 shape
+        with engine.connect() as conn:
+            return [conn.execute(text("SELECT :i"), {"i": i}).scalar() for i in range(12)]
+
+    app.include_router(router, prefix="/items")
+    return TestClient(app)
+
+
+def test_server_timing_and_route_template_labels():
+    registry = Instrumentation(slow_query_ms=10_000)
+    client = _client(registry)
+
+    response = client.get("/items/7")
+    client.get("/items/8")
+    client.get("/items/")
+    client.get("/nowhere")
+
+    assert response.json() == {"value": 7}
+    assert 'db;dur=' in response.headers["Server-Timing"]
+    assert 'desc="1 queries"' in response.headers["Server-Timing"]
+
+    metrics = registry.render_prometheus()
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 2' in metrics
+    assert 'http_responses_total{method="GET",route="unmatched",status="404"} 1' in metrics
+    assert 'db_queries_per_request_bucket{route="/items/{item_id}",le="1"} 2' in metrics
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/"} 1' in metrics
+    assert "/items/7" not in metrics
+
+
+def test_repeated_queries_flagged_as_n_plus_one():
+    registry = Instrumentation(slow_query_ms=10_000, repeated_query_threshold=10)
+    client = _client(registry)
+
+    client.get("/items/1")
+    client.get("/loop")
+
+    assert registry.n_plus_one == {"/loop": 1}
+    assert 'db_n_plus_one_suspects_total{route="/loop"} 1' in registry.render_prometheus()
+
+
+def test_slow_queries_grouped_by_fingerprint():
+    registry = Instrumentation(slow_query_ms=0)
+    registry.record_query("SELECT * FROM users WHERE id = 1", 0.2)
+    registry.record_query("SELECT *  FROM users WHERE id = 42", 0.4)
+
+    summary = registry.summary()
+
+    assert summary["slow_queries"] == [
+        {"fingerprint": "SELECT * FROM users WHERE id = ?", "count": 2, "avg_ms": 300.0, "max_ms": 400.0}
+    ]
+    assert "db_slow_queries_total 2" in registry.render_prometheus()
+
+
+def test_fingerprint_normalizes_literals_and_in_lists():
+    assert fingerprint("SELECT a FROM t WHERE b = 'x''y' AND c IN (?, ?, ?)") == "SELECT a FROM t WHERE b = ? AND c IN (?+)"
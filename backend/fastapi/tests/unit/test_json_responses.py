@@ -0,0 +1,73 @@
+"""
+Tests for the pre-validated orjson responses used by hot routes.
+"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from backend.fastapi.api.responses import FastJSONResponse, model_list_json
+from backend.fastapi.api.schemas import QuestionListResponse, QuestionResponse
+
+
+def _rows(count: int):
+    return [SimpleNamespace(id=i, question_text=f"Question {i}", category_id=i % 5, difficulty=None,
+                            is_active=1, min_age=10, max_age=120, weight=1.5, tooltip=None)
+            for i in range(count)]
+
+
+def test_payloads_match_the_response_model_output():
+    rows = _rows(3)
+    expected = [QuestionResponse.model_validate(r).model_dump(mode="json") for r in rows]
+    listing = QuestionListResponse.model_validate(
+        {"total": 3, "questions": rows, "page": 1, "page_size": 100}, from_attributes=True
+    )
+
+    assert json.loads(FastJSONResponse(listing).body)["questions"] == expected
+    assert json.loads(model_list_json(QuestionResponse, rows)) == expected
+
+
+def test_dicts_with_models_and_non_native_types():
+    response = FastJSONResponse({
+        1: QuestionResponse.model_validate(_rows(1)[0]),
+        "when": datetime(2024, 1, 2, 3, 4, 5),
+        "amount": Decimal("1.5"),
+        "tags": {"a"},
+    })
+    body = json.loads(response.body)
+    assert body["1"]["question_text"] == "Question 0"
+    assert body["when"] == "2024-01-02T03:04:05"
+    assert body["amount"] == 1.5 and body["tags"] == ["a"]
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_routes_keep_openapi_schema_and_status_and_headers():
+    app = FastAPI()
+
+    async def stamp(response: Response):
+        response.headers["X-Dependency"] = "yes"
+
+    @app.get("/questions", response_model=List[QuestionResponse])
+    async def questions():
+        return FastJSONResponse(model_list_json(QuestionResponse, _rows(2)), headers={"X-Route": "yes"})
+
+    @app.get("/dict", response_class=FastJSONResponse, dependencies=[Depends(stamp)])
+    async def plain():
+        return {"ok": True}
+
+    client = TestClient(app)
+    response = client.get("/questions")
+    assert response.status_code == 200 and response.headers["X-Route"] == "yes"
+    assert [q["id"] for q in response.json()] == [0, 1]
+
+    # As a response_class (not a returned instance), dependency headers still apply
+    response = client.get("/dict")
+    assert response.json() == {"ok": True} and response.headers["X-Dependency"] == "yes"
+
+    schema = app.openapi()["paths"]["/questions"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert schema["items"]["$ref"].endswith("/QuestionResponse")
@@ -0,0 +1,147 @@
+"""
+Tests for the GCRA rate limiter, its storage backends and RateLimit-* headers.
+"""
+
+import threading
+
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from jose import jwt
+import pytest
+
+from backend.fastapi.api.config import get_settings_instance
+from backend.fastapi.api.middleware.rate_limiter import (
+    MemoryRateLimitStore,
+    RateLimiter,
+    SQLiteRateLimitStore,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteRateLimitStore(str(tmp_path / "rate_limits.db"))
+    return MemoryRateLimitStore()
+
+
+def test_burst_then_steady_refill(store, clock):
+    limiter = RateLimiter(requests_per_minute=3, store=store, clock=clock)
+
+    assert [limiter.hit("ip:a")[:2] for _ in range(3)] == [(True, 2), (True, 1), (True, 0)]
+    allowed, _, _, retry_after = limiter.hit("ip:a")
+    assert not allowed and retry_after == pytest.approx(20)
+
+    clock.now += 20  # one emission interval refills one request
+    assert limiter.hit("ip:a")[:2] == (True, 0)
+    assert limiter.hit("ip:b")[:2] == (True, 2)  # other clients unaffected
+
+    clock.now += 120
+    assert limiter.hit("ip:a")[:2] == (True, 2)
+
+
+def test_denied_requests_do_not_consume_allowance(store, clock):
+    limiter = RateLimiter(requests_per_minute=2, store=store, clock=clock)
+    limiter.hit("k"), limiter.hit("k")
+    for _ in range(10):
+        assert not limiter.hit("k")[0]
+
+    clock.now += 30
+    assert limiter.hit("k")[0]
+
+
+def test_sqlite_store_is_shared_between_workers(tmp_path, clock):
+    path = str(tmp_path / "rate_limits.db")
+    worker_a = RateLimiter(requests_per_minute=2, store=SQLiteRateLimitStore(path), clock=clock)
+    worker_b = RateLimiter(requests_per_minute=2, store=SQLiteRateLimitStore(path), clock=clock)
+
+    assert worker_a.hit("ip:a")[0] and worker_b.hit("ip:a")[0]
+    assert not worker_a.hit("ip:a")[0]
+    assert not worker_b.hit("ip:a")[0]
+
+
+def _app(limiter: RateLimiter) -> FastAPI:
+    app = FastAPI()
+
+    async def limit(request: Request, response: Response):
+        await limiter.check_rate_limit(request, response)
+
+    @app.get("/ping", dependencies=[Depends(limit)])
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def test_headers_and_429(clock):
+    client = TestClient(_app(RateLimiter(requests_per_minute=2, clock=clock)))
+
+    first = client.get("/ping")
+    assert first.headers["RateLimit-Limit"] == "2"
+    assert first.headers["RateLimit-Remaining"] == "1"
+    assert first.headers["RateLimit-Reset"] == "30"
+    assert first.headers["RateLimit-Policy"] == "2;w=60"
+
+    client.get("/ping")
+    denied = client.get("/ping")
+    assert denied.status_code == 429
+    assert denied.headers["Retry-After"] == "30"
+    assert denied.headers["RateLimit-Remaining"] == "0"
+
+
+def test_authenticated_users_are_keyed_by_subject(clock):
+    settings = get_settings_instance()
+    limiter = RateLimiter(requests_per_minute=1, clock=clock)
+    client = TestClient(_app(limiter))
+
+    def bearer(sub):
+        token = jwt.encode({"sub": sub}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+        return {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/ping", headers=bearer("alice")).status_code == 200
+    assert client.get("/ping", headers=bearer("alice")).status_code == 429
+    # Same IP, different user: separate allowance
+    assert client.get("/ping", headers=bearer("bob")).status_code == 200
+    # Invalid token falls back to the IP key
+    assert client.get("/ping", headers={"Authorization": "Bearer junk"}).status_code == 200
+    assert client.get("/ping").status_code == 429
+
+
+def test_blocking_store_is_updated_off_the_event_loop(tmp_path, clock):
+    threads = {}
+
+    class RecordingSQLiteStore(SQLiteRateLimitStore):
+        def update(self, key, fn):
+            threads["store"] = threading.get_ident()
+            return super().update(key, fn)
+
+    class RecordingMemoryStore(MemoryRateLimitStore):
+        def update(self, key, fn):
+            threads["store"] = threading.get_ident()
+            return super().update(key, fn)
+
+    for store, off_loop in ((RecordingSQLiteStore(str(tmp_path / "rate_limits.db")), True),
+                            (RecordingMemoryStore(), False)):
+        limiter = RateLimiter(requests_per_minute=5, store=store, clock=clock)
+        app = _app(limiter)
+
+        @app.get("/loop")
+        async def loop_thread():
+            return {"thread": threading.get_ident()}
+
+        with TestClient(app) as client:  # one event loop thread for both requests
+            response = client.get("/ping")
+            assert response.status_code == 200 and response.headers["RateLimit-Remaining"] == "4"
+            assert (threads["store"] != client.get("/loop").json()["thread"]) is off_loop
@@ -0,0 +1,104 @@
+"""
+Tests for the startup warm-up pipeline and the /startup probe that waits for it.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.fastapi.api.routers import health
+from backend.fastapi.api.services.db_service import get_db
+from backend.fastapi.api.services.warmup import WarmupPipeline, WarmupStep
+
+
+def test_blocking_steps_finish_before_start_returns():
+    release = threading.Event()
+    calls = []
+
+    def database():
+        calls.append("database")
+
+    def catalog():
+        release.wait(5)
+        calls.append("catalog")
+
+    pipeline = WarmupPipeline([WarmupStep("database", database, blocking=True), WarmupStep("catalog", catalog)])
+
+    async def scenario():
+        await pipeline.start()
+        assert calls == ["database"] and not pipeline.ready
+        release.set()
+        await pipeline._task
+        return pipeline.status()
+
+    status = asyncio.run(scenario())
+    assert calls == ["database", "catalog"]
+    assert status["ready"] and status["steps"]["catalog"]["status"] == "ok"
+    assert status["steps"]["catalog"]["duration_ms"] is not None
+
+
+def test_failed_step_is_recorded_and_does_not_block_readiness():
+    def broken():
+        raise RuntimeError("lexicon unavailable")
+
+    ran = []
+
+    def models():
+        ran.append(1)
+
+    pipeline = WarmupPipeline([WarmupStep("sentiment", broken), WarmupStep("models", models)])
+
+    async def scenario():
+        await pipeline.start()
+        await pipeline._task
+
+    asyncio.run(scenario())
+    steps = pipeline.status()["steps"]
+    assert steps["sentiment"] == {"status": "failed", "duration_ms": steps["sentiment"]["duration_ms"],
+                                  "error": "lexicon unavailable"}
+    assert ran == [1] and pipeline.ready
+
+
+def test_startup_probe_waits_for_warmup(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+    Session = sessionmaker(bind=engine)
+
+    def session():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    release = threading.Event()
+    pipeline = WarmupPipeline([WarmupStep("catalog", lambda: release.wait(5))])
+    monkeypatch.setattr(health, "warmup", pipeline)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        await pipeline.start()
+        yield
+        await pipeline.stop()
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(health.router)
+    app.dependency_overrides[get_db] = session
+
+    with TestClient(app) as client:
+        response = client.get("/startup")
+        assert response.status_code == 503 and response.json()["status"] == "starting"
+
+        release.set()
+        for _ in range(100):
+            if pipeline.ready:
+                break
+            time.sleep(0.01)
+        response = client.get("/startup")
+        assert response.status_code == 200 and response.json()["status"] == "healthy"
+        assert response.json()["details"]["warmup"]["steps"]["catalog"]["status"] == "ok"
@@ -11,14 +11,43 @@ from sklearn.metrics import (
     confusion_matrix
 )
 import numpy as np
+from sqlalchemy import create_engine
 
-from .dataset import load_training_data
+from app.ml.feature_store import feature_store
 from .features import build_vectorizer
 
 # Correct paths relative to project root (assuming script run from root)
 DB_PATH = "data/soulsense.db"
 MODEL_PATH = "data/experiments/emotion_classification/model.pkl"
 
+# Same cut-offs as the journal's Negative / Neutral / Positive mood filter
+NEGATIVE_BELOW = -30
+POSITIVE_ABOVE = 30
+
+
+def load_training_data(db_path=DB_PATH):
+    """Journal texts and their sentiment labels (0 negative, 1 neutral, 2 positive).
+
+    Reads the journal snapshot of the feature store, which is refreshed with
+    only the entries added since the last run.
+    """
+    engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        with engine.connect() as connection:
+            journal = feature_store.snapshot(
+                connection, "journal_entries", columns=["content", "sentiment_score"]
+            )
+    finally:
+        engine.dispose()
+
+    journal = journal[(journal["content"].str.strip() != "") & journal["sentiment_score"].notna()]
+    labels = np.select(
+        [journal["sentiment_score"] < NEGATIVE_BELOW, journal["sentiment_score"] > POSITIVE_ABOVE],
+        [0, 2],
+        default=1,
+    )
+    return journal["content"].tolist(), labels
+
 
 def train():
     texts, labels = load_training_data(DB_PATH)
@@ -0,0 +1,40 @@
+"""add user_score_stats table
+
+Revision ID: 9a3c7e1d5b20
+Revises: 28f7f5014a54
+Create Date: 2026-10-19 10:30:12.418093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3c7e1d5b20'
+down_revision: Union[str, Sequence[str], None] = '28f7f5014a54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_score_stats',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('username', sa.String(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=True),
+    sa.Column('mean', sa.Float(), nullable=True),
+    sa.Column('m2', sa.Float(), nullable=True),
+    sa.Column('last_score', sa.Integer(), nullable=True),
+    sa.Column('abs_change_sum', sa.Float(), nullable=True),
+    sa.Column('updated_at', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_user_score_stats_username'), 'user_score_stats', ['username'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_user_score_stats_username'), table_name='user_score_stats')
+    op.drop_table('user_score_stats')
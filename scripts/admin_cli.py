@@ -324,6 +324,55 @@ class AdminCLI:
         finally:
             conn.close()
 
+    def show_retention(self, weeks=12, min_attempts=2):
+        """Show weekly cohort retention and returning-user statistics"""
+        from app.db import safe_db_context
+        from app.analysis.retention import retention_engine
+
+        print("\n" + "="*50)
+        print("  Cohort Retention (Admin Only)")
+        print("="*50 + "\n")
+
+        try:
+            with safe_db_context() as session:
+                report = retention_engine.get_report(session, weeks=weeks, min_attempts=min_attempts)
+        except Exception as e:
+            print(f"✗ Error calculating retention: {e}\n")
+            return
+
+        if not report["cohorts"]:
+            print("No scores available.\n")
+            return
+
+        headers = ["Cohort", "Users"] + [f"W{i}" for i in range(weeks)]
+        table_data = [
+            [c["cohort_week"], c["cohort_size"]] + [f"{r:.0f}%" for r in c["retention"]]
+            for c in report["cohorts"]
+        ]
+        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+        print(f"\nTotal users: {report['total_users']}")
+        print(f"Returning users (>= {min_attempts} attempts): {report['returning_users']} "
+              f"({report['returning_user_rate']:.1f}%)")
+        avg_gap = report["average_days_between_attempts"]
+        if avg_gap is not None:
+            print(f"Average days between attempts: {avg_gap:.1f}")
+
+        gap_data = [[b["range"], b["count"]] for b in report["gap_distribution"]]
+        print(f"\n{tabulate(gap_data, headers=['Time Between Attempts', 'Count'], tablefmt='grid')}\n")
+
+    def rebuild_score_stats(self, username=None):
+        """Rebuild the per-user running score statistics from score history"""
+        from app.db import safe_db_context
+        from app.analysis.score_stats import rebuild_user_stats
+
+        try:
+            with safe_db_context() as session:
+                rebuilt = rebuild_user_stats(session, username)
+            print(f"\n✓ Rebuilt score statistics for {rebuilt} user(s)\n")
+        except Exception as e:
+            print(f"\n✗ Failed to rebuild score statistics: {e}\n")
+
     def _calculate_stats(self, data, name):
         """Helper to calculate numeric stats"""
         if not data:
@@ -359,11 +408,14 @@ class AdminCLI:
 def main():
     """Main CLI function"""
     parser = argparse.ArgumentParser(description="SoulSense Admin CLI")
-    parser.add_argument('command', choices=['list', 'add', 'view', 'update', 'delete', 'categories', 'create-admin'],
+    parser.add_argument('command', choices=['list', 'add', 'view', 'update', 'delete', 'categories', 'create-admin', 'retention', 'rebuild-score-stats'],
                        help='Command to execute')
     parser.add_argument('--id', type=int, help='Question ID (for view, update, delete)')
     parser.add_argument('--category', help='Filter by category (for list)')
     parser.add_argument('--inactive', action='store_true', help='Include inactive questions (for list)')
+    parser.add_argument('--weeks', type=int, default=12, help='Number of weekly cohorts (for retention)')
+    parser.add_argument('--min-attempts', type=int, default=2, help='Attempts to count as returning (for retention)')
+    parser.add_argument('--username', help='Limit to a single user (for rebuild-score-stats)')
     parser.add_argument('--no-auth', action='store_true', help='Skip authentication (for create-admin only)')
     
     args = parser.parse_args()
@@ -424,6 +476,12 @@ def main():
 
     elif args.command == 'stats':
         cli.show_stats(args.visual)
+
+    elif args.command == 'retention':
+        cli.show_retention(args.weeks, args.min_attempts)
+
+    elif args.command == 'rebuild-score-stats':
+        cli.rebuild_score_stats(args.username)
         
 if __name__ == "__main__":
     main()
@@ -0,0 +1,135 @@
+"""
+Risk Back-Scoring Utility for SoulSense
+
+Re-scores every historical assessment in the scores table with the current
+risk model and writes the predictions to a CSV file. Rows are read in
+id-ordered chunks (keyset pagination) and each chunk is scored with a single
+vectorized predict_many call, so memory stays flat and the nightly job does
+not pay one model call per row.
+
+Usage:
+    # Re-score everything with the production SoulSense predictor
+    python scripts/backscore_risk.py
+
+    # Use the plain RiskPredictor and a custom chunk size / output file
+    python scripts/backscore_risk.py --predictor risk --chunk-size 50000 --output exports/risk.csv
+"""
+
+import sys
+import os
+import argparse
+import logging
+import time
+from datetime import datetime
+from typing import Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db import safe_db_context
+from app.models import Score
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+OUTPUT_COLUMNS = ["score_id", "username", "timestamp", "prediction", "prediction_label", "confidence"]
+
+
+def iter_score_chunks(session: Session, chunk_size: int):
+    """Yield DataFrames of scores in id order, chunk_size rows at a time."""
+    last_id = 0
+    conn = session.connection()
+    while True:
+        rows = conn.execute(
+            select(Score.id, Score.username, Score.timestamp, Score.total_score,
+                   Score.sentiment_score, Score.age)
+            .where(Score.id > last_id, Score.total_score.isnot(None))
+            .order_by(Score.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield pd.DataFrame(rows, columns=["score_id", "username", "timestamp",
+                                          "total_score", "sentiment_score", "age"])
+
+
+def backscore(session: Session, predictor, output: str, chunk_size: int = 10000) -> int:
+    """
+    Score every row of the scores table and write the results to a CSV file.
+
+    Args:
+        session: Active database session
+        predictor: Object exposing predict_with_explanation_many()
+        output: Destination CSV path
+        chunk_size: Rows fetched and scored per batch
+
+    Returns:
+        Number of scores written
+    """
+    total = 0
+    with open(output, "w", newline="") as handle:
+        for chunk in iter_score_chunks(session, chunk_size):
+            features = chunk[["total_score", "sentiment_score", "age"]].fillna(
+                {"sentiment_score": 0.0, "age": 0}
+            )
+            result = predictor.predict_with_explanation_many(features)
+            result.index = chunk.index
+            scored = pd.concat([chunk[["score_id", "username", "timestamp"]], result], axis=1)
+            scored[OUTPUT_COLUMNS].to_csv(handle, header=(total == 0), index=False)
+            total += len(chunk)
+            logger.info(f"Scored {total} assessments")
+    return total
+
+
+def build_predictor(kind: str):
+    """Instantiate the requested predictor."""
+    if kind == "risk":
+        from app.ml.risk_predictor import RiskPredictor
+        return RiskPredictor()
+    from app.ml.predictor import SoulSenseMLPredictor
+    return SoulSenseMLPredictor()
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-score historical assessments with the current risk model")
+    parser.add_argument("--predictor", choices=["soulsense", "risk"], default="soulsense",
+                        help="Predictor to use (default: soulsense)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per batch (default: 10000)")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Output CSV path (default: exports/risk_scores_<timestamp>.csv)")
+    args = parser.parse_args(argv)
+
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be positive")
+
+    output = args.output or os.path.join(
+        "exports", f"risk_scores_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    )
+    output_dir = os.path.dirname(output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    predictor = build_predictor(args.predictor)
+    start = time.perf_counter()
+    try:
+        with safe_db_context() as session:
+            total = backscore(session, predictor, output, args.chunk_size)
+    except Exception as e:
+        logger.error(f"Back-scoring failed: {e}")
+        return 1
+
+    logger.info(f"Wrote {total} predictions to {output} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
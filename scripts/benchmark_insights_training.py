@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark EQ insights model training against the number of score rows.
+
+For each row count, builds a throwaway SQLite database with synthetic scores
+and times:
+    - per-row path:   one variance query per score row, plus a Python loop
+                      per user for improvement potential (the previous
+                      implementation of _train_model_from_data)
+    - set-based path: feature store snapshot + build_training_frame()
+
+Both paths then fit the same models, and the script checks that they
+produce the same training frame. The per-row path is skipped above
+--per-row-max rows because it grows with one query per row.
+
+Usage:
+    python scripts/benchmark_insights_training.py [--rows 1000 10000 100000] [--per-row-max 20000]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sklearn.linear_model import LinearRegression
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models import Base, Score
+from app.ml.feature_store import FeatureStore
+from app.ml.insights_generator import SCORE_COLUMNS, EQInsightsGenerator, build_training_frame
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def build_database(path: str, rows: int, seed: int = 7):
+    """Create a scores table with synthetic scores, ~5 per user."""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+
+    rng = np.random.default_rng(seed)
+    users = max(rows // 5, 1)
+    user_ids = rng.integers(1, users + 1, size=rows)
+    values = rng.integers(5, 26, size=rows)
+    records = [
+        {"username": f"user_{u}", "user_id": int(u), "total_score": int(v), "age": 30,
+         "sentiment_score": 0.0, "timestamp": f"2025-01-01T00:00:{i:010d}"}
+        for i, (u, v) in enumerate(zip(user_ids, values))
+    ]
+    with engine.begin() as conn:
+        conn.execute(text("PRAGMA foreign_keys=OFF"))
+        conn.execute(
+            text("INSERT INTO scores (username, user_id, total_score, age, sentiment_score, timestamp) "
+                 "VALUES (:username, :user_id, :total_score, :age, :sentiment_score, :timestamp)"),
+            records,
+        )
+    return engine
+
+
+def per_row_training_frame(generator: EQInsightsGenerator, session) -> pd.DataFrame:
+    """The previous implementation: a variance query per row, a regression per user."""
+    rows = session.query(
+        Score.total_score, Score.sentiment_score, Score.age, Score.user_id, Score.timestamp
+    ).filter(Score.user_id.isnot(None)).all()
+
+    data = [{
+        'user_id': row.user_id,
+        'age': row.age or 25,
+        'total_score': row.total_score,
+        'sentiment_score': row.sentiment_score or 0.0,
+        'score_variance': generator._calculate_score_variance(session, row.user_id),
+        'avg_response': row.total_score / 5,
+        'question_count': 5,
+        'time_per_question': 60,
+        'timestamp': row.timestamp,
+    } for row in rows]
+    df = pd.DataFrame(data).sort_values(['user_id', 'timestamp'], kind='stable').reset_index(drop=True)
+
+    potentials = []
+    for _, user_scores in df.groupby('user_id', sort=True):
+        scores = user_scores['total_score'].values
+        if len(scores) < 2:
+            potentials.extend([0.0] * len(scores))
+            continue
+        trend = LinearRegression().fit(np.arange(len(scores)).reshape(-1, 1), scores)
+        improvement = trend.coef_[0] * 5 + (25 - scores.mean()) * 0.1
+        potentials.extend([improvement] * len(scores))
+    df['improvement_potential'] = potentials
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark insights training time vs. row count")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Score row counts to benchmark")
+    parser.add_argument("--per-row-max", type=int, default=20_000,
+                        help="Largest row count to run the per-row path for")
+    args = parser.parse_args()
+
+    generator = EQInsightsGenerator(load_model=False)
+    print(f"{'rows':>10} {'per-row (s)':>12} {'set-based (s)':>14} {'speedup':>8}")
+
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = build_database(str(Path(tmp) / "bench.db"), rows)
+            session = sessionmaker(bind=engine)()
+            store = FeatureStore(root=str(Path(tmp) / "feature_store"))
+
+            start = time.perf_counter()
+            frame = build_training_frame(store.snapshot(session, "scores", columns=SCORE_COLUMNS))
+            generator._fit_models(frame)
+            set_seconds = time.perf_counter() - start
+
+            per_row_seconds = None
+            if rows <= args.per_row_max:
+                start = time.perf_counter()
+                legacy = per_row_training_frame(generator, session)
+                generator._fit_models(legacy)
+                per_row_seconds = time.perf_counter() - start
+
+                columns = generator.feature_columns + ['improvement_potential']
+                assert np.allclose(legacy[columns].to_numpy(float), frame[columns].to_numpy(float)), \
+                    "set-based frame differs from per-row frame"
+
+            session.close()
+            engine.dispose()
+
+        if per_row_seconds is None:
+            print(f"{rows:>10,} {'skipped':>12} {set_seconds:>14.2f} {'':>8}")
+        else:
+            print(f"{rows:>10,} {per_row_seconds:>12.2f} {set_seconds:>14.2f} "
+                  f"{per_row_seconds / set_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
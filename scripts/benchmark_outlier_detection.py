@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch outlier detection against the per-user path.
+
+Builds a throwaway SQLite database with synthetic scores, then times:
+    - per-user path:  detect_outliers_for_user() called once per user
+    - batch path:     detect_outliers_batch(group_by="username")
+
+and checks that both flag the same score ids.
+
+Usage:
+    python scripts/benchmark_outlier_detection.py [--rows 1000000] [--users 100000]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models import Base
+from app.analysis.outlier_detection import OutlierDetector
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def build_database(path: str, rows: int, users: int, seed: int = 7):
+    """Create a scores table filled with synthetic data."""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+
+    rng = np.random.default_rng(seed)
+    user_ids = rng.integers(0, users, size=rows)
+    values = rng.normal(25, 5, size=rows).round().astype(int)
+    spikes = rng.random(rows) < 0.002
+    values[spikes] = rng.integers(80, 120, size=int(spikes.sum()))
+
+    records = [
+        {"username": f"user_{u}", "total_score": int(v), "timestamp": f"2025-01-01T00:00:{i:010d}"}
+        for i, (u, v) in enumerate(zip(user_ids, values))
+    ]
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO scores (username, total_score, timestamp) VALUES (:username, :total_score, :timestamp)"),
+            records,
+        )
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch vs per-user outlier detection")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of synthetic scores")
+    parser.add_argument("--users", type=int, default=100_000, help="Number of distinct users")
+    parser.add_argument("--method", default="ensemble", help="Detection method to compare")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building database with {args.rows:,} scores for {args.users:,} users...")
+        engine = build_database(str(Path(tmp) / "bench.db"), args.rows, args.users)
+        session = sessionmaker(bind=engine)()
+        detector = OutlierDetector()
+
+        start = time.perf_counter()
+        batch = detector.detect_outliers_batch(session, group_by="username", method=args.method)
+        batch_seconds = time.perf_counter() - start
+
+        usernames = [row[0] for row in session.execute(text("SELECT DISTINCT username FROM scores"))]
+        start = time.perf_counter()
+        per_user_ids = set()
+        for username in usernames:
+            result = detector.detect_outliers_for_user(session, username, method=args.method)
+            per_user_ids.update(d["score_id"] for d in result.get("outlier_details", []))
+        per_user_seconds = time.perf_counter() - start
+
+        session.close()
+        engine.dispose()
+
+    matches = per_user_ids == set(batch["score_ids"].tolist())
+    print(f"Per-user path: {per_user_seconds:8.2f}s  ({len(per_user_ids):,} outliers)")
+    print(f"Batch path:    {batch_seconds:8.2f}s  ({batch['outlier_count']:,} outliers)")
+    print(f"Speedup:       {per_user_seconds / batch_seconds:8.1f}x")
+    print(f"Results match: {matches}")
+
+
+if __name__ == "__main__":
+    main()
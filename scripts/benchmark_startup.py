@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark desktop-app import time and catch startup regressions.
+
+Imports ``app.main`` (everything needed before the login window, minus Tk
+itself) in fresh interpreters and reports the median wall time. Also checks
+that heavy optional dependencies stay out of the startup path; they should
+be loaded lazily when a chart, journal or ML feature is first used.
+
+Exits non-zero when the median exceeds --max-seconds or a deferred module
+was imported eagerly, so it can run in CI.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 5] [--max-seconds 1.5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Modules that must not be imported just to reach the login window
+DEFERRED_MODULES = ["matplotlib", "seaborn", "sklearn", "scipy", "nltk", "pandas"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed,
+                   "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+
+def measure_once(module_names=DEFERRED_MODULES) -> dict:
+    """Import app.main in a fresh interpreter; return its time and eagerly loaded modules."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(deferred=list(module_names))],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SoulSense startup imports")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time")
+    parser.add_argument("--max-seconds", type=float, default=1.5,
+                        help="Fail if the median import time exceeds this")
+    args = parser.parse_args()
+
+    # First run warms the bytecode cache and is not counted
+    measure_once()
+    samples = [measure_once() for _ in range(args.runs)]
+    times = [s["seconds"] for s in samples]
+    median = statistics.median(times)
+    eager = sorted({m for s in samples for m in s["loaded"]})
+
+    print(f"import app.main: median {median:.3f}s, min {min(times):.3f}s, "
+          f"max {max(times):.3f}s over {args.runs} runs")
+
+    failed = False
+    if eager:
+        print(f"FAIL: deferred modules imported at startup: {', '.join(eager)}")
+        failed = True
+    if median > args.max_seconds:
+        print(f"FAIL: median {median:.3f}s exceeds budget of {args.max_seconds:.3f}s")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,14 +6,16 @@ A reproducible pipeline to train, validate, and save ML models.
 
 This script provides:
 - Data loading and preprocessing
-- Model training with hyperparameter tuning
+- Model training with hyperparameter tuning (exhaustive grid or successive halving)
 - Cross-validation and evaluation
+- Concurrent model comparison under a configurable core budget
 - Model versioning and artifact saving
 - Experiment tracking and comparison
 
 Usage:
     python scripts/ml_training_pipeline.py --help
     python scripts/ml_training_pipeline.py train --model-type rf
+    python scripts/ml_training_pipeline.py train --model-type gb --full-search --search halving
     python scripts/ml_training_pipeline.py evaluate --model-version 1.0.0
     python scripts/ml_training_pipeline.py compare --versions 1.0.0 1.1.0
 
@@ -23,8 +25,12 @@ Author: SoulSense Team
 import argparse
 import json
 import logging
+import math
 import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -43,19 +49,24 @@ from sklearn.metrics import (
     recall_score,
     roc_auc_score,
 )
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
 from sklearn.model_selection import (
     GridSearchCV,
+    HalvingGridSearchCV,
+    HalvingRandomSearchCV,
+    ParameterGrid,
     StratifiedKFold,
-    cross_val_score,
     train_test_split,
 )
+from sklearn.model_selection import cross_validate as sklearn_cross_validate
+from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from sklearn.svm import SVC
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from model_versioning import ModelVersioningManager, create_versioning_manager
+from app.ml.versioning import ModelVersioningManager, create_versioning_manager
 
 # Configure logging
 logging.basicConfig(
@@ -75,8 +86,9 @@ class MLTrainingPipeline:
     
     This pipeline supports:
     - Multiple model types (Random Forest, Gradient Boosting, Logistic Regression, SVM)
-    - Hyperparameter tuning via GridSearchCV
+    - Hyperparameter tuning via GridSearchCV or successive halving
     - Cross-validation for robust evaluation
+    - Concurrent model comparison across a process pool
     - Model versioning and experiment tracking
     - Artifact saving (models, metrics, plots)
     """
@@ -97,6 +109,17 @@ class MLTrainingPipeline:
     
     CLASS_NAMES = ["Low Risk", "Moderate Risk", "High Risk"]
     
+    # Hyperparameter search strategies:
+    # - grid: exhaustive GridSearchCV on the full training set
+    # - halving: HalvingGridSearchCV, every candidate starts on a small budget (trees
+    #   for rf/gb, training samples otherwise) and only the best third advances to
+    #   three times the budget each round
+    # - halving-random: HalvingRandomSearchCV over the same grid
+    SEARCH_STRATEGIES = ("grid", "halving", "halving-random")
+    
+    # Metrics evaluated together in a single cross-validation pass
+    CV_SCORING = ["accuracy", "f1_weighted", "precision_weighted", "recall_weighted"]
+    
     # Default hyperparameter grids for each model type
     PARAM_GRIDS = {
         "rf": {
@@ -159,6 +182,7 @@ class MLTrainingPipeline:
         output_dir: str = "models/pipeline_output",
         use_versioning: bool = True,
         random_state: int = 42,
+        n_jobs: int = -1,
     ):
         """
         Initialize the ML Training Pipeline.
@@ -167,17 +191,21 @@ class MLTrainingPipeline:
             output_dir: Directory to save outputs
             use_versioning: Whether to use model versioning
             random_state: Random seed for reproducibility
+            n_jobs: Core budget for searches, cross-validation and model
+                comparison (-1 for all cores)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         self.use_versioning = use_versioning
         self.random_state = random_state
+        self.n_jobs = n_jobs
         
         self.scaler = StandardScaler()
         self.model = None
         self.best_params = None
         self.metrics = {}
+        self.feature_store_version = None
         
         if use_versioning:
             self.versioning_manager = create_versioning_manager()
@@ -266,8 +294,9 @@ class MLTrainingPipeline:
         Returns:
             Tuple of (features, labels) or None if insufficient data
         """
-        import sqlite3
+        from sqlalchemy import create_engine
         from app.config import DB_PATH as DEFAULT_DB_PATH
+        from app.ml.feature_store import feature_store
         
         if db_path is None:
             db_path = DEFAULT_DB_PATH
@@ -279,23 +308,23 @@ class MLTrainingPipeline:
             return None, None
         
         try:
-            conn = sqlite3.connect(db_path)
+            # Read the columnar snapshot; only rows added since the last run hit the DB
+            engine = create_engine(f"sqlite:///{db_path}")
+            try:
+                with engine.connect() as connection:
+                    snapshot = feature_store.refresh(connection, "scores")
+            finally:
+                engine.dispose()
+            self.feature_store_version = snapshot["version"]
+            df = feature_store.load_frame("scores", ["total_score", "age", "timestamp"], snapshot["version"])
             
-            # Try to load from scores table
-            query = """
-                SELECT total_score, age, timestamp
-                FROM scores
-                WHERE total_score IS NOT NULL AND age IS NOT NULL
-            """
-            df = pd.read_sql_query(query, conn)
+            df = df.dropna(subset=["total_score", "age"])
             
             if len(df) < 100:
                 logger.warning(f"Insufficient data ({len(df)} rows). Need at least 100 samples.")
-                conn.close()
                 return None, None
             
-            logger.info(f"Loaded {len(df)} samples from database")
-            conn.close()
+            logger.info(f"Loaded {len(df)} samples from feature store version {self.feature_store_version}")
             
             # Process data (simplified for demonstration)
             # In production, you'd want more sophisticated feature engineering
@@ -368,19 +397,22 @@ class MLTrainingPipeline:
             "X_test_raw": X_test,
         }
     
-    def get_model(self, model_type: str) -> Any:
+    def get_model(self, model_type: str, early_stopping: bool = False) -> Any:
         """
         Get a model instance based on type.
         
         Args:
             model_type: One of 'rf', 'gb', 'lr', 'svm'
+            early_stopping: Stop boosting once a held-out 10% of the training
+                data stops improving for 10 rounds (gradient boosting only)
             
         Returns:
             Sklearn model instance
         """
+        gb_options = {"n_iter_no_change": 10, "validation_fraction": 0.1} if early_stopping else {}
         models = {
             "rf": RandomForestClassifier(random_state=self.random_state),
-            "gb": GradientBoostingClassifier(random_state=self.random_state),
+            "gb": GradientBoostingClassifier(random_state=self.random_state, **gb_options),
             "lr": LogisticRegression(random_state=self.random_state),
             "svm": SVC(probability=True, random_state=self.random_state),
         }
@@ -398,6 +430,7 @@ class MLTrainingPipeline:
         quick_mode: bool = False,
         cv_folds: int = 5,
         experiment_name: Optional[str] = None,
+        search: str = "grid",
     ) -> Dict[str, Any]:
         """
         Train a model with optional hyperparameter tuning.
@@ -405,15 +438,20 @@ class MLTrainingPipeline:
         Args:
             model_type: Type of model to train
             data: Preprocessed data dict (if None, generates synthetic data)
-            hyperparameter_tuning: Whether to perform grid search
+            hyperparameter_tuning: Whether to perform a hyperparameter search
             quick_mode: Use reduced parameter grid for faster training
             cv_folds: Number of cross-validation folds
             experiment_name: Name for experiment tracking
+            search: One of SEARCH_STRATEGIES
             
         Returns:
             Dictionary with training results
         """
-        logger.info(f"Starting training with model_type={model_type}, tuning={hyperparameter_tuning}")
+        if search not in self.SEARCH_STRATEGIES:
+            raise ValueError(f"Unknown search strategy: {search}. Choose from {list(self.SEARCH_STRATEGIES)}")
+        
+        logger.info(f"Starting training with model_type={model_type}, tuning={hyperparameter_tuning}, search={search}")
+        started = time.perf_counter()
         
         # Generate data if not provided
         if data is None:
@@ -433,12 +471,13 @@ class MLTrainingPipeline:
             self.versioning_manager.start_run(
                 name=exp_name,
                 description=f"Training {model_type.upper()} model for depression risk prediction",
-                hyperparameters={"model_type": model_type, "param_grid": param_grid},
+                hyperparameters={"model_type": model_type, "param_grid": param_grid, "search": search},
                 dataset_info={
                     "n_train": len(y_train),
                     "n_val": len(y_val),
                     "n_features": X_train.shape[1],
                     "n_classes": len(self.CLASS_NAMES),
+                    "feature_store_version": self.feature_store_version,
                 },
                 tags=["soulsense", "depression_risk", model_type],
             )
@@ -448,27 +487,12 @@ class MLTrainingPipeline:
             base_model = self.get_model(model_type)
             
             if hyperparameter_tuning:
-                # Perform grid search
                 param_grid = self.QUICK_PARAM_GRIDS[model_type] if quick_mode else self.PARAM_GRIDS[model_type]
                 
-                logger.info(f"Performing GridSearchCV with {cv_folds} folds...")
-                
-                grid_search = GridSearchCV(
-                    base_model,
-                    param_grid,
-                    cv=StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=self.random_state),
-                    scoring="f1_weighted",
-                    n_jobs=-1,
-                    verbose=1,
-                )
-                
-                grid_search.fit(X_train, y_train)
-                
-                self.model = grid_search.best_estimator_
-                self.best_params = grid_search.best_params_
-                
-                logger.info(f"Best parameters: {self.best_params}")
-                logger.info(f"Best CV score: {grid_search.best_score_:.4f}")
+                if search == "grid":
+                    self._grid_search(base_model, param_grid, X_train, y_train, cv_folds)
+                else:
+                    self._halving_search(model_type, param_grid, data, cv_folds, search)
             else:
                 # Train with default parameters
                 self.model = base_model
@@ -489,8 +513,10 @@ class MLTrainingPipeline:
             
             self.metrics = {
                 "model_type": model_type,
+                "search": search if hyperparameter_tuning else None,
                 "best_params": self.best_params,
                 "validation": val_metrics,
+                "train_seconds": round(time.perf_counter() - started, 2),
             }
             
             return {
@@ -506,6 +532,94 @@ class MLTrainingPipeline:
                 self.versioning_manager.fail_run(str(e))
             raise
     
+    def _grid_search(self, base_model, param_grid, X_train, y_train, cv_folds: int) -> None:
+        """Exhaustive GridSearchCV on the full (pre-scaled) training set."""
+        logger.info(f"Performing GridSearchCV with {cv_folds} folds...")
+        
+        grid_search = GridSearchCV(
+            base_model,
+            param_grid,
+            cv=StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=self.random_state),
+            scoring="f1_weighted",
+            n_jobs=self.n_jobs,
+            verbose=1,
+        )
+        
+        grid_search.fit(X_train, y_train)
+        
+        self.model = grid_search.best_estimator_
+        self.best_params = grid_search.best_params_
+        
+        logger.info(f"Best parameters: {self.best_params}")
+        logger.info(f"Best CV score: {grid_search.best_score_:.4f}")
+    
+    def _halving_search(self, model_type: str, param_grid, data: Dict[str, np.ndarray],
+                        cv_folds: int, search: str) -> None:
+        """
+        Successive-halving search: score every candidate on a small budget and
+        give only the best third three times the budget in the next round.
+        
+        For the tree ensembles the budget is the number of trees (the
+        ``n_estimators`` values of the grid become the budget range), so
+        losing candidates never grow past a handful of trees. Other models
+        are budgeted by training samples; they are searched as a scaler +
+        model pipeline whose fitted scaler is cached (joblib.Memory) and
+        reused by every candidate on the same fold.
+        """
+        logger.info(f"Performing {search} search with {cv_folds} folds...")
+        
+        cv = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=self.random_state)
+        options = dict(
+            factor=3,
+            cv=cv,
+            scoring="f1_weighted",
+            n_jobs=self.n_jobs,
+            random_state=self.random_state,
+            verbose=1,
+        )
+        search_cls = HalvingGridSearchCV if search == "halving" else HalvingRandomSearchCV
+        if search_cls is HalvingRandomSearchCV:
+            options["n_candidates"] = "exhaust"
+        
+        if "n_estimators" in param_grid:
+            grid = {name: values for name, values in param_grid.items() if name != "n_estimators"}
+            max_trees = max(param_grid["n_estimators"])
+            # Enough rounds to narrow the full grid to one candidate, ending at max_trees
+            rounds = 1 + int(math.log(len(ParameterGrid(grid)), options["factor"]))
+            halving_search = search_cls(
+                self.get_model(model_type, early_stopping=True), grid,
+                resource="n_estimators", max_resources=max_trees,
+                min_resources=max(1, max_trees // options["factor"] ** (rounds - 1)), **options,
+            )
+            halving_search.fit(data["X_train"], data["y_train"])
+            self.model = halving_search.best_estimator_
+            self.best_params = halving_search.best_params_
+        else:
+            grid = {f"model__{name}": values for name, values in param_grid.items()}
+            # Every round needs enough samples of each class for every fold
+            min_resources = max(cv_folds * len(self.CLASS_NAMES) * 4, 20)
+            with tempfile.TemporaryDirectory(prefix="soulsense_cv_cache_") as cache_dir:
+                estimator = Pipeline(
+                    [("scaler", StandardScaler()), ("model", self.get_model(model_type))],
+                    memory=cache_dir,
+                )
+                halving_search = search_cls(
+                    estimator, grid, min_resources=min(min_resources, len(data["y_train"])), **options
+                )
+                # Scaling is refit inside each fold; start from unscaled data when available
+                halving_search.fit(data.get("X_train_raw", data["X_train"]), data["y_train"])
+            # The refit scaler saw the same training rows as self.scaler; keep the bare model
+            self.model = halving_search.best_estimator_.named_steps["model"]
+            self.best_params = {
+                name.split("__", 1)[1]: value for name, value in halving_search.best_params_.items()
+            }
+        
+        logger.info(f"Halving rounds: {halving_search.n_iterations_}, "
+                    f"candidates per round: {list(halving_search.n_candidates_)}, "
+                    f"budget per round: {list(halving_search.n_resources_)}")
+        logger.info(f"Best parameters: {self.best_params}")
+        logger.info(f"Best CV score: {halving_search.best_score_:.4f}")
+    
     def evaluate(
         self,
         data: Dict[str, np.ndarray],
@@ -779,11 +893,14 @@ class MLTrainingPipeline:
         # Perform CV
         cv = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=self.random_state)
         
-        scoring_metrics = ["accuracy", "f1_weighted", "precision_weighted", "recall_weighted"]
+        # One fit per fold, scored on every metric
+        cv_results = sklearn_cross_validate(
+            model, X_scaled, y, cv=cv, scoring=self.CV_SCORING, n_jobs=self.n_jobs
+        )
         
         results = {}
-        for metric in scoring_metrics:
-            scores = cross_val_score(model, X_scaled, y, cv=cv, scoring=metric, n_jobs=-1)
+        for metric in self.CV_SCORING:
+            scores = cv_results[f"test_{metric}"]
             results[metric] = {
                 "mean": round(scores.mean(), 4),
                 "std": round(scores.std(), 4),
@@ -797,13 +914,21 @@ class MLTrainingPipeline:
         self,
         model_types: Optional[List[str]] = None,
         quick_mode: bool = True,
+        search: str = "grid",
+        parallel: bool = True,
     ) -> pd.DataFrame:
         """
         Compare multiple model types on the same data.
         
+        With ``parallel`` the model types train concurrently in a process pool;
+        the core budget (``n_jobs``) is split evenly between the workers, which
+        use their share for their own hyperparameter search.
+        
         Args:
             model_types: List of model types to compare
             quick_mode: Use quick training mode
+            search: Hyperparameter search strategy (see SEARCH_STRATEGIES)
+            parallel: Train model types concurrently
             
         Returns:
             DataFrame with comparison results
@@ -817,43 +942,24 @@ class MLTrainingPipeline:
         X, y = self.generate_synthetic_data()
         data = self.preprocess_data(X, y)
         
-        results = []
-        
-        for model_type in model_types:
-            logger.info(f"\n{'='*50}\nTraining {model_type.upper()}...\n{'='*50}")
-            
-            try:
-                # Create fresh pipeline for each model
-                pipeline = MLTrainingPipeline(
-                    output_dir=self.output_dir,
-                    use_versioning=False,
-                    random_state=self.random_state,
-                )
-                pipeline.scaler = self.scaler
-                
-                # Train
-                train_result = pipeline.train(
-                    model_type=model_type,
-                    data=data,
-                    hyperparameter_tuning=True,
-                    quick_mode=quick_mode,
-                )
-                
-                # Evaluate
-                eval_result = pipeline.evaluate(data, save_artifacts=False)
-                
-                results.append({
-                    "model_type": model_type,
-                    **eval_result["metrics"],
-                    "best_params": str(train_result["best_params"]),
-                })
-                
-            except Exception as e:
-                logger.error(f"Failed to train {model_type}: {e}")
-                results.append({
-                    "model_type": model_type,
-                    "error": str(e),
-                })
+        budget = self.n_jobs if self.n_jobs > 0 else (os.cpu_count() or 1)
+        workers = min(len(model_types), budget) if parallel else 1
+        jobs_per_model = max(1, budget // workers)
+        tasks = [
+            (model_type, data, self.scaler, quick_mode, search, jobs_per_model,
+             str(self.output_dir), self.random_state)
+            for model_type in model_types
+        ]
+        
+        started = time.perf_counter()
+        if workers > 1:
+            logger.info(f"Training {len(model_types)} model types on {workers} processes "
+                        f"({jobs_per_model} core(s) each)")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_train_and_evaluate, *zip(*tasks)))
+        else:
+            results = [_train_and_evaluate(*task) for task in tasks]
+        logger.info(f"Model comparison finished in {time.perf_counter() - started:.1f}s")
         
         # Create comparison DataFrame
         df = pd.DataFrame(results)
@@ -872,6 +978,56 @@ class MLTrainingPipeline:
         return df
 
 
+def _train_and_evaluate(
+    model_type: str,
+    data: Dict[str, np.ndarray],
+    scaler: StandardScaler,
+    quick_mode: bool,
+    search: str,
+    n_jobs: int,
+    output_dir: str,
+    random_state: int,
+) -> Dict[str, Any]:
+    """Train and evaluate one model type (module level so process pools can run it)."""
+    logger.info(f"\n{'='*50}\nTraining {model_type.upper()}...\n{'='*50}")
+    
+    try:
+        # Create fresh pipeline for each model
+        pipeline = MLTrainingPipeline(
+            output_dir=output_dir,
+            use_versioning=False,
+            random_state=random_state,
+            n_jobs=n_jobs,
+        )
+        pipeline.scaler = scaler
+        
+        # Train
+        train_result = pipeline.train(
+            model_type=model_type,
+            data=data,
+            hyperparameter_tuning=True,
+            quick_mode=quick_mode,
+            search=search,
+        )
+        
+        # Evaluate
+        eval_result = pipeline.evaluate(data, save_artifacts=False)
+        
+        return {
+            "model_type": model_type,
+            **eval_result["metrics"],
+            "train_seconds": train_result["metrics"]["train_seconds"],
+            "best_params": str(train_result["best_params"]),
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to train {model_type}: {e}")
+        return {
+            "model_type": model_type,
+            "error": str(e),
+        }
+
+
 def main():
     """Main entry point for CLI."""
     parser = argparse.ArgumentParser(
@@ -885,6 +1041,9 @@ Examples:
   Train with full hyperparameter tuning:
     python scripts/ml_training_pipeline.py train --model-type rf --full-search
     
+  Full search with successive halving on 4 cores:
+    python scripts/ml_training_pipeline.py train --model-type gb --full-search --search halving --jobs 4
+    
   Compare all model types:
     python scripts/ml_training_pipeline.py compare
     
@@ -908,6 +1067,18 @@ Examples:
         action="store_true",
         help="Perform full hyperparameter search (slower)",
     )
+    train_parser.add_argument(
+        "--search",
+        choices=list(MLTrainingPipeline.SEARCH_STRATEGIES),
+        default="grid",
+        help="Hyperparameter search strategy (default: grid)",
+    )
+    train_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=-1,
+        help="CPU cores to use (default: all)",
+    )
     train_parser.add_argument(
         "--no-tuning",
         action="store_true",
@@ -960,6 +1131,23 @@ Examples:
         action="store_true",
         help="Perform full hyperparameter search",
     )
+    compare_parser.add_argument(
+        "--search",
+        choices=list(MLTrainingPipeline.SEARCH_STRATEGIES),
+        default="grid",
+        help="Hyperparameter search strategy (default: grid)",
+    )
+    compare_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=-1,
+        help="CPU cores to use (default: all)",
+    )
+    compare_parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Train model types one after another instead of concurrently",
+    )
     compare_parser.add_argument(
         "--output-dir", "-o",
         default="models/pipeline_output",
@@ -980,6 +1168,12 @@ Examples:
         default=5,
         help="Number of CV folds",
     )
+    cv_parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=-1,
+        help="CPU cores to use (default: all)",
+    )
     cv_parser.add_argument(
         "--output-dir", "-o",
         default="models/pipeline_output",
@@ -994,7 +1188,7 @@ Examples:
     
     # Execute command
     if args.command == "train":
-        pipeline = MLTrainingPipeline(output_dir=args.output_dir)
+        pipeline = MLTrainingPipeline(output_dir=args.output_dir, n_jobs=args.jobs)
         
         # Generate data
         X, y = pipeline.generate_synthetic_data(n_samples=args.samples)
@@ -1007,6 +1201,7 @@ Examples:
             hyperparameter_tuning=not args.no_tuning,
             quick_mode=not args.full_search,
             experiment_name=args.experiment_name,
+            search=args.search,
         )
         
         # Evaluate
@@ -1036,11 +1231,13 @@ Examples:
         print(f"Test F1 Score: {results['metrics']['f1_weighted']:.4f}")
         
     elif args.command == "compare":
-        pipeline = MLTrainingPipeline(output_dir=args.output_dir, use_versioning=False)
+        pipeline = MLTrainingPipeline(output_dir=args.output_dir, use_versioning=False, n_jobs=args.jobs)
         
         df = pipeline.compare_models(
             model_types=args.models,
             quick_mode=not args.full_search,
+            search=args.search,
+            parallel=not args.sequential,
         )
         
         # Find best model
@@ -1050,7 +1247,7 @@ Examples:
             print(f"\n🏆 Best model: {best_model['model_type'].upper()} (Accuracy: {best_model['accuracy']:.4f})")
         
     elif args.command == "cv":
-        pipeline = MLTrainingPipeline(output_dir=args.output_dir, use_versioning=False)
+        pipeline = MLTrainingPipeline(output_dir=args.output_dir, use_versioning=False, n_jobs=args.jobs)
         
         results = pipeline.cross_validate(
             model_type=args.model_type,
@@ -0,0 +1,114 @@
+"""
+Tests for the vectorized batch prediction API and the back-scoring script.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from app.ml.predictor import SoulSenseMLPredictor
+from app.ml.risk_predictor import RiskPredictor
+from app.models import Score
+from scripts.backscore_risk import backscore
+
+FEATURES = np.array([
+    [10, -0.5, 30],
+    [30, 0.0, 25],
+    [40, 0.6, 45],
+    [20, 0.1, 60],
+])
+
+
+@pytest.fixture
+def risk_predictor(tmp_path):
+    predictor = RiskPredictor(models_dir=str(tmp_path))
+    frame = pd.DataFrame(FEATURES, columns=["total_score", "avg_sentiment", "age"])
+    model = LogisticRegression(max_iter=1000).fit(
+        frame, ["High Risk", "Medium Risk", "Low Risk", "High Risk"]
+    )
+    predictor.model = model
+    predictor._model_loaded = True
+    return predictor
+
+
+@pytest.fixture
+def ml_predictor(tmp_path):
+    predictor = SoulSenseMLPredictor(use_versioning=False, models_dir=str(tmp_path))
+    predictor.scaler = StandardScaler().fit(FEATURES)
+    predictor.model = LogisticRegression(max_iter=1000).fit(
+        predictor.scaler.transform(FEATURES), [2, 1, 0, 2]
+    )
+    return predictor
+
+
+def test_risk_predictor_many_matches_single(risk_predictor):
+    result = risk_predictor.predict_with_explanation_many(FEATURES)
+
+    for row, (score, sentiment, age) in zip(result.itertuples(), FEATURES):
+        single = risk_predictor.predict_with_explanation([], age, score, sentiment)
+        assert row.prediction_label == single["prediction_label"]
+        assert row.prediction == single["prediction"]
+        assert row.confidence == pytest.approx(single["confidence"])
+
+
+def test_risk_predictor_accepts_dataframe(risk_predictor):
+    frame = pd.DataFrame(FEATURES, columns=["total_score", "sentiment_score", "age"])
+
+    assert list(risk_predictor.predict_many(frame)) == list(risk_predictor.predict_many(FEATURES))
+
+
+def test_risk_predictor_rule_based_batch(tmp_path):
+    predictor = RiskPredictor(models_dir=str(tmp_path))
+
+    labels = predictor.predict_many(FEATURES)
+
+    assert list(labels) == [predictor.predict(*row) for row in FEATURES]
+    assert (predictor.predict_with_explanation_many(FEATURES)["confidence"] == 0.8).all()
+
+
+def test_soulsense_many_matches_single(ml_predictor):
+    result = ml_predictor.predict_with_explanation_many(FEATURES)
+
+    for row, (score, sentiment, age) in zip(result.itertuples(), FEATURES):
+        single = ml_predictor.predict_with_explanation([], age, score, sentiment)
+        assert row.prediction_label == single["prediction_label"]
+        assert row.prediction == single["prediction"]
+        assert row.confidence == pytest.approx(single["confidence"])
+
+
+def test_soulsense_rule_based_batch_codes(tmp_path):
+    predictor = SoulSenseMLPredictor(use_versioning=False, models_dir=str(tmp_path))
+    predictor.model = predictor.scaler = None
+
+    result = predictor.predict_with_explanation_many(FEATURES)
+
+    assert list(result["prediction_label"]) == [
+        "High Risk (Rule)", "Medium Risk (Rule)", "Low Risk (Rule)", "High Risk (Rule)"
+    ]
+    assert list(result["prediction"]) == [2, 1, 0, 2]
+    assert predictor.predict_with_explanation([], 25, 30, 0.0)["prediction"] == 1
+
+
+def test_soulsense_uses_one_predict_proba_call(ml_predictor, mocker):
+    spy = mocker.spy(ml_predictor.model, "predict_proba")
+
+    ml_predictor.predict_with_explanation_many(FEATURES)
+
+    assert spy.call_count == 1
+
+
+def test_backscore_writes_every_row(temp_db, risk_predictor, tmp_path):
+    for i in range(7):
+        temp_db.add(Score(username=f"user{i}", total_score=10 + i * 5,
+                          sentiment_score=None if i == 3 else 0.1, age=30))
+    temp_db.commit()
+    output = tmp_path / "risk.csv"
+
+    assert backscore(temp_db, risk_predictor, str(output), chunk_size=3) == 7
+
+    written = pd.read_csv(output)
+    assert len(written) == 7
+    assert written["score_id"].is_monotonic_increasing
+    assert set(written["prediction_label"]) <= {"High Risk", "Medium Risk", "Low Risk"}
@@ -0,0 +1,84 @@
+"""
+Tests for the reusable, in-place updating chart widget.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+pytest.importorskip("matplotlib")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from app.ui.components.chart_widget import ChartWidget, decimate
+
+
+def _agg_chart(**kwargs):
+    return ChartWidget(canvas_factory=lambda figure, master: FigureCanvasAgg(figure), **kwargs)
+
+
+def test_decimate_keeps_extremes_and_caps_points():
+    x = np.arange(100_000)
+    y = np.sin(x / 500.0)
+    y[12_345] = 50.0
+    y[67_890] = -50.0
+
+    dx, dy = decimate(x, y, 400)
+
+    assert len(dx) <= 400
+    assert dy.max() == 50.0 and dy.min() == -50.0
+    assert dx[0] == 0 and dx[-1] == 99_999
+    assert np.all(np.diff(dx) > 0)
+
+
+def test_decimate_leaves_short_series_untouched():
+    dx, dy = decimate([1, 2, 3], [4, 5, 6], 400)
+    assert list(dx) == [1, 2, 3]
+    assert list(dy) == [4.0, 5.0, 6.0]
+
+
+def test_set_line_updates_the_same_artist_in_place():
+    chart = _agg_chart(max_points=200)
+    chart.axes("main")
+    line = chart.line("series", "main")
+
+    chart.set_line("series", range(10), range(10))
+    chart.draw()
+    chart.set_line("series", range(5_000), np.random.default_rng(0).random(5_000))
+    chart.refresh()
+
+    assert chart.line("series", "main") is line
+    assert len(chart.figure.axes[0].lines) == 1
+    assert len(line.get_xdata()) <= 200
+
+
+def test_refresh_blits_when_limits_are_unchanged():
+    chart = _agg_chart()
+    ax = chart.axes("main")
+    chart.line("series", "main")
+    ax.set_xlim(0, 10)
+    ax.set_ylim(0, 10)
+    chart.set_line("series", [1, 2, 3], [1, 2, 3])
+    chart.draw()
+
+    chart.set_line("series", [1, 2, 3], [3, 2, 1])
+    chart.refresh()
+
+    assert chart.blits == 1
+    assert chart.full_draws == 1
+
+
+def test_bars_and_dates():
+    chart = _agg_chart()
+    chart.axes("bars")
+    container = chart.bars("work", "bars", 3)
+    chart.set_bars("work", [1.0, 2.0, 3.0])
+    assert [p.get_height() for p in container.patches] == [1.0, 2.0, 3.0]
+    assert chart.bars("work", "bars", 3) is container
+
+    chart.axes("dates")
+    chart.line("mood", "dates")
+    start = datetime(2024, 1, 1)
+    chart.set_line("mood", [start + timedelta(days=i) for i in range(30)], range(30))
+    chart.draw()
+    assert len(chart.line("mood", "dates").get_xdata()) == 30
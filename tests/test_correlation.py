@@ -0,0 +1,99 @@
+"""
+Test module for the EQ / journal correlation engine.
+
+Builds the aligned daily frame from an in-memory SQLite database and checks
+the correlation matrix, lagged columns and data-version caching.
+"""
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from app.analysis.correlation import CorrelationEngine, correlation_matrix, lag_column
+from app.models import JournalEntry, Score
+
+
+def _add_day(session, day, score=None, sleep=None, stress=None, username="alice", deleted=False):
+    if score is not None:
+        session.add(Score(username=username, total_score=score, timestamp=f"2025-01-{day:02d}T10:00:00"))
+    if sleep is not None or stress is not None:
+        session.add(JournalEntry(username=username, content="entry", sleep_hours=sleep, stress_level=stress,
+                                 entry_date=f"2025-01-{day:02d} 21:00:00", is_deleted=deleted))
+    session.commit()
+
+
+@pytest.fixture
+def engine():
+    return CorrelationEngine()
+
+
+@pytest.fixture
+def populated(temp_db):
+    # More sleep the night before -> higher score the next day; stress tracks score inversely
+    sleeps = [5, 6, 7, 8, 9, 6, 7]
+    for day, sleep in enumerate(sleeps, start=1):
+        _add_day(temp_db, day, sleep=sleep, stress=11 - sleep)
+    for day in range(2, 8):
+        _add_day(temp_db, day, score=20 + sleeps[day - 2])
+    _add_day(temp_db, 3, score=99, username="bob")
+    return temp_db
+
+
+def _r(report, metric, lag):
+    return next(row["r"] for row in report["eq_correlations"] if row["metric"] == metric and row["lag"] == lag)
+
+
+class TestCorrelationEngine:
+    """Test suite for CorrelationEngine."""
+
+    def test_daily_frame_is_aligned_and_continuous(self, engine, populated):
+        frame = engine.build_frame(populated, "alice")
+
+        assert len(frame) == 7
+        assert frame["eq_score"].isna().sum() == 1
+        assert frame.loc["2025-01-02", "eq_score"] == 25
+
+    def test_lagged_correlation(self, engine, populated):
+        report = engine.get_report(populated, "alice", lags=[0, 1])
+
+        assert _r(report, "sleep_hours", 1) == pytest.approx(1.0)
+        assert _r(report, "stress_level", 1) == pytest.approx(-1.0)
+        assert abs(_r(report, "sleep_hours", 0)) < 1.0
+        assert report["eq_correlations"][0]["n"] == 6
+        assert lag_column("sleep_hours", 1) in report["columns"]
+        size = len(report["columns"])
+        assert len(report["matrix"]) == size and len(report["counts"][0]) == size
+
+    def test_spearman_and_validation(self, engine, populated):
+        report = engine.get_report(populated, "alice", method="spearman", lags=[1])
+        assert _r(report, "sleep_hours", 1) == pytest.approx(1.0)
+
+        frame = engine.build_frame(populated, "alice")
+        with pytest.raises(ValueError):
+            correlation_matrix(frame, method="kendall")
+        with pytest.raises(ValueError):
+            correlation_matrix(frame, lags=[-1])
+
+    def test_report_cached_until_data_changes(self, engine, populated):
+        first = engine.get_report(populated, "alice")
+        assert engine.get_report(populated, "alice") is first
+
+        _add_day(populated, 8, score=30, sleep=8)
+        second = engine.get_report(populated, "alice")
+        assert second is not first
+        assert second["days"] == first["days"] + 1
+
+    def test_deleted_journal_entries_are_ignored(self, engine, temp_db):
+        for day in range(1, 5):
+            _add_day(temp_db, day, score=20 + day, sleep=5 + day)
+        _add_day(temp_db, 5, score=10, sleep=12, deleted=True)
+
+        report = engine.get_report(temp_db, "alice", lags=[0])
+        assert _r(report, "sleep_hours", 0) == pytest.approx(1.0)
+
+    def test_no_overlap_returns_empty_correlations(self, engine, temp_db):
+        _add_day(temp_db, 1, score=20)
+        report = engine.get_report(temp_db, "alice")
+
+        assert report["eq_correlations"] == []
+        assert report["days"] == 1
@@ -0,0 +1,107 @@
+"""
+Tests for the per-user dashboard snapshot service.
+"""
+
+import pytest
+
+from app.analysis.time_based_analysis import time_analyzer
+from app.models import JournalEntry, SatisfactionRecord, Score
+from app.services.dashboard_snapshot import DashboardSnapshotService
+
+
+def _add_score(session, total, timestamp, sentiment=None, username="alice"):
+    session.add(Score(username=username, total_score=total, timestamp=timestamp, sentiment_score=sentiment))
+    session.commit()
+
+
+def _add_journal(session, sentiment, patterns=None, sleep=None, entry_date="2024-01-01 09:00:00"):
+    session.add(JournalEntry(username="alice", content="entry", sentiment_score=sentiment,
+                             emotional_patterns=patterns, sleep_hours=sleep, entry_date=entry_date))
+    session.commit()
+
+
+@pytest.fixture
+def service():
+    return DashboardSnapshotService()
+
+
+def test_snapshot_aggregates_all_panel_inputs(temp_db, service):
+    _add_score(temp_db, 20, "2024-01-02T10:00:00", sentiment=10.0)
+    _add_score(temp_db, 30, "2024-01-01T10:00:00", sentiment=20.0)
+    _add_score(temp_db, 99, "2024-01-01T10:00:00", username="bob")
+    _add_journal(temp_db, 40.0, "Stress; Joy", sleep=7.0, entry_date="2024-01-03 09:00:00")
+    _add_journal(temp_db, -10.0, "Joy", sleep=5.0, entry_date="2024-01-02 09:00:00")
+    temp_db.add(SatisfactionRecord(username="alice", satisfaction_score=8, timestamp="2024-01-05"))
+    temp_db.commit()
+
+    snapshot = service.get("alice")
+
+    assert snapshot.score_count == 2
+    assert snapshot.average_score == 25
+    assert snapshot.average_score_sentiment == 15.0
+    assert [r.total_score for r in snapshot.scores_by_time()] == [30, 20]
+    assert [row[0] for row in snapshot.eq_trend_rows()] == [20, 30]
+    assert snapshot.average_journal_sentiment == 15.0
+    assert snapshot.journal_sentiment_max == 40.0
+    assert snapshot.pattern_counts.most_common(1) == [("Joy", 2)]
+    assert [r.sleep_hours for r in snapshot.wellbeing_rows()] == [5.0, 7.0]
+    assert [r[0] for r in snapshot.satisfaction_records()] == [8]
+
+
+def test_unchanged_data_returns_cached_snapshot(temp_db, service):
+    _add_score(temp_db, 20, "2024-01-01T10:00:00")
+
+    first = service.get("alice")
+    assert service.get("alice") is first
+    assert service.full_builds == 1
+
+
+def test_new_rows_are_folded_in_incrementally(temp_db, service):
+    _add_score(temp_db, 20, "2024-01-01T10:00:00")
+    _add_journal(temp_db, 10.0, "Calm")
+    first = service.get("alice")
+
+    _add_score(temp_db, 40, "2024-01-02T10:00:00")
+    _add_journal(temp_db, 30.0, "Calm")
+    second = service.get("alice")
+
+    assert service.full_builds == 1
+    assert service.incremental_updates == 1
+    assert second.score_count == 2
+    assert second.score_max == 40
+    assert second.average_journal_sentiment == 20.0
+    assert second.pattern_counts["Calm"] == 2
+    # Readers holding the previous snapshot are unaffected
+    assert first.score_count == 1
+    assert first.pattern_counts["Calm"] == 1
+
+
+def test_deleted_rows_trigger_rebuild(temp_db, service):
+    _add_score(temp_db, 20, "2024-01-01T10:00:00")
+    _add_score(temp_db, 30, "2024-01-02T10:00:00")
+    service.get("alice")
+
+    temp_db.query(Score).filter(Score.total_score == 20).delete()
+    temp_db.commit()
+    snapshot = service.get("alice")
+
+    assert service.full_builds == 2
+    assert [r.total_score for r in snapshot.scores] == [30]
+    assert snapshot.score_min == 30
+
+
+def test_score_trends_match_time_analyzer(temp_db, service):
+    for total, day in [(20, 3), (25, 1), (30, 2), (35, 4)]:
+        _add_score(temp_db, total, f"2024-01-0{day}T10:00:00")
+
+    assert service.get("alice").score_trends() == time_analyzer.analyze_score_trends("alice")
+
+
+def test_invalidate_forces_rebuild(temp_db, service):
+    _add_score(temp_db, 20, "2024-01-01T10:00:00")
+    first = service.get("alice")
+
+    service.invalidate("alice")
+
+    assert service.get("alice") is not first
+    assert service.full_builds == 2
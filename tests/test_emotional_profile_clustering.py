@@ -178,6 +178,30 @@ class TestEmotionalFeatureExtractor:
         variance = feature_extractor._response_variance(responses)
         assert variance == 0.0, "Uniform responses should have zero variance"
 
+    def test_features_from_frames_matches_per_user_helpers(self, feature_extractor):
+        """Test grouped feature extraction against the per-user helpers."""
+        scores = pd.DataFrame({
+            'username': ['a', 'a', 'a', 'b', ''],
+            'total_score': [30.0, 10.0, 20.0, 15.0, 99.0],
+            'sentiment_score': [0.5, np.nan, -0.5, np.nan, 0.0],
+            'timestamp': ['2024-01-03', '2024-01-01', '2024-01-02', '2024-01-01', '2024-01-01'],
+        })
+        responses = pd.DataFrame({'username': ['a', 'a', 'a'], 'response_value': [1.0, 3.0, 5.0]})
+
+        features = feature_extractor.features_from_frames(scores, responses).set_index('username')
+
+        assert list(features.index) == ['a', 'b']
+        a, b = features.loc['a'], features.loc['b']
+        assert a['avg_total_score'] == 20.0
+        assert a['score_trend'] == pytest.approx(feature_extractor._calculate_trend([10, 20, 30]))
+        assert a['emotional_range'] == 20.0
+        assert a['avg_sentiment'] == 0.0 and a['sentiment_std'] == 0.5
+        assert a['response_consistency'] == pytest.approx(
+            feature_extractor._calculate_consistency([Mock(response_value=v) for v in (1, 3, 5)]))
+        assert a['response_variance'] == pytest.approx(np.var([1, 3, 5]))
+        assert b['score_trend'] == 0.0 and b['assessment_frequency'] == 1
+        assert b['response_consistency'] == 0.0 and b['avg_response_value'] == 2.5
+
 
 # ==============================================================================
 # TEST CLUSTERER
@@ -0,0 +1,85 @@
+"""
+Tests for the versioned, columnar ML feature store.
+"""
+
+import numpy as np
+import pytest
+
+from app.ml.feature_store import FeatureStore
+from app.models import JournalEntry, Response, Score
+
+
+def _add_score(session, total, timestamp, username="alice", sentiment=None):
+    session.add(Score(username=username, total_score=total,
+                      sentiment_score=sentiment, age=30, timestamp=timestamp))
+    session.commit()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FeatureStore(root=str(tmp_path / "feature_store"))
+
+
+def test_snapshot_materializes_table(temp_db, store):
+    _add_score(temp_db, 20, "2024-01-02T10:00:00", sentiment=0.5)
+    _add_score(temp_db, 30, "2024-01-01T10:00:00", username="bøb")
+
+    frame = store.snapshot(temp_db, "scores")
+
+    assert list(frame["total_score"]) == [30.0, 20.0]
+    assert list(frame["username"]) == ["bøb", "alice"]
+    assert np.isnan(frame["user_id"]).all()
+    assert list(frame["sentiment_score"]) == [0.0, 0.5]
+    assert store.current_version("scores") == 1
+    assert isinstance(store.load_columns("scores", ["total_score"])["total_score"], np.memmap)
+
+
+def test_refresh_appends_only_new_rows(temp_db, store):
+    _add_score(temp_db, 20, "2024-01-01T10:00:00")
+    store.refresh(temp_db, "scores")
+
+    _add_score(temp_db, 25, "2024-01-01T10:00:00")  # same timestamp as the watermark
+    _add_score(temp_db, 30, "2024-01-02T10:00:00")
+    entry = store.refresh(temp_db, "scores")
+
+    assert entry["version"] == 2
+    assert entry["parts"] == ["part-00001", "part-00002"]
+    assert entry["rows"] == 3
+    assert entry["watermark"] == "2024-01-02T10:00:00"
+    assert sorted(store.load_frame("scores")["total_score"]) == [20.0, 25.0, 30.0]
+    # Nothing new: no new version
+    assert store.refresh(temp_db, "scores")["version"] == 2
+    # Older versions stay readable
+    assert list(store.load_frame("scores", version=1)["total_score"]) == [20.0]
+
+
+def test_deleted_rows_trigger_full_rebuild(temp_db, store):
+    _add_score(temp_db, 20, "2024-01-01T10:00:00")
+    _add_score(temp_db, 30, "2024-01-02T10:00:00")
+    store.refresh(temp_db, "scores")
+
+    temp_db.query(Score).filter(Score.total_score == 20).delete()
+    temp_db.commit()
+    entry = store.refresh(temp_db, "scores")
+
+    assert entry["parts"] == ["part-00002"]
+    assert list(store.load_frame("scores")["total_score"]) == [30.0]
+
+
+def test_journal_and_response_tables(temp_db, store):
+    temp_db.add(JournalEntry(username="alice", content="Slept well ✨", sleep_hours=8.0,
+                             entry_date="2024-01-01 09:00:00"))
+    temp_db.add(JournalEntry(username="alice", content="hidden", is_deleted=True,
+                             entry_date="2024-01-02 09:00:00"))
+    temp_db.add(Response(username="alice", question_id=1, response_value=4, timestamp="2024-01-01"))
+    temp_db.commit()
+
+    journal = store.snapshot(temp_db, "journal_entries", columns=["content", "sleep_hours"])
+    responses = store.snapshot(temp_db, "responses")
+
+    assert list(journal["content"]) == ["Slept well ✨"]
+    assert list(responses["response_value"]) == [4.0]
+    with pytest.raises(ValueError):
+        store.load_columns("scores", ["missing"])
+    with pytest.raises(ValueError):
+        store.refresh(temp_db, "users")
@@ -10,7 +10,10 @@ from unittest.mock import Mock, patch, MagicMock
 # Add app directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from app.ml.insights_generator import EQInsightsGenerator
+import numpy as np
+import pandas as pd
+
+from app.ml.insights_generator import EQInsightsGenerator, build_training_frame
 
 
 class TestEQInsightsGenerator:
@@ -230,5 +233,53 @@ class TestEQInsightsGenerator:
         )
 
 
+class TestBuildTrainingFrame:
+    """Test cases for the set-based training frame builder."""
+
+    @pytest.fixture
+    def scores(self):
+        return pd.DataFrame({
+            'user_id': [1.0, 2.0, 1.0, 1.0, np.nan, 3.0],
+            'total_score': [10.0, 18.0, 20.0, 15.0, 12.0, 22.0],
+            'sentiment_score': [0.1, np.nan, 0.3, 0.2, 0.0, 0.5],
+            'age': [30.0, np.nan, 30.0, 30.0, 40.0, 0.0],
+            'timestamp': ['2024-01-01', '2024-01-05', '2024-01-03', '2024-01-02', '2024-01-01', '2024-01-01'],
+        })
+
+    def test_per_user_features(self, scores):
+        df = build_training_frame(scores)
+
+        assert list(df['user_id']) == [1, 1, 1, 2, 3]
+        user1 = df[df['user_id'] == 1]
+        assert list(user1['total_score']) == [10.0, 15.0, 20.0]
+        assert (user1['score_variance'] == np.var([10, 15, 20])).all()
+        # Slope of 5 points per assessment, mean 15
+        assert list(user1['improvement_potential']) == pytest.approx([5 * 5 + (25 - 15) * 0.1] * 3)
+        single = df[df['user_id'] != 1]
+        assert (single['score_variance'] == 0.0).all()
+        assert (single['improvement_potential'] == 0.0).all()
+        assert list(single['age']) == [25.0, 25.0]
+        assert list(single['sentiment_score']) == [0.0, 0.5]
+        assert list(df['avg_response']) == list(df['total_score'] / 5)
+
+    def test_train_from_scores(self):
+        rng = np.random.default_rng(0)
+        n = 60
+        scores = pd.DataFrame({
+            'user_id': rng.integers(1, 10, n).astype(float),
+            'total_score': rng.integers(5, 25, n).astype(float),
+            'sentiment_score': rng.normal(0, 1, n),
+            'age': rng.integers(18, 60, n).astype(float),
+            'timestamp': [f"2024-01-{i % 28 + 1:02d}T{i:04d}" for i in range(n)],
+        })
+        generator = EQInsightsGenerator(load_model=False)
+
+        assert generator.train_from_scores(scores.head(5)) is None
+        metrics = generator.train_from_scores(scores)
+
+        assert set(metrics) == {'mse', 'r2'}
+        assert generator.is_trained
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
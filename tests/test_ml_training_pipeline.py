@@ -0,0 +1,60 @@
+"""
+Tests for the hyperparameter search strategies of the ML training pipeline.
+"""
+
+import pytest
+
+from scripts.ml_training_pipeline import MLTrainingPipeline
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    return MLTrainingPipeline(output_dir=str(tmp_path), use_versioning=False, n_jobs=1)
+
+
+@pytest.fixture
+def data(pipeline):
+    X, y = pipeline.generate_synthetic_data(n_samples=300)
+    return pipeline.preprocess_data(X, y)
+
+
+def test_halving_budgets_trees_for_ensembles(pipeline, data):
+    pipeline.PARAM_GRIDS = {"rf": {"n_estimators": [10, 30], "max_depth": [3, 5, None]}}
+
+    result = pipeline.train("rf", data, cv_folds=3, search="halving")
+
+    assert result["metrics"]["search"] == "halving"
+    assert set(result["best_params"]) == {"max_depth", "n_estimators"}
+    assert result["model"].n_estimators == result["best_params"]["n_estimators"] <= 30
+
+
+def test_halving_random_unwraps_scaled_pipeline(pipeline, data):
+    result = pipeline.train("svm", data, cv_folds=3, quick_mode=True, search="halving-random")
+
+    assert result["best_params"] == {"C": 1, "kernel": "rbf", "gamma": "scale"}
+    assert result["model"].predict(data["X_val"]).shape == data["y_val"].shape
+
+
+def test_unknown_search_strategy(pipeline, data):
+    with pytest.raises(ValueError):
+        pipeline.train("lr", data, search="bayes")
+
+
+def test_cross_validate_scores_every_metric_in_one_pass(pipeline):
+    X, y = pipeline.generate_synthetic_data(n_samples=200)
+
+    results = pipeline.cross_validate("lr", X, y, cv_folds=3)
+
+    assert set(results) == set(MLTrainingPipeline.CV_SCORING)
+    assert all(len(r["scores"]) == 3 for r in results.values())
+
+
+def test_compare_models_sequential(pipeline, monkeypatch):
+    original = pipeline.generate_synthetic_data
+    monkeypatch.setattr(pipeline, "generate_synthetic_data", lambda: original(n_samples=300))
+
+    df = pipeline.compare_models(["lr", "svm"], quick_mode=True, search="halving", parallel=False)
+
+    assert list(df["model_type"]) == ["lr", "svm"]
+    assert "error" not in df.columns
+    assert (df["train_seconds"] >= 0).all()
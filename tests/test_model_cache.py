@@ -0,0 +1,116 @@
+"""
+Tests for the process-wide ML model cache.
+"""
+
+import time
+
+import joblib
+import numpy as np
+import pytest
+
+from app.ml.model_cache import ModelCache, model_cache, warm_up_models
+from app.ml.risk_predictor import RiskPredictor
+from app.ml.versioning import ModelRegistry
+
+
+@pytest.fixture
+def cache():
+    return ModelCache()
+
+
+def test_load_is_cached_per_file(cache, tmp_path):
+    path = str(tmp_path / "model.pkl")
+    joblib.dump({"weights": [1, 2, 3]}, path)
+
+    first = cache.load(path, name="m")
+    second = cache.load(path, name="m")
+
+    assert first is second
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_changed_file_is_reloaded(cache, tmp_path):
+    path = str(tmp_path / "model.pkl")
+    joblib.dump({"v": 1}, path)
+    assert cache.load(path)["v"] == 1
+
+    time.sleep(0.01)
+    joblib.dump({"v": 2, "pad": "x" * 10}, path)
+
+    assert cache.load(path)["v"] == 2
+    assert cache.stats()["entries"] == 1
+
+
+def test_mmap_loading(cache, tmp_path):
+    path = str(tmp_path / "arrays.pkl")
+    joblib.dump({"coef": np.arange(1000.0)}, path)
+
+    data = cache.load(path, mmap=True)
+
+    assert isinstance(data["coef"], np.memmap)
+    assert data["coef"][10] == 10.0
+
+
+def test_missing_file_is_not_cached(cache, mocker):
+    loader = mocker.Mock(return_value="model")
+
+    assert cache.load("does/not/exist.pkl", loader=loader) == "model"
+    assert cache.load("does/not/exist.pkl", loader=loader) == "model"
+    assert loader.call_count == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_risk_predictors_share_one_load(tmp_path, mocker):
+    path = tmp_path / "risk_model_v1.pkl"
+    joblib.dump("model-object", path)
+    model_cache.clear()
+    spy = mocker.spy(joblib, "load")
+
+    for _ in range(3):
+        predictor = RiskPredictor(models_dir=str(tmp_path))
+        predictor.load_latest_model()
+        assert predictor.model == "model-object"
+
+    assert spy.call_count == 1
+
+
+def test_promotion_bumps_generation_and_registry_uses_cache(tmp_path):
+    registry = ModelRegistry(str(tmp_path / "registry"))
+    registry.register_model(model={"id": 1}, name="cache_test_model")
+    registry.register_model(model={"id": 2}, name="cache_test_model")
+
+    first, _ = registry.get_model("cache_test_model", "1.0.0")
+    again, _ = registry.get_model("cache_test_model", "1.0.0")
+    assert first is again
+
+    generation = model_cache.production_generation("cache_test_model")
+    registry.promote_to_production("cache_test_model", "1.0.1")
+    assert model_cache.production_generation("cache_test_model") == generation + 1
+
+    # A second registry instance (e.g. another process) sees the new pointer
+    other = ModelRegistry(str(tmp_path / "registry"))
+    registry.promote_to_production("cache_test_model", "1.0.0")
+    model_data, metadata = other.get_production_model("cache_test_model")
+    assert metadata.version == "1.0.0"
+
+
+def test_warm_up_preloads_risk_model(tmp_path):
+    joblib.dump("warm", tmp_path / "risk_model_v2.pkl")
+    model_cache.clear()
+
+    stats = warm_up_models(models_dir=str(tmp_path), names=())
+
+    assert stats["entries"] == 1
+
+
+def test_registry_models_can_be_memory_mapped(tmp_path):
+    registry = ModelRegistry(str(tmp_path / "registry"))
+    registry.register_model(model={"coef": np.arange(1000.0)}, name="mmap_test_model")
+    model_cache.clear()
+
+    model_data, metadata = registry.get_model("mmap_test_model", mmap=True)
+
+    assert isinstance(model_data["model"]["coef"], np.memmap)
+    assert model_data["model"]["coef"][10] == 10.0
+    model_file = registry.models_path / "mmap_test_model" / "1.0.0" / "model.pkl"
+    assert metadata.file_hash == registry._compute_file_hash(model_file)
@@ -2,7 +2,7 @@
 
 import pytest
 import numpy as np
-from app.analysis.outlier_detection import OutlierDetector
+from app.analysis.outlier_detection import OutlierDetector, grouped_outlier_masks
 from app.db import get_session
 from app.models import Score, User, Base
 from datetime import datetime
@@ -275,5 +275,63 @@ class TestOutlierDetectorDatabase:
         assert "coefficient_of_variation" in result
 
 
+class TestOutlierDetectorBatch:
+    """Test vectorized batch mode against the list-based detectors"""
+    
+    @pytest.fixture
+    def detector(self):
+        return OutlierDetector(threshold=2.5)
+    
+    def test_grouped_masks_match_per_group_methods(self, detector):
+        """Every group must be flagged exactly like the per-list methods"""
+        rng = np.random.default_rng(42)
+        codes = rng.integers(0, 40, size=600)
+        values = rng.integers(10, 40, size=600).astype(float)
+        values[rng.choice(600, 15, replace=False)] = 200  # inject outliers
+        codes[-3:] = 40  # tiny group (below IQR minimum)
+        codes[-1] = 41  # single-score group
+        
+        masks = grouped_outlier_masks(values, codes)
+        
+        per_list = {
+            "zscore": detector.detect_outliers_zscore,
+            "iqr": detector.detect_outliers_iqr,
+            "modified_zscore": detector.detect_outliers_modified_zscore,
+            "mad": detector.detect_outliers_mad,
+            "ensemble": detector.detect_outliers_ensemble,
+        }
+        for group in np.unique(codes):
+            rows = np.flatnonzero(codes == group)
+            for name, method in per_list.items():
+                expected = method(values[rows].tolist())["indices"]
+                assert np.flatnonzero(masks[name][rows]).tolist() == expected, (name, group)
+    
+    def test_grouped_masks_empty(self):
+        masks = grouped_outlier_masks(np.array([]), np.array([], dtype=int))
+        assert masks["ensemble"].size == 0
+    
+    def test_detect_outliers_batch_by_user(self, detector, temp_db):
+        """Batch mode returns compact arrays of outlier score ids"""
+        for username, values in [("u1", [20, 22, 21, 23, 22, 100, 21, 23]),
+                                 ("u2", [30, 31, 30, 29, 31, 30])]:
+            for value in values:
+                temp_db.add(Score(username=username, total_score=value,
+                                  timestamp=datetime.utcnow().isoformat()))
+        temp_db.commit()
+        outlier_id = temp_db.query(Score.id).filter(Score.total_score == 100).scalar()
+        
+        result = detector.detect_outliers_batch(temp_db, group_by="username")
+        
+        assert result["total_scores"] == 14
+        assert result["total_groups"] == 2
+        assert isinstance(result["score_ids"], np.ndarray)
+        assert result["score_ids"].tolist() == [outlier_id]
+        assert result["outlier_groups"].tolist() == ["u1"]
+    
+    def test_detect_outliers_batch_invalid_group(self, detector, temp_db):
+        result = detector.detect_outliers_batch(temp_db, group_by="country")
+        assert "error" in result
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,87 @@
+"""
+Test module for cohort retention analysis.
+
+Runs the set-based retention passes against an in-memory SQLite database and
+checks the cohort matrix, gap distribution and data-version caching.
+"""
+
+import pytest
+from app.analysis.retention import RetentionEngine, build_cohort_matrix, build_gap_summary
+from app.models import Score
+
+
+def _add_scores(session, rows):
+    for username, timestamp in rows:
+        session.add(Score(username=username, total_score=30, timestamp=timestamp))
+    session.commit()
+
+
+@pytest.fixture
+def engine():
+    return RetentionEngine()
+
+
+@pytest.fixture
+def populated(temp_db):
+    # Week of 2025-01-06 (Mon): alice, bob. Week of 2025-01-13: carol
+    _add_scores(temp_db, [
+        ("alice", "2025-01-06T09:00:00"),
+        ("alice", "2025-01-06T18:00:00"),   # same day  -> <1d gap
+        ("alice", "2025-01-14T09:00:00"),   # next week -> 7-30d gap
+        ("bob", "2025-01-08T10:00:00"),
+        ("carol", "2025-01-13T10:00:00.123456"),
+        ("carol", "2025-01-16T10:00:00"),   # 1-7d gap, same week
+    ])
+    return temp_db
+
+
+class TestRetentionEngine:
+    """Test suite for RetentionEngine."""
+
+    def test_cohort_matrix(self, engine, populated):
+        report = engine.get_report(populated, weeks=3)
+
+        assert [c["cohort_week"] for c in report["cohorts"]] == ["2025-01-06", "2025-01-13"]
+        first = report["cohorts"][0]
+        assert first["cohort_size"] == 2
+        assert first["active_users"] == [2, 1, 0]
+        assert first["retention"] == [100.0, 50.0, 0.0]
+        assert report["cohorts"][1]["active_users"] == [1, 0, 0]
+
+    def test_gap_distribution_and_returning_users(self, engine, populated):
+        report = engine.get_report(populated, min_attempts=2)
+
+        assert report["total_users"] == 3
+        assert report["returning_users"] == 2
+        counts = {b["range"]: b["count"] for b in report["gap_distribution"]}
+        assert counts == {"<1d": 1, "1-7d": 1, "7-30d": 1, "30-90d": 0, "90d+": 0}
+        assert report["average_days_between_attempts"] > 0
+
+    def test_report_cached_until_data_changes(self, engine, populated):
+        first = engine.get_report(populated)
+        assert engine.get_report(populated) is first
+
+        _add_scores(populated, [("dave", "2025-01-20T10:00:00")])
+        refreshed = engine.get_report(populated)
+
+        assert refreshed is not first
+        assert refreshed["total_users"] == 4
+
+    def test_empty_database(self, engine, temp_db):
+        report = engine.get_report(temp_db)
+
+        assert report["cohorts"] == []
+        assert report["total_users"] == 0
+        assert report["average_days_between_attempts"] is None
+
+
+def test_build_helpers_limit_weeks():
+    rows = [("2025-01-06", 0, 4), ("2025-01-06", 1, 2), ("2025-01-13", 0, 5)]
+    matrix = build_cohort_matrix(rows, weeks=1)
+
+    assert [c["cohort_week"] for c in matrix["cohorts"]] == ["2025-01-13"]
+    assert matrix["cohorts"][0]["active_users"] == [5]
+
+    summary = build_gap_summary([(-1, 10, None, 4), (0, 3, 1.5, 0)])
+    assert summary["returning_user_rate"] == 40.0
+    assert summary["average_days_between_attempts"] == 0.5
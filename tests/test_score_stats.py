@@ -0,0 +1,129 @@
+"""
+Tests for the streaming per-user score statistics store and its use in
+ScoreAnalyzer.validate_user_score.
+"""
+
+import statistics
+import pytest
+from app.analysis.score_stats import (
+    get_user_stats, record_score, rebuild_user_stats, stats_average_change, stats_std
+)
+from app.ml.score_analyzer import ScoreAnalyzer
+from app.models import Score, UserScoreStats
+from app.services.exam_service import ExamService
+
+
+HISTORY = [20, 22, 21, 23, 22, 21, 23]
+
+
+def _add_history(session, username, values):
+    for i, value in enumerate(values):
+        session.add(Score(username=username, total_score=value,
+                          timestamp=f"2025-01-0{i + 1}T10:00:00"))
+    session.commit()
+
+
+def test_running_stats_match_batch_statistics(temp_db):
+    for value in HISTORY:
+        record_score(temp_db, "alice", value)
+    temp_db.commit()
+
+    stats = get_user_stats(temp_db, "alice")
+    changes = [abs(b - a) for a, b in zip(HISTORY, HISTORY[1:])]
+
+    assert stats.count == len(HISTORY)
+    assert stats.last_score == HISTORY[-1]
+    assert stats.mean == pytest.approx(statistics.mean(HISTORY))
+    assert stats_std(stats) == pytest.approx(statistics.pstdev(HISTORY))
+    assert stats_average_change(stats) == pytest.approx(sum(changes) / len(changes))
+
+
+def test_rebuild_from_history(temp_db):
+    _add_history(temp_db, "alice", HISTORY)
+    _add_history(temp_db, "bob", [30, 10])
+
+    assert rebuild_user_stats(temp_db) == 2
+    temp_db.commit()
+
+    assert get_user_stats(temp_db, "alice").count == len(HISTORY)
+    assert stats_average_change(get_user_stats(temp_db, "bob")) == 20
+
+    # Rebuilding a single user replaces only that user's row
+    assert rebuild_user_stats(temp_db, "bob") == 1
+    temp_db.commit()
+    assert temp_db.query(UserScoreStats).count() == 2
+
+
+def test_save_score_updates_store(temp_db, monkeypatch):
+    from contextlib import contextmanager
+
+    @contextmanager
+    def session_context():
+        yield temp_db
+        temp_db.commit()
+
+    monkeypatch.setattr("app.services.exam_service.safe_db_context", session_context)
+
+    for value in (20, 24):
+        assert ExamService.save_score("carol", 25, "adult", value, 0.0, "", False, False, "adult")
+
+    stats = get_user_stats(temp_db, "carol")
+    assert stats.count == 2
+    assert stats.abs_change_sum == 4
+
+
+def test_first_recorded_score_includes_existing_history(temp_db, monkeypatch):
+    """Users with scores from before the stats table existed have no row yet."""
+    from contextlib import contextmanager
+
+    @contextmanager
+    def session_context():
+        yield temp_db
+        temp_db.commit()
+
+    monkeypatch.setattr("app.services.exam_service.safe_db_context", session_context)
+    _add_history(temp_db, "dave", [15, 16, 14, 18])
+    assert get_user_stats(temp_db, "dave") is None
+
+    assert ExamService.save_score("dave", 25, "adult", 20, 0.0, "", False, False, "adult")
+
+    stats = get_user_stats(temp_db, "dave")
+    assert stats.count == 5
+    assert stats.mean == pytest.approx(16.6)
+    assert stats.last_score == 20
+    assert stats_average_change(stats) == pytest.approx((1 + 2 + 4 + 2) / 4)
+
+
+class TestValidateUserScore:
+    """validate_user_score must agree with the old history-based checks"""
+
+    @pytest.fixture
+    def analyzer(self, temp_db, monkeypatch):
+        monkeypatch.setattr("app.ml.score_analyzer.get_session", lambda: temp_db)
+        return ScoreAnalyzer()
+
+    def test_first_score(self, analyzer):
+        result = analyzer.validate_user_score("nobody", 30, 25, "adult")
+        assert result["valid"] is True
+        assert result["warnings"] == []
+
+    def test_outlier_and_extreme_change(self, analyzer, temp_db):
+        _add_history(temp_db, "alice", HISTORY)
+
+        result = analyzer.validate_user_score("alice", 90, 25, "adult")
+
+        types = {w["type"] for w in result["warnings"]}
+        assert types == {"statistical_outlier", "extreme_change"}
+        details = result["validation_details"]
+        assert details["user_history_count"] == len(HISTORY)
+        assert details["historical_mean"] == pytest.approx(statistics.mean(HISTORY))
+        assert details["change_from_last"] == 90 - HISTORY[-1]
+        # The store was backfilled from history on first use
+        assert get_user_stats(temp_db, "alice") is not None
+
+    def test_normal_score(self, analyzer, temp_db):
+        _add_history(temp_db, "alice", HISTORY)
+
+        result = analyzer.validate_user_score("alice", 22, 25, "adult")
+
+        assert result["warnings"] == []
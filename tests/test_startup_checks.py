@@ -268,6 +268,89 @@ class TestRunAllChecks:
             assert any(r.status == CheckStatus.FAILED for r in results)
 
 
+class TestCheckCache:
+    """Tests for parallel execution and the fingerprint result cache."""
+    
+    @pytest.fixture
+    def install(self, monkeypatch, tmp_path):
+        """A clean install in tmp_path with an on-disk SQLite database."""
+        import sqlite3
+        
+        db_path = tmp_path / "soulsense.db"
+        conn = sqlite3.connect(db_path)
+        for table in REQUIRED_TABLES:
+            conn.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY)")
+        conn.commit()
+        conn.close()
+        
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"database": {}, "ui": {}, "features": {}}))
+        for file_info in REQUIRED_FILES:
+            (tmp_path / file_info["path"]).mkdir(exist_ok=True)
+        
+        monkeypatch.setattr("app.startup_checks.BASE_DIR", str(tmp_path))
+        monkeypatch.setattr("app.startup_checks.DB_PATH", str(db_path))
+        monkeypatch.setattr("app.startup_checks.CONFIG_PATH", str(config_path))
+        
+        calls = []
+        def schema_check():
+            calls.append("schema")
+            return IntegrityCheckResult("database_schema", CheckStatus.PASSED, "All required tables present")
+        monkeypatch.setattr("app.startup_checks.check_database_schema", schema_check)
+        
+        return {"db_path": db_path, "config_path": config_path,
+                "cache_path": str(tmp_path / "cache.json"), "calls": calls}
+    
+    def test_unchanged_install_skips_checks(self, install):
+        first = run_all_checks(use_cache=True, cache_path=install["cache_path"])
+        second = run_all_checks(use_cache=True, cache_path=install["cache_path"])
+        
+        assert install["calls"] == ["schema"]
+        assert [r.name for r in second] == [r.name for r in first]
+        assert all(r.details.get("cached") for r in second)
+    
+    def test_config_change_invalidates_cache(self, install):
+        run_all_checks(use_cache=True, cache_path=install["cache_path"])
+        install["config_path"].write_text(json.dumps({"database": {}, "ui": {"theme": "dark"}, "features": {}}))
+        run_all_checks(use_cache=True, cache_path=install["cache_path"])
+        
+        assert install["calls"] == ["schema", "schema"]
+    
+    def test_schema_change_invalidates_cache(self, install):
+        import sqlite3
+        
+        run_all_checks(use_cache=True, cache_path=install["cache_path"])
+        conn = sqlite3.connect(install["db_path"])
+        conn.execute("CREATE TABLE extra (id INTEGER PRIMARY KEY)")
+        conn.commit()
+        conn.close()
+        run_all_checks(use_cache=True, cache_path=install["cache_path"])
+        
+        assert install["calls"] == ["schema", "schema"]
+    
+    def test_full_check_ignores_cache(self, install):
+        run_all_checks(use_cache=True, cache_path=install["cache_path"])
+        run_all_checks(use_cache=True, full_check=True, cache_path=install["cache_path"])
+        
+        assert install["calls"] == ["schema", "schema"]
+    
+    def test_warnings_are_not_cached(self, install, monkeypatch):
+        monkeypatch.setattr(
+            "app.startup_checks.check_required_files",
+            lambda: IntegrityCheckResult("required_files", CheckStatus.WARNING, "Created logs"),
+        )
+        run_all_checks(use_cache=True, cache_path=install["cache_path"])
+        
+        assert not os.path.exists(install["cache_path"])
+    
+    def test_parallel_and_sequential_results_match(self, install):
+        parallel = run_all_checks(parallel=True)
+        sequential = run_all_checks(parallel=False)
+        
+        assert [(r.name, r.status) for r in parallel] == [(r.name, r.status) for r in sequential]
+        assert [r.name for r in parallel] == ["config_integrity", "required_files", "database_schema"]
+
+
 class TestGetCheckSummary:
     """Tests for the summary generation function."""
     
@@ -0,0 +1,110 @@
+"""
+Tests for startup profiling and the lazy-import helpers that keep startup fast.
+"""
+
+import builtins
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.utils.lazy_imports import LazyModule, lazy_attr, lazy_exports, lazy_import, module_available
+from app.utils.startup_profiler import StartupProfiler, profiling_requested
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_lazy_import_defers_until_first_use(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    hooks = []
+
+    module = lazy_import("colorsys", before_import=lambda: hooks.append("hook"))
+    assert isinstance(module, LazyModule)
+    assert "colorsys" not in sys.modules
+
+    assert module.rgb_to_hsv(1, 0, 0)[0] == 0
+    assert "colorsys" in sys.modules
+    assert hooks == ["hook"]
+
+
+def test_lazy_attr_is_callable_proxy():
+    dumps = lazy_attr("json", "dumps")
+    assert dumps({"a": 1}) == '{"a": 1}'
+    assert dumps.resolve() is json.dumps
+
+
+def test_module_available_does_not_import(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    assert module_available("colorsys")
+    assert "colorsys" not in sys.modules
+    assert not module_available("soulsense_no_such_module")
+
+
+def test_lazy_exports_resolves_and_caches(monkeypatch):
+    import app.ml as ml_package
+
+    getattr_ = lazy_exports("app.ml", {"RiskPredictor": ".risk_predictor"})
+    monkeypatch.delattr(ml_package, "RiskPredictor", raising=False)
+    from app.ml.risk_predictor import RiskPredictor
+
+    assert getattr_("RiskPredictor") is RiskPredictor
+    assert ml_package.__dict__["RiskPredictor"] is RiskPredictor
+    with pytest.raises(AttributeError):
+        getattr_("Missing")
+
+
+def test_profiler_records_imports_and_phases(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    profiler = StartupProfiler()
+    original_import = builtins.__import__
+
+    profiler.enable()
+    try:
+        with profiler.phase("load"):
+            import colorsys  # noqa: F401
+        profiler.mark("ready")
+        profiler.mark("ready")
+    finally:
+        profiler.disable()
+
+    assert builtins.__import__ is original_import
+    data = profiler.to_dict()
+    modules = {row["module"]: row for row in data["imports"]}
+    assert "colorsys" in modules
+    assert modules["colorsys"]["self_s"] <= modules["colorsys"]["cumulative_s"]
+    assert [p["name"] for p in data["phases"]] == ["load"]
+    assert list(data["marks"]) == ["ready"]
+    assert "colorsys" in profiler.report()
+
+
+def test_disabled_profiler_is_a_no_op():
+    profiler = StartupProfiler()
+    with profiler.phase("load"):
+        pass
+    profiler.mark("ready")
+    profiler.finish()
+
+    assert profiler.to_dict()["phases"] == []
+    assert profiler.to_dict()["marks"] == {}
+
+
+def test_profiling_requested(monkeypatch):
+    monkeypatch.delenv("SOULSENSE_PROFILE_STARTUP", raising=False)
+    assert profiling_requested(["app/main.py", "--profile-startup"])
+    assert not profiling_requested(["app/main.py"])
+    monkeypatch.setenv("SOULSENSE_PROFILE_STARTUP", "1")
+    assert profiling_requested(["app/main.py"])
+
+
+def test_app_main_import_skips_heavy_dependencies():
+    """Reaching the login window must not import charting, NLP or ML stacks."""
+    probe = (
+        "import sys, app.main; "
+        "print(','.join(m for m in ('matplotlib', 'seaborn', 'sklearn', 'nltk', 'pandas') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
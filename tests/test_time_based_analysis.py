@@ -237,7 +237,7 @@ class TestTimeBasedAnalyzer:
         ]
         
         mock_session = MagicMock()
-        mock_session.query.return_value.group_by.return_value.filter.return_value.all.return_value = mock_user_data
+        mock_session.query.return_value.group_by.return_value.having.return_value.order_by.return_value.all.return_value = mock_user_data
         
         mock_db.return_value.__enter__.return_value = mock_session
         mock_db.return_value.__exit__.return_value = None
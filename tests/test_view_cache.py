@@ -0,0 +1,134 @@
+"""
+Tests for the ViewManager view cache (LRU of hidden view frames).
+
+Tk needs a display, so frames are replaced by a small fake widget class.
+"""
+
+import pytest
+
+from app import events
+from app.ui.view_manager import ViewManager
+
+
+class FakeWidget:
+    def __init__(self, parent=None, **kwargs):
+        self.parent = parent
+        self.children = []
+        self.packed = False
+        self.destroyed = False
+        if parent is not None:
+            parent.children.append(self)
+
+    def pack(self, **kwargs):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+    def destroy(self):
+        self.destroyed = True
+        if self.parent is not None and self in self.parent.children:
+            self.parent.children.remove(self)
+
+    def winfo_children(self):
+        return list(self.children)
+
+    def winfo_exists(self):
+        return not self.destroyed
+
+    def after(self, ms, func):
+        return "after#1"
+
+    def after_cancel(self, after_id):
+        pass
+
+
+class FakeApp:
+    def __init__(self):
+        self.root = FakeWidget()
+        self.content_area = FakeWidget()
+        self.colors = {"bg": "#000000"}
+        self.username = "alice"
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr("app.ui.view_manager.tk.Frame", FakeWidget)
+    monkeypatch.setattr(events, "_subscribers", {})
+    manager = ViewManager(FakeApp(), cache_size=2)
+    manager.renders = []
+    for view_id in ("home", "dashboard", "journal", "history"):
+        monkeypatch.setattr(manager, f"_render_{view_id}",
+                            lambda parent, view_id=view_id: manager.renders.append(view_id))
+    yield manager
+    manager.loader.shutdown()
+
+
+def test_revisiting_a_view_reuses_its_frame(manager):
+    manager.show_dashboard()
+    manager.show_journal()
+    manager.show_dashboard()
+
+    assert manager.renders == ["dashboard", "journal"]
+    shown = [w for w in manager.app.content_area.children if w.packed]
+    assert shown == [manager._view_cache["dashboard"]]
+
+
+def test_least_recently_used_view_is_evicted(manager):
+    manager.show_home()
+    manager.show_dashboard()
+    home_frame = manager._view_cache["home"]
+
+    manager.show_journal()
+
+    assert list(manager._view_cache) == ["dashboard", "journal"]
+    assert home_frame.destroyed
+
+
+def test_data_change_invalidates_dependent_views(manager):
+    manager.show_dashboard()
+    manager.show_journal()
+
+    events.publish(events.SCORE_SAVED, username="alice")
+    manager.show_journal()
+    manager.show_dashboard()
+
+    assert manager.renders == ["dashboard", "journal", "dashboard"]
+
+
+def test_theme_change_invalidates_everything(manager):
+    manager.show_dashboard()
+    manager.show_journal()
+
+    events.publish(events.THEME_CHANGED, theme="dark")
+    manager.show_dashboard()
+    manager.show_journal()
+
+    assert manager.renders == ["dashboard", "journal", "dashboard", "journal"]
+
+
+def test_user_change_drops_cache(manager):
+    manager.show_dashboard()
+    manager.app.username = "bob"
+    manager.show_dashboard()
+
+    assert manager.renders == ["dashboard", "dashboard"]
+
+
+def test_uncached_screens_are_destroyed(manager):
+    manager.show_dashboard()
+    transient = FakeWidget(manager.app.content_area)
+
+    manager.clear_screen()
+
+    assert transient.destroyed
+    assert not manager._view_cache["dashboard"].destroyed
+
+
+def test_cache_disabled(manager):
+    manager.cache_size = 0
+    manager.show_dashboard()
+    manager.show_dashboard()
+
+    assert manager.renders == ["dashboard", "dashboard"]
+    assert not manager._view_cache
@@ -0,0 +1,130 @@
+"""
+Tests for the background view data loader.
+
+Uses a fake Tk root whose ``after`` queue is pumped by the test, standing in
+for the Tk mainloop.
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.ui.data_loader import ViewDataLoader, run_view_load
+
+
+class FakeRoot:
+    """Minimal stand-in for tk.Tk: records after() callbacks for manual pumping."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.ui_thread = threading.get_ident()
+        self._next_id = 0
+
+    def after(self, ms, func):
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.callbacks[after_id] = func
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def pump(self, loader, timeout=2.0):
+        """Run scheduled callbacks until the loader has nothing pending."""
+        deadline = time.monotonic() + timeout
+        while loader.pending_count and time.monotonic() < deadline:
+            for after_id, func in list(self.callbacks.items()):
+                del self.callbacks[after_id]
+                func()
+            time.sleep(0.005)
+
+
+class FakeWidget:
+    def __init__(self, alive=True):
+        self.alive = alive
+
+    def winfo_exists(self):
+        return self.alive
+
+
+@pytest.fixture
+def root():
+    return FakeRoot()
+
+
+@pytest.fixture
+def loader(root):
+    loader = ViewDataLoader(root, max_workers=2)
+    yield loader
+    loader.shutdown()
+
+
+def test_result_delivered_on_ui_thread(root, loader):
+    delivered = []
+    worker_threads = []
+
+    def fetch():
+        worker_threads.append(threading.get_ident())
+        return [1, 2, 3]
+
+    loader.load(fetch, lambda rows: delivered.append((rows, threading.get_ident())))
+    root.pump(loader)
+
+    assert delivered == [([1, 2, 3], root.ui_thread)]
+    assert worker_threads[0] != root.ui_thread
+
+
+def test_errors_go_to_error_callback(root, loader):
+    errors = []
+
+    def fetch():
+        raise ValueError("boom")
+
+    loader.load(fetch, lambda _: pytest.fail("should not succeed"), on_error=errors.append)
+    root.pump(loader)
+
+    assert [str(e) for e in errors] == ["boom"]
+
+
+def test_switching_views_drops_stale_results(root, loader):
+    release = threading.Event()
+    delivered = []
+
+    loader.begin_view("history")
+    loader.load(lambda: release.wait(1) or "old", delivered.append)
+
+    loader.begin_view("home")
+    loader.load(lambda: "new", delivered.append)
+    release.set()
+    root.pump(loader)
+    time.sleep(0.05)
+    root.pump(loader)
+
+    assert delivered == ["new"]
+
+
+def test_cancelled_handle_is_not_delivered(root, loader):
+    delivered = []
+    handle = loader.load(lambda: "value", delivered.append)
+    handle.cancel()
+    root.pump(loader)
+
+    assert delivered == []
+    assert loader.pending_count == 0
+
+
+def test_destroyed_owner_is_skipped(root, loader):
+    delivered = []
+    owner = FakeWidget()
+    loader.load(lambda: "value", delivered.append, owner=owner)
+    owner.alive = False
+    root.pump(loader)
+
+    assert delivered == []
+
+
+def test_run_view_load_without_loader_is_synchronous():
+    delivered = []
+    assert run_view_load(None, lambda: 42, delivered.append) is None
+    assert delivered == [42]